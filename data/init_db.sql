@@ -1,3 +1,7 @@
+-- Schéma de base (version 0). Les migrations versionnées de data/migrations
+-- sont appliquées ensuite (utils/migrations.py, table schema_version).
+DROP TABLE IF EXISTS schema_version;
+
 -----------------------------------------------------
 -- TABLE : Utilisateur
 -----------------------------------------------------
@@ -31,9 +35,21 @@ CREATE TABLE evenement (
     date_creation TIMESTAMP DEFAULT NOW(),
     categorie VARCHAR(50),
     statut VARCHAR(50) DEFAULT 'pas encore finalisé'
-        CHECK (statut IN ('disponible en ligne', 'déjà réalisé', 'annulé', 'pas encore finalisé'))
+        CHECK (statut IN ('disponible en ligne', 'déjà réalisé', 'annulé', 'pas encore finalisé')),
+
+    -- Compteurs dénormalisés, tenus à jour par triggers (cf. fin de fichier)
+    inscrits INT NOT NULL DEFAULT 0,
+    bus_aller_pris INT NOT NULL DEFAULT 0,
+    bus_retour_pris INT NOT NULL DEFAULT 0,
+    nb_sam INT NOT NULL DEFAULT 0,
+    nb_adh INT NOT NULL DEFAULT 0,
+    capacite_bus_aller INT NOT NULL DEFAULT 0,
+    capacite_bus_retour INT NOT NULL DEFAULT 0
 );
 
+-- Pagination par curseur des listes d'événements (tri date puis id)
+CREATE INDEX evenement_date_id_idx ON evenement (date_evenement, id_evenement);
+
 -----------------------------------------------------
 -- TABLE : Bus
 -----------------------------------------------------
@@ -80,5 +96,393 @@ CREATE TABLE commentaire (
     fk_utilisateur INT NOT NULL REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
     note INT CHECK (note BETWEEN 1 AND 5),             
     avis TEXT,                                        
-    date_commentaire TIMESTAMP DEFAULT NOW()          
+    date_commentaire TIMESTAMP DEFAULT NOW()
+);
+
+-----------------------------------------------------
+-- TABLE : Statistiques des avis par événement
+-----------------------------------------------------
+-- Agrégats des commentaires, tenus à jour par triggers (cf. fin de fichier).
+-- Table séparée de evenement : l'écriture d'un commentaire n'attend pas le
+-- verrou pris sur la ligne de l'événement par reserver_place().
+-- Pas de ligne = aucun commentaire.
+
+DROP TABLE IF EXISTS evenement_stats CASCADE;
+CREATE TABLE evenement_stats (
+    fk_evenement INT PRIMARY KEY REFERENCES evenement(id_evenement) ON DELETE CASCADE,
+    nb_commentaires INT NOT NULL DEFAULT 0,
+    nb_notes INT NOT NULL DEFAULT 0,
+    somme_notes INT NOT NULL DEFAULT 0
 );
+
+-----------------------------------------------------
+-- TABLE : File d'envoi des e-mails (outbox)
+-----------------------------------------------------
+-- Une ligne par destinataire. Les services y déposent les messages dans leur
+-- transaction ; le dispatcher (service/email_service.py) les envoie par lots.
+
+DROP TABLE IF EXISTS email_outbox CASCADE;
+CREATE TABLE email_outbox (
+    id_email SERIAL PRIMARY KEY,
+    destinataire VARCHAR(100) NOT NULL,
+    sujet VARCHAR(255) NOT NULL,
+    contenu TEXT NOT NULL,
+    statut VARCHAR(20) NOT NULL DEFAULT 'en_attente'
+        CHECK (statut IN ('en_attente', 'en_cours', 'envoye', 'echec')),
+    tentatives INT NOT NULL DEFAULT 0,
+    prochain_essai TIMESTAMP NOT NULL DEFAULT NOW(),
+    verrouille_le TIMESTAMP,
+    derniere_erreur TEXT,
+    message_id VARCHAR(255),
+    date_creation TIMESTAMP NOT NULL DEFAULT NOW(),
+    date_envoi TIMESTAMP
+);
+
+-- Seuls les messages à envoyer sont indexés : l'index reste petit
+CREATE INDEX email_outbox_a_envoyer_idx
+    ON email_outbox (prochain_essai, id_email)
+    WHERE statut = 'en_attente';
+
+
+-----------------------------------------------------
+-- TRIGGERS : Compteurs dénormalisés de l'événement
+-----------------------------------------------------
+-- evenement.inscrits / bus_aller_pris / bus_retour_pris / nb_sam / nb_adh
+-- suivent la table reservation, evenement.capacite_bus_aller / _retour
+-- suivent la table bus. Les mises à jour se font dans la transaction de
+-- l'écriture : les lectures de places restantes deviennent O(1).
+
+CREATE OR REPLACE FUNCTION maj_compteurs_reservation()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE evenement SET
+            inscrits = inscrits - 1,
+            bus_aller_pris = bus_aller_pris - COALESCE(OLD.bus_aller, FALSE)::INT,
+            bus_retour_pris = bus_retour_pris - COALESCE(OLD.bus_retour, FALSE)::INT,
+            nb_sam = nb_sam - COALESCE(OLD.sam, FALSE)::INT,
+            nb_adh = nb_adh - COALESCE(OLD.adherent, FALSE)::INT
+        WHERE id_evenement = OLD.fk_evenement;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE evenement SET
+            inscrits = inscrits + 1,
+            bus_aller_pris = bus_aller_pris + COALESCE(NEW.bus_aller, FALSE)::INT,
+            bus_retour_pris = bus_retour_pris + COALESCE(NEW.bus_retour, FALSE)::INT,
+            nb_sam = nb_sam + COALESCE(NEW.sam, FALSE)::INT,
+            nb_adh = nb_adh + COALESCE(NEW.adherent, FALSE)::INT
+        WHERE id_evenement = NEW.fk_evenement;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_reservation_compteurs
+AFTER INSERT OR DELETE OR UPDATE OF fk_evenement, bus_aller, bus_retour, sam, adherent
+ON reservation
+FOR EACH ROW EXECUTE FUNCTION maj_compteurs_reservation();
+
+
+CREATE OR REPLACE FUNCTION maj_capacite_bus()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE evenement SET
+            capacite_bus_aller = capacite_bus_aller
+                - CASE WHEN OLD.direction = 'aller' THEN OLD.nombre_places ELSE 0 END,
+            capacite_bus_retour = capacite_bus_retour
+                - CASE WHEN OLD.direction = 'retour' THEN OLD.nombre_places ELSE 0 END
+        WHERE id_evenement = OLD.fk_evenement;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE evenement SET
+            capacite_bus_aller = capacite_bus_aller
+                + CASE WHEN NEW.direction = 'aller' THEN NEW.nombre_places ELSE 0 END,
+            capacite_bus_retour = capacite_bus_retour
+                + CASE WHEN NEW.direction = 'retour' THEN NEW.nombre_places ELSE 0 END
+        WHERE id_evenement = NEW.fk_evenement;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_bus_capacite
+AFTER INSERT OR DELETE OR UPDATE OF fk_evenement, nombre_places, direction
+ON bus
+FOR EACH ROW EXECUTE FUNCTION maj_capacite_bus();
+
+
+
+-----------------------------------------------------
+-- TRIGGERS : Statistiques des avis (evenement_stats)
+-----------------------------------------------------
+-- Un commentaire est rattaché à son événement via sa réservation.
+-- Quand une réservation est supprimée, ses commentaires sont retirés des
+-- statistiques AVANT la suppression (ensuite, la réservation n'est plus
+-- visible depuis la suppression en cascade des commentaires, qui est ignorée).
+
+CREATE OR REPLACE FUNCTION maj_stats_commentaire()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE evenement_stats s SET
+            nb_commentaires = s.nb_commentaires - 1,
+            nb_notes = s.nb_notes - (OLD.note IS NOT NULL)::INT,
+            somme_notes = s.somme_notes - COALESCE(OLD.note, 0)
+        FROM reservation r
+        WHERE r.id_reservation = OLD.fk_reservation
+          AND s.fk_evenement = r.fk_evenement;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO evenement_stats AS s (fk_evenement, nb_commentaires, nb_notes, somme_notes)
+        SELECT r.fk_evenement, 1, (NEW.note IS NOT NULL)::INT, COALESCE(NEW.note, 0)
+        FROM reservation r
+        WHERE r.id_reservation = NEW.fk_reservation
+        ON CONFLICT (fk_evenement) DO UPDATE SET
+            nb_commentaires = s.nb_commentaires + EXCLUDED.nb_commentaires,
+            nb_notes = s.nb_notes + EXCLUDED.nb_notes,
+            somme_notes = s.somme_notes + EXCLUDED.somme_notes;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+CREATE TRIGGER trg_commentaire_stats
+AFTER INSERT OR DELETE OR UPDATE OF fk_reservation, note
+ON commentaire
+FOR EACH ROW EXECUTE FUNCTION maj_stats_commentaire();
+
+
+CREATE OR REPLACE FUNCTION maj_stats_reservation()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_nb INT;
+    v_nb_notes INT;
+    v_somme INT;
+BEGIN
+    SELECT COUNT(*), COUNT(note), COALESCE(SUM(note), 0)
+    INTO v_nb, v_nb_notes, v_somme
+    FROM commentaire
+    WHERE fk_reservation = OLD.id_reservation;
+
+    IF v_nb > 0 THEN
+        UPDATE evenement_stats SET
+            nb_commentaires = nb_commentaires - v_nb,
+            nb_notes = nb_notes - v_nb_notes,
+            somme_notes = somme_notes - v_somme
+        WHERE fk_evenement = OLD.fk_evenement;
+
+        IF TG_OP = 'UPDATE' THEN
+            INSERT INTO evenement_stats AS s (fk_evenement, nb_commentaires, nb_notes, somme_notes)
+            VALUES (NEW.fk_evenement, v_nb, v_nb_notes, v_somme)
+            ON CONFLICT (fk_evenement) DO UPDATE SET
+                nb_commentaires = s.nb_commentaires + EXCLUDED.nb_commentaires,
+                nb_notes = s.nb_notes + EXCLUDED.nb_notes,
+                somme_notes = s.somme_notes + EXCLUDED.somme_notes;
+        END IF;
+    END IF;
+
+    IF TG_OP = 'DELETE' THEN
+        RETURN OLD;
+    END IF;
+    RETURN NEW;
+END;
+$$;
+
+CREATE TRIGGER trg_reservation_stats
+BEFORE DELETE OR UPDATE OF fk_evenement
+ON reservation
+FOR EACH ROW EXECUTE FUNCTION maj_stats_reservation();
+
+
+-----------------------------------------------------
+-- FONCTION : Réconciliation des compteurs
+-----------------------------------------------------
+-- Recalcule tous les compteurs de zéro à partir des tables reservation, bus
+-- et commentaire (compteurs de evenement et table evenement_stats).
+-- Les écritures sur ces tables sont bloquées le temps du recalcul (les lectures
+-- restent possibles). Retourne le nombre d'événements dont un compteur a dérivé.
+
+CREATE OR REPLACE FUNCTION recalculer_compteurs()
+RETURNS INT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_compteurs INT[];
+    v_stats INT[];
+BEGIN
+    LOCK TABLE reservation, bus, commentaire IN SHARE MODE;
+
+    WITH resa AS (
+        SELECT fk_evenement,
+               COUNT(*) AS inscrits,
+               COUNT(*) FILTER (WHERE bus_aller) AS bus_aller_pris,
+               COUNT(*) FILTER (WHERE bus_retour) AS bus_retour_pris,
+               COUNT(*) FILTER (WHERE sam) AS nb_sam,
+               COUNT(*) FILTER (WHERE adherent) AS nb_adh
+        FROM reservation
+        GROUP BY fk_evenement
+    ),
+    places AS (
+        SELECT fk_evenement,
+               COALESCE(SUM(nombre_places) FILTER (WHERE direction = 'aller'), 0) AS capacite_bus_aller,
+               COALESCE(SUM(nombre_places) FILTER (WHERE direction = 'retour'), 0) AS capacite_bus_retour
+        FROM bus
+        WHERE fk_evenement IS NOT NULL
+        GROUP BY fk_evenement
+    ),
+    attendu AS (
+        SELECT e.id_evenement,
+               COALESCE(r.inscrits, 0) AS inscrits,
+               COALESCE(r.bus_aller_pris, 0) AS bus_aller_pris,
+               COALESCE(r.bus_retour_pris, 0) AS bus_retour_pris,
+               COALESCE(r.nb_sam, 0) AS nb_sam,
+               COALESCE(r.nb_adh, 0) AS nb_adh,
+               COALESCE(p.capacite_bus_aller, 0) AS capacite_bus_aller,
+               COALESCE(p.capacite_bus_retour, 0) AS capacite_bus_retour
+        FROM evenement e
+        LEFT JOIN resa r ON r.fk_evenement = e.id_evenement
+        LEFT JOIN places p ON p.fk_evenement = e.id_evenement
+    ),
+    corriges AS (
+        UPDATE evenement e SET
+            inscrits = a.inscrits,
+            bus_aller_pris = a.bus_aller_pris,
+            bus_retour_pris = a.bus_retour_pris,
+            nb_sam = a.nb_sam,
+            nb_adh = a.nb_adh,
+            capacite_bus_aller = a.capacite_bus_aller,
+            capacite_bus_retour = a.capacite_bus_retour
+        FROM attendu a
+        WHERE e.id_evenement = a.id_evenement
+          AND (e.inscrits, e.bus_aller_pris, e.bus_retour_pris, e.nb_sam, e.nb_adh,
+               e.capacite_bus_aller, e.capacite_bus_retour)
+              IS DISTINCT FROM
+              (a.inscrits, a.bus_aller_pris, a.bus_retour_pris, a.nb_sam, a.nb_adh,
+               a.capacite_bus_aller, a.capacite_bus_retour)
+        RETURNING e.id_evenement
+    )
+    SELECT COALESCE(array_agg(id_evenement), '{}') INTO v_compteurs FROM corriges;
+
+    WITH avis AS (
+        SELECT r.fk_evenement,
+               COUNT(*) AS nb_commentaires,
+               COUNT(c.note) AS nb_notes,
+               COALESCE(SUM(c.note), 0) AS somme_notes
+        FROM commentaire c
+        JOIN reservation r ON r.id_reservation = c.fk_reservation
+        GROUP BY r.fk_evenement
+    ),
+    attendu AS (
+        SELECT e.id_evenement,
+               COALESCE(a.nb_commentaires, 0) AS nb_commentaires,
+               COALESCE(a.nb_notes, 0) AS nb_notes,
+               COALESCE(a.somme_notes, 0) AS somme_notes
+        FROM evenement e
+        LEFT JOIN avis a ON a.fk_evenement = e.id_evenement
+        LEFT JOIN evenement_stats s ON s.fk_evenement = e.id_evenement
+        WHERE (COALESCE(s.nb_commentaires, 0), COALESCE(s.nb_notes, 0), COALESCE(s.somme_notes, 0))
+              IS DISTINCT FROM
+              (COALESCE(a.nb_commentaires, 0), COALESCE(a.nb_notes, 0), COALESCE(a.somme_notes, 0))
+    ),
+    corriges AS (
+        INSERT INTO evenement_stats AS s (fk_evenement, nb_commentaires, nb_notes, somme_notes)
+        SELECT id_evenement, nb_commentaires, nb_notes, somme_notes FROM attendu
+        ON CONFLICT (fk_evenement) DO UPDATE SET
+            nb_commentaires = EXCLUDED.nb_commentaires,
+            nb_notes = EXCLUDED.nb_notes,
+            somme_notes = EXCLUDED.somme_notes
+        RETURNING s.fk_evenement
+    )
+    SELECT COALESCE(array_agg(fk_evenement), '{}') INTO v_stats FROM corriges;
+
+    RETURN (SELECT COUNT(DISTINCT id) FROM unnest(v_compteurs || v_stats) AS id);
+END;
+$$;
+
+
+-----------------------------------------------------
+-- FONCTION : Réservation atomique (shotgun)
+-----------------------------------------------------
+-- Un seul aller-retour client/serveur par réservation :
+--   1. verrouille la ligne de l'événement (les réservations concurrentes
+--      d'un même événement passent l'une après l'autre) ;
+--   2. vérifie doublon, capacité du lieu et capacité des bus demandés ;
+--   3. insère la réservation.
+-- Les capacités sont lues sur les compteurs de la ligne verrouillée : aucune
+-- survente n'est possible entre la vérification et l'insertion.
+-- statut : 'ok', 'introuvable', 'deja_reserve', 'complet',
+--          'bus_aller_complet', 'bus_retour_complet'
+
+CREATE OR REPLACE FUNCTION reserver_place(
+    p_utilisateur INT,
+    p_evenement INT,
+    p_bus_aller BOOLEAN,
+    p_bus_retour BOOLEAN,
+    p_adherent BOOLEAN,
+    p_sam BOOLEAN,
+    p_boisson BOOLEAN
+)
+RETURNS TABLE (statut TEXT, id_reservation INT, date_reservation TIMESTAMP)
+LANGUAGE plpgsql AS $$
+#variable_conflict use_column
+DECLARE
+    v_evt evenement%ROWTYPE;
+BEGIN
+    -- Le verrou rend les compteurs de la ligne fiables jusqu'à la fin de la transaction
+    SELECT * INTO v_evt
+    FROM evenement e
+    WHERE e.id_evenement = p_evenement
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'introuvable'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM reservation r
+        WHERE r.fk_utilisateur = p_utilisateur AND r.fk_evenement = p_evenement
+    ) THEN
+        RETURN QUERY SELECT 'deja_reserve'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF v_evt.inscrits >= v_evt.capacite THEN
+        RETURN QUERY SELECT 'complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF p_bus_aller AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller THEN
+        RETURN QUERY SELECT 'bus_aller_complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF p_bus_retour AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour THEN
+        RETURN QUERY SELECT 'bus_retour_complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO reservation AS r (
+        fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+    ) VALUES (
+        p_utilisateur, p_evenement, p_bus_aller, p_bus_retour, p_adherent, p_sam, p_boisson
+    )
+    ON CONFLICT ON CONSTRAINT reservation_unique_user_event DO NOTHING
+    RETURNING 'ok'::TEXT, r.id_reservation, r.date_reservation;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'deja_reserve'::TEXT, NULL::INT, NULL::TIMESTAMP;
+    END IF;
+END;
+$$;
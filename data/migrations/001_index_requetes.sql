@@ -0,0 +1,61 @@
+-----------------------------------------------------
+-- MIGRATION 001 : Index des requêtes fréquentes
+-----------------------------------------------------
+-- init_db.sql ne déclare que les clés primaires et les contraintes d'unicité
+-- (dont utilisateur.email et reservation (fk_utilisateur, fk_evenement), qui
+-- servent déjà la connexion et la recherche des réservations d'un utilisateur).
+-- Chaque index ci-dessous sert une requête des DAO.
+--
+-- Pas d'index partiels sur reservation.bus_aller / bus_retour / sam / adherent :
+-- ces comptages sont lus sur les compteurs de la table evenement (triggers),
+-- de tels index ne feraient que ralentir les réservations.
+
+-- Réservations / inscrits d'un événement, triés du plus récent au plus ancien
+-- (ReservationDao.find_by_event, lister_inscrits, iter_inscrits).
+-- Sert aussi la suppression en cascade des réservations d'un événement.
+CREATE INDEX IF NOT EXISTS reservation_evenement_date_idx
+    ON reservation (fk_evenement, date_reservation DESC, id_reservation DESC);
+
+-- Commentaire d'une réservation (CommentaireDao.find_by_reservation_id,
+-- jointure LATERAL de la liste des inscrits, trigger maj_stats_reservation)
+CREATE INDEX IF NOT EXISTS commentaire_reservation_idx
+    ON commentaire (fk_reservation);
+
+-- Suppression en cascade des commentaires d'un utilisateur
+CREATE INDEX IF NOT EXISTS commentaire_utilisateur_idx
+    ON commentaire (fk_utilisateur);
+
+-- Bus d'un événement, par sens (CreneauBusDao.find_by_event, count_for_event)
+CREATE INDEX IF NOT EXISTS bus_evenement_direction_idx
+    ON bus (fk_evenement, direction);
+
+-- Événements ouverts à la réservation, par date
+-- (ConsultationEvenementDao.lister_disponibles / lister_avec_places_restantes)
+CREATE INDEX IF NOT EXISTS evenement_disponible_date_idx
+    ON evenement (date_evenement, id_evenement)
+    WHERE statut = 'disponible en ligne';
+
+-- Recherche par statut (ConsultationEvenementDao.rechercher)
+CREATE INDEX IF NOT EXISTS evenement_statut_date_idx
+    ON evenement (statut, date_evenement, id_evenement);
+
+-- Liste des administrateurs (AdministrateurDao.find_all / find_page) :
+-- quelques lignes parmi tous les utilisateurs
+CREATE INDEX IF NOT EXISTS utilisateur_administrateur_idx
+    ON utilisateur (id_utilisateur)
+    WHERE administrateur;
+
+-- Recherche « ville ILIKE '%x%' » : index trigramme (extension pg_trgm).
+-- L'extension est créée dans le schéma public, partagé par tous les schémas
+-- de l'application. Sans pg_trgm sur le serveur, l'index est simplement omis.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+        CREATE INDEX IF NOT EXISTS evenement_ville_trgm_idx
+            ON evenement USING gin (ville public.gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm indisponible : index evenement_ville_trgm_idx non créé';
+    END IF;
+END;
+$$;
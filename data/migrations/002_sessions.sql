@@ -0,0 +1,23 @@
+-----------------------------------------------------
+-- MIGRATION 002 : Sessions utilisateur
+-----------------------------------------------------
+-- Stockage partagé (optionnel, SESSION_PERSISTANCE=1) des sessions ouvertes
+-- par service/session_service.py : une session survit au redémarrage du
+-- processus et peut être reprise par un autre processus.
+-- Seule l'empreinte SHA-256 du jeton est stockée : une fuite de la table ne
+-- donne pas de jeton utilisable.
+
+CREATE TABLE IF NOT EXISTS session_utilisateur (
+    jeton_hash CHAR(64) PRIMARY KEY,
+    fk_utilisateur INT NOT NULL REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
+    date_creation TIMESTAMP NOT NULL DEFAULT NOW(),
+    expire_le TIMESTAMP NOT NULL
+);
+
+-- Fermeture de toutes les sessions d'un utilisateur
+CREATE INDEX IF NOT EXISTS session_utilisateur_utilisateur_idx
+    ON session_utilisateur (fk_utilisateur);
+
+-- Purge des sessions expirées
+CREATE INDEX IF NOT EXISTS session_utilisateur_expire_idx
+    ON session_utilisateur (expire_le);
@@ -0,0 +1,35 @@
+-----------------------------------------------------
+-- MIGRATION 003 : Recherche plein texte des événements
+-----------------------------------------------------
+-- ConsultationEvenementDao.rechercher_texte : recherche libre sur le titre,
+-- la ville, la catégorie et la description, triée par pertinence.
+
+-- Document de recherche (configuration 'french' : racinisation, mots vides),
+-- pondéré : titre (A) > ville, catégorie (B) > description (C).
+-- Colonne générée : tenue à jour par PostgreSQL à chaque écriture.
+ALTER TABLE evenement ADD COLUMN IF NOT EXISTS recherche tsvector
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('french', coalesce(titre, '')), 'A') ||
+        setweight(to_tsvector('french', coalesce(ville, '')), 'B') ||
+        setweight(to_tsvector('french', coalesce(categorie, '')), 'B') ||
+        setweight(to_tsvector('french', coalesce(description, '')), 'C')
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS evenement_recherche_idx
+    ON evenement USING gin (recherche);
+
+-- Fautes de frappe (« festval », « toulouze ») : similarité trigramme sur le
+-- titre et la ville (extension pg_trgm, cf. migration 001). L'expression doit
+-- rester identique à celle de ConsultationEvenementDao.SQL_TEXTE_FLOU.
+-- Sans pg_trgm, la recherche reste plein texte uniquement.
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm') THEN
+        CREATE EXTENSION IF NOT EXISTS pg_trgm WITH SCHEMA public;
+        CREATE INDEX IF NOT EXISTS evenement_titre_ville_trgm_idx
+            ON evenement USING gin ((titre || ' ' || coalesce(ville, '')) public.gin_trgm_ops);
+    ELSE
+        RAISE NOTICE 'pg_trgm indisponible : index evenement_titre_ville_trgm_idx non créé';
+    END IF;
+END;
+$$;
@@ -0,0 +1,173 @@
+-----------------------------------------------------
+-- MIGRATION 004 : Liste d'attente
+-----------------------------------------------------
+-- Files d'attente FIFO (ordre d'arrivée = id_attente) :
+--   direction NULL              une place à l'événement, avec les options voulues ;
+--   direction 'aller'/'retour'  une place dans le bus de ce sens, pour un inscrit.
+-- Quand une place se libère (réservation supprimée, bus abandonné, bus ajouté
+-- ou agrandi, capacité de l'événement augmentée), les premiers de la file sont
+-- servis par les triggers ci-dessous, dans la transaction de l'écriture :
+-- l'entrée est retirée, la réservation créée (ou le bus ajouté) et l'e-mail
+-- déposé dans email_outbox en même temps, ou pas du tout.
+
+CREATE TABLE IF NOT EXISTS liste_attente (
+    id_attente SERIAL PRIMARY KEY,
+    fk_utilisateur INT NOT NULL REFERENCES utilisateur(id_utilisateur) ON DELETE CASCADE,
+    fk_evenement INT NOT NULL REFERENCES evenement(id_evenement) ON DELETE CASCADE,
+    direction VARCHAR(10) CHECK (direction IN ('aller', 'retour')),
+    bus_aller BOOLEAN NOT NULL DEFAULT FALSE,
+    bus_retour BOOLEAN NOT NULL DEFAULT FALSE,
+    adherent BOOLEAN NOT NULL DEFAULT FALSE,
+    sam BOOLEAN NOT NULL DEFAULT FALSE,
+    boisson BOOLEAN NOT NULL DEFAULT FALSE,
+    date_demande TIMESTAMP NOT NULL DEFAULT NOW()
+);
+
+-- Une seule demande par utilisateur et par file
+CREATE UNIQUE INDEX IF NOT EXISTS liste_attente_unique_idx
+    ON liste_attente (fk_utilisateur, fk_evenement, COALESCE(direction, ''));
+
+-- Tête de chaque file (promotion, position)
+CREATE INDEX IF NOT EXISTS liste_attente_file_idx
+    ON liste_attente (fk_evenement, direction, id_attente);
+
+
+-- Sert les files d'un événement tant que des places sont libres.
+-- Une demande de place dont le bus voulu est complet reste en tête de sa file
+-- sans bloquer les suivantes. Retourne les demandes servies.
+CREATE OR REPLACE FUNCTION promouvoir_liste_attente(p_evenement INT)
+RETURNS TABLE (id_utilisateur INT, id_reservation INT, direction TEXT)
+LANGUAGE plpgsql AS $$
+#variable_conflict use_column
+DECLARE
+    v_evt evenement%ROWTYPE;
+    v_attente liste_attente%ROWTYPE;
+    v_resa INT;
+    v_sujet TEXT;
+    v_contenu TEXT;
+BEGIN
+    -- Même verrou que reserver_place : compteurs fiables, pas de réservation concurrente
+    SELECT * INTO v_evt FROM evenement e WHERE e.id_evenement = p_evenement FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    FOR v_attente IN
+        SELECT * FROM liste_attente a WHERE a.fk_evenement = p_evenement ORDER BY a.id_attente
+    LOOP
+        -- Compteurs à jour des promotions précédentes (triggers de reservation)
+        SELECT * INTO v_evt FROM evenement e WHERE e.id_evenement = p_evenement;
+        v_resa := NULL;
+
+        IF v_attente.direction IS NULL THEN
+            CONTINUE WHEN v_evt.inscrits >= v_evt.capacite;
+            CONTINUE WHEN v_attente.bus_aller AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller;
+            CONTINUE WHEN v_attente.bus_retour AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour;
+
+            -- (utilisateur absent : supprimé dans cette même transaction)
+            INSERT INTO reservation AS r (
+                fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+            )
+            SELECT u.id_utilisateur, p_evenement, v_attente.bus_aller, v_attente.bus_retour,
+                   v_attente.adherent, v_attente.sam, v_attente.boisson
+            FROM utilisateur u
+            WHERE u.id_utilisateur = v_attente.fk_utilisateur
+            ON CONFLICT ON CONSTRAINT reservation_unique_user_event DO NOTHING
+            RETURNING r.id_reservation INTO v_resa;
+
+            v_sujet := 'Place libérée : réservation confirmée — BDE Ensai';
+            v_contenu := format(
+                'Une place s''est libérée pour l''événement « %s » du %s : '
+                || 'vous étiez sur la liste d''attente, votre réservation est confirmée.',
+                v_evt.titre, to_char(v_evt.date_evenement, 'DD/MM/YYYY')
+            );
+        ELSE
+            CONTINUE WHEN (v_attente.direction = 'aller' AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller)
+                       OR (v_attente.direction = 'retour' AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour);
+
+            UPDATE reservation r
+            SET bus_aller = COALESCE(r.bus_aller, FALSE) OR v_attente.direction = 'aller',
+                bus_retour = COALESCE(r.bus_retour, FALSE) OR v_attente.direction = 'retour'
+            WHERE r.fk_utilisateur = v_attente.fk_utilisateur
+              AND r.fk_evenement = p_evenement
+              AND NOT COALESCE(CASE WHEN v_attente.direction = 'aller' THEN r.bus_aller ELSE r.bus_retour END, FALSE)
+            RETURNING r.id_reservation INTO v_resa;
+
+            v_sujet := 'Place libérée dans le bus — BDE Ensai';
+            v_contenu := format(
+                'Une place s''est libérée dans le bus %s de l''événement « %s » du %s : '
+                || 'elle a été ajoutée à votre réservation.',
+                v_attente.direction, v_evt.titre, to_char(v_evt.date_evenement, 'DD/MM/YYYY')
+            );
+        END IF;
+
+        -- Servie, ou devenue sans objet (déjà inscrit, réservation supprimée, bus déjà pris)
+        DELETE FROM liste_attente a WHERE a.id_attente = v_attente.id_attente;
+
+        IF v_resa IS NOT NULL THEN
+            INSERT INTO email_outbox (destinataire, sujet, contenu)
+            SELECT u.email, v_sujet,
+                   format(E'Bonjour %s %s,\n\n%s\n\nSi vous ne pouvez plus venir, pensez à annuler '
+                          || E'pour libérer la place.\n\n— L''équipe du BDE Ensai',
+                          u.prenom, u.nom, v_contenu)
+            FROM utilisateur u
+            WHERE u.id_utilisateur = v_attente.fk_utilisateur;
+
+            RETURN QUERY SELECT v_attente.fk_utilisateur, v_resa, v_attente.direction::TEXT;
+        END IF;
+    END LOOP;
+END;
+$$;
+
+
+-- Déclencheurs : s'exécutent après les triggers de compteurs (ordre alphabétique)
+CREATE OR REPLACE FUNCTION liberation_place_reservation()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM promouvoir_liste_attente(OLD.fk_evenement);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_reservation_liste_attente ON reservation;
+CREATE TRIGGER trg_reservation_liste_attente
+AFTER DELETE ON reservation
+FOR EACH ROW EXECUTE FUNCTION liberation_place_reservation();
+
+DROP TRIGGER IF EXISTS trg_reservation_liste_attente_bus ON reservation;
+CREATE TRIGGER trg_reservation_liste_attente_bus
+AFTER UPDATE OF bus_aller, bus_retour ON reservation
+FOR EACH ROW
+WHEN ((OLD.bus_aller AND NOT NEW.bus_aller) OR (OLD.bus_retour AND NOT NEW.bus_retour))
+EXECUTE FUNCTION liberation_place_reservation();
+
+CREATE OR REPLACE FUNCTION liberation_place_bus()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM promouvoir_liste_attente(NEW.fk_evenement);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_bus_liste_attente ON bus;
+CREATE TRIGGER trg_bus_liste_attente
+AFTER INSERT OR UPDATE OF nombre_places ON bus
+FOR EACH ROW EXECUTE FUNCTION liberation_place_bus();
+
+CREATE OR REPLACE FUNCTION liberation_place_evenement()
+RETURNS TRIGGER
+LANGUAGE plpgsql AS $$
+BEGIN
+    PERFORM promouvoir_liste_attente(NEW.id_evenement);
+    RETURN NULL;
+END;
+$$;
+
+DROP TRIGGER IF EXISTS trg_evenement_liste_attente ON evenement;
+CREATE TRIGGER trg_evenement_liste_attente
+AFTER UPDATE OF capacite ON evenement
+FOR EACH ROW
+WHEN (NEW.capacite > OLD.capacite)
+EXECUTE FUNCTION liberation_place_evenement();
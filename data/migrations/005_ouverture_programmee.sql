@@ -0,0 +1,182 @@
+-----------------------------------------------------
+-- MIGRATION 005 : Ouverture programmée des réservations
+-----------------------------------------------------
+-- evenement.ouverture : date et heure d'ouverture du shotgun. L'événement peut
+-- être mis en ligne (visible) avant ; reserver_place refuse ('pas_ouvert')
+-- toute réservation antérieure, et la liste d'attente n'est servie qu'à partir
+-- de cette heure. NULL : réservations ouvertes dès la mise en ligne.
+-- La file d'admission (service/admission_service.py) lisse ensuite la ruée.
+-- TIMESTAMPTZ : un instant, le même pour la base (NOW()) et pour la file
+-- d'admission, quels que soient les fuseaux du serveur et des processus.
+
+ALTER TABLE evenement ADD COLUMN IF NOT EXISTS ouverture TIMESTAMPTZ;
+
+-- reserver_place (init_db.sql) + statut 'pas_ouvert'
+CREATE OR REPLACE FUNCTION reserver_place(
+    p_utilisateur INT,
+    p_evenement INT,
+    p_bus_aller BOOLEAN,
+    p_bus_retour BOOLEAN,
+    p_adherent BOOLEAN,
+    p_sam BOOLEAN,
+    p_boisson BOOLEAN
+)
+RETURNS TABLE (statut TEXT, id_reservation INT, date_reservation TIMESTAMP)
+LANGUAGE plpgsql AS $$
+#variable_conflict use_column
+DECLARE
+    v_evt evenement%ROWTYPE;
+BEGIN
+    -- Ouverture programmée : refus avant l'heure, sans attendre le verrou
+    -- (les essais anticipés ne font pas la queue derrière les autres)
+    IF EXISTS (
+        SELECT 1 FROM evenement e
+        WHERE e.id_evenement = p_evenement AND e.ouverture > NOW()
+    ) THEN
+        RETURN QUERY SELECT 'pas_ouvert'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    -- Le verrou rend les compteurs de la ligne fiables jusqu'à la fin de la transaction
+    SELECT * INTO v_evt
+    FROM evenement e
+    WHERE e.id_evenement = p_evenement
+    FOR UPDATE;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'introuvable'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM reservation r
+        WHERE r.fk_utilisateur = p_utilisateur AND r.fk_evenement = p_evenement
+    ) THEN
+        RETURN QUERY SELECT 'deja_reserve'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF v_evt.inscrits >= v_evt.capacite THEN
+        RETURN QUERY SELECT 'complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF p_bus_aller AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller THEN
+        RETURN QUERY SELECT 'bus_aller_complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    IF p_bus_retour AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour THEN
+        RETURN QUERY SELECT 'bus_retour_complet'::TEXT, NULL::INT, NULL::TIMESTAMP;
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    INSERT INTO reservation AS r (
+        fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+    ) VALUES (
+        p_utilisateur, p_evenement, p_bus_aller, p_bus_retour, p_adherent, p_sam, p_boisson
+    )
+    ON CONFLICT ON CONSTRAINT reservation_unique_user_event DO NOTHING
+    RETURNING 'ok'::TEXT, r.id_reservation, r.date_reservation;
+
+    IF NOT FOUND THEN
+        RETURN QUERY SELECT 'deja_reserve'::TEXT, NULL::INT, NULL::TIMESTAMP;
+    END IF;
+END;
+$$;
+
+
+-- promouvoir_liste_attente (migration 004) : rien avant l'ouverture. Les
+-- triggers (bus ajouté, capacité augmentée...) ne promeuvent donc personne
+-- avant l'heure ; les demandes restées en file sont servies au premier
+-- changement qui suit l'ouverture.
+CREATE OR REPLACE FUNCTION promouvoir_liste_attente(p_evenement INT)
+RETURNS TABLE (id_utilisateur INT, id_reservation INT, direction TEXT)
+LANGUAGE plpgsql AS $$
+#variable_conflict use_column
+DECLARE
+    v_evt evenement%ROWTYPE;
+    v_attente liste_attente%ROWTYPE;
+    v_resa INT;
+    v_sujet TEXT;
+    v_contenu TEXT;
+BEGIN
+    -- Même verrou que reserver_place : compteurs fiables, pas de réservation concurrente
+    SELECT * INTO v_evt FROM evenement e WHERE e.id_evenement = p_evenement FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN;
+    END IF;
+
+    -- Ouverture programmée : personne n'est servi avant l'heure, sinon la liste
+    -- d'attente contournerait la file d'admission (places toutes libres)
+    IF v_evt.ouverture > NOW() THEN
+        RETURN;
+    END IF;
+
+    FOR v_attente IN
+        SELECT * FROM liste_attente a WHERE a.fk_evenement = p_evenement ORDER BY a.id_attente
+    LOOP
+        -- Compteurs à jour des promotions précédentes (triggers de reservation)
+        SELECT * INTO v_evt FROM evenement e WHERE e.id_evenement = p_evenement;
+        v_resa := NULL;
+
+        IF v_attente.direction IS NULL THEN
+            CONTINUE WHEN v_evt.inscrits >= v_evt.capacite;
+            CONTINUE WHEN v_attente.bus_aller AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller;
+            CONTINUE WHEN v_attente.bus_retour AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour;
+
+            -- (utilisateur absent : supprimé dans cette même transaction)
+            INSERT INTO reservation AS r (
+                fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson
+            )
+            SELECT u.id_utilisateur, p_evenement, v_attente.bus_aller, v_attente.bus_retour,
+                   v_attente.adherent, v_attente.sam, v_attente.boisson
+            FROM utilisateur u
+            WHERE u.id_utilisateur = v_attente.fk_utilisateur
+            ON CONFLICT ON CONSTRAINT reservation_unique_user_event DO NOTHING
+            RETURNING r.id_reservation INTO v_resa;
+
+            v_sujet := 'Place libérée : réservation confirmée — BDE Ensai';
+            v_contenu := format(
+                'Une place s''est libérée pour l''événement « %s » du %s : '
+                || 'vous étiez sur la liste d''attente, votre réservation est confirmée.',
+                v_evt.titre, to_char(v_evt.date_evenement, 'DD/MM/YYYY')
+            );
+        ELSE
+            CONTINUE WHEN (v_attente.direction = 'aller' AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller)
+                       OR (v_attente.direction = 'retour' AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour);
+
+            UPDATE reservation r
+            SET bus_aller = COALESCE(r.bus_aller, FALSE) OR v_attente.direction = 'aller',
+                bus_retour = COALESCE(r.bus_retour, FALSE) OR v_attente.direction = 'retour'
+            WHERE r.fk_utilisateur = v_attente.fk_utilisateur
+              AND r.fk_evenement = p_evenement
+              AND NOT COALESCE(CASE WHEN v_attente.direction = 'aller' THEN r.bus_aller ELSE r.bus_retour END, FALSE)
+            RETURNING r.id_reservation INTO v_resa;
+
+            v_sujet := 'Place libérée dans le bus — BDE Ensai';
+            v_contenu := format(
+                'Une place s''est libérée dans le bus %s de l''événement « %s » du %s : '
+                || 'elle a été ajoutée à votre réservation.',
+                v_attente.direction, v_evt.titre, to_char(v_evt.date_evenement, 'DD/MM/YYYY')
+            );
+        END IF;
+
+        -- Servie, ou devenue sans objet (déjà inscrit, réservation supprimée, bus déjà pris)
+        DELETE FROM liste_attente a WHERE a.id_attente = v_attente.id_attente;
+
+        IF v_resa IS NOT NULL THEN
+            INSERT INTO email_outbox (destinataire, sujet, contenu)
+            SELECT u.email, v_sujet,
+                   format(E'Bonjour %s %s,\n\n%s\n\nSi vous ne pouvez plus venir, pensez à annuler '
+                          || E'pour libérer la place.\n\n— L''équipe du BDE Ensai',
+                          u.prenom, u.nom, v_contenu)
+            FROM utilisateur u
+            WHERE u.id_utilisateur = v_attente.fk_utilisateur;
+
+            RETURN QUERY SELECT v_attente.fk_utilisateur, v_resa, v_attente.direction::TEXT;
+        END IF;
+    END LOOP;
+END;
+$$;
@@ -0,0 +1,61 @@
+-----------------------------------------------------
+-- MIGRATION 006 : Inscription en liste d'attente réservée aux événements complets
+-----------------------------------------------------
+-- Une demande de place n'entre en file que si reserver_place la refuserait
+-- faute de place (lieu, ou bus demandé), vérifié sous le même verrou. Elle
+-- n'est pas servie dans la foulée : une place libre se réserve par
+-- reserver_place, derrière la file d'admission et la limite de tentatives
+-- (ouverture programmée). La file n'est servie que par les triggers de la
+-- migration 004, quand une place se libère.
+-- Les demandes de bus (direction 'aller' / 'retour') portent sur une
+-- réservation existante : elles restent inscrites puis servies aussitôt.
+
+CREATE OR REPLACE FUNCTION inscrire_liste_attente(
+    p_utilisateur INT,
+    p_evenement INT,
+    p_bus_aller BOOLEAN,
+    p_bus_retour BOOLEAN,
+    p_adherent BOOLEAN,
+    p_sam BOOLEAN,
+    p_boisson BOOLEAN
+)
+RETURNS TEXT
+LANGUAGE plpgsql AS $$
+DECLARE
+    v_evt evenement%ROWTYPE;
+BEGIN
+    -- Même verrou que reserver_place : la place vue libre ne peut pas être prise entre-temps
+    SELECT * INTO v_evt FROM evenement e WHERE e.id_evenement = p_evenement FOR UPDATE;
+    IF NOT FOUND THEN
+        RETURN 'introuvable';
+    END IF;
+
+    IF v_evt.ouverture > NOW() THEN
+        RETURN 'pas_ouvert';
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM reservation r
+        WHERE r.fk_utilisateur = p_utilisateur AND r.fk_evenement = p_evenement
+    ) THEN
+        RETURN 'deja_reserve';
+    END IF;
+
+    IF v_evt.inscrits < v_evt.capacite
+       AND NOT (p_bus_aller AND v_evt.bus_aller_pris >= v_evt.capacite_bus_aller)
+       AND NOT (p_bus_retour AND v_evt.bus_retour_pris >= v_evt.capacite_bus_retour) THEN
+        RETURN 'places_libres';
+    END IF;
+
+    INSERT INTO liste_attente (
+        fk_utilisateur, fk_evenement, direction,
+        bus_aller, bus_retour, adherent, sam, boisson
+    ) VALUES (
+        p_utilisateur, p_evenement, NULL,
+        p_bus_aller, p_bus_retour, p_adherent, p_sam, p_boisson
+    )
+    ON CONFLICT (fk_utilisateur, fk_evenement, COALESCE(direction, '')) DO NOTHING;
+
+    RETURN 'en_attente';
+END;
+$$;
@@ -0,0 +1,98 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+# (y compris dans les workers uvicorn, qui ré-importent ce module)
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import logging
+from contextlib import asynccontextmanager
+
+import dotenv
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from api.dependances import cle_signature
+from api.routes import auth, evenements, reservations, stats
+from dao.db_connection import DBConnection
+from dao_async.db_connection import AsyncDBConnection
+from service.admission_service import AdmissionService
+from service.email_service import DispatcheurEmails
+from utils.securite import hacheur
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Ouvre le pool de connexions au démarrage du worker plutôt qu'à la première requête.
+    Le pool est un singleton du processus : il n'est pas fermé ici, ses connexions
+    sont libérées à l'arrêt du worker. Le pool asynchrone (dao_async, lectures de
+    consultation) suit le même schéma ; lié à la boucle d'événements du worker,
+    il est fermé avec elle.
+
+    Chaque worker fait aussi tourner un dispatcher d'e-mails : les lots sont
+    réservés avec SKIP LOCKED, les workers se partagent la file sans doublon.
+    Les processus de hachage bcrypt (utils.securite) sont arrêtés avec le worker.
+    Le worker refuse de démarrer sans ADMISSION_SECRET_KEY (file d'admission).
+    """
+    AdmissionService.verifier_configuration()
+    await run_in_threadpool(DBConnection)
+    base_async = AsyncDBConnection()
+    await base_async.fermer()
+    base_async.definir_schema(DBConnection().pool.schema)
+    await base_async.ouvrir()
+    dispatcheur = DispatcheurEmails() if DispatcheurEmails.active() else None
+    if dispatcheur:
+        dispatcheur.demarrer()
+    yield
+    if dispatcheur:
+        await run_in_threadpool(dispatcheur.arreter, 10)
+    await run_in_threadpool(hacheur().fermer)
+    await base_async.fermer()
+
+
+def creer_app() -> FastAPI:
+    """
+    Application HTTP de réservation (shotgun) au-dessus des services existants.
+    Les handlers sont asynchrones. Les lectures de consultation (liste, recherche,
+    disponibilités) passent par les DAO asynchrones ; les autres appels aux
+    services (bloquants) passent par le pool de threads de Starlette, la boucle
+    d'événements reste libre.
+    """
+    app = FastAPI(
+        title="Shotgun ENSAI",
+        description="API de consultation et de réservation des événements du BDE.",
+        lifespan=lifespan,
+    )
+    app.include_router(auth.router)
+    app.include_router(evenements.router)
+    app.include_router(reservations.router)
+    app.include_router(stats.router)
+    return app
+
+
+app = creer_app()
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    dotenv.load_dotenv(override=True)
+    # Clé de signature fixée avant le lancement : tous les workers la partagent
+    cle_signature()
+    AdmissionService.verifier_configuration()
+
+    workers = int(os.getenv("API_WORKERS", str(os.cpu_count() or 1)))
+    if workers > 1:
+        logging.getLogger(__name__).warning(
+            "%d workers : chacun tient sa propre file d'admission. Pour une ouverture "
+            "programmée, servez POST /evenements/{id}/admission par une instance à "
+            "un seul worker (API_WORKERS=1).", workers,
+        )
+
+    uvicorn.run(
+        "api.app:app",
+        host=os.getenv("API_HOST", "0.0.0.0"),
+        port=int(os.getenv("API_PORT", "8000")),
+        workers=workers,
+    )
@@ -0,0 +1,161 @@
+# src/api/dependances.py
+"""
+Dépendances FastAPI partagées par les routes : authentification par jeton
+et pagination.
+
+Les jetons sont sans état (signés HMAC-SHA256) : valider une requête ne coûte
+ni aller-retour en base ni vérification bcrypt, et plusieurs workers uvicorn
+les acceptent indifféremment tant qu'ils partagent API_SECRET_KEY.
+"""
+import base64
+import hashlib
+import hmac
+import json
+import os
+import secrets
+import time
+from dataclasses import dataclass
+from typing import List, Optional, TypeVar
+
+from fastapi import Depends, HTTPException, Query, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+
+from model.api_models import Page
+from model.pagination_models import PageCurseur
+
+T = TypeVar("T")
+
+
+# ---------- Jetons ----------
+
+def cle_signature() -> bytes:
+    """
+    Clé de signature des jetons (API_SECRET_KEY).
+    À défaut, une clé aléatoire est tirée et placée dans l'environnement :
+    les workers lancés ensuite par uvicorn en héritent.
+    """
+    cle = os.getenv("API_SECRET_KEY")
+    if not cle:
+        cle = secrets.token_urlsafe(32)
+        os.environ["API_SECRET_KEY"] = cle
+    return cle.encode("utf-8")
+
+
+def _b64(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _unb64(texte: str) -> bytes:
+    return base64.urlsafe_b64decode(texte + "=" * (-len(texte) % 4))
+
+
+def duree_jeton() -> int:
+    """Durée de validité d'un jeton, en secondes (API_TOKEN_TTL, défaut 1h)."""
+    return int(os.getenv("API_TOKEN_TTL", "3600"))
+
+
+def creer_jeton(id_utilisateur: int, administrateur: bool) -> str:
+    """Signe un jeton portant l'identifiant, le rôle et la date d'expiration."""
+    corps = _b64(json.dumps(
+        {"sub": id_utilisateur, "adm": bool(administrateur), "exp": int(time.time()) + duree_jeton()},
+        separators=(",", ":"),
+    ).encode("utf-8"))
+    signature = _b64(hmac.new(cle_signature(), corps.encode("ascii"), hashlib.sha256).digest())
+    return f"{corps}.{signature}"
+
+
+@dataclass(frozen=True)
+class UtilisateurJeton:
+    """Identité portée par un jeton valide."""
+    id_utilisateur: int
+    administrateur: bool
+
+
+def lire_jeton(jeton: str) -> Optional[UtilisateurJeton]:
+    """Retourne l'identité du jeton, ou None s'il est invalide ou expiré."""
+    try:
+        corps, signature = jeton.split(".")
+        attendue = hmac.new(cle_signature(), corps.encode("ascii"), hashlib.sha256).digest()
+        if not hmac.compare_digest(attendue, _unb64(signature)):
+            return None
+        payload = json.loads(_unb64(corps))
+    except (ValueError, TypeError):
+        return None
+
+    if payload.get("exp", 0) < time.time():
+        return None
+    return UtilisateurJeton(id_utilisateur=int(payload["sub"]), administrateur=bool(payload["adm"]))
+
+
+_bearer = HTTPBearer(auto_error=False)
+
+
+def utilisateur_courant(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_bearer),
+) -> UtilisateurJeton:
+    """Dépendance : exige un jeton valide (401 sinon)."""
+    utilisateur = lire_jeton(credentials.credentials) if credentials else None
+    if utilisateur is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Authentification requise.",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return utilisateur
+
+
+def administrateur_courant(utilisateur: UtilisateurJeton = Depends(utilisateur_courant)) -> UtilisateurJeton:
+    """Dépendance : exige le jeton d'un administrateur (401 / 403 sinon)."""
+    if not utilisateur.administrateur:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Accès refusé.")
+    return utilisateur
+
+
+def verifier_proprietaire(utilisateur: UtilisateurJeton, id_proprietaire: int) -> None:
+    """403 si l'utilisateur n'est ni le propriétaire de la ressource ni administrateur."""
+    if not utilisateur.administrateur and utilisateur.id_utilisateur != id_proprietaire:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Accès refusé.")
+
+
+# ---------- Pagination ----------
+
+class Pagination:
+    """Paramètres ?limit=&offset= communs à toutes les listes."""
+
+    def __init__(
+        self,
+        limit: int = Query(20, ge=1, le=100, description="Taille de la page"),
+        offset: int = Query(0, ge=0, description="Position du premier élément"),
+    ):
+        self.limit = limit
+        self.offset = offset
+
+    def page(self, lignes: List[T]) -> Page[T]:
+        """
+        Construit la page à partir de `limit + 1` lignes lues à partir de `offset` :
+        la ligne en trop indique seulement qu'il existe une page suivante.
+        """
+        suivante = len(lignes) > self.limit
+        return Page(
+            items=lignes[: self.limit],
+            limit=self.limit,
+            offset=self.offset,
+            offset_suivant=self.offset + self.limit if suivante else None,
+        )
+
+    def page_curseur(self, page: PageCurseur, premiere: bool) -> Page:
+        """
+        Convertit une page lue par curseur. La première page indique aussi
+        offset_suivant, pour les clients qui paginent encore par offset.
+        """
+        return Page(
+            items=page.items,
+            limit=self.limit,
+            offset=self.offset,
+            offset_suivant=self.limit if premiere and page.curseur_suivant else None,
+            curseur_suivant=page.curseur_suivant,
+        )
+
+    def decouper(self, lignes: List[T]) -> Page[T]:
+        """Construit la page à partir d'une liste complète (services non paginés)."""
+        return self.page(lignes[self.offset: self.offset + self.limit + 1])
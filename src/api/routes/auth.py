@@ -0,0 +1,47 @@
+# src/api/routes/auth.py
+from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
+
+from api.dependances import UtilisateurJeton, creer_jeton, duree_jeton, utilisateur_courant
+from model.api_models import ConnexionIn, JetonOut
+from model.participant_models import ParticipantModelIn, ParticipantModelOut
+from model.utilisateur_models import UtilisateurModelOut
+from service.participant_service import ParticipantService
+from service.utilisateur_service import UtilisateurService
+
+router = APIRouter(prefix="/auth", tags=["auth"])
+
+
+@router.post("/connexion", response_model=JetonOut)
+async def connexion(identifiants: ConnexionIn) -> JetonOut:
+    """Vérifie email / mot de passe et délivre un jeton porteur."""
+    try:
+        utilisateur = await run_in_threadpool(
+            UtilisateurService().authenticate_user, identifiants.email, identifiants.mot_de_passe
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail=str(e))
+
+    return JetonOut(
+        access_token=creer_jeton(utilisateur.id_utilisateur, utilisateur.administrateur),
+        expire_dans=duree_jeton(),
+        utilisateur=utilisateur,
+    )
+
+
+@router.post("/inscription", response_model=ParticipantModelOut, status_code=status.HTTP_201_CREATED)
+async def inscription(participant_in: ParticipantModelIn) -> ParticipantModelOut:
+    """Crée un compte participant."""
+    try:
+        return await run_in_threadpool(ParticipantService().create_participant, participant_in)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+
+
+@router.get("/moi", response_model=UtilisateurModelOut)
+async def moi(utilisateur: UtilisateurJeton = Depends(utilisateur_courant)) -> UtilisateurModelOut:
+    """Profil de l'utilisateur porteur du jeton."""
+    try:
+        return await run_in_threadpool(UtilisateurService().get_user_by_id, utilisateur.id_utilisateur)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
@@ -0,0 +1,194 @@
+# src/api/routes/evenements.py
+import math
+from datetime import date
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from api.dependances import Pagination, UtilisateurJeton, utilisateur_courant
+from model.api_models import (
+    AvisEvenementOut,
+    EvenementDetailOut,
+    EvenementListeOut,
+    Page,
+)
+from model.evenement_models import DisponibiliteModelOut, ResultatRechercheModelOut
+from model.reservation_models import AdmissionModelOut
+from service.admission_service import AdmissionService, admission_service
+from service.bus_service import BusService
+from service.commentaire_service import CommentaireService
+from service.consultation_evenement_service import (
+    ConsultationEvenementService,
+    ConsultationEvenementServiceAsync,
+)
+from service.evenement_service import EvenementService
+from service.export_service import ExportService
+
+router = APIRouter(prefix="/evenements", tags=["evenements"])
+
+
+@router.get("", response_model=Page[EvenementListeOut])
+async def lister_evenements(
+    pagination: Pagination = Depends(),
+    seulement_disponibles: bool = Query(True, description="Uniquement les événements 'disponible en ligne'"),
+    a_partir_du: Optional[date] = Query(None, description="Date minimale de l'événement"),
+    curseur: Optional[str] = Query(None, description="curseur_suivant de la page précédente"),
+) -> Page[EvenementListeOut]:
+    """
+    Liste paginée des événements avec places restantes et avis.
+    Parcours par curseur (première page, puis ?curseur=) ; ?offset= reste accepté.
+    Lue par les DAO asynchrones : pas de thread occupé pendant la requête.
+    """
+    service = ConsultationEvenementServiceAsync()
+    if curseur is None and pagination.offset > 0:
+        lignes = await service.lister_avec_places_restantes(
+            limit=pagination.limit + 1,
+            offset=pagination.offset,
+            seulement_disponibles=seulement_disponibles,
+            a_partir_du=a_partir_du,
+        )
+        return pagination.page(lignes)
+
+    try:
+        page = await service.lister_avec_places_restantes_page(
+            limit=pagination.limit,
+            curseur=curseur,
+            seulement_disponibles=seulement_disponibles,
+            a_partir_du=a_partir_du,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return pagination.page_curseur(page, premiere=curseur is None)
+
+
+@router.get("/recherche", response_model=Page[ResultatRechercheModelOut])
+async def rechercher_evenements(
+    q: str = Query(..., min_length=1, max_length=200, description="Texte libre (titre, ville, catégorie, description)"),
+    pagination: Pagination = Depends(),
+    categorie: Optional[str] = Query(None),
+    statut: Optional[str] = Query(None, description="ex. 'disponible en ligne'"),
+    date_min: Optional[date] = Query(None),
+    date_max: Optional[date] = Query(None),
+) -> Page[ResultatRechercheModelOut]:
+    """
+    Recherche libre, du plus pertinent au moins pertinent, avec un extrait de la
+    description. Syntaxe : mots, "phrase exacte", -mot_exclu, mot1 or mot2.
+    """
+    try:
+        lignes = await ConsultationEvenementServiceAsync().rechercher_texte(
+            q,
+            categorie=categorie,
+            statut=statut,
+            date_min=date_min,
+            date_max=date_max,
+            limit=pagination.limit + 1,
+            offset=pagination.offset,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    return pagination.page(lignes)
+
+
+# Événements par appel à GET /evenements/disponibilites (une page de liste au plus)
+MAX_DISPONIBILITES = 100
+
+
+@router.get("/disponibilites", response_model=List[DisponibiliteModelOut])
+async def disponibilites_evenements(
+    ids: List[int] = Query(..., description="ids des événements (?ids=1&ids=2...)"),
+) -> List[DisponibiliteModelOut]:
+    """
+    Places restantes du lieu et des bus, à jour, pour plusieurs événements en
+    une requête (ex. les événements d'une page de liste). Ids inconnus ignorés.
+    """
+    if len(set(ids)) > MAX_DISPONIBILITES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"{MAX_DISPONIBILITES} événements au plus par appel.",
+        )
+    disponibilites = await ConsultationEvenementServiceAsync().disponibilites(ids)
+    return list(disponibilites.values())
+
+
+def _detail_evenement(id_evenement: int) -> EvenementDetailOut:
+    """Assemble la fiche d'un événement (exécutée dans le pool de threads)."""
+    evenement = EvenementService().get_event_by_id(id_evenement)
+    disponibilite = ConsultationEvenementService().disponibilites([id_evenement]).get(id_evenement)
+    if disponibilite is None:
+        raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
+    return EvenementDetailOut(
+        evenement=evenement,
+        inscrits=disponibilite.inscrits,
+        places_restantes=disponibilite.places_restantes,
+        bus_aller=disponibilite.bus_aller,
+        bus_retour=disponibilite.bus_retour,
+        bus=BusService().get_buses_for_event(id_evenement),
+    )
+
+
+@router.get("/{id_evenement}", response_model=EvenementDetailOut)
+async def detail_evenement(id_evenement: int) -> EvenementDetailOut:
+    """Fiche d'un événement avec ses bus et les places restantes."""
+    try:
+        return await run_in_threadpool(_detail_evenement, id_evenement)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.post("/{id_evenement}/admission", response_model=AdmissionModelOut)
+async def demander_admission(
+    id_evenement: int,
+    response: Response,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> AdmissionModelOut:
+    """
+    File d'admission d'un événement à ouverture programmée : rang, attente estimée
+    et, une fois admis, le jeton de réservation à joindre à POST /reservations.
+    À rappeler après Retry-After secondes tant que le statut est pas_ouvert ou en_attente.
+    """
+    try:
+        admission = await run_in_threadpool(
+            admission_service().demander, utilisateur.id_utilisateur, id_evenement
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    if admission.attente:
+        response.headers["Retry-After"] = str(math.ceil(min(admission.attente, AdmissionService.RAPPEL_MAX)))
+    return admission
+
+
+@router.get("/{id_evenement}/commentaires", response_model=Page[AvisEvenementOut])
+async def commentaires_evenement(
+    id_evenement: int,
+    pagination: Pagination = Depends(),
+) -> Page[AvisEvenementOut]:
+    """Avis laissés sur un événement, du plus récent au plus ancien."""
+    avis = await run_in_threadpool(CommentaireService().get_comments_for_event, id_evenement)
+    return pagination.decouper(avis)
+
+
+@router.get("/{id_evenement}/inscrits/export", response_class=StreamingResponse)
+async def exporter_inscrits(
+    id_evenement: int,
+    format: str = Query("csv", pattern="^(csv|parquet)$", description="csv ou parquet"),
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> StreamingResponse:
+    """
+    Inscrits d'un événement (options bus / SAM / boisson) en fichier CSV ou Parquet,
+    réservé aux administrateurs. Le fichier est envoyé au fil de la lecture en base.
+    """
+    if not utilisateur.administrateur:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Accès refusé.")
+    if format == "parquet" and not ExportService.parquet_disponible():
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Export Parquet indisponible (pyarrow absent).")
+    try:
+        morceaux = await run_in_threadpool(ExportService().flux, id_evenement, format)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return StreamingResponse(
+        morceaux,
+        media_type=ExportService.TYPES_CONTENU[format],
+        headers={"Content-Disposition": f'attachment; filename="inscrits_{id_evenement}.{format}"'},
+    )
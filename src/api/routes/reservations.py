@@ -0,0 +1,279 @@
+# src/api/routes/reservations.py
+import math
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import JSONResponse
+
+from api.dependances import Pagination, UtilisateurJeton, utilisateur_courant, verifier_proprietaire
+from model.api_models import (
+    AttenteOut,
+    AvisIn,
+    Page,
+    RefusReservationOut,
+    ReservationDemandeIn,
+    ReservationOptionsIn,
+)
+from model.commentaire_models import CommentaireModelIn, CommentaireModelOut
+from model.reservation_models import (
+    DemandeAttenteModelOut,
+    ReservationModelIn,
+    ReservationModelOut,
+    StatutReservation,
+)
+from service.admission_service import admission_service
+from service.commentaire_service import CommentaireService
+from service.reservation_service import ReservationService
+
+router = APIRouter(prefix="/reservations", tags=["reservations"])
+
+# Code HTTP des refus de réservation (les autres : 409)
+CODES_REFUS = {
+    StatutReservation.INTROUVABLE: status.HTTP_404_NOT_FOUND,
+    StatutReservation.ADMISSION_REQUISE: status.HTTP_403_FORBIDDEN,
+    StatutReservation.TROP_DE_TENTATIVES: status.HTTP_429_TOO_MANY_REQUESTS,
+}
+
+
+async def _reservation_autorisee(id_reservation: int, utilisateur: UtilisateurJeton) -> ReservationModelOut:
+    """Charge la réservation (404) et vérifie que l'utilisateur y a accès (403)."""
+    try:
+        reservation = await run_in_threadpool(ReservationService().get_reservation_by_id, id_reservation)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    verifier_proprietaire(utilisateur, reservation.fk_utilisateur)
+    return reservation
+
+
+# ---------- Réservations ----------
+
+@router.post(
+    "",
+    response_model=ReservationModelOut,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        403: {"model": RefusReservationOut},
+        404: {"model": RefusReservationOut},
+        409: {"model": RefusReservationOut},
+        429: {"model": RefusReservationOut},
+    },
+)
+async def reserver(
+    demande: ReservationDemandeIn,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+):
+    """
+    Réserve une place (shotgun) pour l'utilisateur du jeton.
+    Capacités du lieu et des bus vérifiées atomiquement : 409 si complet ou déjà réservé.
+    Ouverture programmée : 403 sans jeton d'admission valide ; 429 (Retry-After)
+    si l'utilisateur multiplie les tentatives.
+    """
+    reservation_in = ReservationModelIn(
+        fk_utilisateur=utilisateur.id_utilisateur, **demande.model_dump(exclude={"jeton_admission"})
+    )
+    resultat = await run_in_threadpool(admission_service().reserver, reservation_in, demande.jeton_admission)
+
+    if not resultat.ok:
+        code = CODES_REFUS.get(resultat.statut, status.HTTP_409_CONFLICT)
+        refus = RefusReservationOut(
+            statut=resultat.statut,
+            message=ReservationService.MESSAGES_REFUS[resultat.statut],
+        )
+        entetes = (
+            {"Retry-After": str(math.ceil(resultat.reessayer_dans))} if resultat.reessayer_dans else None
+        )
+        return JSONResponse(status_code=code, content=refus.model_dump(mode="json"), headers=entetes)
+
+    return resultat.reservation
+
+
+@router.get("", response_model=Page[ReservationModelOut])
+async def mes_reservations(
+    pagination: Pagination = Depends(),
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> Page[ReservationModelOut]:
+    """Réservations de l'utilisateur du jeton, les plus récentes d'abord."""
+    reservations = await run_in_threadpool(
+        ReservationService().get_reservations_by_user, utilisateur.id_utilisateur
+    )
+    return pagination.decouper(reservations)
+
+
+# ---------- Liste d'attente ----------
+
+@router.post("/liste-attente", response_model=AttenteOut, status_code=status.HTTP_201_CREATED)
+async def rejoindre_liste_attente(
+    demande: ReservationDemandeIn,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> AttenteOut:
+    """
+    Inscrit l'utilisateur en liste d'attente d'un événement complet, avec ses options.
+    Dès qu'une place se libère, la réservation est créée et un e-mail envoyé.
+    409 s'il reste une place (elle se réserve par POST /reservations, avec le
+    jeton d'admission si l'ouverture est programmée) ou avant l'ouverture.
+    """
+    demande_in = ReservationModelIn(fk_utilisateur=utilisateur.id_utilisateur, **demande.model_dump())
+    try:
+        rang = await run_in_threadpool(ReservationService().rejoindre_liste_attente, demande_in)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return AttenteOut(position=rang)
+
+
+@router.get("/liste-attente", response_model=List[DemandeAttenteModelOut])
+async def mes_attentes(
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> List[DemandeAttenteModelOut]:
+    """Demandes en attente de l'utilisateur du jeton, avec leur rang."""
+    return await run_in_threadpool(ReservationService().get_attentes_utilisateur, utilisateur.id_utilisateur)
+
+
+@router.delete("/liste-attente/{id_evenement}", status_code=status.HTTP_204_NO_CONTENT)
+async def quitter_liste_attente(
+    id_evenement: int,
+    direction: Optional[str] = Query(None, pattern="^(aller|retour)$", description="file d'un bus"),
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> Response:
+    """Retire la demande (place à l'événement, ou place dans le bus `direction`)."""
+    retiree = await run_in_threadpool(
+        ReservationService().quitter_liste_attente, utilisateur.id_utilisateur, id_evenement, direction
+    )
+    if not retiree:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aucune demande en attente.")
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.post("/{id_reservation}/bus/{direction}/attente", response_model=AttenteOut, status_code=status.HTTP_201_CREATED)
+async def attendre_bus(
+    id_reservation: int,
+    direction: str = Path(..., pattern="^(aller|retour)$"),
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> AttenteOut:
+    """
+    Place dans le bus `direction` pour cette réservation : attribuée aussitôt si
+    une place est libre et que personne n'attend (position null), sinon rang
+    dans la file du bus. Seul moyen d'ajouter un bus à une réservation.
+    """
+    await _reservation_autorisee(id_reservation, utilisateur)
+    try:
+        rang = await run_in_threadpool(ReservationService().attendre_bus, id_reservation, direction)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(e))
+    return AttenteOut(position=rang)
+
+
+@router.get("/{id_reservation}", response_model=ReservationModelOut)
+async def lire_reservation(
+    id_reservation: int,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> ReservationModelOut:
+    return await _reservation_autorisee(id_reservation, utilisateur)
+
+
+@router.patch("/{id_reservation}", response_model=ReservationModelOut)
+async def modifier_reservation(
+    id_reservation: int,
+    options: ReservationOptionsIn,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> ReservationModelOut:
+    """
+    Modifie les options fournies (adhérent, SAM, boisson) ; un bus peut être
+    retiré, pas ajouté (400) : passer par POST /reservations/{id}/bus/{direction}/attente.
+    """
+    await _reservation_autorisee(id_reservation, utilisateur)
+    try:
+        return await run_in_threadpool(
+            ReservationService().update_reservation_flags,
+            id_reservation,
+            **options.model_dump(exclude_none=True),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+
+@router.delete("/{id_reservation}", status_code=status.HTTP_204_NO_CONTENT)
+async def annuler_reservation(
+    id_reservation: int,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> Response:
+    """Annule la réservation (libère la place et les places de bus)."""
+    await _reservation_autorisee(id_reservation, utilisateur)
+    try:
+        await run_in_threadpool(ReservationService().delete_reservation, id_reservation)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+# ---------- Commentaire d'une réservation ----------
+
+@router.get("/{id_reservation}/commentaire", response_model=CommentaireModelOut)
+async def lire_commentaire(
+    id_reservation: int,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> CommentaireModelOut:
+    await _reservation_autorisee(id_reservation, utilisateur)
+    commentaire = await run_in_threadpool(CommentaireService().get_comment_by_reservation, id_reservation)
+    if commentaire is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aucun commentaire pour cette réservation.")
+    return commentaire
+
+
+@router.post(
+    "/{id_reservation}/commentaire",
+    response_model=CommentaireModelOut,
+    status_code=status.HTTP_201_CREATED,
+)
+async def commenter(
+    id_reservation: int,
+    avis: AvisIn,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> CommentaireModelOut:
+    """Laisse une note et/ou un avis sur sa réservation."""
+    reservation = await _reservation_autorisee(id_reservation, utilisateur)
+    service = CommentaireService()
+
+    if await run_in_threadpool(service.get_comment_by_reservation, id_reservation):
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Cette réservation a déjà un commentaire.")
+
+    comm_in = CommentaireModelIn(
+        fk_utilisateur=reservation.fk_utilisateur,
+        fk_reservation=id_reservation,
+        **avis.model_dump(),
+    )
+    try:
+        commentaire = await run_in_threadpool(service.create_comment, comm_in)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if commentaire is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Impossible d'enregistrer le commentaire.")
+    return commentaire
+
+
+@router.put("/{id_reservation}/commentaire", response_model=CommentaireModelOut)
+async def modifier_commentaire(
+    id_reservation: int,
+    avis: AvisIn,
+    utilisateur: UtilisateurJeton = Depends(utilisateur_courant),
+) -> CommentaireModelOut:
+    """Remplace la note et l'avis du commentaire de la réservation."""
+    reservation = await _reservation_autorisee(id_reservation, utilisateur)
+    service = CommentaireService()
+
+    existant = await run_in_threadpool(service.get_comment_by_reservation, id_reservation)
+    if existant is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Aucun commentaire pour cette réservation.")
+
+    comm_in = CommentaireModelIn(
+        fk_utilisateur=reservation.fk_utilisateur,
+        fk_reservation=id_reservation,
+        **avis.model_dump(),
+    )
+    try:
+        commentaire = await run_in_threadpool(service.update_comment, existant.id_commentaire, comm_in)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+    if commentaire is None:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Impossible de modifier le commentaire.")
+    return commentaire
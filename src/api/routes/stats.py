@@ -0,0 +1,47 @@
+# src/api/routes/stats.py
+import os
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from fastapi.concurrency import run_in_threadpool
+
+from api.dependances import administrateur_courant
+from model.api_models import PlanOut, RapportRequetesOut, RequeteLenteOut
+from utils.stats_requetes import stats_requetes
+
+# Réservé aux administrateurs. Les statistiques sont propres à chaque worker
+# (le pid de celui qui répond est indiqué) : interroger plusieurs fois pour les voir tous.
+router = APIRouter(prefix="/stats", tags=["stats"], dependencies=[Depends(administrateur_courant)])
+
+TRIS = ("total_ms", "appels", "moyenne_ms", "p95_ms", "p99_ms", "max_ms", "erreurs", "lignes")
+
+
+@router.get("/requetes", response_model=RapportRequetesOut)
+async def statistiques_requetes(
+    tri: str = Query("total_ms", pattern=f"^({'|'.join(TRIS)})$", description="colonne de tri, décroissant"),
+    limit: int = Query(50, ge=1, le=1000),
+) -> RapportRequetesOut:
+    """Latence des requêtes SQL par site d'appel (classe DAO + méthode), les plus coûteuses d'abord."""
+    return RapportRequetesOut(pid=os.getpid(), **stats_requetes().rapport(tri=tri, limite=limit))
+
+
+@router.get("/requetes/lentes", response_model=List[RequeteLenteOut])
+async def requetes_lentes() -> List[RequeteLenteOut]:
+    """Dernières requêtes au-dessus du seuil DB_REQUETE_LENTE_MS, les plus récentes d'abord."""
+    return [RequeteLenteOut(index=i, **r) for i, r in enumerate(stats_requetes().requetes_lentes())]
+
+
+@router.get("/requetes/lentes/{index}/plan", response_model=PlanOut)
+async def plan_requete_lente(index: int) -> PlanOut:
+    """Plan d'exécution (EXPLAIN, sans exécuter la requête) d'une requête lente, avec ses paramètres."""
+    try:
+        return PlanOut(plan=await run_in_threadpool(stats_requetes().expliquer, index))
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.delete("/requetes", status_code=status.HTTP_204_NO_CONTENT)
+async def reinitialiser_statistiques() -> Response:
+    """Remet les compteurs à zéro (avant une mesure)."""
+    stats_requetes().reinitialiser()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
@@ -0,0 +1,89 @@
+"""
+Benchmark du hachage des mots de passe : connexions par seconde selon le
+nombre de processus bcrypt.
+
+Simule une rafale de connexions (vérification bcrypt d'un mot de passe)
+lancées par `--clients` threads, comme les requêtes d'un worker de l'API à
+l'ouverture d'un shotgun. « sur place » = calcul dans les threads appelants
+(BCRYPT_WORKERS=0), sinon pool de N processus.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+from utils.securite import HacheurMotsDePasse, hash_password
+
+
+def mesurer(workers: int, cout: int, connexions: int, clients: int) -> Dict[str, Any]:
+    """Débit de vérification pour un nombre de processus donné."""
+    hacheur = HacheurMotsDePasse(workers=workers, cout=cout)
+    hashed = hash_password("mdpShotgun1", rounds=cout)
+    try:
+        # Démarrage des processus hors mesure
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            list(executor.map(lambda _: hacheur.verifier("mdpShotgun1", hashed), range(max(workers, 1))))
+
+        debut = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=clients) as executor:
+            resultats = list(executor.map(lambda _: hacheur.verifier("mdpShotgun1", hashed), range(connexions)))
+        duree = time.perf_counter() - debut
+    finally:
+        hacheur.fermer()
+
+    assert all(resultats)
+    return {
+        "workers": workers,
+        "connexions": connexions,
+        "duree_s": duree,
+        "connexions_par_s": connexions / duree,
+        "latence_moyenne_ms": duree / connexions * clients * 1000,
+    }
+
+
+def lancer(cout: int, connexions: int, clients: int, workers: List[int]) -> Dict[str, Any]:
+    return {
+        "cout": cout,
+        "clients": clients,
+        "coeurs": os.cpu_count(),
+        "mesures": [mesurer(w, cout, connexions, clients) for w in workers],
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\nbcrypt coût {rapport['cout']}, {rapport['clients']} clients simultanés, "
+          f"{rapport['coeurs']} cœurs")
+    print(f"{'Processus':>10} | {'Connexions/s':>12} | {'Latence moy.':>12}")
+    print("-" * 42)
+    for m in rapport["mesures"]:
+        nom = "sur place" if m["workers"] == 0 else str(m["workers"])
+        print(f"{nom:>10} | {m['connexions_par_s']:>12.1f} | {m['latence_moyenne_ms']:>9.0f} ms")
+
+
+if __name__ == "__main__":
+    coeurs = os.cpu_count() or 1
+    paliers = sorted({0, 1, 2, 4, coeurs} | ({coeurs * 2} if coeurs > 1 else set()))
+
+    parser = argparse.ArgumentParser(description="Benchmark bcrypt : connexions par seconde")
+    parser.add_argument("--cout", type=int, default=12)
+    parser.add_argument("--connexions", type=int, default=64)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--workers", type=int, nargs="+", default=paliers)
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.cout, args.connexions, args.clients, args.workers)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_bcrypt.py [--cout 12 --connexions 64] [--json]
@@ -0,0 +1,378 @@
+"""
+Test de charge : `--clients` clients concurrents pendant `--duree` secondes.
+
+Peuple un schéma jetable (`--utilisateurs` comptes, `--evenements` événements
+avec un bus aller et un bus retour chacun), puis chaque client enchaîne, selon
+les poids de `--mix`, les opérations d'un shotgun :
+- reserver   ReservationService.create_reservation (80 % des demandes sur les
+             `--chauds` événements les plus courus, pour créer de la contention) ;
+- lister     ConsultationEvenementService.lister_avec_places_restantes ;
+- connexion  SessionService.connecter (bcrypt au coût `--cout`).
+Rapporte par opération le débit, p50 / p95 / p99 et les refus métier ; pour
+l'ensemble, l'attente d'une connexion du pool, l'attente de verrous côté
+PostgreSQL (pg_stat_activity échantillonné toutes les 10 ms) et la survente
+(inscrits au-delà de la capacité du lieu ou des bus).
+
+`--sortie fichier.json` enregistre le rapport (avec le commit courant) ;
+`--comparer fichier.json` affiche l'écart avec un rapport précédent, pour
+suivre les régressions d'un commit à l'autre.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import random
+import subprocess
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional
+
+import dotenv
+
+from dao.db_connection import DBConnection
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_charge"
+MOT_DE_PASSE = "mdpCharge1"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '0600000000', 'client' || i || '@ensai.fr', %(hash)s, i = 1
+    FROM generate_series(1, %(utilisateurs)s) AS i;
+
+    -- Les `chauds` premiers événements sont petits : ils se remplissent pendant le test
+    INSERT INTO evenement (fk_utilisateur, titre, ville, date_evenement, capacite, statut)
+    SELECT 1, 'Événement ' || i, 'Rennes', DATE '2026-06-01' + i,
+           CASE WHEN i <= %(chauds)s THEN 50 ELSE 100 + i %% 200 END, 'disponible en ligne'
+    FROM generate_series(1, %(evenements)s) AS i;
+
+    INSERT INTO bus (fk_evenement, matricule, nombre_places, direction, description)
+    SELECT e.id_evenement, 'BUS-' || e.id_evenement || '-' || d.direction,
+           GREATEST(e.capacite / 2, 1), d.direction, 'Bus ' || d.direction || ' ' || e.id_evenement
+    FROM evenement e CROSS JOIN (VALUES ('aller'), ('retour')) AS d(direction);
+
+    ANALYZE;
+"""
+
+SQL_SURVENTE = """
+    SELECT
+        COUNT(*) FILTER (WHERE n.inscrits > e.capacite)                   AS evenements,
+        COUNT(*) FILTER (WHERE n.aller > COALESCE(b.aller, 0)
+                            OR n.retour > COALESCE(b.retour, 0))         AS bus,
+        COALESCE(SUM(n.inscrits), 0)                                      AS reservations
+    FROM evenement e
+    JOIN (
+        SELECT fk_evenement, COUNT(*) AS inscrits,
+               COUNT(*) FILTER (WHERE bus_aller) AS aller,
+               COUNT(*) FILTER (WHERE bus_retour) AS retour
+        FROM reservation GROUP BY fk_evenement
+    ) n ON n.fk_evenement = e.id_evenement
+    LEFT JOIN (
+        SELECT fk_evenement,
+               SUM(nombre_places) FILTER (WHERE direction = 'aller') AS aller,
+               SUM(nombre_places) FILTER (WHERE direction = 'retour') AS retour
+        FROM bus GROUP BY fk_evenement
+    ) b ON b.fk_evenement = e.id_evenement
+"""
+
+# Backends du test bloqués sur un verrou (ligne d'événement, index unique...)
+SQL_ATTENTES_VERROUS = """
+    SELECT COUNT(*) AS n
+    FROM pg_stat_activity
+    WHERE datname = current_database() AND wait_event_type = 'Lock'
+"""
+
+
+def _centiles(durees: List[float]) -> Dict[str, float]:
+    durees = sorted(durees)
+
+    def centile(q: float) -> float:
+        return durees[min(len(durees) - 1, int(len(durees) * q))] * 1000 if durees else 0.0
+
+    return {"p50_ms": centile(0.50), "p95_ms": centile(0.95), "p99_ms": centile(0.99)}
+
+
+class Mesures:
+    """Durées et issues par opération, partagées par les clients."""
+
+    def __init__(self):
+        self.durees: Dict[str, List[float]] = defaultdict(list)
+        self.refus: Dict[str, int] = defaultdict(int)
+        self.erreurs: Dict[str, int] = defaultdict(int)
+        self.attentes_pool: List[float] = []
+        self._lock = threading.Lock()
+
+    def mesurer(self, operation: str, fn: Callable[[], Any]) -> None:
+        debut = time.perf_counter()
+        issue = None
+        try:
+            fn()
+        except ValueError:
+            issue = self.refus
+        except Exception:
+            issue = self.erreurs
+        duree = time.perf_counter() - debut
+        with self._lock:
+            self.durees[operation].append(duree)
+            if issue is not None:
+                issue[operation] += 1
+
+
+class EchantillonneurVerrous(threading.Thread):
+    """Compte, toutes les `periode` secondes, les backends en attente d'un verrou (connexion dédiée)."""
+
+    def __init__(self, periode: float = 0.01):
+        super().__init__(daemon=True)
+        self.periode = periode
+        self.echantillons: List[int] = []
+        self._fin = threading.Event()
+
+    def run(self) -> None:
+        con = DBConnection._connect()
+        con.autocommit = True
+        try:
+            with con.cursor() as curs:
+                while not self._fin.wait(self.periode):
+                    curs.execute(SQL_ATTENTES_VERROUS)
+                    self.echantillons.append(curs.fetchone()["n"])
+        finally:
+            con.close()
+
+    def arreter(self) -> Dict[str, float]:
+        self._fin.set()
+        self.join()
+        n = len(self.echantillons) or 1
+        return {
+            "echantillons": len(self.echantillons),
+            "part_echantillons_avec_attente": sum(1 for e in self.echantillons if e) / n,
+            "backends_en_attente_moyen": sum(self.echantillons) / n,
+            "backends_en_attente_max": max(self.echantillons, default=0),
+            # Somme des attentes observées : estimation du temps total passé à attendre un verrou
+            "attente_verrous_estimee_s": sum(self.echantillons) * self.periode,
+        }
+
+
+def _peupler(utilisateurs: int, evenements: int, chauds: int, cout: int) -> None:
+    from utils.securite import hash_password
+
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+        with con.cursor() as curs:
+            # Un seul hachage pour tous les comptes : le peuplement reste rapide
+            curs.execute(SQL_PEUPLER, {
+                "hash": hash_password(MOT_DE_PASSE, rounds=cout),
+                "utilisateurs": utilisateurs,
+                "evenements": evenements,
+                "chauds": chauds,
+            })
+
+
+def _client(
+    mesures: Mesures, fin: float, mix: Dict[str, int], utilisateurs: int, evenements: int, chauds: int, graine: int
+) -> None:
+    from model.reservation_models import ReservationModelIn
+    from service.consultation_evenement_service import ConsultationEvenementService
+    from service.reservation_service import ReservationService
+    from service.session_service import SessionService
+
+    alea = random.Random(graine)
+    reservations = ReservationService()
+    consultation = ConsultationEvenementService()
+    sessions = SessionService(persistance=False)
+    operations = {
+        "reserver": lambda: reservations.create_reservation(ReservationModelIn(
+            fk_utilisateur=alea.randint(1, utilisateurs),
+            fk_evenement=alea.randint(1, chauds) if alea.random() < 0.8 else alea.randint(1, evenements),
+            bus_aller=alea.random() < 0.5,
+            bus_retour=alea.random() < 0.5,
+        )),
+        "lister": lambda: consultation.lister_avec_places_restantes(limit=50),
+        "connexion": lambda: sessions.connecter(f"client{alea.randint(1, utilisateurs)}@ensai.fr", MOT_DE_PASSE),
+    }
+    noms, poids = list(mix), list(mix.values())
+
+    while time.perf_counter() < fin:
+        operation = alea.choices(noms, poids)[0]
+        mesures.mesurer(operation, operations[operation])
+
+
+def lancer(
+    clients: int, duree: float, utilisateurs: int, evenements: int, chauds: int,
+    mix: Dict[str, int], cout: int, garder: bool,
+) -> Dict[str, Any]:
+    # Le hacheur partagé lit sa configuration à sa création
+    os.environ["BCRYPT_COUT"] = str(cout)
+    _peupler(utilisateurs, evenements, chauds, cout)
+
+    # Attente d'une connexion libre : on chronomètre les emprunts au pool
+    mesures = Mesures()
+    pool = DBConnection().pool
+    emprunter = pool.getconn
+
+    def getconn_chronometre():
+        debut = time.perf_counter()
+        try:
+            return emprunter()
+        finally:
+            attente = time.perf_counter() - debut
+            with mesures._lock:
+                mesures.attentes_pool.append(attente)
+
+    pool.getconn = getconn_chronometre
+    verrous = EchantillonneurVerrous()
+    try:
+        verrous.start()
+        debut = time.perf_counter()
+        threads = [
+            threading.Thread(target=_client, args=(mesures, debut + duree, mix, utilisateurs, evenements, chauds, i))
+            for i in range(clients)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        ecoule = time.perf_counter() - debut
+        attentes_verrous = verrous.arreter()
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(SQL_SURVENTE)
+                survente = curs.fetchone()
+    finally:
+        pool.getconn = emprunter
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "commit": _commit(),
+        "clients": clients,
+        "duree_s": ecoule,
+        "utilisateurs": utilisateurs,
+        "evenements": evenements,
+        "mix": mix,
+        "cout_bcrypt": cout,
+        "pool_max": pool.max_size,
+        "operations": [
+            {
+                "operation": nom,
+                "appels": len(durees),
+                "par_seconde": len(durees) / ecoule,
+                **_centiles(durees),
+                "refus": mesures.refus[nom],
+                "erreurs": mesures.erreurs[nom],
+            }
+            for nom, durees in sorted(mesures.durees.items())
+        ],
+        "attente_pool": {"emprunts": len(mesures.attentes_pool), **_centiles(mesures.attentes_pool)},
+        "attente_verrous": attentes_verrous,
+        "survente": {
+            "evenements": int(survente["evenements"]),
+            "bus": int(survente["bus"]),
+            "reservations_en_base": int(survente["reservations"]),
+        },
+    }
+
+
+def _commit() -> Optional[str]:
+    """Commit courant (pour comparer les rapports), None hors d'un dépôt git."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def afficher(rapport: Dict[str, Any], reference: Optional[Dict[str, Any]] = None) -> None:
+    print(f"\n{rapport['clients']} clients pendant {rapport['duree_s']:.1f} s "
+          f"(commit {rapport['commit']}, pool de {rapport['pool_max']} connexions, bcrypt {rapport['cout_bcrypt']})")
+    print(f"{'Opération':<10} | {'Appels':>7} | {'/s':>7} | {'p50':>9} | {'p95':>9} | {'p99':>9} | "
+          f"{'Refus':>6} | {'Erreurs':>7}")
+    print("-" * 86)
+    for o in rapport["operations"]:
+        print(f"{o['operation']:<10} | {o['appels']:>7} | {o['par_seconde']:>7.1f} | {o['p50_ms']:>6.1f} ms | "
+              f"{o['p95_ms']:>6.1f} ms | {o['p99_ms']:>6.1f} ms | {o['refus']:>6} | {o['erreurs']:>7}")
+
+    pool, verrous, survente = rapport["attente_pool"], rapport["attente_verrous"], rapport["survente"]
+    print(f"\nAttente du pool    : p50 {pool['p50_ms']:.1f} ms, p95 {pool['p95_ms']:.1f} ms, "
+          f"p99 {pool['p99_ms']:.1f} ms ({pool['emprunts']} emprunts)")
+    print(f"Attente de verrous : {verrous['part_echantillons_avec_attente']:.0%} des échantillons, "
+          f"{verrous['backends_en_attente_moyen']:.2f} backends en moyenne (max {verrous['backends_en_attente_max']}), "
+          f"~{verrous['attente_verrous_estimee_s']:.1f} s cumulées")
+    print(f"Survente           : {survente['evenements']} événement(s), {survente['bus']} bus "
+          f"({survente['reservations_en_base']} réservations en base)")
+
+    if reference:
+        print(f"\nÉcart avec le commit {reference.get('commit')} :")
+        avant = {o["operation"]: o for o in reference["operations"]}
+        for o in rapport["operations"]:
+            r = avant.get(o["operation"])
+            if not r:
+                continue
+            print(f"  {o['operation']:<10} débit {_ecart(o['par_seconde'], r['par_seconde'])}, "
+                  f"p95 {_ecart(o['p95_ms'], r['p95_ms'])}, p99 {_ecart(o['p99_ms'], r['p99_ms'])}")
+
+
+def _ecart(valeur: float, reference: float) -> str:
+    return f"{(valeur - reference) / reference:+.0%}" if reference else "n/a"
+
+
+def _lire_mix(texte: str) -> Dict[str, int]:
+    mix = {}
+    for morceau in texte.split(","):
+        nom, _, poids = morceau.partition("=")
+        if nom.strip() not in ("reserver", "lister", "connexion"):
+            raise argparse.ArgumentTypeError(f"Opération inconnue : {nom}")
+        mix[nom.strip()] = int(poids or 1)
+    return mix
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Test de charge d'un shotgun")
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--duree", type=float, default=30, help="secondes")
+    parser.add_argument("--utilisateurs", type=int, default=5000)
+    parser.add_argument("--evenements", type=int, default=300)
+    parser.add_argument("--chauds", type=int, default=10, help="événements qui concentrent 80 %% des réservations")
+    parser.add_argument("--mix", type=_lire_mix, default="reserver=6,lister=3,connexion=1",
+                        help="poids des opérations (reserver, lister, connexion)")
+    parser.add_argument("--cout", type=int, default=10, help="coût bcrypt des comptes")
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    parser.add_argument("--sortie", help="enregistre le rapport JSON dans ce fichier")
+    parser.add_argument("--comparer", help="rapport JSON précédent à comparer")
+    args = parser.parse_args()
+
+    rapport = lancer(args.clients, args.duree, args.utilisateurs, args.evenements, args.chauds,
+                     args.mix, args.cout, args.garder)
+    if args.sortie:
+        with open(args.sortie, "w", encoding="utf-8") as f:
+            json.dump(rapport, f, indent=2, ensure_ascii=False)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        reference = None
+        if args.comparer:
+            with open(args.comparer, encoding="utf-8") as f:
+                reference = json.load(f)
+        afficher(rapport, reference)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_charge.py [--clients 50] [--duree 30] [--sortie base.json]
+# PYTHONPATH="src"; python src/benchmarks/bench_charge.py --comparer base.json
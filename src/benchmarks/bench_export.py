@@ -0,0 +1,115 @@
+"""
+Benchmark de l'export des inscrits : mémoire et débit sur un gros événement.
+
+Crée un schéma jetable avec un événement de `--inscrits` réservations, puis compare :
+- la liste complète (ReservationDao.lister_inscrits, une InscritModelOut par ligne) ;
+- l'export en flux (ExportService, curseur serveur + écriture CSV / Parquet par lots).
+Le pic de mémoire Python est mesuré par tracemalloc ; l'export écrit dans un
+fichier jetable.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+import dotenv
+
+from dao.db_connection import DBConnection
+from dao.reservation_dao import ReservationDao
+from service.export_service import ExportService
+
+SCHEMA = "projet_bench_export"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '0600000000', 'user' || i || '@ensai.fr', 'x', i = 1
+    FROM generate_series(1, %(inscrits)s) AS i;
+
+    INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement, description,
+                           capacite, categorie, statut)
+    VALUES (1, 'Gala', '1 rue de Bruz', 'Rennes', DATE '2030-01-01', 'Gala annuel',
+            %(inscrits)s, 'Soirée', 'disponible en ligne');
+
+    INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+    SELECT i, 1, i %% 2 = 0, i %% 3 = 0, i %% 4 = 0, i %% 10 = 0, i %% 5 = 0
+    FROM generate_series(1, %(inscrits)s) AS i;
+"""
+
+
+def _mesurer(fn: Callable[[], Any]) -> Dict[str, float]:
+    """Durée et pic de mémoire Python (allocations faites pendant l'appel)."""
+    tracemalloc.start()
+    debut = time.perf_counter()
+    fn()
+    duree = time.perf_counter() - debut
+    _, pic = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"duree_s": duree, "pic_memoire_mo": pic / 1024 / 1024}
+
+
+def _exporter(format: str) -> None:
+    with tempfile.TemporaryFile() as f:
+        ExportService().exporter(1, f, format=format)
+
+
+def lancer(inscrits: int, garder: bool) -> Dict[str, Any]:
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+            curs.execute("ALTER TABLE reservation DISABLE TRIGGER USER")
+            curs.execute(SQL_PEUPLER, {"inscrits": inscrits})
+            curs.execute("ALTER TABLE reservation ENABLE TRIGGER USER")
+            curs.execute("SELECT recalculer_compteurs()")
+            curs.execute("ANALYZE utilisateur, reservation")
+
+    mesures = {"Liste complète (modèles)": _mesurer(lambda: ReservationDao().lister_inscrits(1))}
+    mesures["Export CSV en flux"] = _mesurer(lambda: _exporter("csv"))
+    if ExportService.parquet_disponible():
+        mesures["Export Parquet en flux"] = _mesurer(lambda: _exporter("parquet"))
+
+    if not garder:
+        with DBConnection().connection as con:
+            with con.cursor() as curs:
+                curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {"inscrits": inscrits, "mesures": [{"methode": nom, **m} for nom, m in mesures.items()]}
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\n{rapport['inscrits']} inscrits")
+    print(f"{'Méthode':<28} | {'Durée':>9} | {'Pic mémoire':>12}")
+    print("-" * 56)
+    for m in rapport["mesures"]:
+        print(f"{m['methode']:<28} | {m['duree_s']:>7.2f} s | {m['pic_memoire_mo']:>9.1f} Mo")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark de l'export des inscrits")
+    parser.add_argument("--inscrits", type=int, default=100_000)
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.inscrits, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_export.py [--inscrits 100000] [--json]
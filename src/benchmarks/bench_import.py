@@ -0,0 +1,136 @@
+"""
+Benchmark de l'import en masse des participants.
+
+Génère un CSV de `--lignes` participants (avec quelques lignes invalides et
+doublons), puis compare dans un schéma jetable :
+- la création un par un (ParticipantService.create_participant), mesurée sur
+  un échantillon et extrapolée ;
+- l'import en masse (ParticipantService.importer_csv : hachage en parallèle + COPY).
+Le coût bcrypt (--cout) domine les deux chemins : un coût bas isole la partie base.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import io
+import json
+import time
+from typing import Any, Dict
+
+import dotenv
+
+from dao.db_connection import DBConnection
+from model.participant_models import ParticipantModelIn
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_import"
+
+
+def generer_csv(lignes: int) -> str:
+    """CSV d'une promotion fictive : 1 ligne sur 100 invalide, 1 sur 200 en double."""
+    tampon = io.StringIO()
+    tampon.write("nom,prenom,telephone,email,mot_de_passe\n")
+    for i in range(lignes):
+        email = f"eleve{i}@ensai.fr"
+        if i % 100 == 99:
+            email = f"eleve{i}-sans-arobase"
+        elif i % 200 == 150:
+            email = f"eleve{i - 1}@ensai.fr"
+        tampon.write(f"Nom{i},Prenom{i},06{i:08d},{email},mdpEleve{i}\n")
+    return tampon.getvalue()
+
+
+def lancer(lignes: int, echantillon: int, cout: int, workers: int, taille_lot: int, garder: bool) -> Dict[str, Any]:
+    # Le hacheur partagé lit sa configuration à sa création
+    os.environ["BCRYPT_COUT"] = str(cout)
+    os.environ["BCRYPT_WORKERS"] = str(workers)
+    from service.participant_service import ParticipantService
+    from utils.securite import hacheur
+
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+
+    service = ParticipantService()
+    contenu = generer_csv(lignes)
+    try:
+        # Démarrage des processus de hachage hors mesure
+        hacheur().hacher_lot(["echauffement"] * max(workers, 1))
+
+        debut = time.perf_counter()
+        for i in range(echantillon):
+            service.create_participant(ParticipantModelIn(
+                nom=f"Seul{i}", prenom="Un", telephone=None, email=f"seul{i}@ensai.fr", mot_de_passe=f"mdpSeul{i}"
+            ))
+        un_par_un = time.perf_counter() - debut
+
+        debut = time.perf_counter()
+        rapport = service.importer_csv(io.StringIO(contenu), taille_lot=taille_lot)
+        en_masse = time.perf_counter() - debut
+    finally:
+        hacheur().fermer()
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "lignes": lignes,
+        "cout": cout,
+        "workers": workers,
+        "un_par_un": {
+            "echantillon": echantillon,
+            "lignes_par_s": echantillon / un_par_un,
+            "duree_estimee_s": un_par_un / echantillon * lignes,
+        },
+        "en_masse": {
+            "importees": rapport.importees,
+            "rejetees": len(rapport.rejetees),
+            "duree_s": en_masse,
+            "lignes_par_s": lignes / en_masse,
+        },
+        "gain": (un_par_un / echantillon * lignes) / en_masse,
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    u, m = rapport["un_par_un"], rapport["en_masse"]
+    print(f"\n{rapport['lignes']} lignes, bcrypt coût {rapport['cout']}, {rapport['workers']} processus")
+    print(f"{'Méthode':<22} | {'Lignes/s':>10} | {'Durée':>10}")
+    print("-" * 50)
+    print(f"{'Un par un (estimé)':<22} | {u['lignes_par_s']:>10.0f} | {u['duree_estimee_s']:>8.1f} s")
+    print(f"{'Import en masse':<22} | {m['lignes_par_s']:>10.0f} | {m['duree_s']:>8.1f} s")
+    print("-" * 50)
+    print(f"Gain : {rapport['gain']:.1f}x — {m['importees']} importées, {m['rejetees']} rejetées")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark de l'import en masse des participants")
+    parser.add_argument("--lignes", type=int, default=10_000)
+    parser.add_argument("--echantillon", type=int, default=200, help="créations un par un mesurées")
+    parser.add_argument("--cout", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--taille-lot", type=int, default=1000)
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.lignes, args.echantillon, args.cout, args.workers, args.taille_lot, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_import.py [--lignes 10000 --cout 12] [--json]
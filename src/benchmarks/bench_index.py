@@ -0,0 +1,196 @@
+"""
+Benchmark des index de la migration 001 sur un jeu de données volumineux.
+
+Crée un schéma jetable, le peuple (utilisateurs, événements, bus, réservations,
+commentaires), mesure les requêtes des DAO sans les index, applique les
+migrations, puis mesure à nouveau. Affiche le temps médian de chaque requête
+avant / après et le gain ; --json pour une sortie exploitable.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import random
+import statistics
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Tuple
+
+import dotenv
+
+from dao.administrateur_dao import AdministrateurDao
+from dao.commentaire_dao import CommentaireDao
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.db_connection import DBConnection
+from dao.reservation_dao import ReservationDao
+from utils.migrations import Migrations
+from utils.pagination import params_par_id
+
+SCHEMA = "projet_bench_index"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '0600000000', 'user' || i || '@ensai.fr', 'x', i %% 1000 = 0
+    FROM generate_series(1, %(utilisateurs)s) AS i;
+
+    INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement, description,
+                           capacite, categorie, statut)
+    SELECT 1000, 'Evenement ' || i, i || ' rue de Bruz', 'Ville ' || (i %% 2000),
+           DATE '2020-01-01' + (i %% 3650), 'Description', 200 + i %% 300, 'Soirée',
+           CASE WHEN i %% 20 = 0 THEN 'annulé'
+                WHEN i %% 10 < 2 THEN 'disponible en ligne'
+                ELSE 'déjà réalisé' END
+    FROM generate_series(1, %(evenements)s) AS i;
+
+    INSERT INTO bus (fk_evenement, matricule, nombre_places, direction, description)
+    SELECT e, 'BUS-' || e || '-' || d, 60, d, 'Bus ' || e || ' ' || d
+    FROM generate_series(1, %(evenements)s) AS e, unnest(ARRAY['aller', 'retour']) AS d;
+
+    -- Utilisateurs distincts par événement : pas de 7 sur un nombre d'utilisateurs premier avec 7
+    INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam,
+                             boisson, date_reservation)
+    SELECT ((e * 7919 + k * 7) %% %(utilisateurs)s) + 1, e,
+           k %% 2 = 0, k %% 3 = 0, k %% 4 = 0, k %% 10 = 0, k %% 5 = 0,
+           TIMESTAMP '2020-01-01' + make_interval(mins => e * 53 + k)
+    FROM generate_series(1, %(evenements)s) AS e,
+         generate_series(1, %(par_evenement)s) AS k;
+
+    INSERT INTO commentaire (fk_reservation, fk_utilisateur, note, avis)
+    SELECT id_reservation, fk_utilisateur, 1 + id_reservation %% 5, 'Avis'
+    FROM reservation
+    WHERE id_reservation %% 3 = 0;
+"""
+
+TABLES = ("reservation", "commentaire", "bus")
+SQL_ANALYZE = "ANALYZE utilisateur, evenement, bus, reservation, commentaire"
+
+
+def _requetes(params: Dict[str, int]) -> List[Tuple[str, Callable[[random.Random], Tuple[str, Dict[str, Any]]]]]:
+    """Requêtes des DAO mesurées, avec un tirage de paramètres par exécution."""
+    n_evt, n_resa = params["evenements"], params["evenements"] * params["par_evenement"]
+    consultation = ConsultationEvenementDao
+
+    return [
+        ("Réservations d'un événement",
+         lambda rnd: (ReservationDao.SQL_FIND_BY_EVENT, {"id_evenement": rnd.randint(1, n_evt)})),
+        ("Inscrits d'un événement (avec avis)",
+         lambda rnd: (ReservationDao.SQL_LISTE_INSCRITS, {"id_evenement": rnd.randint(1, n_evt)})),
+        ("Commentaire d'une réservation",
+         lambda rnd: (CommentaireDao.SQL_FIND_BY_RESERVATION_ID, {"id_resa": rnd.randint(1, n_resa)})),
+        ("Commentaires d'un événement",
+         lambda rnd: (CommentaireDao.SQL_FIND_ALL_BY_EVENT_ID, {"id_evt": rnd.randint(1, n_evt)})),
+        ("Bus d'un événement",
+         lambda rnd: (CreneauBusDao.SQL_FIND_BY_EVENT, {"id_evenement": rnd.randint(1, n_evt)})),
+        ("Événements disponibles (page de 20)",
+         lambda rnd: consultation._requete_lister_disponibles(
+             20, 0, date(2020, 1, 1) + timedelta(days=rnd.randint(0, 3000)))),
+        ("Recherche par statut",
+         lambda rnd: consultation._requete_rechercher(None, None, "annulé", None, None, 20, 0)),
+        ("Recherche par ville (ILIKE)",
+         lambda rnd: consultation._requete_rechercher(f"Ville {rnd.randint(1, 1999)}", None, None, None, None, 20, 0)),
+        ("Administrateurs (page de 50)",
+         lambda rnd: (AdministrateurDao.SQL_FIND_PAGE, params_par_id(None, 50, AdministrateurDao.LISTE_PAGE))),
+    ]
+
+
+def _mesurer(curs, requetes, repetitions: int, graine: int) -> Dict[str, float]:
+    """Temps médian (ms) de chaque requête, mêmes paramètres d'une phase à l'autre."""
+    resultats = {}
+    for nom, tirage in requetes:
+        rnd = random.Random(graine)
+        durees = []
+        for _ in range(repetitions):
+            sql, p = tirage(rnd)
+            debut = time.perf_counter()
+            curs.execute(sql, p)
+            curs.fetchall()
+            durees.append((time.perf_counter() - debut) * 1000)
+        resultats[nom] = statistics.median(durees)
+    return resultats
+
+
+def lancer(utilisateurs: int, evenements: int, par_evenement: int, repetitions: int, garder: bool) -> Dict[str, Any]:
+    params = {"utilisateurs": utilisateurs, "evenements": evenements, "par_evenement": par_evenement}
+    if utilisateurs % 7 == 0 or par_evenement > utilisateurs:
+        raise ValueError("Le nombre d'utilisateurs doit être premier avec 7 et au moins égal à par_evenement.")
+
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+
+            print(f"Peuplement : {utilisateurs} utilisateurs, {evenements} événements, "
+                  f"{evenements * par_evenement} réservations...")
+            debut = time.perf_counter()
+            # Compteurs recalculés en une fois à la fin plutôt que ligne à ligne
+            for table in TABLES:
+                curs.execute(f"ALTER TABLE {table} DISABLE TRIGGER USER")
+            curs.execute(SQL_PEUPLER, params)
+            for table in TABLES:
+                curs.execute(f"ALTER TABLE {table} ENABLE TRIGGER USER")
+            curs.execute("SELECT recalculer_compteurs()")
+        con.commit()
+        print(f"  fait en {time.perf_counter() - debut:.1f} s")
+
+        with con.cursor() as curs:
+            curs.execute(SQL_ANALYZE)
+            requetes = _requetes(params)
+            avant = _mesurer(curs, requetes, repetitions, graine=42)
+
+            Migrations().appliquer(con)
+            curs.execute(SQL_ANALYZE)
+            apres = _mesurer(curs, requetes, repetitions, graine=42)
+
+            if not garder:
+                curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "donnees": params,
+        "repetitions": repetitions,
+        "requetes": [
+            {"requete": nom, "sans_index_ms": avant[nom], "avec_index_ms": apres[nom],
+             "gain": avant[nom] / apres[nom] if apres[nom] else None}
+            for nom, _ in requetes
+        ],
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\n{'Requête':<40} | {'Sans index':>11} | {'Avec index':>11} | {'Gain':>7}")
+    print("-" * 80)
+    for r in rapport["requetes"]:
+        print(f"{r['requete']:<40} | {r['sans_index_ms']:>8.2f} ms | {r['avec_index_ms']:>8.2f} ms | "
+              f"{r['gain']:>6.1f}x")
+    print("-" * 80)
+    print(f"(temps médian sur {rapport['repetitions']} exécutions)")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark des index (migration 001)")
+    parser.add_argument("--utilisateurs", type=int, default=100_003)
+    parser.add_argument("--evenements", type=int, default=5_000)
+    parser.add_argument("--par-evenement", type=int, default=100)
+    parser.add_argument("--repetitions", type=int, default=50)
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.utilisateurs, args.evenements, args.par_evenement, args.repetitions, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_index.py [--evenements 5000 --par-evenement 100] [--json]
@@ -0,0 +1,178 @@
+"""
+Benchmark de la conversion des lignes SQL en modèles pydantic : objets par
+seconde sur des résultats de 10k lignes.
+
+Crée un schéma jetable (`--lignes` participants inscrits au même événement,
+`--lignes` événements), applique les migrations, lit une fois les lignes de
+ReservationDao.find_by_event, EvenementDao.find_all, UtilisateurDao.find_all
+et ConsultationEvenementDao.lister_tous (colonnes en trop ignorées), puis les
+convertit selon chaque méthode :
+- Modele(**ligne), l'ancienne conversion des DAO ;
+- Modele.model_validate(ligne), validation ligne par ligne (DB_VALIDER_LIGNES=1) ;
+- Modele.model_construct(**ligne), sans validation ;
+- dao.lignes.vers_modeles, le convertisseur préparé utilisé par les DAO.
+On rapporte le meilleur de `--repetitions` essais, et la durée de l'appel DAO
+complet (requête + conversion).
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import time
+from typing import Any, Callable, Dict, List
+
+import dotenv
+
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.db_connection import DBConnection
+from dao.evenement_dao import EvenementDao
+from dao.lignes import vers_modeles
+from dao.reservation_dao import ReservationDao
+from dao.utilisateur_dao import UtilisateurDao
+from model.evenement_models import EvenementModelOut
+from model.reservation_models import ReservationModelOut
+from model.utilisateur_models import UtilisateurModelOut
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_lignes"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    VALUES ('Admin', 'Bench', '0600000000', 'admin@ensai.fr', 'x', TRUE);
+
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '06' || lpad(i::text, 8, '0'),
+           'participant' || i || '@ensai.fr', 'x', FALSE
+    FROM generate_series(1, %(lignes)s) AS i;
+
+    INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement, description,
+                           capacite, categorie, statut)
+    SELECT 1, 'Soirée ' || i, i || ' rue de Rennes', 'Bruz', DATE '2026-01-01' + i %% 1000,
+           'Soirée de benchmark', %(lignes)s + 1, 'Soirée', 'disponible en ligne'
+    FROM generate_series(1, %(lignes)s) AS i;
+
+    INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+    SELECT id_utilisateur, 1, FALSE, FALSE, id_utilisateur %% 2 = 0, id_utilisateur %% 5 = 0, TRUE
+    FROM utilisateur
+    WHERE NOT administrateur;
+"""
+
+METHODES: Dict[str, Callable[[type, List[Any]], List[Any]]] = {
+    "Modele(**ligne)": lambda modele, rows: [modele(**r) for r in rows],
+    "model_validate": lambda modele, rows: [modele.model_validate(r) for r in rows],
+    "model_construct": lambda modele, rows: [modele.model_construct(**r) for r in rows],
+    "convertisseur préparé (dao.lignes)": vers_modeles,
+}
+
+
+def _meilleur(fn: Callable[[], Any], repetitions: int) -> float:
+    durees = []
+    for _ in range(repetitions):
+        debut = time.perf_counter()
+        fn()
+        durees.append(time.perf_counter() - debut)
+    return min(durees)
+
+
+def _lire(requete: str, params: Dict[str, Any]) -> List[Any]:
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(requete, params)
+            return curs.fetchall()
+
+
+def lancer(nb_lignes: int, repetitions: int, garder: bool) -> Dict[str, Any]:
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+        with con.cursor() as curs:
+            curs.execute(SQL_PEUPLER, {"lignes": nb_lignes})
+            curs.execute("ANALYZE")
+
+    consultation = ConsultationEvenementDao()
+    requete_tous, params_tous = consultation._requete_lister_tous(
+        nb_lignes, 0, "date_evenement ASC, id_evenement ASC"
+    )
+    sources = {
+        "ReservationDao.find_by_event": (
+            ReservationModelOut,
+            lambda: _lire(ReservationDao.SQL_FIND_BY_EVENT, {"id_evenement": 1}),
+            lambda: ReservationDao().find_by_event(1),
+        ),
+        "EvenementDao.find_all": (
+            EvenementModelOut,
+            lambda: _lire(EvenementDao.SQL_FIND_ALL, {"limit": nb_lignes, "offset": 0}),
+            lambda: EvenementDao().find_all(limit=nb_lignes),
+        ),
+        "UtilisateurDao.find_all": (
+            UtilisateurModelOut,
+            lambda: _lire(UtilisateurDao.SQL_FIND_ALL, {"limit": nb_lignes, "offset": 0}),
+            lambda: UtilisateurDao().find_all(limit=nb_lignes),
+        ),
+        "ConsultationEvenementDao.lister_tous": (
+            EvenementModelOut,
+            lambda: _lire(requete_tous, params_tous),
+            None,
+        ),
+    }
+
+    mesures = []
+    try:
+        for nom, (modele, lire, appel) in sources.items():
+            rows = lire()
+            conversions = {}
+            for methode, convertir in METHODES.items():
+                duree = _meilleur(lambda: convertir(modele, rows), repetitions)
+                conversions[methode] = {"duree_ms": duree * 1000, "objets_par_s": len(rows) / duree}
+            mesure = {"requete": nom, "modele": modele.__name__, "lignes": len(rows), "conversions": conversions}
+            if appel is not None:
+                mesure["appel_dao_ms"] = _meilleur(appel, repetitions) * 1000
+            mesures.append(mesure)
+    finally:
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {"lignes": nb_lignes, "repetitions": repetitions, "mesures": mesures}
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    for m in rapport["mesures"]:
+        print(f"\n{m['requete']} -> {m['modele']} ({m['lignes']} lignes)")
+        print(f"{'Méthode':<38} | {'Durée':>9} | {'Objets/s':>11}")
+        print("-" * 64)
+        for methode, c in m["conversions"].items():
+            print(f"{methode:<38} | {c['duree_ms']:>6.1f} ms | {c['objets_par_s']:>11,.0f}")
+        if "appel_dao_ms" in m:
+            print(f"Appel DAO complet : {m['appel_dao_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark de la conversion des lignes en modèles")
+    parser.add_argument("--lignes", type=int, default=10_000, help="taille des résultats")
+    parser.add_argument("--repetitions", type=int, default=5, help="essais par mesure (le meilleur est gardé)")
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.lignes, args.repetitions, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_lignes.py [--lignes 10000] [--json]
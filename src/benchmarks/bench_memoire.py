@@ -0,0 +1,161 @@
+"""
+Benchmark mémoire des objets tenus en mémoire pour une grosse liste : octets
+par objet et total retenu, selon la représentation.
+
+Génère en mémoire, comme les décoderait le pilote PostgreSQL (chaînes et
+dates neuves à chaque ligne), `--reservations` réservations, autant de lignes
+de la liste des inscrits et `--evenements` événements, puis mesure
+(tracemalloc) ce qui reste en mémoire une fois les lignes converties et
+libérées :
+- les lignes elles-mêmes (dict) ;
+- les modèles pydantic renvoyés par les DAO (dao.lignes) ;
+- un objet métier classique, à __dict__ ;
+- les variantes compactes de business_object.compacts (emplacements fixes,
+  Enum, chaînes internées, options dans un entier).
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+from business_object.compacts import EvenementCompact, InscritCompact, ReservationCompacte
+from dao.lignes import vers_modeles
+from model.evenement_models import EvenementModelOut
+from model.reservation_models import InscritModelOut, ReservationModelOut
+
+DEBUT = datetime(2026, 1, 1, 20, 0)
+PRENOMS = ["Alice", "Bob", "Chloé", "David", "Emma", "Hugo", "Inès", "Jules", "Léa", "Louis"]
+VILLES = ["Rennes", "Bruz", "Nantes", "Paris", "Lyon", "Brest", "Vannes", "Lorient"]
+CATEGORIES = ["Soirée", "Sport", "Musique", "Art", "Technologie"]
+STATUTS = ["disponible en ligne", "déjà réalisé", "annulé", "pas encore finalisé"]
+
+
+def _texte(valeur: str) -> str:
+    """Chaîne neuve, comme décodée par le pilote pour chaque ligne."""
+    return valeur.encode().decode()
+
+
+def lignes_reservations(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id_reservation": i, "fk_utilisateur": 2 + i, "fk_evenement": 1 + i % 300,
+            "bus_aller": i % 2 == 0, "bus_retour": i % 3 == 0, "adherent": i % 4 != 0,
+            "sam": i % 10 == 0, "boisson": i % 5 != 0, "date_reservation": DEBUT + timedelta(seconds=i),
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+def lignes_inscrits(n: int) -> List[Dict[str, Any]]:
+    lignes = lignes_reservations(n)
+    for i, ligne in enumerate(lignes, start=1):
+        ligne.update(
+            nom=f"Nom{i}", prenom=_texte(PRENOMS[i % len(PRENOMS)]), email=f"participant{i}@ensai.fr",
+            commentaire_note=None, commentaire_avis=None,
+        )
+        del ligne["fk_evenement"]
+    return lignes
+
+
+def lignes_evenements(n: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id_evenement": i, "fk_utilisateur": 1, "titre": f"Soirée {i}", "adresse": f"{i} rue de Rennes",
+            "ville": _texte(VILLES[i % len(VILLES)]), "date_evenement": date(2026, 1, 1) + timedelta(days=i % 1000),
+            "description": None, "capacite": 50 + i % 200, "categorie": _texte(CATEGORIES[i % len(CATEGORIES)]),
+            "statut": _texte(STATUTS[i % len(STATUTS)]), "date_creation": DEBUT + timedelta(minutes=i),
+            "ouverture": None,
+        }
+        for i in range(1, n + 1)
+    ]
+
+
+class ObjetMetier:
+    """Objet métier classique : attributs dans un __dict__ par instance."""
+
+    def __init__(self, **champs):
+        self.__dict__.update(champs)
+
+
+def _representations(modele: type, compact: type) -> Dict[str, Callable[[List[Dict[str, Any]]], List[Any]]]:
+    return {
+        "lignes (dict)": lambda rows: rows,
+        f"pydantic ({modele.__name__})": lambda rows: vers_modeles(modele, rows),
+        "objet métier à __dict__": lambda rows: [ObjetMetier(**r) for r in rows],
+        f"compact ({compact.__name__})": lambda rows: [compact.depuis(r) for r in rows],
+    }
+
+
+def mesurer(generer: Callable[[], List[Dict[str, Any]]], convertir: Callable) -> Dict[str, float]:
+    """
+    Mémoire retenue par les objets convertis, une fois les lignes libérées,
+    et durée de la conversion (mesurée à part : tracemalloc la ralentit).
+    """
+    rows = generer()
+    debut = time.perf_counter()
+    convertir(rows)
+    duree = time.perf_counter() - debut
+    del rows
+
+    gc.collect()
+    tracemalloc.start()
+    rows = generer()
+    objets = convertir(rows)
+    del rows
+    gc.collect()
+    retenu = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    n = len(objets)
+    del objets
+    return {"objets": n, "retenu_mo": retenu / 1e6, "octets_par_objet": retenu / n, "conversion_ms": duree * 1000}
+
+
+def lancer(reservations: int, evenements: int) -> Dict[str, Any]:
+    listes = {
+        "reservations": (lambda: lignes_reservations(reservations), ReservationModelOut, ReservationCompacte),
+        "inscrits": (lambda: lignes_inscrits(reservations), InscritModelOut, InscritCompact),
+        "evenements": (lambda: lignes_evenements(evenements), EvenementModelOut, EvenementCompact),
+    }
+    mesures = []
+    for liste, (generer, modele, compact) in listes.items():
+        for nom, convertir in _representations(modele, compact).items():
+            mesures.append({"liste": liste, "representation": nom, **mesurer(generer, convertir)})
+    return {"reservations": reservations, "evenements": evenements, "mesures": mesures}
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    liste = None
+    for m in rapport["mesures"]:
+        if m["liste"] != liste:
+            liste = m["liste"]
+            print(f"\n{liste} ({m['objets']} objets)")
+            print(f"{'Représentation':<36} | {'Retenu':>9} | {'Octets/objet':>12} | {'Conversion':>10}")
+            print("-" * 78)
+        print(f"{m['representation']:<36} | {m['retenu_mo']:>6.1f} Mo | {m['octets_par_objet']:>12.0f} | "
+              f"{m['conversion_ms']:>7.0f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark mémoire des objets métier")
+    parser.add_argument("--reservations", type=int, default=100_000)
+    parser.add_argument("--evenements", type=int, default=10_000)
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.reservations, args.evenements)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_memoire.py [--reservations 100000] [--json]
@@ -0,0 +1,177 @@
+"""
+Benchmark des instructions préparées : latence par appel des requêtes chaudes
+des DAO, préparées (PREPARE / EXECUTE par nom) ou analysées à chaque appel.
+
+Crée un schéma jetable (`--utilisateurs` participants, `--evenements`
+événements, deux réservations par participant), applique les migrations, puis
+exécute chaque RequetePreparee `--appels` fois sur une même connexion du pool,
+avec puis sans préparation (ConnexionChronometree.preparer). On rapporte la
+moyenne et le p95 par appel, et le temps gagné par appel.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import dotenv
+
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.db_connection import ConnexionChronometree, DBConnection
+from dao.evenement_dao import EvenementDao
+from dao.participant_dao import ParticipantDao
+from dao.reservation_dao import ReservationDao
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_preparees"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    VALUES ('Admin', 'Bench', '0600000000', 'admin@ensai.fr', 'x', TRUE);
+
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '06' || lpad(i::text, 8, '0'),
+           'participant' || i || '@ensai.fr', 'x', FALSE
+    FROM generate_series(1, %(utilisateurs)s) AS i;
+
+    INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement, description,
+                           capacite, categorie, statut)
+    SELECT 1, 'Soirée ' || i, i || ' rue de Rennes', 'Bruz', DATE '2026-01-01' + i,
+           'Soirée de benchmark', 100000, 'Soirée', 'disponible en ligne'
+    FROM generate_series(1, %(evenements)s) AS i;
+
+    INSERT INTO reservation (fk_utilisateur, fk_evenement, bus_aller, bus_retour, adherent, sam, boisson)
+    SELECT u.id_utilisateur, 1 + (u.id_utilisateur + k * 7) %% %(evenements)s, FALSE, FALSE, TRUE, FALSE, FALSE
+    FROM utilisateur u, generate_series(0, 1) AS k
+    WHERE NOT u.administrateur;
+"""
+
+
+def _cas(utilisateurs: int, evenements: int) -> Dict[str, Callable[[int], tuple]]:
+    """Requête et paramètres du i-ème appel, pour chaque requête chaude mesurée."""
+    return {
+        "EvenementDao.find_by_id": lambda i: (EvenementDao.SQL_FIND_BY_ID, {"id": 1 + i % evenements}),
+        "ParticipantDao.find_by_email": lambda i: (
+            ParticipantDao.SQL_FIND_BY_EMAIL, {"email": f"participant{1 + i % utilisateurs}@ensai.fr"}
+        ),
+        "ReservationDao.find_by_user": lambda i: (
+            ReservationDao.SQL_FIND_BY_USER, {"id_utilisateur": 2 + i % utilisateurs}
+        ),
+        "ReservationDao.exists_for_user_and_event": lambda i: (
+            ReservationDao.SQL_EXISTS_FOR_USER_AND_EVENT,
+            {"id_user": 2 + i % utilisateurs, "id_event": 1 + i % evenements},
+        ),
+        "ReservationDao.count_bus_taken": lambda i: (
+            ReservationDao.SQL_COUNT_BUS_TAKEN["aller"], {"id": 1 + i % evenements}
+        ),
+        "ConsultationEvenementDao.disponibilites": lambda i: (
+            ConsultationEvenementDao.SQL_DISPONIBILITES,
+            {"ids": [1 + (i + k) % evenements for k in range(20)]},
+        ),
+    }
+
+
+def _mesurer(cas: Callable[[int], tuple], appels: int, preparer: bool) -> List[float]:
+    """Durées (s) de `appels` exécutions + lectures, sur une seule connexion."""
+    ConnexionChronometree.preparer = preparer
+    durees = []
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("DEALLOCATE ALL")
+            con.preparees.clear()
+            for i in range(-10, appels):  # 10 appels d'échauffement, dont la préparation
+                requete, params = cas(i)
+                debut = time.perf_counter()
+                curs.execute(requete, params)
+                curs.fetchall()
+                if i >= 0:
+                    durees.append(time.perf_counter() - debut)
+    return durees
+
+
+def _resume(durees: List[float]) -> Dict[str, float]:
+    durees = sorted(durees)
+    return {
+        "moyenne_ms": statistics.fmean(durees) * 1000,
+        "p95_ms": durees[min(len(durees) - 1, int(len(durees) * 0.95))] * 1000,
+    }
+
+
+def lancer(utilisateurs: int, evenements: int, appels: int, garder: bool) -> Dict[str, Any]:
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+        with con.cursor() as curs:
+            curs.execute(SQL_PEUPLER, {"utilisateurs": utilisateurs, "evenements": evenements})
+            curs.execute("ANALYZE")
+
+    preparer = ConnexionChronometree.preparer
+    mesures = []
+    try:
+        for site, cas in _cas(utilisateurs, evenements).items():
+            prepare = _resume(_mesurer(cas, appels, True))
+            direct = _resume(_mesurer(cas, appels, False))
+            mesures.append({
+                "site": site,
+                "nom": cas(0)[0].nom,
+                "preparee": prepare,
+                "analysee": direct,
+                "gain_par_appel_us": (direct["moyenne_ms"] - prepare["moyenne_ms"]) * 1000,
+                "gain_pct": (1 - prepare["moyenne_ms"] / direct["moyenne_ms"]) * 100,
+            })
+    finally:
+        ConnexionChronometree.preparer = preparer
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "utilisateurs": utilisateurs,
+        "evenements": evenements,
+        "appels": appels,
+        "mesures": mesures,
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\n{rapport['utilisateurs']} participants, {rapport['evenements']} événements, "
+          f"{rapport['appels']} appels par requête")
+    print(f"{'Requête':<42} | {'Préparée':>9} | {'Analysée':>9} | {'Gain/appel':>10} | {'Gain':>6}")
+    print("-" * 90)
+    for m in rapport["mesures"]:
+        print(f"{m['site']:<42} | {m['preparee']['moyenne_ms']:>6.3f} ms | {m['analysee']['moyenne_ms']:>6.3f} ms | "
+              f"{m['gain_par_appel_us']:>7.1f} µs | {m['gain_pct']:>5.1f}%")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark des instructions préparées")
+    parser.add_argument("--utilisateurs", type=int, default=10_000)
+    parser.add_argument("--evenements", type=int, default=500)
+    parser.add_argument("--appels", type=int, default=2_000, help="exécutions par requête et par mode")
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.utilisateurs, args.evenements, args.appels, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_preparees.py [--appels 2000] [--json]
@@ -0,0 +1,167 @@
+"""
+Benchmark de la recherche d'événements : latence sur un gros catalogue.
+
+Crée un schéma jetable avec `--evenements` événements synthétiques (titres,
+villes et descriptions tirés de vocabulaires français), applique les migrations,
+puis mesure pour une série de requêtes :
+- l'ancienne recherche (ConsultationEvenementDao.rechercher, ville ILIKE '%x%') ;
+- un ILIKE sur titre et description, sans index utilisable ;
+- la recherche plein texte (rechercher_texte : tsvector + GIN, tri par pertinence,
+  extraits), avec la similarité trigramme si pg_trgm est installé.
+Chaque requête est répétée `--repetitions` fois ; on rapporte p50 / p95 en ms.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import statistics
+import time
+from typing import Any, Callable, Dict, List
+
+import dotenv
+
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.db_connection import DBConnection
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_recherche"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    VALUES ('Admin', 'Bench', '0600000000', 'admin@ensai.fr', 'x', TRUE);
+
+    WITH vocabulaire AS (
+        SELECT ARRAY['Soirée', 'Gala', 'Festival', 'Tournoi', 'Concert', 'Conférence',
+                     'Atelier', 'Randonnée', 'Exposition', 'Afterwork'] AS types,
+               ARRAY['de rentrée', 'de printemps', 'des anciens', 'caritatif', 'de Noël',
+                     'du BDE', 'de musique', 'de football', 'de cuisine', 'astronomie'] AS themes,
+               ARRAY['Rennes', 'Bruz', 'Nantes', 'Paris', 'Lyon', 'Toulouse', 'Lille',
+                     'Bordeaux', 'Marseille', 'Brest'] AS villes,
+               ARRAY['Sport', 'Musique', 'Art', 'Technologie', 'Soirée'] AS categories,
+               ARRAY['Navette depuis le campus', 'Buffet offert aux adhérents',
+                     'Tenue correcte exigée', 'Places limitées, réservez vite',
+                     'Animations et jeux toute la soirée', 'Intervenants de l''industrie',
+                     'Matériel fourni sur place', 'Concert en plein air'] AS phrases
+    )
+    INSERT INTO evenement (fk_utilisateur, titre, adresse, ville, date_evenement, description,
+                           capacite, categorie, statut)
+    SELECT 1,
+           types[1 + i %% 10] || ' ' || themes[1 + (i / 10) %% 10] || ' ' || i,
+           i || ' rue de la République',
+           villes[1 + (i / 7) %% 10],
+           DATE '2026-01-01' + (i %% 1000),
+           phrases[1 + i %% 8] || '. ' || phrases[1 + (i / 8) %% 8] || '.',
+           50 + i %% 200,
+           categories[1 + i %% 5],
+           CASE WHEN i %% 4 = 0 THEN 'déjà réalisé' ELSE 'disponible en ligne' END
+    FROM vocabulaire, generate_series(1, %(evenements)s) AS i;
+"""
+
+SQL_ILIKE = """
+    SELECT id_evenement, titre, date_evenement
+    FROM evenement
+    WHERE titre ILIKE %(motif)s OR description ILIKE %(motif)s
+    ORDER BY date_evenement, id_evenement
+    LIMIT 20
+"""
+
+REQUETES = ["concert", "festival musique", "gala de noël", "randonnée bruz", "buffet adhérents"]
+REQUETES_FAUTES = ["festval", "tournoi footbal", "conferense"]
+
+
+def _percentiles(durees: List[float]) -> Dict[str, float]:
+    durees = sorted(durees)
+    return {
+        "p50_ms": statistics.median(durees) * 1000,
+        "p95_ms": durees[min(len(durees) - 1, int(len(durees) * 0.95))] * 1000,
+    }
+
+
+def _mesurer(fn: Callable[[str], Any], requetes: List[str], repetitions: int) -> Dict[str, Any]:
+    durees, resultats = [], 0
+    for texte in requetes:
+        fn(texte)  # échauffement (cache du serveur)
+        for _ in range(repetitions):
+            debut = time.perf_counter()
+            resultats = len(fn(texte))
+            durees.append(time.perf_counter() - debut)
+    return {**_percentiles(durees), "resultats_derniere_requete": resultats}
+
+
+def _ilike(texte: str) -> List[Any]:
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(SQL_ILIKE, {"motif": f"%{texte}%"})
+            return curs.fetchall()
+
+
+def lancer(evenements: int, repetitions: int, garder: bool) -> Dict[str, Any]:
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+        with con.cursor() as curs:
+            curs.execute(SQL_PEUPLER, {"evenements": evenements})
+            curs.execute("ANALYZE evenement")
+
+    dao = ConsultationEvenementDao()
+    try:
+        mesures = {
+            "Ville ILIKE (rechercher)": _mesurer(lambda t: dao.rechercher(ville=t, limit=20), REQUETES, repetitions),
+            "Titre / description ILIKE": _mesurer(_ilike, REQUETES, repetitions),
+            "Plein texte (rechercher_texte)": _mesurer(lambda t: dao.rechercher_texte(t), REQUETES, repetitions),
+        }
+        if ConsultationEvenementDao._trigramme:
+            mesures["Fautes de frappe (trigrammes)"] = _mesurer(
+                lambda t: dao.rechercher_texte(t), REQUETES_FAUTES, repetitions
+            )
+    finally:
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "evenements": evenements,
+        "repetitions": repetitions,
+        "trigrammes": bool(ConsultationEvenementDao._trigramme),
+        "mesures": [{"methode": nom, **m} for nom, m in mesures.items()],
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\n{rapport['evenements']} événements, pg_trgm : {'oui' if rapport['trigrammes'] else 'non'}")
+    print(f"{'Méthode':<32} | {'p50':>9} | {'p95':>9} | {'Résultats':>9}")
+    print("-" * 68)
+    for m in rapport["mesures"]:
+        print(f"{m['methode']:<32} | {m['p50_ms']:>6.2f} ms | {m['p95_ms']:>6.2f} ms | "
+              f"{m['resultats_derniere_requete']:>9}")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Benchmark de la recherche d'événements")
+    parser.add_argument("--evenements", type=int, default=100_000)
+    parser.add_argument("--repetitions", type=int, default=20, help="mesures par requête")
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de benchmark")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.evenements, args.repetitions, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/bench_recherche.py [--evenements 100000] [--json]
@@ -0,0 +1,230 @@
+"""
+Simulation d'un shotgun : `--utilisateurs` clients se ruent sur un événement
+de `--capacite` places à son heure d'ouverture.
+
+Dans un schéma jetable, deux scénarios sur deux événements identiques :
+- « ruée » : chaque client appelle directement ReservationService.reserver,
+  et réessaie toutes les 50 à 200 ms tant que ce n'est pas ouvert ;
+- « file d'admission » : chaque client passe par AdmissionService (salle
+  d'attente tirée au sort, admission au débit `--debit` après une rafale de
+  `--rafale`, jeton signé, tentatives limitées par utilisateur).
+Un thread par client. On rapporte les tentatives arrivées en base et leur pic
+par seconde, la latence des réservations (p50 / p95 / p99), la durée pour
+remplir l'événement (depuis l'ouverture), les erreurs (pool saturé...) et la
+survente éventuelle.
+"""
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import json
+import random
+import threading
+import time
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+
+import dotenv
+
+from dao.db_connection import DBConnection
+from dao.evenement_dao import EvenementDao
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn, StatutAdmission, StatutReservation
+from service.admission_service import AdmissionService
+from service.reservation_service import ReservationService
+from utils.migrations import Migrations
+
+SCHEMA = "projet_bench_shotgun"
+
+SQL_PEUPLER = """
+    INSERT INTO utilisateur (nom, prenom, telephone, email, mot_de_passe, administrateur)
+    SELECT 'Nom' || i, 'Prenom' || i, '0600000000', 'eleve' || i || '@ensai.fr', 'x', i = 1
+    FROM generate_series(1, %(utilisateurs)s) AS i
+"""
+
+SQL_INSCRITS = "SELECT COUNT(*) AS n FROM reservation WHERE fk_evenement = %(id)s"
+
+
+class Mesures:
+    """Tentatives de réservation arrivées en base (horodatage, durée, statut), partagées par les threads."""
+
+    def __init__(self):
+        self.tentatives: List[tuple] = []
+        self.erreurs = 0
+        self.admissions = 0
+        self._lock = threading.Lock()
+
+    def reserver(self, fn: Callable[[], Any]) -> Any:
+        debut = time.perf_counter()
+        try:
+            resultat = fn()
+        except Exception:
+            with self._lock:
+                self.erreurs += 1
+            return None
+        with self._lock:
+            self.tentatives.append((debut, time.perf_counter() - debut, resultat.statut))
+        return resultat
+
+
+def _client_ruee(id_utilisateur: int, id_evt: int, depart: threading.Event, mesures: Mesures) -> None:
+    service = ReservationService()
+    depart.wait()
+    while True:
+        resultat = mesures.reserver(lambda: service.reserver(
+            ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=id_evt)
+        ))
+        if resultat is not None and resultat.statut != StatutReservation.PAS_OUVERT:
+            return
+        time.sleep(random.uniform(0.05, 0.2))
+
+
+def _client_file(
+    id_utilisateur: int, id_evt: int, depart: threading.Event, mesures: Mesures, file: AdmissionService
+) -> None:
+    depart.wait()
+    while True:
+        admission = file.demander(id_utilisateur, id_evt)
+        with mesures._lock:
+            mesures.admissions += 1
+        if admission.statut == StatutAdmission.COMPLET:
+            return
+        if admission.statut != StatutAdmission.ADMIS:
+            time.sleep(min(max(admission.attente, 0.05), file.RAPPEL_MAX))
+            continue
+        resultat = mesures.reserver(lambda: file.reserver(
+            ReservationModelIn(fk_utilisateur=id_utilisateur, fk_evenement=id_evt), admission.jeton
+        ))
+        if resultat is None or resultat.statut == StatutReservation.TROP_DE_TENTATIVES:
+            time.sleep(resultat.reessayer_dans if resultat else 0.2)
+            continue
+        return
+
+
+def _scenario(nom: str, utilisateurs: int, capacite: int, client: Callable, **kwargs) -> Dict[str, Any]:
+    ouverture = datetime.now() + timedelta(seconds=2)
+    id_evt = EvenementDao().create(EvenementModelIn(
+        fk_utilisateur=1, titre=f"Gala ({nom})", ville="Bruz", date_evenement="2026-12-12",
+        capacite=capacite, statut="disponible en ligne", ouverture=ouverture,
+    )).id_evenement
+
+    mesures, depart = Mesures(), threading.Event()
+    threads = [
+        threading.Thread(target=client, args=(i, id_evt, depart, mesures), kwargs=kwargs, daemon=True)
+        for i in range(1, utilisateurs + 1)
+    ]
+    for t in threads:
+        t.start()
+    # Les clients arrivent dans la seconde qui précède l'ouverture
+    time.sleep(max(0.0, (ouverture - datetime.now()).total_seconds() - 1))
+    debut = time.perf_counter()
+    t_ouverture = debut + (ouverture - datetime.now()).total_seconds()
+    depart.set()
+    for t in threads:
+        t.join()
+    duree = time.perf_counter() - debut
+
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(SQL_INSCRITS, {"id": id_evt})
+            inscrits = curs.fetchone()["n"]
+
+    arrivees = sorted(t for t, _, _ in mesures.tentatives)
+    par_seconde = Counter(int(t - debut) for t in arrivees)
+    latences = sorted(d for _, d, statut in mesures.tentatives if statut != StatutReservation.TROP_DE_TENTATIVES)
+    fins_ok = [t + d for t, d, statut in mesures.tentatives if statut == StatutReservation.OK]
+
+    def centile(q: float) -> float:
+        return latences[min(len(latences) - 1, int(len(latences) * q))] * 1000 if latences else 0.0
+
+    return {
+        "scenario": nom,
+        "tentatives": len(mesures.tentatives),
+        "pic_par_seconde": max(par_seconde.values(), default=0),
+        "demandes_admission": mesures.admissions,
+        "p50_ms": centile(0.50),
+        "p95_ms": centile(0.95),
+        "p99_ms": centile(0.99),
+        "reservations": len(fins_ok),
+        "inscrits_en_base": inscrits,
+        "survente": max(0, inscrits - capacite),
+        "erreurs": mesures.erreurs,
+        # Dernière place attribuée, depuis l'ouverture ; durée : jusqu'à la réponse au dernier client
+        "remplissage_s": max(fins_ok, default=t_ouverture) - t_ouverture,
+        "duree_s": duree,
+    }
+
+
+def lancer(utilisateurs: int, capacite: int, debit: float, rafale: int, garder: bool) -> Dict[str, Any]:
+    with open("data/init_db.sql", encoding="utf-8") as f:
+        init_db = f.read()
+
+    DBConnection().definir_schema(SCHEMA)
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE; CREATE SCHEMA {SCHEMA};")
+            curs.execute(f"SET search_path TO {SCHEMA}, public;")
+            curs.execute(init_db)
+        Migrations().appliquer(con)
+        with con.cursor() as curs:
+            curs.execute(SQL_PEUPLER, {"utilisateurs": utilisateurs})
+
+    # 2 000 threads : des piles réduites suffisent
+    threading.stack_size(512 * 1024)
+    try:
+        scenarios = [
+            _scenario("ruée", utilisateurs, capacite, _client_ruee),
+            _scenario("file d'admission", utilisateurs, capacite, _client_file,
+                      file=AdmissionService(debit=debit, rafale=rafale)),
+        ]
+    finally:
+        if not garder:
+            with DBConnection().connection as con:
+                with con.cursor() as curs:
+                    curs.execute(f"DROP SCHEMA {SCHEMA} CASCADE")
+
+    return {
+        "utilisateurs": utilisateurs,
+        "capacite": capacite,
+        "debit_admission": debit,
+        "rafale_admission": rafale,
+        "scenarios": scenarios,
+    }
+
+
+def afficher(rapport: Dict[str, Any]) -> None:
+    print(f"\n{rapport['utilisateurs']} clients, {rapport['capacite']} places "
+          f"(admission : {rapport['rafale_admission']} puis {rapport['debit_admission']:g}/s)")
+    print(f"{'Scénario':<18} | {'Tentatives':>10} | {'Pic/s':>6} | {'p50':>9} | {'p95':>9} | {'p99':>9} | "
+          f"{'Réservées':>9} | {'Survente':>8} | {'Erreurs':>7} | {'Rempli en':>9} | {'Durée':>7}")
+    print("-" * 134)
+    for s in rapport["scenarios"]:
+        print(f"{s['scenario']:<18} | {s['tentatives']:>10} | {s['pic_par_seconde']:>6} | "
+              f"{s['p50_ms']:>6.1f} ms | {s['p95_ms']:>6.1f} ms | {s['p99_ms']:>6.1f} ms | "
+              f"{s['reservations']:>9} | {s['survente']:>8} | {s['erreurs']:>7} | {s['remplissage_s']:>7.1f} s | "
+              f"{s['duree_s']:>5.1f} s")
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Simulation d'un shotgun avec et sans file d'admission")
+    parser.add_argument("--utilisateurs", type=int, default=2000)
+    parser.add_argument("--capacite", type=int, default=300)
+    parser.add_argument("--debit", type=float, default=50, help="admissions par seconde")
+    parser.add_argument("--rafale", type=int, default=50, help="admissions immédiates à l'ouverture")
+    parser.add_argument("--garder", action="store_true", help="conserver le schéma de simulation")
+    parser.add_argument("--json", action="store_true", help="sortie JSON")
+    args = parser.parse_args()
+
+    rapport = lancer(args.utilisateurs, args.capacite, args.debit, args.rafale, args.garder)
+    if args.json:
+        print(json.dumps(rapport, indent=2, ensure_ascii=False))
+    else:
+        afficher(rapport)
+
+# Exemple (depuis la racine du projet) :
+# PYTHONPATH="src"; python src/benchmarks/simulation_shotgun.py [--utilisateurs 2000] [--json]
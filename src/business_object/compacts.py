@@ -0,0 +1,248 @@
+# src/business_object/compacts.py
+"""
+Variantes compactes des objets métier, pour garder en mémoire des listes
+entières ou longtemps (cache des événements, service.cache_evenements).
+
+Par rapport aux modèles pydantic et aux objets métier à __dict__ :
+- classes figées à emplacements fixes (dataclass(slots=True)) : ni __dict__
+  par instance, ni état pydantic ;
+- statut d'un événement et direction d'un bus en Enum (un seul objet par
+  valeur), catégorie et ville internées (une seule chaîne par valeur) ;
+- les cinq options d'une réservation (bus aller, bus retour, adhérent, SAM,
+  boisson) rangées dans un seul entier, relues par des propriétés.
+
+Chaque classe se construit depuis un modèle de sortie ou une ligne SQL
+(`depuis`) et redonne le modèle de sortie de l'API (`vers_modele`).
+"""
+import sys
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Dict, Mapping, Optional
+
+from pydantic import BaseModel
+
+from model.creneauBus_models import CreneauBusModelOut
+from model.evenement_models import EvenementModelOut
+from model.reservation_models import InscritModelOut, ReservationModelOut
+from model.utilisateur_models import UtilisateurModelOut
+
+
+class StatutEvenement(str, Enum):
+    """Statuts d'un événement (colonne evenement.statut)."""
+    DISPONIBLE = "disponible en ligne"
+    REALISE = "déjà réalisé"
+    ANNULE = "annulé"
+    BROUILLON = "pas encore finalisé"
+
+
+class Direction(str, Enum):
+    """Sens d'un bus (colonne bus.direction)."""
+    ALLER = "aller"
+    RETOUR = "retour"
+
+
+# Options d'une réservation, bit 0 à 4 de `options`
+OPTIONS = ("bus_aller", "bus_retour", "adherent", "sam", "boisson")
+
+
+def _champs(source: Any) -> Mapping[str, Any]:
+    """Valeurs d'une ligne SQL (dict) ou d'un modèle pydantic, par nom de champ."""
+    return source.__dict__ if isinstance(source, BaseModel) else source
+
+
+def _interner(texte: Optional[str]) -> Optional[str]:
+    return None if texte is None else sys.intern(texte)
+
+
+def _options(champs: Mapping[str, Any]) -> int:
+    return sum(1 << bit for bit, nom in enumerate(OPTIONS) if champs[nom])
+
+
+class _AvecOptions:
+    """Lecture des options d'une réservation rangées dans l'entier `options`."""
+    __slots__ = ()
+
+    @property
+    def bus_aller(self) -> bool:
+        return bool(self.options & 1)
+
+    @property
+    def bus_retour(self) -> bool:
+        return bool(self.options & 2)
+
+    @property
+    def adherent(self) -> bool:
+        return bool(self.options & 4)
+
+    @property
+    def sam(self) -> bool:
+        return bool(self.options & 8)
+
+    @property
+    def boisson(self) -> bool:
+        return bool(self.options & 16)
+
+    def _dict_options(self) -> Dict[str, bool]:
+        return {nom: bool(self.options >> bit & 1) for bit, nom in enumerate(OPTIONS)}
+
+
+@dataclass(frozen=True, slots=True)
+class ReservationCompacte(_AvecOptions):
+    """Réservation (table reservation), options rangées dans `options`."""
+    id_reservation: int
+    fk_utilisateur: int
+    fk_evenement: int
+    options: int
+    date_reservation: datetime
+
+    @classmethod
+    def depuis(cls, source: Any) -> "ReservationCompacte":
+        c = _champs(source)
+        return cls(c["id_reservation"], c["fk_utilisateur"], c["fk_evenement"], _options(c), c["date_reservation"])
+
+    def vers_modele(self) -> ReservationModelOut:
+        return ReservationModelOut(
+            id_reservation=self.id_reservation,
+            fk_utilisateur=self.fk_utilisateur,
+            fk_evenement=self.fk_evenement,
+            date_reservation=self.date_reservation,
+            **self._dict_options(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class InscritCompact(_AvecOptions):
+    """Ligne de la liste des inscrits d'un événement (cf. InscritModelOut)."""
+    id_reservation: int
+    fk_utilisateur: int
+    nom: str
+    prenom: str
+    email: str
+    options: int
+    date_reservation: datetime
+    commentaire_note: Optional[int] = None
+    commentaire_avis: Optional[str] = None
+
+    @classmethod
+    def depuis(cls, source: Any) -> "InscritCompact":
+        c = _champs(source)
+        return cls(
+            c["id_reservation"], c["fk_utilisateur"], c["nom"], c["prenom"], c["email"],
+            _options(c), c["date_reservation"], c.get("commentaire_note"), c.get("commentaire_avis"),
+        )
+
+    def vers_modele(self) -> InscritModelOut:
+        return InscritModelOut(
+            id_reservation=self.id_reservation,
+            fk_utilisateur=self.fk_utilisateur,
+            nom=self.nom,
+            prenom=self.prenom,
+            email=self.email,
+            date_reservation=self.date_reservation,
+            commentaire_note=self.commentaire_note,
+            commentaire_avis=self.commentaire_avis,
+            **self._dict_options(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class EvenementCompact:
+    """Événement (table evenement) : statut en Enum, ville et catégorie internées."""
+    id_evenement: int
+    fk_utilisateur: Optional[int]
+    titre: str
+    adresse: Optional[str]
+    ville: Optional[str]
+    date_evenement: date
+    description: Optional[str]
+    capacite: int
+    categorie: Optional[str]
+    statut: StatutEvenement
+    date_creation: datetime
+    ouverture: Optional[datetime] = None
+
+    @classmethod
+    def depuis(cls, source: Any) -> "EvenementCompact":
+        c = _champs(source)
+        return cls(
+            c["id_evenement"], c["fk_utilisateur"], c["titre"], c["adresse"], _interner(c["ville"]),
+            c["date_evenement"], c["description"], c["capacite"], _interner(c["categorie"]),
+            StatutEvenement(c["statut"]), c["date_creation"], c.get("ouverture"),
+        )
+
+    def vers_modele(self) -> EvenementModelOut:
+        return EvenementModelOut(
+            id_evenement=self.id_evenement,
+            fk_utilisateur=self.fk_utilisateur,
+            titre=self.titre,
+            adresse=self.adresse,
+            ville=self.ville,
+            date_evenement=self.date_evenement,
+            description=self.description,
+            capacite=self.capacite,
+            categorie=self.categorie,
+            statut=self.statut.value,
+            date_creation=self.date_creation,
+            ouverture=self.ouverture,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class CreneauBusCompact:
+    """Bus d'un événement (table bus) : direction en Enum."""
+    id_bus: int
+    fk_evenement: Optional[int]
+    matricule: Optional[str]
+    nombre_places: int
+    direction: Direction
+    description: str
+
+    @classmethod
+    def depuis(cls, source: Any) -> "CreneauBusCompact":
+        c = _champs(source)
+        return cls(
+            c["id_bus"], c["fk_evenement"], c["matricule"], c["nombre_places"],
+            Direction(c["direction"]), c["description"],
+        )
+
+    def vers_modele(self) -> CreneauBusModelOut:
+        return CreneauBusModelOut(
+            id_bus=self.id_bus,
+            fk_evenement=self.fk_evenement,
+            matricule=self.matricule,
+            nombre_places=self.nombre_places,
+            direction=self.direction.value,
+            description=self.description,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class UtilisateurCompact:
+    """Participant ou administrateur (table utilisateur), sans mot de passe."""
+    id_utilisateur: int
+    nom: str
+    prenom: str
+    telephone: Optional[str]
+    email: str
+    administrateur: bool
+    date_creation: datetime
+
+    @classmethod
+    def depuis(cls, source: Any) -> "UtilisateurCompact":
+        c = _champs(source)
+        return cls(
+            c["id_utilisateur"], c["nom"], c["prenom"], c["telephone"], c["email"],
+            c["administrateur"], c["date_creation"],
+        )
+
+    def vers_modele(self) -> UtilisateurModelOut:
+        return UtilisateurModelOut(
+            id_utilisateur=self.id_utilisateur,
+            nom=self.nom,
+            prenom=self.prenom,
+            telephone=self.telephone,
+            email=self.email,
+            administrateur=self.administrateur,
+            date_creation=self.date_creation,
+        )
@@ -1,10 +1,13 @@
 # dao/administrateur_dao.py
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
-import bcrypt
 
-from dao.db_connection import DBConnection
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
+from model.pagination_models import PageCurseur
 from model.utilisateur_models import AdministrateurModelOut, AdministrateurModelIn
+from utils.pagination import paginer_par_id, params_par_id
+from utils.securite import hacheur
 
 
 class AdministrateurDao:
@@ -15,23 +18,86 @@ class AdministrateurDao:
       nom, prenom, telephone, email (UNIQUE), mot_de_passe (hash), administrateur BOOLEAN, date_creation TIMESTAMP
     Un administrateur est une ligne avec administrateur = TRUE.
     Les mots de passe sont stockés hashés (bcrypt).
+    Les requêtes SQL sont des attributs de classe, partagées avec AdministrateurDaoAsync.
     """
 
-    # ---------- Helpers mot de passe ----------
+    # ---------- SQL ----------
+    SQL_FIND_ALL = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE administrateur = TRUE "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s OFFSET %(offset)s"
+    )
+
+    # Pagination keyset : la page suivante repart de la dernière clé vue
+    SQL_FIND_PAGE = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE administrateur = TRUE AND id_utilisateur > %(apres)s "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s"
+    )
+
+    SQL_FIND_BY_ID = RequetePreparee(
+        "administrateur_find_by_id",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
+    )
+
+    SQL_FIND_BY_EMAIL = RequetePreparee(
+        "administrateur_find_by_email",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE email = %(email)s AND administrateur = TRUE"
+    )
+
+    SQL_CREATE = (
+        "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
+        "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, TRUE) "
+        "RETURNING id_utilisateur, date_creation"
+    )
+
+    SQL_UPDATE = (
+        "WITH updated AS ( "
+        " UPDATE utilisateur SET "
+        "   email = %(email)s, "
+        "   prenom = %(prenom)s, "
+        "   nom = %(nom)s, "
+        "   telephone = %(telephone)s "
+        " WHERE id_utilisateur = %(id)s AND administrateur = TRUE "
+        " RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        ") "
+        "SELECT * FROM updated"
+    )
+
+    SQL_DELETE = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
+
+    SQL_AUTHENTICATE = RequetePreparee(
+        "administrateur_authenticate",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
+        "FROM utilisateur WHERE email = %(email)s AND administrateur = TRUE"
+    )
+
+    SQL_CHANGE_PASSWORD = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
+    )
+
+    # Coût bcrypt changé depuis l'enregistrement du mot de passe : nouveau hash posé
+    # à la connexion, sauf si le mot de passe a été modifié entre-temps
+    SQL_REHASH = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s AND mot_de_passe = %(ancien)s"
+    )
 
     @staticmethod
-    def _hash_password(plain: str) -> str:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        return bcrypt.hashpw(plain, bcrypt.gensalt()).decode("utf-8")
+    def _row_to_model(r: dict) -> AdministrateurModelOut:
+        """Convertit une ligne SQL (dict) en AdministrateurModelOut (sans le hash du mot de passe)."""
+        return vers_modele(AdministrateurModelOut, r)
 
-    @staticmethod
-    def _check_password(plain: str, hashed: str) -> bool:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        if isinstance(hashed, str):
-            hashed = hashed.encode("utf-8")
-        return bcrypt.checkpw(plain, hashed)
+    LISTE_PAGE = "administrateurs"
 
     # ---------- READ ----------
 
@@ -39,88 +105,54 @@ class AdministrateurDao:
         """
         Récupère une liste paginée d'administrateurs.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE administrateur = TRUE "
-            "ORDER BY id_utilisateur "
-            "LIMIT %(limit)s OFFSET %(offset)s"
-        )
         params = {"limit": max(limit, 0), "offset": max(offset, 0)}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_FIND_ALL, params)
                 results = curs.fetchall()
 
-        admins: List[AdministrateurModelOut] = []
-        for res in results:
-            admins.append(
-                AdministrateurModelOut(
-                    id_utilisateur=res["id_utilisateur"],
-                    email=res["email"],
-                    prenom=res["prenom"],
-                    nom=res["nom"],
-                    telephone=res["telephone"],
-                    administrateur=res["administrateur"],
-                    date_creation=res["date_creation"],
-                )
-            )
-        return admins
+        return vers_modeles(AdministrateurModelOut, results)
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[AdministrateurModelOut]:
+        """
+        Page d'administrateurs située après `curseur` (None pour la première page).
+        Le curseur_suivant de la page rendue donne accès à la suivante.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_PAGE, params_par_id(curseur, limit, self.LISTE_PAGE))
+                rows = curs.fetchall()
+
+        return paginer_par_id(vers_modeles(AdministrateurModelOut, rows), limit, self.LISTE_PAGE, "id_utilisateur")
 
     def find_by_id(self, id_utilisateur: int) -> Optional[AdministrateurModelOut]:
         """
         Récupère un administrateur par son ID.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_utilisateur})
                 res = curs.fetchone()
 
         if res is None:
             return None
 
-        return AdministrateurModelOut(
-            id_utilisateur=res["id_utilisateur"],
-            email=res["email"],
-            prenom=res["prenom"],
-            nom=res["nom"],
-            telephone=res["telephone"],
-            administrateur=res["administrateur"],
-            date_creation=res["date_creation"],
-        )
+        return self._row_to_model(res)
 
     def find_by_email(self, email: str) -> Optional[AdministrateurModelOut]:
         """
         Récupère un administrateur par email.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s AND administrateur = TRUE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_FIND_BY_EMAIL, {"email": email})
                 res = curs.fetchone()
 
         if res is None:
             return None
 
-        return AdministrateurModelOut(
-            id_utilisateur=res["id_utilisateur"],
-            email=res["email"],
-            prenom=res["prenom"],
-            nom=res["nom"],
-            telephone=res["telephone"],
-            administrateur=res["administrateur"],
-            date_creation=res["date_creation"],
-        )
+        return self._row_to_model(res)
 
     # ---------- CREATE ----------
 
@@ -129,22 +161,17 @@ class AdministrateurDao:
         Crée un nouvel administrateur (administrateur=TRUE).
         admin_in.mot_de_passe est hashé avant insertion.
         """
-        query = (
-            "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
-            "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, TRUE) "
-            "RETURNING id_utilisateur, date_creation"
-        )
         params = {
             "email": admin_in.email,
             "prenom": admin_in.prenom,
             "nom": admin_in.nom,
             "telephone": admin_in.telephone,
-            "mot_de_passe": self._hash_password(admin_in.mot_de_passe),
+            "mot_de_passe": hacheur().hacher(admin_in.mot_de_passe),
         }
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CREATE, params)
                 row = curs.fetchone()
 
         return AdministrateurModelOut(
@@ -163,18 +190,6 @@ class AdministrateurDao:
         """
         Met à jour un administrateur (hors mot de passe).
         """
-        query = (
-            "WITH updated AS ( "
-            " UPDATE utilisateur SET "
-            "   email = %(email)s, "
-            "   prenom = %(prenom)s, "
-            "   nom = %(nom)s, "
-            "   telephone = %(telephone)s "
-            " WHERE id_utilisateur = %(id)s AND administrateur = TRUE "
-            " RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            ") "
-            "SELECT * FROM updated"
-        )
         params = {
             "id": admin_out.id_utilisateur,
             "email": admin_out.email,
@@ -185,21 +200,13 @@ class AdministrateurDao:
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_UPDATE, params)
                 res = curs.fetchone()
 
         if res is None:
             return None
 
-        return AdministrateurModelOut(
-            id_utilisateur=res["id_utilisateur"],
-            email=res["email"],
-            prenom=res["prenom"],
-            nom=res["nom"],
-            telephone=res["telephone"],
-            administrateur=res["administrateur"],
-            date_creation=res["date_creation"],
-        )
+        return self._row_to_model(res)
 
     # ---------- DELETE ----------
 
@@ -207,10 +214,9 @@ class AdministrateurDao:
         """
         Supprime un administrateur par ID.
         """
-        query = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_DELETE, {"id": id_utilisateur})
                 return curs.rowcount > 0
 
     # ---------- AUTH / SECURITY ----------
@@ -219,42 +225,39 @@ class AdministrateurDao:
         """
         Vérifie les identifiants et retourne l'admin si OK, sinon None.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
-            "FROM utilisateur WHERE email = %(email)s AND administrateur = TRUE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_AUTHENTICATE, {"email": email})
                 res = curs.fetchone()
 
         if res is None:
             return None
 
-        if not self._check_password(mot_de_passe, res["mot_de_passe"]):
+        ok, nouveau_hash = hacheur().verifier_et_rehacher(mot_de_passe, res["mot_de_passe"])
+        if not ok:
             return None
+        if nouveau_hash:
+            self._rehacher(res, nouveau_hash)
 
-        return AdministrateurModelOut(
-            id_utilisateur=res["id_utilisateur"],
-            email=res["email"],
-            prenom=res["prenom"],
-            nom=res["nom"],
-            telephone=res["telephone"],
-            administrateur=res["administrateur"],
-            date_creation=res["date_creation"],
-        )
+        return self._row_to_model(res)
+
+    @staticmethod
+    def _params_rehash(r: dict, nouveau_hash: str) -> Dict[str, Any]:
+        return {"pwd": nouveau_hash, "id": r["id_utilisateur"], "ancien": r["mot_de_passe"]}
+
+    def _rehacher(self, r: dict, nouveau_hash: str) -> None:
+        """Remplace le hash lu à la connexion par `nouveau_hash` (coût bcrypt à jour)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_REHASH, self._params_rehash(r, nouveau_hash))
 
     def change_password(self, id_utilisateur: int, new_password: str) -> bool:
         """
         Change le mot de passe d'un administrateur (hash bcrypt).
         """
-        query = (
-            "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
-            "WHERE id_utilisateur = %(id)s AND administrateur = TRUE"
-        )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": hacheur().hacher(new_password), "id": id_utilisateur}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CHANGE_PASSWORD, params)
                 return curs.rowcount > 0
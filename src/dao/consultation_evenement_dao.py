@@ -1,19 +1,304 @@
 # src/dao/consultation_evenement_dao.py
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from datetime import date
 
 from psycopg2.extras import RealDictCursor
 
-from dao.db_connection import DBConnection
-from model.evenement_models import EvenementModelOut
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modeles
+from model.evenement_models import (
+    DisponibiliteModelOut,
+    EvenementModelOut,
+    PlacesBusModelOut,
+    ResultatRechercheModelOut,
+)
+from model.pagination_models import PageCurseur
+from utils.pagination import decoder_si_present, paginer
 
 
 class ConsultationEvenementDao:
     """
     DAO de consultation (lecture seule) des événements.
     Fournit des méthodes pratiques pour lister et filtrer les événements.
+
+    Les requêtes (dynamiques) sont construites par les méthodes statiques
+    `_requete_*`, partagées avec ConsultationEvenementDaoAsync.
+
+    Chaque liste existe en deux versions : `limit/offset`, et `*_page` paginée
+    par curseur sur (date_evenement, id_evenement), dont le coût ne dépend pas
+    de la profondeur de la page (cf. utils.pagination).
     """
 
+    ORDRE_PAGE = "date_evenement ASC, id_evenement ASC"
+
+    # ---------- SQL ----------
+    # Avis lus dans evenement_stats (agrégats tenus à jour par triggers) :
+    # coût constant par événement, quel que soit le volume de commentaires.
+    # comment_count compte les commentaires notés, base de la moyenne.
+    SQL_COLONNES_AVIS = (
+        "       s.somme_notes::numeric / NULLIF(s.nb_notes, 0) AS avg_note, "
+        "       COALESCE(s.nb_notes, 0) AS comment_count "
+    )
+    SQL_JOINTURE_AVIS = "LEFT JOIN evenement_stats s ON s.fk_evenement = e.id_evenement "
+
+    # Recherche plein texte (migration 003) : colonne evenement.recherche (GIN),
+    # et similarité trigramme sur titre + ville si pg_trgm est installé.
+    # SQL_TEXTE_FLOU doit rester identique à l'expression de l'index trigramme.
+    SQL_TRIGRAMME_DISPONIBLE = (
+        "SELECT to_regprocedure('public.word_similarity(text,text)') IS NOT NULL AS disponible"
+    )
+    SQL_TEXTE_FLOU = "(e.titre || ' ' || coalesce(e.ville, ''))"
+    OPTIONS_EXTRAIT = "StartSel=«, StopSel=», MaxFragments=2, MaxWords=20, MinWords=5, FragmentDelimiter=\" … \""
+
+    # Disponibilités de plusieurs événements en un aller-retour : compteurs
+    # dénormalisés de la ligne evenement (inscrits, capacités et places prises
+    # des bus, tenus à jour par triggers), sans agréger reservation ni bus.
+    SQL_DISPONIBILITES = RequetePreparee("evenement_disponibilites", """
+        SELECT id_evenement, capacite, inscrits,
+               capacite_bus_aller, bus_aller_pris,
+               capacite_bus_retour, bus_retour_pris
+        FROM evenement
+        WHERE id_evenement = ANY(%(ids)s)
+    """)
+
+    # pg_trgm est installé (ou non) pour tout le serveur : vérifié une fois par processus
+    _trigramme: Optional[bool] = None
+
+    # ---------- Construction des requêtes ----------
+    @staticmethod
+    def _disponibilite(r: Dict[str, Any]) -> DisponibiliteModelOut:
+        """Convertit une ligne de SQL_DISPONIBILITES (places restantes jamais négatives)."""
+        def bus(capacite: int, prises: int) -> PlacesBusModelOut:
+            return PlacesBusModelOut(capacite=capacite, prises=prises, restantes=max(capacite - prises, 0))
+
+        return DisponibiliteModelOut(
+            id_evenement=r["id_evenement"],
+            capacite=r["capacite"],
+            inscrits=r["inscrits"],
+            places_restantes=max(r["capacite"] - r["inscrits"], 0),
+            bus_aller=bus(r["capacite_bus_aller"], r["bus_aller_pris"]),
+            bus_retour=bus(r["capacite_bus_retour"], r["bus_retour_pris"]),
+        )
+
+    @staticmethod
+    def _pagination(limit: int, offset: int) -> Dict[str, Any]:
+        return {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+    @staticmethod
+    def _condition_apres(
+        apres: Optional[Tuple[date, int]], where: List[str], params: Dict[str, Any], alias: str = ""
+    ) -> None:
+        """Ajoute la condition keyset « après la ligne (date, id) » aux filtres de la requête."""
+        if apres is not None:
+            where.append(f"({alias}date_evenement, {alias}id_evenement) > (%(apres_date)s, %(apres_id)s)")
+            params["apres_date"], params["apres_id"] = apres
+
+    @staticmethod
+    def _decoder(curseur: Optional[str], liste: str) -> Optional[Tuple[date, int]]:
+        return decoder_si_present(curseur, liste, (date, int))
+
+    @staticmethod
+    def _page(lignes: List[Any], limit: int, liste: str) -> PageCurseur:
+        """Page à partir de `limit + 1` lignes (dict ou EvenementModelOut)."""
+        def cle(ev):
+            if isinstance(ev, dict):
+                return ev["date_evenement"], ev["id_evenement"]
+            return ev.date_evenement, ev.id_evenement
+
+        return paginer(lignes, max(limit, 1), liste, cle)
+
+    @classmethod
+    def _requete_lister_tous(
+        cls, limit: int, offset: int, order_by: str, apres: Optional[Tuple[date, int]] = None
+    ) -> Tuple[str, Dict[str, Any]]:
+        where: List[str] = []
+        params = cls._pagination(limit, offset)
+        cls._condition_apres(apres, where, params, "e.")
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+
+        query = (
+            "SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
+            "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, e.ouverture, "
+            "       (e.capacite - e.inscrits) AS places_restantes, "
+            "       e.inscrits AS nb_inscrits, "
+            "       e.nb_sam, "
+            "       e.nb_adh, "
+            f"{cls.SQL_COLONNES_AVIS}"
+            "FROM evenement e "
+            f"{cls.SQL_JOINTURE_AVIS}"
+            f"{where_clause}"
+            f"ORDER BY {order_by} "
+            "LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, params
+
+    @classmethod
+    def _requete_lister_disponibles(
+        cls,
+        limit: int,
+        offset: int,
+        a_partir_du: Optional[date],
+        apres: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        where = ["statut = 'disponible en ligne'"]
+        params = cls._pagination(limit, offset)
+
+        if a_partir_du is not None:
+            where.append("date_evenement >= %(dmin)s")
+            params["dmin"] = a_partir_du
+        cls._condition_apres(apres, where, params)
+
+        query = (
+            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
+            "       date_evenement, description, capacite, categorie, statut, date_creation, ouverture "
+            "FROM evenement "
+            f"WHERE {' AND '.join(where)} "
+            "ORDER BY date_evenement ASC, id_evenement ASC "
+            "LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, params
+
+    @classmethod
+    def _requete_lister_avec_places_restantes(
+        cls,
+        limit: int,
+        offset: int,
+        seulement_disponibles: bool,
+        a_partir_du: Optional[date],
+        apres: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        where = []
+        params = cls._pagination(limit, offset)
+
+        if seulement_disponibles:
+            where.append("e.statut = 'disponible en ligne'")
+        if a_partir_du is not None:
+            where.append("e.date_evenement >= %(dmin)s")
+            params["dmin"] = a_partir_du
+        cls._condition_apres(apres, where, params, "e.")
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+
+        query = (
+            "SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
+            "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, e.ouverture, "
+            "       (e.capacite - e.inscrits) AS places_restantes, "
+            f"{cls.SQL_COLONNES_AVIS}"
+            "FROM evenement e "
+            f"{cls.SQL_JOINTURE_AVIS}"
+            f"{where_clause}"
+            "ORDER BY e.date_evenement ASC, e.id_evenement ASC "
+            "LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, params
+
+    @classmethod
+    def _requete_rechercher(
+        cls,
+        ville: Optional[str],
+        categorie: Optional[str],
+        statut: Optional[str],
+        date_min: Optional[date],
+        date_max: Optional[date],
+        limit: int,
+        offset: int,
+        apres: Optional[Tuple[date, int]] = None,
+    ) -> Tuple[str, Dict[str, Any]]:
+        where = []
+        params = cls._pagination(limit, offset)
+
+        if ville:
+            where.append("ville ILIKE %(ville)s")
+            params["ville"] = f"%{ville}%"
+        if categorie:
+            where.append("categorie = %(categorie)s")
+            params["categorie"] = categorie
+        if statut:
+            where.append("statut = %(statut)s")
+            params["statut"] = statut
+        if date_min:
+            where.append("date_evenement >= %(date_min)s")
+            params["date_min"] = date_min
+        if date_max:
+            where.append("date_evenement <= %(date_max)s")
+            params["date_max"] = date_max
+        cls._condition_apres(apres, where, params)
+
+        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
+
+        query = (
+            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
+            "       date_evenement, description, capacite, categorie, statut, date_creation, ouverture "
+            "FROM evenement "
+            f"{where_clause}"
+            "ORDER BY date_evenement ASC, id_evenement ASC "
+            "LIMIT %(limit)s OFFSET %(offset)s"
+        )
+        return query, params
+
+    @classmethod
+    def _requete_rechercher_texte(
+        cls,
+        texte: str,
+        categorie: Optional[str],
+        statut: Optional[str],
+        date_min: Optional[date],
+        date_max: Optional[date],
+        limit: int,
+        offset: int,
+        trigramme: bool,
+    ) -> Tuple[str, Dict[str, Any]]:
+        """
+        Recherche libre, triée par pertinence puis par date.
+
+        Un événement correspond si son document (titre, ville, catégorie,
+        description) contient les mots cherchés (syntaxe websearch : "phrase",
+        -exclu, or) ou, avec `trigramme`, si le texte ressemble à un mot du titre
+        ou de la ville (fautes de frappe). Score : le meilleur des deux, dans [0, 1].
+        Les extraits (ts_headline, coûteux) ne sont calculés que pour la page rendue.
+        """
+        where = ["(e.recherche @@ q.tsq" + (
+            f" OR %(texte)s OPERATOR(public.<%%) {cls.SQL_TEXTE_FLOU})" if trigramme else ")"
+        )]
+        params = cls._pagination(limit, offset)
+        params["texte"], params["options"] = texte, cls.OPTIONS_EXTRAIT
+
+        if categorie:
+            where.append("e.categorie = %(categorie)s")
+            params["categorie"] = categorie
+        if statut:
+            where.append("e.statut = %(statut)s")
+            params["statut"] = statut
+        if date_min:
+            where.append("e.date_evenement >= %(date_min)s")
+            params["date_min"] = date_min
+        if date_max:
+            where.append("e.date_evenement <= %(date_max)s")
+            params["date_max"] = date_max
+
+        # ts_rank_cd normalisé (option 32) : rang / (rang + 1)
+        score = "ts_rank_cd(e.recherche, q.tsq, 32)"
+        if trigramme:
+            score = f"GREATEST({score}, public.word_similarity(%(texte)s, {cls.SQL_TEXTE_FLOU}))"
+
+        query = (
+            "WITH q AS (SELECT websearch_to_tsquery('french', %(texte)s) AS tsq) "
+            "SELECT r.*, "
+            "       ts_headline('french', coalesce(r.description, ''), q.tsq, %(options)s) AS extrait "
+            "FROM ( "
+            "    SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
+            "           e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, e.ouverture, "
+            f"           {score}::float AS score "
+            "    FROM evenement e, q "
+            f"    WHERE {' AND '.join(where)} "
+            "    ORDER BY score DESC, e.date_evenement ASC, e.id_evenement ASC "
+            "    LIMIT %(limit)s OFFSET %(offset)s "
+            ") r, q "
+            "ORDER BY r.score DESC, r.date_evenement ASC, r.id_evenement ASC"
+        )
+        return query, params
+
+    # ---------- Lecture ----------
     def lister_tous(
         self,
         limit: int = 100,
@@ -22,41 +307,11 @@ class ConsultationEvenementDao:
     ) -> List[Dict[str, Any]]:
         """
         Liste paginée de tous les événements avec TOUTES les stats (places, avis, SAM, etc.).
+        Inscrits / SAM / adhérents sont lus sur les compteurs de la table evenement,
+        les avis sur evenement_stats : rien n'est agrégé à la lecture.
         Retourne des dictionnaires enrichis.
         """
-        query = (
-            "WITH resa AS ( "
-            "   SELECT fk_evenement, "
-            "          COUNT(*) AS nb_resa, "
-            "          COUNT(CASE WHEN sam THEN 1 END) AS nb_sam, "
-            "          COUNT(CASE WHEN adherent THEN 1 END) AS nb_adh "
-            "   FROM reservation "
-            "   GROUP BY fk_evenement "
-            "), "
-            "comm AS ( "
-            "   SELECT r.fk_evenement, "
-            "          AVG(c.note) as avg_note, "
-            "          COUNT(c.id_commentaire) as comment_count "
-            "   FROM commentaire c "
-            "   JOIN reservation r ON c.fk_reservation = r.id_reservation "
-            "   WHERE c.note IS NOT NULL "
-            "   GROUP BY r.fk_evenement "
-            ") "
-            "SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
-            "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, "
-            "       (e.capacite - COALESCE(r.nb_resa, 0)) AS places_restantes, "
-            "       COALESCE(r.nb_resa, 0) AS nb_inscrits, "
-            "       COALESCE(r.nb_sam, 0) AS nb_sam, "
-            "       COALESCE(r.nb_adh, 0) AS nb_adh, "
-            "       c.avg_note, "
-            "       COALESCE(c.comment_count, 0) AS comment_count "
-            "FROM evenement e "
-            "LEFT JOIN resa r ON r.fk_evenement = e.id_evenement "
-            "LEFT JOIN comm c ON c.fk_evenement = e.id_evenement "
-            f"ORDER BY {order_by} "
-            "LIMIT %(limit)s OFFSET %(offset)s"
-        )
-        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+        query, params = self._requete_lister_tous(limit, offset, order_by)
 
         with DBConnection().getConnexion() as con:
             # On utilise RealDictCursor pour avoir des dictionnaires directement
@@ -78,28 +333,14 @@ class ConsultationEvenementDao:
         Liste simple des événements 'disponible en ligne'.
         Retourne des OBJETS EvenementModelOut (pas de stats calculées).
         """
-        where = ["statut = 'disponible en ligne'"]
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
-
-        if a_partir_du is not None:
-            where.append("date_evenement >= %(dmin)s")
-            params["dmin"] = a_partir_du
-
-        query = (
-            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
-            "       date_evenement, description, capacite, categorie, statut, date_creation "
-            "FROM evenement "
-            f"WHERE {' AND '.join(where)} "
-            "ORDER BY date_evenement ASC, id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
-        )
+        query, params = self._requete_lister_disponibles(limit, offset, a_partir_du)
 
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
                 curs.execute(query, params)
                 rows = curs.fetchall()
 
-        return [EvenementModelOut(**row) for row in rows]
+        return vers_modeles(EvenementModelOut, rows)
 
 
     def lister_avec_places_restantes(
@@ -113,43 +354,8 @@ class ConsultationEvenementDao:
         Liste des événements avec calcul des places restantes ET des avis.
         Retourne des DICTIONNAIRES enrichis.
         """
-        where = []
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
-
-        if seulement_disponibles:
-            where.append("e.statut = 'disponible en ligne'")
-        if a_partir_du is not None:
-            where.append("e.date_evenement >= %(dmin)s")
-            params["dmin"] = a_partir_du
-
-        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
-
-        query = (
-            "WITH resa AS ( "
-            "   SELECT fk_evenement, COUNT(*) AS nb_resa "
-            "   FROM reservation "
-            "   GROUP BY fk_evenement "
-            "), "
-            "comm AS ( "
-            "   SELECT r.fk_evenement, "
-            "          AVG(c.note) as avg_note, "
-            "          COUNT(c.id_commentaire) as comment_count "
-            "   FROM commentaire c "
-            "   JOIN reservation r ON c.fk_reservation = r.id_reservation "
-            "   WHERE c.note IS NOT NULL "
-            "   GROUP BY r.fk_evenement "
-            ") "
-            "SELECT e.id_evenement, e.fk_utilisateur, e.titre, e.adresse, e.ville, "
-            "       e.date_evenement, e.description, e.capacite, e.categorie, e.statut, e.date_creation, "
-            "       (e.capacite - COALESCE(r.nb_resa, 0)) AS places_restantes, "
-            "       c.avg_note, "
-            "       COALESCE(c.comment_count, 0) AS comment_count "
-            "FROM evenement e "
-            "LEFT JOIN resa r ON r.fk_evenement = e.id_evenement "
-            "LEFT JOIN comm c ON c.fk_evenement = e.id_evenement "
-            f"{where_clause}"
-            "ORDER BY e.date_evenement ASC, e.id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
+        query, params = self._requete_lister_avec_places_restantes(
+            limit, offset, seulement_disponibles, a_partir_du
         )
 
         with DBConnection().getConnexion() as con:
@@ -174,34 +380,112 @@ class ConsultationEvenementDao:
         Recherche d'événements avec filtres.
         Retourne des OBJETS EvenementModelOut.
         """
-        where = []
-        params: Dict[str, Any] = {"limit": max(limit, 0), "offset": max(offset, 0)}
+        query, params = self._requete_rechercher(
+            ville, categorie, statut, date_min, date_max, limit, offset
+        )
 
-        if ville:
-            where.append("ville ILIKE %(ville)s")
-            params["ville"] = f"%{ville}%"
-        if categorie:
-            where.append("categorie = %(categorie)s")
-            params["categorie"] = categorie
-        if statut:
-            where.append("statut = %(statut)s")
-            params["statut"] = statut
-        if date_min:
-            where.append("date_evenement >= %(date_min)s")
-            params["date_min"] = date_min
-        if date_max:
-            where.append("date_evenement <= %(date_max)s")
-            params["date_max"] = date_max
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
 
-        where_clause = f"WHERE {' AND '.join(where)} " if where else ""
-        
-        query = (
-            "SELECT id_evenement, fk_utilisateur, titre, adresse, ville, "
-            "       date_evenement, description, capacite, categorie, statut, date_creation "
-            "FROM evenement "
-            f"{where_clause}"
-            "ORDER BY date_evenement ASC, id_evenement ASC "
-            "LIMIT %(limit)s OFFSET %(offset)s"
+        return vers_modeles(EvenementModelOut, rows)
+
+    def rechercher_texte(
+        self,
+        texte: str,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[ResultatRechercheModelOut]:
+        """
+        Recherche libre (titre, ville, catégorie, description), du plus pertinent
+        au moins pertinent, avec un extrait surligné de la description.
+        Retourne des OBJETS ResultatRechercheModelOut.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                if ConsultationEvenementDao._trigramme is None:
+                    curs.execute(self.SQL_TRIGRAMME_DISPONIBLE)
+                    ConsultationEvenementDao._trigramme = curs.fetchone()["disponible"]
+
+                query, params = self._requete_rechercher_texte(
+                    texte, categorie, statut, date_min, date_max, limit, offset, self._trigramme
+                )
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        return vers_modeles(ResultatRechercheModelOut, rows)
+
+    # ---------- Lecture paginée par curseur ----------
+    def lister_tous_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur:
+        """lister_tous, par pages triées par (date_evenement, id_evenement)."""
+        query, params = self._requete_lister_tous(
+            max(limit, 1) + 1, 0, self.ORDRE_PAGE, self._decoder(curseur, "consultation.tous")
+        )
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        return self._page([dict(row) for row in rows], limit, "consultation.tous")
+
+    def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """lister_disponibles, par pages (mêmes filtres à chaque page)."""
+        query, params = self._requete_lister_disponibles(
+            max(limit, 1) + 1, 0, a_partir_du, self._decoder(curseur, "consultation.disponibles")
+        )
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        return self._page(vers_modeles(EvenementModelOut, rows), limit, "consultation.disponibles")
+
+    def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """lister_avec_places_restantes, par pages (mêmes filtres à chaque page)."""
+        query, params = self._requete_lister_avec_places_restantes(
+            max(limit, 1) + 1, 0, seulement_disponibles, a_partir_du,
+            self._decoder(curseur, "consultation.places_restantes"),
+        )
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(query, params)
+                rows = curs.fetchall()
+
+        return self._page([dict(row) for row in rows], limit, "consultation.places_restantes")
+
+    def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageCurseur:
+        """rechercher, par pages (mêmes filtres à chaque page)."""
+        query, params = self._requete_rechercher(
+            ville, categorie, statut, date_min, date_max, max(limit, 1) + 1, 0,
+            self._decoder(curseur, "consultation.recherche"),
         )
 
         with DBConnection().getConnexion() as con:
@@ -209,4 +493,20 @@ class ConsultationEvenementDao:
                 curs.execute(query, params)
                 rows = curs.fetchall()
 
-        return [EvenementModelOut(**row) for row in rows]
\ No newline at end of file
+        return self._page(vers_modeles(EvenementModelOut, rows), limit, "consultation.recherche")
+
+    # ---------- Disponibilités ----------
+    def disponibilites(self, ids_evenements: List[int]) -> Dict[int, DisponibiliteModelOut]:
+        """
+        Disponibilités (lieu, bus aller et retour) d'un ensemble d'événements,
+        en une seule requête. Les ids inconnus sont absents du résultat.
+        """
+        if not ids_evenements:
+            return {}
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(self.SQL_DISPONIBILITES, {"ids": list(ids_evenements)})
+                rows = curs.fetchall()
+
+        return {r["id_evenement"]: self._disponibilite(r) for r in rows}
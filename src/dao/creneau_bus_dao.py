@@ -2,37 +2,87 @@
 from typing import List, Optional, Dict, Any
 from psycopg2.extras import RealDictCursor
 
-from dao.db_connection import DBConnection
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
 from model.creneauBus_models import CreneauBusModelIn, CreneauBusModelOut
+from model.pagination_models import PageCurseur
+from utils.pagination import paginer_par_id, params_par_id
 
 
 class CreneauBusDao:
     """
     DAO pour la gestion des créneaux de bus (table `bus`).
+    Les requêtes SQL sont des attributs de classe, partagées avec CreneauBusDaoAsync.
     """
 
+    # ------------- SQL -------------
+    SQL_CREATE = """
+        INSERT INTO bus (fk_evenement, matricule, nombre_places, direction, description)
+        VALUES (%(fk_evenement)s, %(matricule)s, %(nombre_places)s, %(direction)s, %(description)s)
+        RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
+    """
+    SQL_FIND_BY_ID = "SELECT * FROM bus WHERE id_bus = %(id)s"
+    SQL_FIND_BY_EVENT = "SELECT * FROM bus WHERE fk_evenement = %(id_evenement)s ORDER BY id_bus"
+    SQL_FIND_BY_DESCRIPTION = "SELECT * FROM bus WHERE description = %(description)s"
+    SQL_FIND_ALL = "SELECT * FROM bus LIMIT %(limit)s OFFSET %(offset)s"
+    # Pagination keyset : la page suivante repart du dernier id vu
+    SQL_FIND_PAGE = "SELECT * FROM bus WHERE id_bus > %(apres)s ORDER BY id_bus LIMIT %(limit)s"
+    SQL_FIND_BY_EVENT_ID = "SELECT * FROM bus WHERE fk_evenement = %(id)s ORDER BY direction DESC"
+    # Compteurs tenus à jour par trigger sur la table evenement
+    SQL_CAPACITE_TOTALE = {
+        "aller": RequetePreparee(
+            "bus_capacite_aller",
+            "SELECT capacite_bus_aller AS total FROM evenement WHERE id_evenement = %(id)s",
+        ),
+        "retour": RequetePreparee(
+            "bus_capacite_retour",
+            "SELECT capacite_bus_retour AS total FROM evenement WHERE id_evenement = %(id)s",
+        ),
+    }
+    SQL_UPDATE = """
+        WITH updated AS (
+            UPDATE bus
+            SET fk_evenement = %(fk_evenement)s,
+                matricule    = %(matricule)s,
+                nombre_places= %(nombre_places)s,
+                direction    = %(direction)s,
+                description  = %(description)s
+            WHERE id_bus = %(id_bus)s
+            RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
+        )
+        SELECT * FROM updated
+    """
+    SQL_UPDATE_PLACES = """
+        WITH updated AS (
+            UPDATE bus
+            SET nombre_places = %(nombre_places)s
+            WHERE id_bus = %(id_bus)s
+            RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
+        )
+        SELECT * FROM updated
+    """
+    SQL_DELETE = "DELETE FROM bus WHERE id_bus = %(id)s"
+    SQL_COUNT_FOR_EVENT = "SELECT COUNT(*) AS c FROM bus WHERE fk_evenement = %(id)s"
+
     # ------------- HELPERS -------------
     @staticmethod
     def _row_to_model(row: dict) -> CreneauBusModelOut:
         """Convertit une ligne SQL (dict) en objet Pydantic CreneauBusModelOut."""
-        return CreneauBusModelOut(**row)
+        return vers_modele(CreneauBusModelOut, row)
+
+    LISTE_PAGE = "bus"
 
     # ------------- CREATE -------------
     def create(self, bus_in: CreneauBusModelIn) -> Optional[CreneauBusModelOut]:
         """
         Insère un bus à partir d'un CreneauBusModelIn.
         """
-        query = """
-            INSERT INTO bus (fk_evenement, matricule, nombre_places, direction, description)
-            VALUES (%(fk_evenement)s, %(matricule)s, %(nombre_places)s, %(direction)s, %(description)s)
-            RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
-        """
         params = bus_in.model_dump()
 
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
                 try:
-                    curs.execute(query, params)
+                    curs.execute(self.SQL_CREATE, params)
                     row = curs.fetchone()
                     con.commit()
                 except Exception as e:
@@ -44,27 +94,24 @@ class CreneauBusDao:
 
     # ------------- READ -------------
     def find_by_id(self, id_bus: int) -> Optional[CreneauBusModelOut]:
-        query = "SELECT * FROM bus WHERE id_bus = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"id": id_bus})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_bus})
                 row = curs.fetchone()
         return self._row_to_model(row) if row else None
 
     def find_by_event(self, id_evenement: int) -> List[CreneauBusModelOut]:
         """Récupère tous les bus d'un événement."""
-        query = "SELECT * FROM bus WHERE fk_evenement = %(id_evenement)s ORDER BY id_bus"
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"id_evenement": id_evenement})
+                curs.execute(self.SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
                 rows = curs.fetchall()
-        return [self._row_to_model(r) for r in rows]
+        return vers_modeles(CreneauBusModelOut, rows)
 
     def find_by_description(self, description: str) -> Optional[CreneauBusModelOut]:
-        query = "SELECT * FROM bus WHERE description = %(description)s"
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"description": description})
+                curs.execute(self.SQL_FIND_BY_DESCRIPTION, {"description": description})
                 row = curs.fetchone()
         return self._row_to_model(row) if row else None
     
@@ -73,39 +120,42 @@ class CreneauBusDao:
         return self.find_by_description(description) is not None
     
     def find_all(self, limit: int = 100, offset: int = 0) -> List[CreneauBusModelOut]:
-        query = "SELECT * FROM bus LIMIT %(limit)s OFFSET %(offset)s"
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"limit": limit, "offset": offset})
+                curs.execute(self.SQL_FIND_ALL, {"limit": limit, "offset": offset})
                 rows = curs.fetchall()
-        return [self._row_to_model(r) for r in rows]
+        return vers_modeles(CreneauBusModelOut, rows)
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[CreneauBusModelOut]:
+        """Page de bus située après `curseur` (None pour la première page), triée par id_bus."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor(cursor_factory=RealDictCursor) as curs:
+                curs.execute(self.SQL_FIND_PAGE, params_par_id(curseur, limit, self.LISTE_PAGE))
+                rows = curs.fetchall()
+        return paginer_par_id(vers_modeles(CreneauBusModelOut, rows), limit, self.LISTE_PAGE, "id_bus")
     
     def find_by_event_id(self, id_evenement: int) -> list:
         """
         Récupère tous les bus (aller et retour) pour un événement donné.
         """
-        query = "SELECT * FROM bus WHERE fk_evenement = %(id)s ORDER BY direction DESC"
-        
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self.SQL_FIND_BY_EVENT_ID, {"id": id_evenement})
                 buses = curs.fetchall()
         
-        return [CreneauBusModelOut(**bus) for bus in buses]
+        return vers_modeles(CreneauBusModelOut, buses)
 
     # ------------- CALCULS (Capacité) -------------
     def get_capacite_totale(self, id_evenement: int, direction: str) -> int:
         """
-        Calcule la somme des places pour un événement et une direction.
-        """
-        query = """
-            SELECT SUM(nombre_places) as total
-            FROM bus
-            WHERE fk_evenement = %(id)s AND direction = %(dir)s
+        Somme des places pour un événement et une direction.
+        Lecture O(1) du compteur evenement.capacite_bus_<direction> (tenu à jour par trigger).
         """
+        query = self.SQL_CAPACITE_TOTALE["aller" if direction == "aller" else "retour"]
+
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"id": id_evenement, "dir": direction})
+                curs.execute(query, {"id": id_evenement})
                 row = curs.fetchone()
         
         val = row.get('total') if row else 0
@@ -115,26 +165,13 @@ class CreneauBusDao:
     
     def update(self, bus_in: CreneauBusModelIn, id_bus: int) -> Optional[CreneauBusModelOut]:
         """Met à jour un bus."""
-        query = """
-            WITH updated AS (
-                UPDATE bus
-                SET fk_evenement = %(fk_evenement)s,
-                    matricule    = %(matricule)s,
-                    nombre_places= %(nombre_places)s,
-                    direction    = %(direction)s,
-                    description  = %(description)s
-                WHERE id_bus = %(id_bus)s
-                RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
-            )
-            SELECT * FROM updated
-        """
         params = bus_in.model_dump()
         params["id_bus"] = id_bus
 
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
                 try:
-                    curs.execute(query, params)
+                    curs.execute(self.SQL_UPDATE, params)
                     row = curs.fetchone()
                     con.commit()
                 except Exception as e:
@@ -147,19 +184,10 @@ class CreneauBusDao:
         """
         Met à jour uniquement le nombre de places.
         """
-        query = """
-            WITH updated AS (
-                UPDATE bus
-                SET nombre_places = %(nombre_places)s
-                WHERE id_bus = %(id_bus)s
-                RETURNING id_bus, fk_evenement, matricule, nombre_places, direction, description
-            )
-            SELECT * FROM updated
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
                 try:
-                    curs.execute(query, {"id_bus": id_bus, "nombre_places": nombre_places})
+                    curs.execute(self.SQL_UPDATE_PLACES, {"id_bus": id_bus, "nombre_places": nombre_places})
                     row = curs.fetchone()
                     con.commit()
                 except Exception as e:
@@ -169,18 +197,16 @@ class CreneauBusDao:
         return self._row_to_model(row) if row else None
 
     def delete(self, id_bus: int) -> bool:
-        query = "DELETE FROM bus WHERE id_bus = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_bus})
+                curs.execute(self.SQL_DELETE, {"id": id_bus})
                 con.commit()
                 return curs.rowcount > 0
 
     def count_for_event(self, id_evenement: int) -> int:
         """Nombre de bus rattachés à un événement."""
-        query = "SELECT COUNT(*) AS c FROM bus WHERE fk_evenement = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self.SQL_COUNT_FOR_EVENT, {"id": id_evenement})
                 row = curs.fetchone()
         return int(row[0]) if row else 0
\ No newline at end of file
@@ -1,40 +1,479 @@
+import logging
 import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional, Tuple
+
 import dotenv
 import psycopg2
+from psycopg2 import errors, extensions
 from psycopg2.extras import RealDictCursor
 
 from utils.singleton import Singleton
+from utils.stats_requetes import chronometrer
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeoutError(Exception):
+    """Levée quand aucune connexion ne se libère avant la fin du délai d'attente."""
+
+
+# ---------- Instructions préparées ----------
+
+class RequetePreparee(str):
+    """
+    Requête SQL (chaîne ordinaire, à paramètres %(nom)s ou %s) exécutée comme
+    instruction préparée nommée par les curseurs du pool : préparée (PREPARE)
+    à sa première exécution sur une connexion, puis exécutée par son nom
+    (EXECUTE) : PostgreSQL ne l'analyse et ne la planifie plus à chaque appel.
+
+    Reste une `str` : partagée telle quelle avec les DAO asynchrones (psycopg 3
+    la prépare lui-même) et avec tout code qui attend le texte de la requête.
+    Sur un autre curseur (curseur nommé, connexion hors pool), ou si la
+    préparation échoue, elle est exécutée normalement.
+    """
+
+    # %(nom)s, %s et %% (un % littéral) ; « %(nom)s » peut apparaître plusieurs fois
+    _PARAMETRE = re.compile(r"%\((\w+)\)s|%s|%%")
+
+    def __new__(cls, nom: str, sql: str):
+        requete = super().__new__(cls, sql)
+        requete.nom = nom
+        requete.preparable = True
+        requete._positionnel = None
+        return requete
+
+    def positionnelle(self) -> Tuple[str, Optional[List[str]], int]:
+        """
+        (texte à paramètres $1..$n pour PREPARE, noms des paramètres dans
+        l'ordre — None si la requête utilise des %s —, nombre de paramètres).
+        """
+        if self._positionnel is None:
+            noms: List[str] = []
+            positions: Dict[str, int] = {}
+            nb_anonymes = 0
+
+            def remplacer(m: "re.Match") -> str:
+                nonlocal nb_anonymes
+                if m.group(0) == "%%":
+                    return "%"
+                if m.group(1) is None:
+                    nb_anonymes += 1
+                    return f"${nb_anonymes}"
+                if m.group(1) not in positions:
+                    noms.append(m.group(1))
+                    positions[m.group(1)] = len(noms)
+                return f"${positions[m.group(1)]}"
+
+            texte = self._PARAMETRE.sub(remplacer, str(self))
+            if noms and nb_anonymes:
+                raise ValueError(f"Requête {self.nom} : paramètres nommés et anonymes mélangés.")
+            self._positionnel = (texte, noms if not nb_anonymes else None, len(noms) or nb_anonymes)
+        return self._positionnel
+
+
+# ---------- Chronométrage des requêtes ----------
+
+class _CurseurChronometre:
+    """
+    Ajoute à une classe de curseur l'enregistrement de chaque requête (utils.stats_requetes)
+    et l'exécution des RequetePreparee comme instructions préparées.
+    """
+
+    def execute(self, query, vars=None):
+        if (
+            isinstance(query, RequetePreparee)
+            and query.preparable
+            and self.name is None
+            and getattr(self.connection, "preparer", False)
+        ):
+            return chronometrer(self._executer_preparee, query, vars, self)
+        return chronometrer(super().execute, query, vars, self, _texte(query, self))
+
+    def _executer_preparee(self, requete: RequetePreparee, vars) -> None:
+        """PREPARE à la première exécution sur cette connexion, puis EXECUTE par le nom."""
+        texte, noms, nb = requete.positionnelle()
+        connexion = self.connection
+        if requete.nom not in connexion.preparees and not self._preparer(requete, texte):
+            return super().execute(requete, vars)
+
+        valeurs = [vars[n] for n in noms] if noms is not None else list(vars or ())
+        if len(valeurs) != nb:
+            raise ValueError(f"Requête {requete.nom} : {nb} paramètres attendus, {len(valeurs)} reçus.")
+        try:
+            if nb:
+                return super().execute(f"EXECUTE {requete.nom} ({', '.join(['%s'] * nb)})", valeurs)
+            return super().execute(f"EXECUTE {requete.nom}")
+        except errors.InvalidSqlStatementName:
+            # Instruction disparue (DISCARD ALL, DEALLOCATE) : elle sera
+            # préparée à nouveau à la prochaine exécution sur cette connexion
+            connexion.preparees.discard(requete.nom)
+            raise
+
+    def _preparer(self, requete: RequetePreparee, texte: str) -> bool:
+        """
+        Prépare la requête sur la connexion du curseur. En cas d'échec (type de
+        paramètre indéterminable...), la requête ne sera plus préparée dans ce
+        processus : retourne False, l'appelant l'exécute normalement.
+        Dans une transaction, la préparation est isolée par un SAVEPOINT pour
+        qu'un échec n'interrompe pas la transaction en cours.
+        """
+        connexion = self.connection
+        isoler = not connexion.autocommit
+        prepare = f"PREPARE {requete.nom} AS {texte}"
+        try:
+            if isoler:
+                super().execute(f"SAVEPOINT preparation; {prepare}; RELEASE SAVEPOINT preparation")
+            else:
+                super().execute(prepare)
+        except errors.DuplicatePreparedStatement:
+            # Déjà préparée sur cette session (registre perdu) : on la réutilise
+            if isoler:
+                super().execute("ROLLBACK TO SAVEPOINT preparation")
+        except psycopg2.Error as e:
+            if isoler:
+                super().execute("ROLLBACK TO SAVEPOINT preparation")
+            requete.preparable = False
+            logger.warning("Requête %s non préparée, exécutée normalement : %s", requete.nom, e)
+            return False
+        connexion.preparees.add(requete.nom)
+        return True
+
+    def executemany(self, query, vars_list):
+        return chronometrer(super().executemany, query, vars_list, self, _texte(query, self))
+
+
+def _texte(query, curseur) -> Optional[str]:
+    """Texte d'une requête composée (psycopg2.sql), None pour une chaîne."""
+    return None if isinstance(query, (str, bytes)) else query.as_string(curseur)
+
+
+_curseurs_chronometres: Dict[type, type] = {}
+
+
+def curseur_chronometre(base: type) -> type:
+    """Variante chronométrée d'une classe de curseur (créée une fois par classe)."""
+    classe = _curseurs_chronometres.get(base)
+    if classe is None:
+        classe = _curseurs_chronometres.setdefault(
+            base, type(f"{base.__name__}Chronometre", (_CurseurChronometre, base), {})
+        )
+    return classe
+
+
+class ConnexionChronometree(extensions.connection):
+    """
+    Connexion dont tous les curseurs sont chronométrés, quelle que soit la
+    `cursor_factory` demandée (RealDictCursor, curseur nommé, TupleCursor...).
+    Tient le registre des instructions préparées sur sa session (`preparees`).
+    """
+
+    # Exécution des RequetePreparee comme instructions préparées (DB_PREPARE=0 pour désactiver).
+    # Relu par lire_reglages() à la création du pool, une fois le .env chargé.
+    preparer = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.preparees = set()
+
+    @classmethod
+    def lire_reglages(cls) -> None:
+        """Relit DB_PREPARE dans l'environnement (à appeler après dotenv.load_dotenv)."""
+        cls.preparer = os.getenv("DB_PREPARE", "1") != "0"
+
+    def cursor(self, *args, **kwargs):
+        base = kwargs.get("cursor_factory") or self.cursor_factory or extensions.cursor
+        kwargs["cursor_factory"] = curseur_chronometre(base)
+        return super().cursor(*args, **kwargs)
+
+
+class ConnectionPool:
+    """
+    Pool borné de connexions PostgreSQL, partagé entre threads.
+
+    - min_size connexions sont ouvertes dès la création, max_size au plus ;
+    - getconn() attend au plus `timeout` secondes qu'une connexion se libère ;
+    - une connexion inutilisée depuis plus de `max_idle` secondes est fermée
+      (tant que le pool reste au-dessus de min_size) ;
+    - une connexion fermée ou dans un état inconnu est détectée et remplacée.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], "extensions.connection"],
+        min_size: int = 1,
+        max_size: int = 10,
+        timeout: float = 30.0,
+        max_idle: float = 600.0,
+        schema: Optional[str] = None,
+    ):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise ValueError("Tailles de pool invalides (0 <= min_size <= max_size, max_size >= 1).")
+
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.schema = schema
+
+        self._cond = threading.Condition()
+        self._idle: List["extensions.connection"] = []   # connexions libres (pile LIFO)
+        self._last_used: Dict[int, float] = {}          # id(conn) -> dernier retour au pool
+        self._schemas: Dict[int, Optional[str]] = {}    # id(conn) -> search_path appliqué
+        self._size = 0                                  # connexions ouvertes (libres + prêtées)
+        self._closed = False
+
+        for _ in range(min_size):
+            conn = self._open()
+            self._idle.append(conn)
+            self._last_used[id(conn)] = time.monotonic()
+
+    # ---------- Ouverture / fermeture ----------
+    def _open(self):
+        """Ouvre une nouvelle connexion physique (compte dans la taille du pool)."""
+        conn = self._connect()
+        self._size += 1
+        self._schemas[id(conn)] = None
+        return conn
+
+    def _discard(self, conn) -> None:
+        """Ferme définitivement une connexion et libère sa place dans le pool."""
+        self._last_used.pop(id(conn), None)
+        self._schemas.pop(id(conn), None)
+        self._size -= 1
+        try:
+            if not conn.closed:
+                conn.close()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_broken(conn) -> bool:
+        """Une connexion est inutilisable si elle est fermée ou dans un état inconnu."""
+        if conn.closed:
+            return True
+        return conn.get_transaction_status() == extensions.TRANSACTION_STATUS_UNKNOWN
+
+    @staticmethod
+    def _ping(conn) -> bool:
+        """Vérifie par un aller-retour qu'une connexion restée longtemps inactive répond encore."""
+        try:
+            with conn.cursor() as curs:
+                curs.execute("SELECT 1")
+            conn.rollback()
+            return True
+        except Exception:
+            return False
+
+    def _prepare(self, conn) -> None:
+        """
+        Aligne le search_path de la connexion sur le schéma courant du pool.
+        Une instruction préparée garde le search_path de sa préparation :
+        celles de la connexion sont donc oubliées au changement de schéma.
+        """
+        if self.schema and self._schemas.get(id(conn)) != self.schema:
+            preparees = getattr(conn, "preparees", None)
+            with conn.cursor() as curs:
+                curs.execute(f"SET search_path TO {self.schema}")
+                if preparees:
+                    curs.execute("DEALLOCATE ALL")
+                    preparees.clear()
+            conn.commit()
+            self._schemas[id(conn)] = self.schema
+
+    # ---------- Emprunt / restitution ----------
+    def getconn(self):
+        """Emprunte une connexion, en attendant au plus `timeout` secondes."""
+        deadline = time.monotonic() + self.timeout
+
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise RuntimeError("Le pool de connexions est fermé.")
+
+                now = time.monotonic()
+                while self._idle:
+                    conn = self._idle.pop()
+                    idle_for = now - self._last_used.get(id(conn), now)
+
+                    # Recyclage des connexions inactives au-delà du minimum
+                    if idle_for > self.max_idle and self._size > self.min_size:
+                        self._discard(conn)
+                        continue
+                    if self._is_broken(conn) or (idle_for > self.max_idle and not self._ping(conn)):
+                        self._discard(conn)
+                        continue
+                    break
+                else:
+                    conn = None
+
+                if conn is not None:
+                    break
+
+                if self._size < self.max_size:
+                    # On réserve la place sous verrou, la connexion s'ouvre hors verrou
+                    self._size += 1
+                    break
+
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PoolTimeoutError(
+                        f"Aucune connexion disponible après {self.timeout:.1f}s "
+                        f"({self._size}/{self.max_size} ouvertes)."
+                    )
+                self._cond.wait(remaining)
+
+        if conn is None:
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._schemas[id(conn)] = None
+
+        try:
+            self._prepare(conn)
+        except Exception:
+            with self._cond:
+                self._discard(conn)
+                self._cond.notify()
+            raise
+        return conn
+
+    def putconn(self, conn, close: bool = False) -> None:
+        """Rend une connexion au pool (ou la ferme si elle est cassée / `close=True`)."""
+        with self._cond:
+            if close or self._closed or self._is_broken(conn):
+                self._discard(conn)
+            else:
+                # On ne rend jamais au pool une connexion avec une transaction ouverte
+                if conn.get_transaction_status() != extensions.TRANSACTION_STATUS_IDLE:
+                    try:
+                        conn.rollback()
+                    except Exception:
+                        self._discard(conn)
+                        self._cond.notify()
+                        return
+                self._last_used[id(conn)] = time.monotonic()
+                self._idle.append(conn)
+            self._cond.notify()
+
+    @contextmanager
+    def connection(self):
+        """
+        Emprunte une connexion le temps d'un bloc `with`.
+        Même sémantique que `with psycopg2_connection:` : commit si le bloc
+        se termine normalement, rollback en cas d'exception. La connexion est
+        ensuite rendue au pool dans tous les cas.
+        """
+        conn = self.getconn()
+        try:
+            yield conn
+            if not conn.closed:
+                conn.commit()
+        except BaseException:
+            try:
+                if not conn.closed:
+                    conn.rollback()
+            except Exception:
+                pass
+            raise
+        finally:
+            self.putconn(conn)
+
+    def closeall(self) -> None:
+        """Ferme toutes les connexions libres ; celles prêtées seront fermées à leur retour."""
+        with self._cond:
+            self._closed = True
+            while self._idle:
+                self._discard(self._idle.pop())
+            self._cond.notify_all()
+
+    # ---------- Introspection ----------
+    @property
+    def size(self) -> int:
+        """Nombre de connexions ouvertes (libres + empruntées)."""
+        return self._size
+
+    @property
+    def idle(self) -> int:
+        """Nombre de connexions libres."""
+        return len(self._idle)
 
 
 class DBConnection(metaclass=Singleton):
     """
-    Classe gérant une unique connexion à la base PostgreSQL.
-    Utilise le patron Singleton pour éviter plusieurs connexions simultanées.
+    Classe gérant l'accès à la base PostgreSQL.
+    Utilise le patron Singleton pour partager un unique pool de connexions
+    (borné) entre tous les DAO et tous les threads.
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      POSTGRES_POOL_MIN      connexions ouvertes au démarrage (défaut 1)
+      POSTGRES_POOL_MAX      connexions ouvertes au maximum   (défaut 10)
+      POSTGRES_POOL_TIMEOUT  attente max d'une connexion libre, en secondes (défaut 30)
+      POSTGRES_POOL_MAX_IDLE durée d'inactivité avant recyclage, en secondes (défaut 600)
+      DB_PREPARE             0 pour exécuter les RequetePreparee sans les préparer (défaut 1)
     """
 
     def __init__(self):
-        """Initialise la connexion à la base de données."""
+        """Initialise le pool de connexions à la base de données."""
         dotenv.load_dotenv()  # charge le fichier .env
+        ConnexionChronometree.lire_reglages()
+        schema = os.getenv("POSTGRES_SCHEMA")
         try:
-            self.__connection = psycopg2.connect(
-                host=os.getenv("POSTGRES_HOST"),
-                port=os.getenv("POSTGRES_PORT"),
-                database=os.getenv("POSTGRES_DATABASE"),
-                user=os.getenv("POSTGRES_USER"),
-                password=os.getenv("POSTGRES_PASSWORD"),
-                options=f"-c search_path={os.getenv('POSTGRES_SCHEMA')}",
-                cursor_factory=RealDictCursor,
+            self.__pool = ConnectionPool(
+                self._connect,
+                min_size=int(os.getenv("POSTGRES_POOL_MIN", "1")),
+                max_size=int(os.getenv("POSTGRES_POOL_MAX", "10")),
+                timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+                max_idle=float(os.getenv("POSTGRES_POOL_MAX_IDLE", "600")),
+                schema=schema,
             )
-            print(f"Connexion réussie au schéma : {os.getenv('POSTGRES_SCHEMA')}")
+            # Journalisé plutôt qu'affiché : le pool peut s'ouvrir en tâche de
+            # fond pendant qu'un menu est à l'écran (utils.demarrage)
+            logger.info("Connexion réussie au schéma : %s", schema)
         except Exception as e:
-            print("Erreur de connexion à la base de données :", e)
+            logger.error("Erreur de connexion à la base de données : %s", e)
             raise
 
+    @staticmethod
+    def _connect():
+        """Ouvre une connexion physique à partir des variables d'environnement."""
+        return psycopg2.connect(
+            host=os.getenv("POSTGRES_HOST"),
+            port=os.getenv("POSTGRES_PORT"),
+            database=os.getenv("POSTGRES_DATABASE"),
+            user=os.getenv("POSTGRES_USER"),
+            password=os.getenv("POSTGRES_PASSWORD"),
+            options=f"-c search_path={os.getenv('POSTGRES_SCHEMA')}",
+            connection_factory=ConnexionChronometree,
+            cursor_factory=RealDictCursor,
+        )
+
+    @property
+    def pool(self) -> ConnectionPool:
+        """Retourne le pool de connexions partagé."""
+        return self.__pool
+
     @property
     def connection(self):
-        """Retourne la connexion PostgreSQL active."""
-        return self.__connection
+        """
+        Emprunte une connexion au pool pour un bloc `with`
+        (commit / rollback automatiques, puis restitution au pool).
+        """
+        return self.__pool.connection()
 
     def getConnexion(self):
-        """Alias pour compatibilité."""
-        return self.__connection
+        """Alias pour compatibilité : `with DBConnection().getConnexion() as con:`."""
+        return self.__pool.connection()
+
+    def definir_schema(self, schema: str) -> None:
+        """Change le search_path appliqué à toutes les connexions du pool."""
+        self.__pool.schema = schema
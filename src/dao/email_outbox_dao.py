@@ -0,0 +1,196 @@
+# src/dao/email_outbox_dao.py
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from dao.db_connection import DBConnection
+from dao.lignes import vers_modele, vers_modeles
+from model.email_models import EmailModelOut, StatutEmail
+
+
+class EmailOutboxDao:
+    """
+    DAO pour la file d'envoi des e-mails (table 'email_outbox').
+
+    Les services déposent les messages (une ligne par destinataire) ;
+    le dispatcher les réserve par lots, les envoie, puis enregistre le résultat.
+    La réservation d'un lot passe par FOR UPDATE SKIP LOCKED : plusieurs
+    dispatchers (un par worker de l'API, la CLI...) peuvent tourner en même
+    temps sans jamais envoyer deux fois le même message.
+    """
+
+    # ---------- SQL ----------
+    SQL_AJOUTER = """
+        INSERT INTO email_outbox (destinataire, sujet, contenu)
+        SELECT d, %(sujet)s, %(contenu)s
+        FROM unnest(%(destinataires)s::text[]) AS d
+        RETURNING id_email
+    """
+
+    SQL_FIND_BY_ID = "SELECT * FROM email_outbox WHERE id_email = %(id)s"
+
+    SQL_RESERVER_LOT = """
+        WITH reserves AS (
+            UPDATE email_outbox
+            SET statut = 'en_cours',
+                verrouille_le = NOW(),
+                tentatives = tentatives + 1
+            WHERE id_email IN (
+                SELECT id_email
+                FROM email_outbox
+                WHERE statut = 'en_attente' AND prochain_essai <= NOW()
+                ORDER BY prochain_essai, id_email
+                LIMIT %(taille)s
+                FOR UPDATE SKIP LOCKED
+            )
+            RETURNING *
+        )
+        SELECT * FROM reserves ORDER BY id_email
+    """
+
+    # Messages réservés par un dispatcher arrêté (ou bloqué) en cours de route.
+    # La tentative est déjà comptée : un message qui fait tomber le dispatcher
+    # à chaque envoi, ou envoyé sans que l'envoi ait pu être enregistré,
+    # passe en échec après max_tentatives au lieu d'être repris sans fin.
+    SQL_LIBERER_VERROUS_EXPIRES = """
+        UPDATE email_outbox
+        SET statut = CASE WHEN tentatives < %(max_tentatives)s THEN 'en_attente' ELSE 'echec' END,
+            verrouille_le = NULL,
+            derniere_erreur = CASE WHEN tentatives < %(max_tentatives)s THEN derniere_erreur
+                                   ELSE 'Verrou expiré : envoi non confirmé' END
+        WHERE statut = 'en_cours'
+          AND verrouille_le < NOW() - make_interval(secs => %(expiration)s)
+    """
+
+    SQL_MARQUER_ENVOYES = """
+        UPDATE email_outbox o
+        SET statut = 'envoye',
+            date_envoi = NOW(),
+            verrouille_le = NULL,
+            derniere_erreur = NULL,
+            message_id = e.message_id
+        FROM unnest(%(ids)s::int[], %(message_ids)s::text[]) AS e(id_email, message_id)
+        WHERE o.id_email = e.id_email
+    """
+
+    # Backoff exponentiel plafonné : base * 2^(tentatives - 1)
+    SQL_REPLANIFIER = """
+        UPDATE email_outbox
+        SET statut = CASE WHEN tentatives >= %(max_tentatives)s THEN 'echec' ELSE 'en_attente' END,
+            prochain_essai = NOW() + make_interval(
+                secs => LEAST(%(delai_base)s * power(2, GREATEST(tentatives - 1, 0)), %(delai_max)s)
+            ),
+            verrouille_le = NULL,
+            derniere_erreur = %(erreur)s
+        WHERE id_email = ANY(%(ids)s)
+    """
+
+    SQL_MARQUER_ECHEC = """
+        UPDATE email_outbox
+        SET statut = 'echec', verrouille_le = NULL, derniere_erreur = %(erreur)s
+        WHERE id_email = ANY(%(ids)s)
+    """
+
+    SQL_COMPTER_PAR_STATUT = "SELECT statut, COUNT(*) AS n FROM email_outbox GROUP BY statut"
+
+    # ---------- Helpers ----------
+    @staticmethod
+    def _row_to_model(r: dict) -> EmailModelOut:
+        return vers_modele(EmailModelOut, r)
+
+    def _ecrire(self, requete: str, params: dict) -> int:
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(requete, params)
+                return curs.rowcount
+
+    # ---------- CREATE ----------
+    def ajouter(self, destinataires: Sequence[str], sujet: str, contenu: str) -> List[int]:
+        """Dépose un message pour chaque destinataire (une seule requête). Retourne leurs identifiants."""
+        if not destinataires:
+            return []
+        params = {"destinataires": list(destinataires), "sujet": sujet, "contenu": contenu}
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_AJOUTER, params)
+                return [r["id_email"] for r in curs.fetchall()]
+
+    # ---------- READ ----------
+    def find_by_id(self, id_email: int) -> Optional[EmailModelOut]:
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_email})
+                row = curs.fetchone()
+        return self._row_to_model(row) if row else None
+
+    def compter_par_statut(self) -> Dict[StatutEmail, int]:
+        """Nombre de messages par statut (tous les statuts sont présents, à 0 par défaut)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_COMPTER_PAR_STATUT)
+                rows = curs.fetchall()
+        compte = {statut: 0 for statut in StatutEmail}
+        for r in rows:
+            compte[StatutEmail(r["statut"])] = r["n"]
+        return compte
+
+    # ---------- Dispatcher ----------
+    def reserver_lot(self, taille: int) -> List[EmailModelOut]:
+        """
+        Passe au plus `taille` messages dus de 'en_attente' à 'en_cours'
+        (et compte la tentative). Les lignes déjà réservées par un autre
+        dispatcher sont ignorées au lieu d'être attendues.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_RESERVER_LOT, {"taille": taille})
+                rows = curs.fetchall()
+        return vers_modeles(EmailModelOut, rows)
+
+    def liberer_verrous_expires(self, expiration: float, max_tentatives: int) -> int:
+        """
+        Remet en attente les messages réservés depuis plus de `expiration` secondes,
+        ou les passe en échec s'ils ont déjà eu `max_tentatives` tentatives.
+        """
+        return self._ecrire(
+            self.SQL_LIBERER_VERROUS_EXPIRES, {"expiration": expiration, "max_tentatives": max_tentatives}
+        )
+
+    def marquer_envoyes(self, envois: Iterable[Tuple[int, Optional[str]]]) -> int:
+        """Enregistre l'envoi de chaque message : couples (id_email, message_id Brevo ou None)."""
+        envois = list(envois)
+        if not envois:
+            return 0
+        return self._ecrire(
+            self.SQL_MARQUER_ENVOYES,
+            {"ids": [i for i, _ in envois], "message_ids": [m for _, m in envois]},
+        )
+
+    def replanifier(
+        self,
+        ids: Sequence[int],
+        erreur: str,
+        max_tentatives: int,
+        delai_base: float,
+        delai_max: float,
+    ) -> int:
+        """
+        Échec temporaire : nouvel essai après un délai croissant avec le nombre
+        de tentatives, ou abandon ('echec') une fois `max_tentatives` atteint.
+        """
+        if not ids:
+            return 0
+        return self._ecrire(
+            self.SQL_REPLANIFIER,
+            {
+                "ids": list(ids),
+                "erreur": erreur,
+                "max_tentatives": max_tentatives,
+                "delai_base": delai_base,
+                "delai_max": delai_max,
+            },
+        )
+
+    def marquer_echec(self, ids: Sequence[int], erreur: str) -> int:
+        """Échec définitif (adresse refusée, requête invalide...) : pas de nouvel essai."""
+        if not ids:
+            return 0
+        return self._ecrire(self.SQL_MARQUER_ECHEC, {"ids": list(ids), "erreur": erreur})
@@ -1,7 +1,10 @@
 # dao/evenement_dao.py
-from typing import List, Optional
-from dao.db_connection import DBConnection
+from typing import Any, Dict, List, Optional
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
 from model.evenement_models import EvenementModelOut, EvenementModelIn
+from model.pagination_models import PageCurseur
+from utils.pagination import paginer_par_id, params_par_id
 
 
 class EvenementDao:
@@ -20,106 +23,153 @@ class EvenementDao:
       date_creation TIMESTAMP DEFAULT NOW()
       categorie VARCHAR(50)
       statut VARCHAR(50) CHECK (...)
+      ouverture TIMESTAMPTZ NULL (ouverture des réservations, migration 005)
+
+    Les requêtes SQL sont des attributs de classe, partagées avec EvenementDaoAsync.
+    """
+
+    # ---------- SQL ----------
+    SQL_FIND_ALL = """
+        SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
+               date_evenement, description, capacite, categorie,
+               statut, date_creation, ouverture
+        FROM evenement
+        ORDER BY id_evenement
+        LIMIT %(limit)s OFFSET %(offset)s
+    """
+
+    # Pagination keyset : la page suivante repart du dernier id vu
+    SQL_FIND_PAGE = """
+        SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
+               date_evenement, description, capacite, categorie,
+               statut, date_creation, ouverture
+        FROM evenement
+        WHERE id_evenement > %(apres)s
+        ORDER BY id_evenement
+        LIMIT %(limit)s
+    """
+
+    SQL_FIND_BY_ID = RequetePreparee("evenement_find_by_id", """
+        SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
+               date_evenement, description, capacite, categorie,
+               statut, date_creation, ouverture
+        FROM evenement
+        WHERE id_evenement = %(id)s
+    """)
+
+    SQL_CREATE = """
+        INSERT INTO evenement (
+            fk_utilisateur, titre, adresse, ville, date_evenement,
+            description, capacite, categorie, statut, ouverture
+        )
+        VALUES (
+            %(fk_utilisateur)s, %(titre)s, %(adresse)s, %(ville)s,
+            %(date_evenement)s, %(description)s, %(capacite)s,
+            %(categorie)s, %(statut)s, %(ouverture)s
+        )
+        RETURNING id_evenement, date_creation
+    """
+
+    SQL_UPDATE = """
+        WITH updated AS (
+          UPDATE evenement SET
+              fk_utilisateur = %(fk_utilisateur)s,
+              titre = %(titre)s,
+              adresse = %(adresse)s,
+              ville = %(ville)s,
+              date_evenement = %(date_evenement)s,
+              description = %(description)s,
+              capacite = %(capacite)s,
+              categorie = %(categorie)s,
+              statut = %(statut)s,
+              ouverture = %(ouverture)s
+          WHERE id_evenement = %(id_evenement)s
+          RETURNING id_evenement, fk_utilisateur, titre, adresse, ville,
+                    date_evenement, description, capacite, categorie,
+                    statut, date_creation, ouverture
+        )
+        SELECT * FROM updated
     """
 
+    SQL_DELETE = "DELETE FROM evenement WHERE id_evenement = %(id)s"
+
+    SQL_RECALCULER_COMPTEURS = "SELECT recalculer_compteurs() AS corriges"
+
+    # ---------- HELPERS ----------
+    @staticmethod
+    def _row_to_model(r: dict) -> EvenementModelOut:
+        """Convertit une ligne SQL (dict) en EvenementModelOut."""
+        return vers_modele(EvenementModelOut, r)
+
+    @staticmethod
+    def _params_create(evenement_in: EvenementModelIn) -> Dict[str, Any]:
+        return {
+            "fk_utilisateur": evenement_in.fk_utilisateur,
+            "titre": evenement_in.titre,
+            "adresse": evenement_in.adresse,
+            "ville": evenement_in.ville,
+            "date_evenement": evenement_in.date_evenement,
+            "description": evenement_in.description,
+            "capacite": evenement_in.capacite,
+            "categorie": evenement_in.categorie,
+            "statut": evenement_in.statut,
+            "ouverture": evenement_in.ouverture,
+        }
+
+    @staticmethod
+    def _params_update(evenement: EvenementModelOut) -> Dict[str, Any]:
+        params = EvenementDao._params_create(evenement)
+        params["id_evenement"] = evenement.id_evenement
+        return params
+
+    LISTE_PAGE = "evenements"
+
     # ---------- READ ----------
 
     def find_all(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
         """Récupère une liste paginée d'événements."""
-        query = """
-            SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
-                   date_evenement, description, capacite, categorie,
-                   statut, date_creation
-            FROM evenement
-            ORDER BY id_evenement
-            LIMIT %(limit)s OFFSET %(offset)s
-        """
         params = {"limit": max(limit, 0), "offset": max(offset, 0)}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_FIND_ALL, params)
+                rows = curs.fetchall()
+
+        return vers_modeles(EvenementModelOut, rows)
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[EvenementModelOut]:
+        """
+        Page d'événements située après `curseur` (None pour la première page).
+        Le curseur_suivant de la page rendue donne accès à la suivante.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_PAGE, params_par_id(curseur, limit, self.LISTE_PAGE))
                 rows = curs.fetchall()
 
-        return [
-            EvenementModelOut(
-                id_evenement=r["id_evenement"],
-                fk_utilisateur=r["fk_utilisateur"],
-                titre=r["titre"],
-                adresse=r["adresse"],
-                ville=r["ville"],
-                date_evenement=r["date_evenement"],
-                description=r["description"],
-                capacite=r["capacite"],
-                categorie=r["categorie"],
-                statut=r["statut"],
-                date_creation=r["date_creation"],
-            )
-            for r in rows
-        ]
+        return paginer_par_id(vers_modeles(EvenementModelOut, rows), limit, self.LISTE_PAGE, "id_evenement")
 
     def find_by_id(self, id_evenement: int) -> Optional[EvenementModelOut]:
         """Récupère un événement par son ID."""
-        query = """
-            SELECT id_evenement, fk_utilisateur, titre, adresse, ville,
-                   date_evenement, description, capacite, categorie,
-                   statut, date_creation
-            FROM evenement
-            WHERE id_evenement = %(id)s
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_evenement})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return EvenementModelOut(
-            id_evenement=r["id_evenement"],
-            fk_utilisateur=r["fk_utilisateur"],
-            titre=r["titre"],
-            adresse=r["adresse"],
-            ville=r["ville"],
-            date_evenement=r["date_evenement"],
-            description=r["description"],
-            capacite=r["capacite"],
-            categorie=r["categorie"],
-            statut=r["statut"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- CREATE ----------
 
     def create(self, evenement_in: EvenementModelIn) -> EvenementModelOut:
         """Crée un nouvel événement."""
-        query = """
-            INSERT INTO evenement (
-                fk_utilisateur, titre, adresse, ville, date_evenement,
-                description, capacite, categorie, statut
-            )
-            VALUES (
-                %(fk_utilisateur)s, %(titre)s, %(adresse)s, %(ville)s,
-                %(date_evenement)s, %(description)s, %(capacite)s,
-                %(categorie)s, %(statut)s
-            )
-            RETURNING id_evenement, date_creation
-        """
-        params = {
-            "fk_utilisateur": evenement_in.fk_utilisateur,
-            "titre": evenement_in.titre,
-            "adresse": evenement_in.adresse,
-            "ville": evenement_in.ville,
-            "date_evenement": evenement_in.date_evenement,
-            "description": evenement_in.description,
-            "capacite": evenement_in.capacite,
-            "categorie": evenement_in.categorie,
-            "statut": evenement_in.statut,
-        }
+        params = self._params_create(evenement_in)
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CREATE, params)
                 row = curs.fetchone()
                 con.commit()
 
@@ -128,82 +178,43 @@ class EvenementDao:
 
         return EvenementModelOut(
             id_evenement=row["id_evenement"],
-            fk_utilisateur=evenement_in.fk_utilisateur,
-            titre=evenement_in.titre,
-            adresse=evenement_in.adresse,
-            ville=evenement_in.ville,
-            date_evenement=evenement_in.date_evenement,
-            description=evenement_in.description,
-            capacite=evenement_in.capacite,
-            categorie=evenement_in.categorie,
-            statut=evenement_in.statut,
             date_creation=row["date_creation"],
+            **params,
         )
 
     # ---------- UPDATE ----------
 
     def update(self, evenement: EvenementModelOut) -> Optional[EvenementModelOut]:
         """Met à jour un événement existant."""
-        query = """
-            WITH updated AS (
-              UPDATE evenement SET
-                  fk_utilisateur = %(fk_utilisateur)s,
-                  titre = %(titre)s,
-                  adresse = %(adresse)s,
-                  ville = %(ville)s,
-                  date_evenement = %(date_evenement)s,
-                  description = %(description)s,
-                  capacite = %(capacite)s,
-                  categorie = %(categorie)s,
-                  statut = %(statut)s
-              WHERE id_evenement = %(id_evenement)s
-              RETURNING id_evenement, fk_utilisateur, titre, adresse, ville,
-                        date_evenement, description, capacite, categorie,
-                        statut, date_creation
-            )
-            SELECT * FROM updated
-        """
-        params = {
-            "id_evenement": evenement.id_evenement,
-            "fk_utilisateur": evenement.fk_utilisateur,
-            "titre": evenement.titre,
-            "adresse": evenement.adresse,
-            "ville": evenement.ville,
-            "date_evenement": evenement.date_evenement,
-            "description": evenement.description,
-            "capacite": evenement.capacite,
-            "categorie": evenement.categorie,
-            "statut": evenement.statut,
-        }
-
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_UPDATE, self._params_update(evenement))
                 r = curs.fetchone()
 
         if not r:
             return None
 
-        return EvenementModelOut(
-            id_evenement=r["id_evenement"],
-            fk_utilisateur=r["fk_utilisateur"],
-            titre=r["titre"],
-            adresse=r["adresse"],
-            ville=r["ville"],
-            date_evenement=r["date_evenement"],
-            description=r["description"],
-            capacite=r["capacite"],
-            categorie=r["categorie"],
-            statut=r["statut"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- DELETE ----------
 
     def delete(self, id_evenement: int) -> bool:
         """Supprime un événement par son ID."""
-        query = "DELETE FROM evenement WHERE id_evenement = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self.SQL_DELETE, {"id": id_evenement})
                 return curs.rowcount > 0
+
+    # ---------- MAINTENANCE ----------
+
+    def recalculer_compteurs(self) -> int:
+        """
+        Recalcule de zéro les compteurs dénormalisés (inscrits, bus, SAM, adhérents,
+        capacités bus, statistiques d'avis) de tous les événements.
+        Retourne le nombre d'événements dont les compteurs ont été corrigés.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_RECALCULER_COMPTEURS)
+                row = curs.fetchone()
+        return int(row["corriges"]) if row else 0
@@ -0,0 +1,120 @@
+# src/dao/lignes.py
+"""
+Conversion des lignes SQL (dict : RealDictCursor, dict_row) en modèles pydantic.
+
+Les valeurs viennent de colonnes déjà typées et contraintes par PostgreSQL.
+Pour chaque couple (modèle, colonnes de la requête), un convertisseur est
+préparé une fois, avec l'API publique de pydantic :
+- modèle à champs simples (nombres, texte, dates, booléens, Enum, Literal) :
+  un `TypeAdapter(List[Modele])` convertit tout le résultat en un seul appel
+  au validateur compilé, au lieu d'un `model_validate` par ligne ;
+- modèle dont un champ a un validateur coûteux (EmailStr, chaîne contrainte) :
+  `Modele.model_construct`, sans revalider ce que la base a déjà accepté,
+  avec la liste des champs lus calculée d'avance et le texte des Enum
+  converti en membre.
+Les colonnes en trop sont ignorées, les champs absents prennent leur valeur
+par défaut ; une requête qui ne lit pas un champ obligatoire est refusée.
+
+Réglage (variable d'environnement, optionnelle, lue à chaque conversion) :
+  DB_VALIDER_LIGNES  1 pour valider chaque ligne (model_validate) : met en
+                     évidence une colonne dont le type ne correspond plus au
+                     modèle (défaut 0)
+"""
+import os
+from datetime import date, datetime, time
+from decimal import Decimal
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Literal, Mapping, Optional, Sequence, Tuple, Type, TypeVar, Union, get_args, get_origin
+
+from pydantic import BaseModel, EmailStr, TypeAdapter
+from pydantic.fields import FieldInfo
+
+M = TypeVar("M", bound=BaseModel)
+
+Convertisseur = Callable[[Sequence[Mapping[str, Any]]], List[BaseModel]]
+
+# Types que la colonne garantit : rien à revalider
+_SIMPLES = (bool, int, float, str, bytes, Decimal, date, datetime, time)
+
+_convertisseurs: Dict[Tuple[type, Tuple[str, ...]], Convertisseur] = {}
+
+
+def _valider() -> bool:
+    return os.getenv("DB_VALIDER_LIGNES", "0") == "1"
+
+
+def _type(annotation: Any) -> Any:
+    """Type d'un champ annoté `T` ou `Optional[T]` (None pour une autre union)."""
+    if get_origin(annotation) is Union:
+        types = [a for a in get_args(annotation) if a is not type(None)]
+        return types[0] if len(types) == 1 else None
+    return annotation
+
+
+def _enum(champ: FieldInfo) -> Optional[Type[Enum]]:
+    t = _type(champ.annotation)
+    return t if isinstance(t, type) and issubclass(t, Enum) else None
+
+
+def _copiable(champ: FieldInfo) -> bool:
+    """Valeur de colonne utilisable telle quelle (après conversion des Enum)."""
+    t = _type(champ.annotation)
+    return t is EmailStr or get_origin(t) is Literal or _enum(champ) is not None or t in _SIMPLES
+
+
+def _couteux(champ: FieldInfo) -> bool:
+    """Validateur écrit en Python, ou contrainte déjà vérifiée par la colonne."""
+    return _type(champ.annotation) is EmailStr or bool(champ.metadata)
+
+
+def _compiler(modele: Type[M], colonnes: Tuple[str, ...]) -> Convertisseur:
+    """Convertisseur des lignes à `colonnes` vers `modele`."""
+    champs = modele.model_fields
+    requis = [nom for nom, champ in champs.items() if nom not in colonnes and champ.is_required()]
+    if requis:
+        raise ValueError(f"{modele.__name__} : colonnes absentes de la requête : {', '.join(requis)}.")
+
+    if not (all(map(_copiable, champs.values())) and any(map(_couteux, champs.values()))):
+        return TypeAdapter(List[modele]).validate_python
+
+    lus = tuple(nom for nom in champs if nom in colonnes)
+    enums = tuple((nom, enum) for nom in lus if (enum := _enum(champs[nom])))
+    construire = modele.model_construct
+
+    def convertir(rows: Sequence[Mapping[str, Any]]) -> List[BaseModel]:
+        modeles = []
+        for row in rows:
+            valeurs = {nom: row[nom] for nom in lus}
+            for nom, enum in enums:
+                if valeurs[nom] is not None:
+                    valeurs[nom] = enum(valeurs[nom])
+            modeles.append(construire(set(lus), **valeurs))
+        return modeles
+
+    return convertir
+
+
+def _convertisseur(modele: Type[M], row: Mapping[str, Any]) -> Convertisseur:
+    cle = (modele, tuple(row))
+    convertir = _convertisseurs.get(cle)
+    if convertir is None:
+        convertir = _convertisseurs.setdefault(cle, _compiler(modele, cle[1]))
+    return convertir
+
+
+def vers_modele(modele: Type[M], row: Mapping[str, Any]) -> M:
+    """Convertit une ligne SQL en `modele`."""
+    if _valider():
+        return modele.model_validate(row)
+    return _convertisseur(modele, row)((row,))[0]
+
+
+def vers_modeles(modele: Type[M], rows: Iterable[Mapping[str, Any]]) -> List[M]:
+    """Convertit les lignes d'une requête en `modele`."""
+    if _valider():
+        valider = modele.model_validate
+        return [valider(r) for r in rows]
+    rows = rows if isinstance(rows, (list, tuple)) else list(rows)
+    if not rows:
+        return []
+    return _convertisseur(modele, rows[0])(rows)
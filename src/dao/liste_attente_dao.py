@@ -0,0 +1,185 @@
+# src/dao/liste_attente_dao.py
+from typing import List, Optional
+
+from dao.db_connection import DBConnection
+from dao.lignes import vers_modeles
+from model.reservation_models import (
+    DemandeAttenteModelOut,
+    PromotionAttente,
+    ReservationModelIn,
+    StatutReservation,
+)
+
+
+class ListeAttenteDao:
+    """
+    DAO de la liste d'attente (table 'liste_attente', migration 004).
+
+    Une file FIFO par événement (demandes de place, direction NULL) et par sens
+    de bus (direction 'aller' / 'retour', pour des inscrits). Les demandes sont
+    servies par la fonction SQL promouvoir_liste_attente, appelée par trigger
+    dès qu'une place se libère, dans la transaction de l'écriture.
+
+    Une demande de place n'est acceptée que si l'événement est complet pour
+    elle (fonction inscrire_liste_attente, migration 006) et n'est jamais servie
+    dans la foulée : une place libre se réserve par la file d'admission.
+    """
+
+    # ---------- SQL ----------
+    SQL_INSCRIRE_PLACE = """
+        SELECT inscrire_liste_attente(
+            %(fk_utilisateur)s, %(fk_evenement)s,
+            %(bus_aller)s, %(bus_retour)s, %(adherent)s, %(sam)s, %(boisson)s
+        ) AS statut
+    """
+
+    SQL_INSCRIRE_BUS = """
+        INSERT INTO liste_attente (
+            fk_utilisateur, fk_evenement, direction,
+            bus_aller, bus_retour, adherent, sam, boisson
+        ) VALUES (
+            %(fk_utilisateur)s, %(fk_evenement)s, %(direction)s,
+            %(bus_aller)s, %(bus_retour)s, %(adherent)s, %(sam)s, %(boisson)s
+        )
+        ON CONFLICT (fk_utilisateur, fk_evenement, COALESCE(direction, '')) DO NOTHING
+    """
+
+    # Les places de bus ont pu se libérer avant l'inscription : la file est servie aussitôt
+    SQL_PROMOUVOIR = """
+        SELECT id_utilisateur, id_reservation, direction
+        FROM promouvoir_liste_attente(%(id_evenement)s)
+    """
+
+    SQL_RETIRER = """
+        DELETE FROM liste_attente
+        WHERE fk_utilisateur = %(fk_utilisateur)s
+          AND fk_evenement = %(fk_evenement)s
+          AND direction IS NOT DISTINCT FROM %(direction)s
+    """
+
+    SQL_POSITION = """
+        SELECT COUNT(*) AS position
+        FROM liste_attente moi
+        JOIN liste_attente a
+          ON a.fk_evenement = moi.fk_evenement
+         AND a.direction IS NOT DISTINCT FROM moi.direction
+         AND a.id_attente <= moi.id_attente
+        WHERE moi.fk_utilisateur = %(fk_utilisateur)s
+          AND moi.fk_evenement = %(fk_evenement)s
+          AND moi.direction IS NOT DISTINCT FROM %(direction)s
+    """
+
+    SQL_COLONNES = """
+        id_attente, fk_utilisateur, fk_evenement, direction,
+        bus_aller, bus_retour, adherent, sam, boisson, date_demande,
+        ROW_NUMBER() OVER (PARTITION BY fk_evenement, direction ORDER BY id_attente) AS position
+    """
+
+    SQL_LISTER_EVENEMENT = f"""
+        SELECT {SQL_COLONNES}
+        FROM liste_attente
+        WHERE fk_evenement = %(id_evenement)s
+        ORDER BY direction NULLS FIRST, id_attente
+    """
+
+    SQL_LISTER_UTILISATEUR = f"""
+        SELECT *
+        FROM (
+            SELECT {SQL_COLONNES}
+            FROM liste_attente
+            WHERE fk_evenement IN (
+                SELECT fk_evenement FROM liste_attente WHERE fk_utilisateur = %(id_utilisateur)s
+            )
+        ) files
+        WHERE fk_utilisateur = %(id_utilisateur)s
+        ORDER BY date_demande
+    """
+
+    # ---------- CREATE ----------
+    @staticmethod
+    def _params(demande: ReservationModelIn, direction: Optional[str]) -> dict:
+        return {
+            "fk_utilisateur": demande.fk_utilisateur,
+            "fk_evenement": demande.fk_evenement,
+            "direction": direction,
+            "bus_aller": demande.bus_aller,
+            "bus_retour": demande.bus_retour,
+            "adherent": demande.adherent,
+            "sam": demande.sam,
+            "boisson": demande.boisson,
+        }
+
+    def inscrire(self, demande: ReservationModelIn) -> StatutReservation:
+        """
+        Ajoute une demande de place, avec les options de `demande`, en fin de file
+        (sans effet si elle y est déjà). EN_ATTENTE si elle est en file ; sinon
+        le refus : INTROUVABLE, PAS_OUVERT, DEJA_RESERVE, ou PLACES_LIBRES si
+        l'événement (et les bus demandés) ont encore de la place.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_INSCRIRE_PLACE, self._params(demande, None))
+                r = curs.fetchone()
+
+        return StatutReservation(r["statut"])
+
+    def inscrire_bus(self, demande: ReservationModelIn, direction: str) -> List[PromotionAttente]:
+        """
+        Ajoute une demande de place dans le bus `direction` ('aller' / 'retour')
+        pour la réservation existante, puis sert la file si des places sont
+        libres. Retourne les demandes servies (dont, éventuellement, celle-ci).
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_INSCRIRE_BUS, self._params(demande, direction))
+                curs.execute(self.SQL_PROMOUVOIR, {"id_evenement": demande.fk_evenement})
+                rows = curs.fetchall()
+
+        return vers_modeles(PromotionAttente, rows)
+
+    def promouvoir(self, id_evenement: int) -> List[PromotionAttente]:
+        """Sert les files de l'événement tant que des places sont libres (rattrapage)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_PROMOUVOIR, {"id_evenement": id_evenement})
+                rows = curs.fetchall()
+
+        return vers_modeles(PromotionAttente, rows)
+
+    # ---------- READ ----------
+    def position(self, id_utilisateur: int, id_evenement: int, direction: Optional[str] = None) -> Optional[int]:
+        """Rang de la demande dans sa file (1 = prochaine servie), None si absente."""
+        params = {"fk_utilisateur": id_utilisateur, "fk_evenement": id_evenement, "direction": direction}
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_POSITION, params)
+                r = curs.fetchone()
+
+        return int(r["position"]) or None
+
+    def lister(self, id_evenement: int) -> List[DemandeAttenteModelOut]:
+        """Files d'un événement : places d'abord, puis bus aller et retour, dans l'ordre d'arrivée."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_LISTER_EVENEMENT, {"id_evenement": id_evenement})
+                rows = curs.fetchall()
+
+        return vers_modeles(DemandeAttenteModelOut, rows)
+
+    def find_by_user(self, id_utilisateur: int) -> List[DemandeAttenteModelOut]:
+        """Demandes en attente d'un utilisateur, avec leur rang."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_LISTER_UTILISATEUR, {"id_utilisateur": id_utilisateur})
+                rows = curs.fetchall()
+
+        return vers_modeles(DemandeAttenteModelOut, rows)
+
+    # ---------- DELETE ----------
+    def retirer(self, id_utilisateur: int, id_evenement: int, direction: Optional[str] = None) -> bool:
+        """Retire la demande de sa file."""
+        params = {"fk_utilisateur": id_utilisateur, "fk_evenement": id_evenement, "direction": direction}
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_RETIRER, params)
+                return curs.rowcount > 0
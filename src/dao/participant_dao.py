@@ -1,11 +1,15 @@
 # dao/participant_dao.py
+import csv
+import io
 from psycopg2.extras import RealDictCursor
-from typing import List, Optional
-import bcrypt
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
-from dao.db_connection import DBConnection
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
+from model.pagination_models import PageCurseur
 from model.participant_models import ParticipantModelIn, ParticipantModelOut
-from utils.securite import hash_password, check_password
+from utils.securite import hacheur
+from utils.pagination import paginer_par_id, params_par_id
 
 class ParticipantDao:
     """
@@ -14,101 +18,182 @@ class ParticipantDao:
       id_utilisateur SERIAL PK
       nom, prenom, telephone, email (UNIQUE)
       mot_de_passe (hash), administrateur BOOLEAN, date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    Les requêtes SQL sont des attributs de classe, partagées avec ParticipantDaoAsync.
     """
 
-    def _hash_password(self, password: str) -> str:
-        return hash_password(password)
+    # ---------- SQL ----------
+    SQL_FIND_ALL = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE administrateur = FALSE "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s OFFSET %(offset)s"
+    )
 
-    def _check_password(self, password: str, hashed: str) -> bool:
-        return check_password(password, hashed)
+    # Pagination keyset : la page suivante repart de la dernière clé vue
+    SQL_FIND_PAGE = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE administrateur = FALSE AND id_utilisateur > %(apres)s "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s"
+    )
+
+    SQL_FIND_BY_ID = RequetePreparee(
+        "participant_find_by_id",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
+    )
+
+    SQL_FIND_BY_EMAIL = RequetePreparee(
+        "participant_find_by_email",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE email = %(email)s AND administrateur = FALSE"
+    )
+
+    SQL_CREATE = (
+        "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
+        "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, FALSE) "
+        "RETURNING id_utilisateur, date_creation"
+    )
+
+    SQL_UPDATE = (
+        "WITH updated AS ("
+        "  UPDATE utilisateur SET "
+        "    email = %(email)s, "
+        "    prenom = %(prenom)s, "
+        "    nom = %(nom)s, "
+        "    telephone = %(telephone)s "
+        "  WHERE id_utilisateur = %(id)s AND administrateur = FALSE "
+        "  RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation"
+        ") "
+        "SELECT * FROM updated"
+    )
+
+    SQL_DELETE = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
+
+    SQL_AUTHENTICATE = RequetePreparee(
+        "participant_authenticate",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE email = %(email)s AND administrateur = FALSE"
+    )
+
+    SQL_CHANGE_PASSWORD = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
+    )
+
+    SQL_FIND_ALL_EMAILS = (
+        "SELECT email FROM utilisateur "
+        "WHERE administrateur = FALSE "
+        "ORDER BY id_utilisateur"
+    )
+
+    # Coût bcrypt changé depuis l'enregistrement du mot de passe : nouveau hash posé
+    # à la connexion, sauf si le mot de passe a été modifié entre-temps
+    SQL_REHASH = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s AND mot_de_passe = %(ancien)s"
+    )
+
+    # Import en masse : COPY dans une table temporaire, puis insertion des
+    # emails encore libres (un compte créé entre-temps n'est pas écrasé)
+    SQL_CREATE_STAGING = (
+        "CREATE TEMP TABLE import_participant ("
+        "  email VARCHAR(100), prenom VARCHAR(100), nom VARCHAR(50), "
+        "  telephone VARCHAR(20), mot_de_passe VARCHAR(255)"
+        ") ON COMMIT DROP"
+    )
+
+    SQL_COPY_STAGING = (
+        "COPY import_participant (email, prenom, nom, telephone, mot_de_passe) "
+        "FROM STDIN WITH (FORMAT csv, FORCE_NOT_NULL (email, prenom, nom, mot_de_passe))"
+    )
+
+    SQL_INSERT_STAGING = (
+        "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
+        "SELECT email, prenom, nom, telephone, mot_de_passe, FALSE FROM import_participant "
+        "ON CONFLICT (email) DO NOTHING "
+        "RETURNING email"
+    )
+
+    SQL_FIND_EMAILS_EXISTANTS = (
+        "SELECT lower(email) AS email FROM utilisateur "
+        "WHERE lower(email) = ANY(%(emails)s)"
+    )
+
+    @staticmethod
+    def _csv_staging(participants: Iterable[Tuple[ParticipantModelIn, str]]) -> str:
+        """Données de SQL_COPY_STAGING (CSV) pour des couples (participant, hash)."""
+        tampon = io.StringIO()
+        ecrivain = csv.writer(tampon)
+        for p, hash_mdp in participants:
+            ecrivain.writerow([p.email, p.prenom, p.nom, p.telephone, hash_mdp])
+        return tampon.getvalue()
+
+    @staticmethod
+    def _row_to_model(r: dict) -> ParticipantModelOut:
+        """Convertit une ligne SQL (dict) en ParticipantModelOut (sans le hash du mot de passe)."""
+        return vers_modele(ParticipantModelOut, r)
+
+    LISTE_PAGE = "participants"
 
     # ---------- READ ----------
     def find_all(self, limit: int = 100, offset: int = 0) -> List[ParticipantModelOut]:
         """
         Récupère une liste paginée de participants.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE administrateur = FALSE "
-            "ORDER BY id_utilisateur "
-            "LIMIT %(limit)s OFFSET %(offset)s"
-        )
         params = {"limit": max(limit, 0), "offset": max(offset, 0)}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_FIND_ALL, params)
+                rows = curs.fetchall()
+
+        return vers_modeles(ParticipantModelOut, rows)
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[ParticipantModelOut]:
+        """
+        Page de participants située après `curseur` (None pour la première page).
+        Le curseur_suivant de la page rendue donne accès à la suivante.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_PAGE, params_par_id(curseur, limit, self.LISTE_PAGE))
                 rows = curs.fetchall()
 
-        participants: List[ParticipantModelOut] = []
-        for r in rows:
-            participants.append(
-                ParticipantModelOut(
-                    id_utilisateur=r["id_utilisateur"],
-                    email=r["email"],
-                    prenom=r["prenom"],
-                    nom=r["nom"],
-                    telephone=r["telephone"],
-                    administrateur=r["administrateur"],
-                    date_creation=r["date_creation"],
-                )
-            )
-        return participants
+        return paginer_par_id(vers_modeles(ParticipantModelOut, rows), limit, self.LISTE_PAGE, "id_utilisateur")
 
     def find_by_id(self, id_utilisateur: int) -> Optional[ParticipantModelOut]:
         """
         Récupère un participant par ID.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_utilisateur})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return ParticipantModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     def find_by_email(self, email: str) -> Optional[ParticipantModelOut]:
         """
         Récupère un participant par email.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s AND administrateur = FALSE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_FIND_BY_EMAIL, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return ParticipantModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- CREATE ----------
     def create(self, participant_in: ParticipantModelIn) -> ParticipantModelOut:
@@ -116,22 +201,17 @@ class ParticipantDao:
         Crée un nouveau participant (administrateur=FALSE).
         Laisse la BDD remplir date_creation (DEFAULT CURRENT_TIMESTAMP).
         """
-        query = (
-            "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
-            "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, FALSE) "
-            "RETURNING id_utilisateur, date_creation"
-        )
         params = {
             "email": participant_in.email,
             "prenom": participant_in.prenom,
             "nom": participant_in.nom,
             "telephone": participant_in.telephone,
-            "mot_de_passe": self._hash_password(participant_in.mot_de_passe),
+            "mot_de_passe": hacheur().hacher(participant_in.mot_de_passe),
         }
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CREATE, params)
                 row = curs.fetchone()
 
         return ParticipantModelOut(
@@ -144,23 +224,26 @@ class ParticipantDao:
             date_creation=row["date_creation"],
         )
 
+    def create_many(self, participants: Iterable[Tuple[ParticipantModelIn, str]]) -> Set[str]:
+        """
+        Insère des participants en une seule transaction, par COPY.
+        `participants` : couples (participant, hash du mot de passe déjà calculé).
+        Les emails déjà pris sont ignorés ; retourne les emails réellement insérés.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_CREATE_STAGING)
+                curs.copy_expert(self.SQL_COPY_STAGING, io.StringIO(self._csv_staging(participants)))
+                curs.execute(self.SQL_INSERT_STAGING)
+                rows = curs.fetchall()
+
+        return {r["email"] for r in rows}
+
     # ---------- UPDATE ----------
     def update(self, participant_out: ParticipantModelOut) -> Optional[ParticipantModelOut]:
         """
         Met à jour les informations d’un participant (hors mot de passe).
         """
-        query = (
-            "WITH updated AS ("
-            "  UPDATE utilisateur SET "
-            "    email = %(email)s, "
-            "    prenom = %(prenom)s, "
-            "    nom = %(nom)s, "
-            "    telephone = %(telephone)s "
-            "  WHERE id_utilisateur = %(id)s AND administrateur = FALSE "
-            "  RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation"
-            ") "
-            "SELECT * FROM updated"
-        )
         params = {
             "id": participant_out.id_utilisateur,
             "email": participant_out.email,
@@ -171,31 +254,22 @@ class ParticipantDao:
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_UPDATE, params)
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return ParticipantModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- DELETE ----------
     def delete(self, id_utilisateur: int) -> bool:
         """
         Supprime un participant par son ID.
         """
-        query = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_DELETE, {"id": id_utilisateur})
                 return curs.rowcount > 0
 
     # ---------- AUTH ----------
@@ -203,68 +277,60 @@ class ParticipantDao:
         """
         Authentifie un participant par email/mot de passe.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s AND administrateur = FALSE"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor(cursor_factory=RealDictCursor) as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_AUTHENTICATE, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
-            print(f"\n[DEBUG AUTH] Utilisateur '{email}' non trouvé (ou est admin).")
             return None
-        
-        hash_from_db = r["mot_de_passe"]
-        is_match = self._check_password(mot_de_passe, hash_from_db)
-        
-        print(f"\n[DEBUG AUTH] Email trouvé: {email}")
-        print(f"[DEBUG AUTH] Hash en BDD: {hash_from_db}")
-        print(f"[DEBUG AUTH] Le mot de passe correspond ? {is_match}")
 
+        is_match, nouveau_hash = hacheur().verifier_et_rehacher(mot_de_passe, r["mot_de_passe"])
         if not is_match:
             return None
+        if nouveau_hash:
+            self._rehacher(r, nouveau_hash)
 
-        return ParticipantModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
+
+    @staticmethod
+    def _params_rehash(r: dict, nouveau_hash: str) -> Dict[str, Any]:
+        return {"pwd": nouveau_hash, "id": r["id_utilisateur"], "ancien": r["mot_de_passe"]}
+
+    def _rehacher(self, r: dict, nouveau_hash: str) -> None:
+        """Remplace le hash lu à la connexion par `nouveau_hash` (coût bcrypt à jour)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_REHASH, self._params_rehash(r, nouveau_hash))
 
     def change_password(self, id_utilisateur: int, new_password: str) -> bool:
         """
         Met à jour le mot de passe (hash bcrypt) du participant.
         """
-        query = (
-            "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
-            "WHERE id_utilisateur = %(id)s AND administrateur = FALSE"
-        )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": hacheur().hacher(new_password), "id": id_utilisateur}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CHANGE_PASSWORD, params)
                 return curs.rowcount > 0
 
+    def find_emails_existants(self, emails: List[str]) -> Set[str]:
+        """Parmi `emails`, ceux déjà utilisés par un compte (comparaison en minuscules)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_EMAILS_EXISTANTS, {"emails": [e.lower() for e in emails]})
+                rows = curs.fetchall()
+
+        return {r["email"] for r in rows}
+
     def find_all_emails(self) -> List[str]:
         """
         Retourne tous les emails des PARTICIPANTS (administrateur = FALSE).
         """
-        query = (
-            "SELECT email FROM utilisateur "
-            "WHERE administrateur = FALSE "
-            "ORDER BY id_utilisateur"
-        )
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query)
+                curs.execute(self.SQL_FIND_ALL_EMAILS)
                 rows = curs.fetchall()
 
         # rows = [{'email': 'x'}, {'email': 'y'}] selon cursor_factory
@@ -1,7 +1,15 @@
 # src/dao/reservation_dao.py
-from typing import List, Optional
-from dao.db_connection import DBConnection
-from model.reservation_models import ReservationModelOut, ReservationModelIn
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from psycopg2.extensions import cursor as TupleCursor
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
+from model.reservation_models import (
+    InscritModelOut,
+    ReservationModelOut,
+    ReservationModelIn,
+    ResultatReservation,
+    StatutReservation,
+)
 
 
 class ReservationDao:
@@ -18,140 +26,301 @@ class ReservationDao:
       adherent BOOLEAN DEFAULT FALSE
       sam BOOLEAN DEFAULT FALSE
       boisson BOOLEAN DEFAULT FALSE
+
+    Les requêtes SQL sont des attributs de classe : elles sont partagées
+    avec le jumeau asynchrone (dao_async.reservation_dao.ReservationDaoAsync).
+    """
+
+    # ---------- SQL ----------
+    SQL_FIND_BY_USER = RequetePreparee("reservation_find_by_user", """
+        SELECT r.id_reservation,
+               r.fk_utilisateur,
+               r.fk_evenement,
+               r.bus_aller,
+               r.bus_retour,
+               r.adherent,
+               r.sam,
+               r.boisson,
+               r.date_reservation
+        FROM reservation r
+        WHERE r.fk_utilisateur = %(id_utilisateur)s
+        ORDER BY r.date_reservation DESC
+    """)
+
+    SQL_FIND_BY_EVENT = """
+        SELECT id_reservation,
+               fk_utilisateur,
+               fk_evenement,
+               bus_aller,
+               bus_retour,
+               adherent,
+               sam,
+               boisson,
+               date_reservation
+        FROM reservation
+        WHERE fk_evenement = %(id_evenement)s
+        ORDER BY date_reservation DESC
+    """
+
+    SQL_FIND_BY_ID = RequetePreparee("reservation_find_by_id", """
+        SELECT id_reservation,
+               fk_utilisateur,
+               fk_evenement,
+               bus_aller,
+               bus_retour,
+               adherent,
+               sam,
+               boisson,
+               date_reservation
+        FROM reservation
+        WHERE id_reservation = %(id)s
+    """)
+
+    # Liste des inscrits : réservation + auteur + commentaire, en une requête
+    SQL_LISTE_INSCRITS = """
+        SELECT r.id_reservation,
+               r.fk_utilisateur,
+               u.nom,
+               u.prenom,
+               u.email,
+               r.bus_aller,
+               r.bus_retour,
+               r.adherent,
+               r.sam,
+               r.boisson,
+               r.date_reservation,
+               c.note AS commentaire_note,
+               c.avis AS commentaire_avis
+        FROM reservation r
+        JOIN utilisateur u ON u.id_utilisateur = r.fk_utilisateur
+        LEFT JOIN LATERAL (
+            SELECT note, avis
+            FROM commentaire
+            WHERE fk_reservation = r.id_reservation
+            LIMIT 1
+        ) c ON TRUE
+        WHERE r.fk_evenement = %(id_evenement)s
+        ORDER BY r.date_reservation DESC, r.id_reservation DESC
+    """
+
+    # Export des inscrits (transporteurs, bar) : colonnes à plat, dans l'ordre de COLONNES_EXPORT
+    COLONNES_EXPORT = (
+        "id_reservation", "nom", "prenom", "email", "telephone",
+        "bus_aller", "bus_retour", "adherent", "sam", "boisson", "date_reservation",
+    )
+
+    SQL_EXPORT_INSCRITS = """
+        SELECT r.id_reservation, u.nom, u.prenom, u.email, u.telephone,
+               r.bus_aller, r.bus_retour, r.adherent, r.sam, r.boisson, r.date_reservation
+        FROM reservation r
+        JOIN utilisateur u ON u.id_utilisateur = r.fk_utilisateur
+        WHERE r.fk_evenement = %(id_evenement)s
+        ORDER BY u.nom, u.prenom, r.id_reservation
+    """
+
+    # Compteurs tenus à jour par trigger sur la table evenement
+    SQL_COUNT_BUS_TAKEN = {
+        "aller": RequetePreparee(
+            "reservation_bus_aller_pris",
+            "SELECT bus_aller_pris AS total FROM evenement WHERE id_evenement = %(id)s",
+        ),
+        "retour": RequetePreparee(
+            "reservation_bus_retour_pris",
+            "SELECT bus_retour_pris AS total FROM evenement WHERE id_evenement = %(id)s",
+        ),
+    }
+
+    SQL_CREATE = """
+        INSERT INTO reservation (
+            fk_utilisateur, fk_evenement,
+            bus_aller, bus_retour,
+            adherent, sam, boisson
+        ) VALUES (
+            %(fk_utilisateur)s, %(fk_evenement)s,
+            %(bus_aller)s, %(bus_retour)s,
+            %(adherent)s, %(sam)s, %(boisson)s
+        )
+        RETURNING id_reservation, date_reservation
     """
+
+    SQL_RESERVER = RequetePreparee("reservation_reserver", """
+        SELECT statut, id_reservation, date_reservation
+        FROM reserver_place(
+            %(fk_utilisateur)s, %(fk_evenement)s,
+            %(bus_aller)s, %(bus_retour)s,
+            %(adherent)s, %(sam)s, %(boisson)s
+        )
+    """)
+
+    SQL_DELETE = "DELETE FROM reservation WHERE id_reservation = %(id)s"
+
+    SQL_COUNT_BY_EVENT = RequetePreparee("reservation_count_by_event", "SELECT inscrits AS c FROM evenement WHERE id_evenement = %(id)s")
+
+    SQL_EXISTS_FOR_USER_AND_EVENT = RequetePreparee("reservation_exists", """
+        SELECT 1
+        FROM reservation
+        WHERE fk_utilisateur = %(id_user)s AND fk_evenement = %(id_event)s
+        LIMIT 1
+    """)
+
+    # ---------- HELPERS ----------
+    @staticmethod
+    def _params_create(reservation_in: ReservationModelIn) -> Dict[str, Any]:
+        """Paramètres communs à SQL_CREATE et SQL_RESERVER."""
+        return {
+            "fk_utilisateur": reservation_in.fk_utilisateur,
+            "fk_evenement": reservation_in.fk_evenement,
+            "bus_aller": reservation_in.bus_aller,
+            "bus_retour": reservation_in.bus_retour,
+            "adherent": reservation_in.adherent,
+            "sam": reservation_in.sam,
+            "boisson": reservation_in.boisson,
+        }
+
+    @staticmethod
+    def _resultat_reserver(row: dict, params: Dict[str, Any]) -> ResultatReservation:
+        """Convertit la ligne renvoyée par reserver_place en ResultatReservation."""
+        statut = StatutReservation(row["statut"])
+        if statut != StatutReservation.OK:
+            return ResultatReservation(statut=statut)
+
+        return ResultatReservation(
+            statut=statut,
+            reservation=ReservationModelOut(
+                id_reservation=row["id_reservation"],
+                date_reservation=row["date_reservation"],
+                **params,
+            ),
+        )
+
+    @staticmethod
+    def _requete_update_flags(
+        id_reservation: int, **flags: Optional[bool]
+    ) -> Tuple[Optional[str], Dict[str, Any]]:
+        """
+        Construit l'UPDATE partiel des options (seuls les flags non None sont modifiés).
+        Retourne (None, params) s'il n'y a rien à mettre à jour.
+
+        Les bus ne peuvent être que retirés : True laisse le flag tel quel. Une
+        place de bus s'obtient sous le verrou de l'événement, capacité et file
+        d'attente du bus vérifiées (ListeAttenteDao.inscrire_bus).
+        """
+        fields = []
+        params: Dict[str, Any] = {"id": id_reservation}
+
+        for nom in ("bus_aller", "bus_retour", "adherent", "sam", "boisson"):
+            valeur = flags.get(nom)
+            if valeur is not None:
+                if nom.startswith("bus_"):
+                    fields.append(f"{nom} = COALESCE({nom}, FALSE) AND %({nom})s")
+                else:
+                    fields.append(f"{nom} = %({nom})s")
+                params[nom] = valeur
+
+        if not fields:
+            return None, params
+
+        query = f"""
+            UPDATE reservation
+            SET {", ".join(fields)}
+            WHERE id_reservation = %(id)s
+            RETURNING id_reservation, fk_utilisateur, fk_evenement,
+                      bus_aller, bus_retour, adherent, sam, boisson, date_reservation
+        """
+        return query, params
+
     # ---------- READ ----------
     def find_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
         """Récupère toutes les réservations d'un utilisateur donné."""
-        query = """
-            SELECT r.id_reservation,
-                   r.fk_utilisateur,
-                   r.fk_evenement,
-                   r.bus_aller,
-                   r.bus_retour,
-                   r.adherent,
-                   r.sam,
-                   r.boisson,
-                   r.date_reservation
-            FROM reservation r
-            WHERE r.fk_utilisateur = %(id_utilisateur)s
-            ORDER BY r.date_reservation DESC
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id_utilisateur": id_utilisateur})
+                curs.execute(self.SQL_FIND_BY_USER, {"id_utilisateur": id_utilisateur})
                 rows = curs.fetchall()
 
-        return [
-            ReservationModelOut(**r)
-            for r in rows
-        ]
+        return vers_modeles(ReservationModelOut, rows)
 
     def find_by_event(self, id_evenement: int) -> List[ReservationModelOut]:
         """Récupère toutes les réservations d'un événement donné."""
-        query = """
-            SELECT id_reservation,
-                   fk_utilisateur,
-                   fk_evenement,
-                   bus_aller,
-                   bus_retour,
-                   adherent,
-                   sam,
-                   boisson,
-                   date_reservation
-            FROM reservation
-            WHERE fk_evenement = %(id_evenement)s
-            ORDER BY date_reservation DESC
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id_evenement": id_evenement})
+                curs.execute(self.SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
                 rows = curs.fetchall()
 
-        return [ReservationModelOut(**r) for r in rows]
+        return vers_modeles(ReservationModelOut, rows)
 
     def find_by_id(self, id_reservation: int) -> Optional[ReservationModelOut]:
         """Récupère une réservation par son ID."""
-        query = """
-            SELECT id_reservation,
-                   fk_utilisateur,
-                   fk_evenement,
-                   bus_aller,
-                   bus_retour,
-                   adherent,
-                   sam,
-                   boisson,
-                   date_reservation
-            FROM reservation
-            WHERE id_reservation = %(id)s
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_reservation})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_reservation})
                 r = curs.fetchone()
 
-        return ReservationModelOut(**r) if r else None
-    
-    def count_by_event(self, id_evenement: int) -> int:
+        return vers_modele(ReservationModelOut, r) if r else None
+
+    def lister_inscrits(self, id_evenement: int) -> List[InscritModelOut]:
         """
-        Compte le nombre total d'inscrits (réservations) pour un événement.
+        Liste des inscrits d'un événement (nom, prénom, email, options, commentaire),
+        en une seule requête, de la réservation la plus récente à la plus ancienne.
         """
-        query = "SELECT COUNT(*) FROM reservation WHERE fk_evenement = %(id)s"
-        
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
-                result = curs.fetchone()
-        
-        # result est un tuple (ex: (5,)), on prend le premier élément
-        return result[0] if result else 0
-    
+                curs.execute(self.SQL_LISTE_INSCRITS, {"id_evenement": id_evenement})
+                rows = curs.fetchall()
+
+        return vers_modeles(InscritModelOut, rows)
+
+    def iter_inscrits(self, id_evenement: int, taille_lot: int = 1000) -> Iterator[InscritModelOut]:
+        """
+        Même liste que lister_inscrits, lue par un curseur côté serveur :
+        seules `taille_lot` lignes sont en mémoire à la fois.
+        La connexion reste empruntée au pool jusqu'à la fin (ou la fermeture) de l'itération.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor(name="liste_inscrits") as curs:
+                curs.itersize = taille_lot
+                curs.execute(self.SQL_LISTE_INSCRITS, {"id_evenement": id_evenement})
+                for r in curs:
+                    yield vers_modele(InscritModelOut, r)
+
+    def iter_lignes_export(self, id_evenement: int, taille_lot: int = 5000) -> Iterator[List[tuple]]:
+        """
+        Inscrits à exporter, par lots de `taille_lot` tuples (colonnes de COLONNES_EXPORT),
+        lus par un curseur côté serveur : ni liste complète ni objet par ligne en mémoire.
+        La connexion reste empruntée au pool jusqu'à la fin (ou la fermeture) de l'itération.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor(name="export_inscrits", cursor_factory=TupleCursor) as curs:
+                curs.execute(self.SQL_EXPORT_INSCRITS, {"id_evenement": id_evenement})
+                while True:
+                    lot = curs.fetchmany(taille_lot)
+                    if not lot:
+                        break
+                    yield lot
+
     def count_bus_taken(self, id_evenement: int, direction: str) -> int:
         """
         Compte combien de réservations ont pris l'option bus pour une direction.
         direction: 'aller' ou 'retour'
+        Lecture O(1) du compteur tenu à jour par trigger sur la table evenement.
         """
-        colonne = "bus_aller" if direction == "aller" else "bus_retour"
-        
-        query = f"SELECT COUNT(*) as total FROM reservation WHERE fk_evenement = %(id)s AND {colonne} = TRUE"
-        
+        query = self.SQL_COUNT_BUS_TAKEN["aller" if direction == "aller" else "retour"]
+
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, {"id": id_evenement})
                 row = curs.fetchone()
-        
-        if isinstance(row, dict):
-            return row.get('total', 0)
-        return row[0] if row else 0
+
+        return int(row["total"]) if row else 0
 
     # ---------- CREATE ----------
     def create(self, reservation_in: ReservationModelIn) -> Optional[ReservationModelOut]:
         """Crée une nouvelle réservation (1 par utilisateur + événement)."""
-        query = """
-            INSERT INTO reservation (
-                fk_utilisateur, fk_evenement,
-                bus_aller, bus_retour,
-                adherent, sam, boisson
-            ) VALUES (
-                %(fk_utilisateur)s, %(fk_evenement)s,
-                %(bus_aller)s, %(bus_retour)s,
-                %(adherent)s, %(sam)s, %(boisson)s
-            )
-            RETURNING id_reservation, date_reservation
-        """
-        params = {
-            "fk_utilisateur": reservation_in.fk_utilisateur,
-            "fk_evenement": reservation_in.fk_evenement,
-            "bus_aller": reservation_in.bus_aller,
-            "bus_retour": reservation_in.bus_retour,
-            "adherent": reservation_in.adherent,
-            "sam": reservation_in.sam,
-            "boisson": reservation_in.boisson,
-        }
+        params = self._params_create(reservation_in)
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 try:
-                    curs.execute(query, params)
+                    curs.execute(self.SQL_CREATE, params)
                     row = curs.fetchone()
                     con.commit()
                 except Exception as e:
@@ -161,16 +330,25 @@ class ReservationDao:
 
         return ReservationModelOut(
             id_reservation=row["id_reservation"],
-            fk_utilisateur=reservation_in.fk_utilisateur,
-            fk_evenement=reservation_in.fk_evenement,
-            bus_aller=reservation_in.bus_aller,
-            bus_retour=reservation_in.bus_retour,
-            adherent=reservation_in.adherent,
-            sam=reservation_in.sam,
-            boisson=reservation_in.boisson,
             date_reservation=row["date_reservation"],
+            **params,
         )
 
+    def reserver(self, reservation_in: ReservationModelIn) -> ResultatReservation:
+        """
+        Réservation atomique (shotgun) : vérifie doublon, capacité du lieu et des bus
+        puis insère, en une seule transaction et un seul aller-retour
+        (fonction SQL reserver_place, qui verrouille la ligne de l'événement).
+        """
+        params = self._params_create(reservation_in)
+
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_RESERVER, params)
+                row = curs.fetchone()
+
+        return self._resultat_reserver(row, params)
+
     # ---------- UPDATE ----------
     def update_flags(
         self,
@@ -182,72 +360,52 @@ class ReservationDao:
         sam: Optional[bool] = None,
         boisson: Optional[bool] = None,
     ) -> Optional[ReservationModelOut]:
-        """Met à jour sélectivement les options de la réservation."""
-        fields = []
-        params = {"id": id_reservation}
-
-        if bus_aller is not None:
-            fields.append("bus_aller = %(bus_aller)s")
-            params["bus_aller"] = bus_aller
-        if bus_retour is not None:
-            fields.append("bus_retour = %(bus_retour)s")
-            params["bus_retour"] = bus_retour
-        if adherent is not None:
-            fields.append("adherent = %(adherent)s")
-            params["adherent"] = adherent
-        if sam is not None:
-            fields.append("sam = %(sam)s")
-            params["sam"] = sam
-        if boisson is not None:
-            fields.append("boisson = %(boisson)s")
-            params["boisson"] = boisson
+        """Met à jour sélectivement les options de la réservation (bus : retrait seulement)."""
+        query, params = self._requete_update_flags(
+            id_reservation,
+            bus_aller=bus_aller,
+            bus_retour=bus_retour,
+            adherent=adherent,
+            sam=sam,
+            boisson=boisson,
+        )
 
-        if not fields:
+        if query is None:
             return self.find_by_id(id_reservation)
 
-        query = f"""
-            UPDATE reservation
-            SET {", ".join(fields)}
-            WHERE id_reservation = %(id)s
-            RETURNING id_reservation, fk_utilisateur, fk_evenement,
-                      bus_aller, bus_retour, adherent, sam, boisson, date_reservation
-        """
-
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
                 curs.execute(query, params)
                 r = curs.fetchone()
 
-        return ReservationModelOut(**r) if r else None
+        return vers_modele(ReservationModelOut, r) if r else None
 
     # ---------- DELETE ----------
     def delete(self, id_reservation: int) -> bool:
         """Supprime une réservation par ID."""
-        query = "DELETE FROM reservation WHERE id_reservation = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_reservation})
+                curs.execute(self.SQL_DELETE, {"id": id_reservation})
                 return curs.rowcount > 0
 
     # ---------- HELPERS / STATS ----------
     def count_by_event(self, id_evenement: int) -> int:
-        """Retourne le nombre de réservations pour un événement."""
-        query = "SELECT COUNT(*) AS c FROM reservation WHERE fk_evenement = %(id)s"
+        """
+        Retourne le nombre de réservations pour un événement.
+        Lecture O(1) du compteur evenement.inscrits (tenu à jour par trigger).
+        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_evenement})
+                curs.execute(self.SQL_COUNT_BY_EVENT, {"id": id_evenement})
                 r = curs.fetchone()
                 return int(r["c"]) if r else 0
 
     def exists_for_user_and_event(self, id_utilisateur: int, id_evenement: int) -> bool:
         """Vérifie si un utilisateur a déjà réservé un événement précis."""
-        query = """
-            SELECT 1
-            FROM reservation
-            WHERE fk_utilisateur = %(id_user)s AND fk_evenement = %(id_event)s
-            LIMIT 1
-        """
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id_user": id_utilisateur, "id_event": id_evenement})
+                curs.execute(
+                    self.SQL_EXISTS_FOR_USER_AND_EVENT,
+                    {"id_user": id_utilisateur, "id_event": id_evenement},
+                )
                 return curs.fetchone() is not None
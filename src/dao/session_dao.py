@@ -0,0 +1,80 @@
+# src/dao/session_dao.py
+from typing import Any, Dict, Optional
+
+from dao.db_connection import DBConnection, RequetePreparee
+
+
+class SessionDao:
+    """
+    DAO pour les sessions persistées (table 'session_utilisateur').
+    Les jetons sont identifiés par leur empreinte SHA-256, jamais en clair.
+    Les échéances sont calculées par le serveur (NOW()) : tous les processus
+    qui partagent la table ont la même horloge de référence.
+    """
+
+    # ---------- SQL ----------
+    SQL_CREATE = """
+        INSERT INTO session_utilisateur (jeton_hash, fk_utilisateur, expire_le)
+        VALUES (%(jeton)s, %(id_utilisateur)s, NOW() + make_interval(secs => %(ttl)s))
+    """
+
+    # Profil de l'utilisateur et temps restant (en secondes) avant expiration
+    SQL_FIND_VALIDE = RequetePreparee("session_find_valide", """
+        SELECT u.id_utilisateur, u.email, u.prenom, u.nom, u.telephone,
+               u.administrateur, u.date_creation,
+               s.date_creation AS debut_session,
+               EXTRACT(EPOCH FROM (s.expire_le - NOW()))::float AS reste
+        FROM session_utilisateur s
+        JOIN utilisateur u ON u.id_utilisateur = s.fk_utilisateur
+        WHERE s.jeton_hash = %(jeton)s AND s.expire_le > NOW()
+    """)
+
+    SQL_PROLONGER = """
+        UPDATE session_utilisateur
+        SET expire_le = NOW() + make_interval(secs => %(ttl)s)
+        WHERE jeton_hash = %(jeton)s AND expire_le > NOW()
+    """
+
+    SQL_DELETE = "DELETE FROM session_utilisateur WHERE jeton_hash = %(jeton)s"
+
+    SQL_DELETE_FOR_USER = "DELETE FROM session_utilisateur WHERE fk_utilisateur = %(id_utilisateur)s"
+
+    SQL_PURGER = "DELETE FROM session_utilisateur WHERE expire_le <= NOW()"
+
+    # ---------- Helpers ----------
+    def _ecrire(self, requete: str, params: Optional[dict] = None) -> int:
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(requete, params)
+                return curs.rowcount
+
+    # ---------- CREATE ----------
+    def create(self, jeton_hash: str, id_utilisateur: int, ttl: float) -> None:
+        """Enregistre une session valable `ttl` secondes."""
+        self._ecrire(self.SQL_CREATE, {"jeton": jeton_hash, "id_utilisateur": id_utilisateur, "ttl": ttl})
+
+    # ---------- READ ----------
+    def find_valide(self, jeton_hash: str) -> Optional[Dict[str, Any]]:
+        """Session non expirée : colonnes de l'utilisateur + debut_session + reste (secondes)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_VALIDE, {"jeton": jeton_hash})
+                row = curs.fetchone()
+        return dict(row) if row else None
+
+    # ---------- UPDATE ----------
+    def prolonger(self, jeton_hash: str, ttl: float) -> bool:
+        """Repousse l'expiration à maintenant + `ttl` (sans effet sur une session expirée)."""
+        return self._ecrire(self.SQL_PROLONGER, {"jeton": jeton_hash, "ttl": ttl}) > 0
+
+    # ---------- DELETE ----------
+    def delete(self, jeton_hash: str) -> bool:
+        return self._ecrire(self.SQL_DELETE, {"jeton": jeton_hash}) > 0
+
+    def delete_for_user(self, id_utilisateur: int) -> int:
+        """Ferme toutes les sessions d'un utilisateur ; retourne leur nombre."""
+        return self._ecrire(self.SQL_DELETE_FOR_USER, {"id_utilisateur": id_utilisateur})
+
+    def purger(self) -> int:
+        """Supprime les sessions expirées ; retourne leur nombre."""
+        return self._ecrire(self.SQL_PURGER)
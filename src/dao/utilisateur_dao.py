@@ -1,9 +1,12 @@
 # dao/utilisateur_dao.py
-from typing import List, Optional
-import bcrypt
+from typing import Any, Dict, List, Optional
 
-from dao.db_connection import DBConnection
+from dao.db_connection import DBConnection, RequetePreparee
+from dao.lignes import vers_modele, vers_modeles
+from model.pagination_models import PageCurseur
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from utils.pagination import paginer_par_id, params_par_id
+from utils.securite import hacheur
 
 
 class UtilisateurDao:
@@ -13,109 +16,143 @@ class UtilisateurDao:
       id_utilisateur SERIAL PK
       nom, prenom, telephone, email (UNIQUE)
       mot_de_passe (hash), administrateur BOOLEAN, date_creation TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    Les requêtes SQL sont des attributs de classe, partagées avec UtilisateurDaoAsync.
     """
 
+    # ---------- SQL ----------
+    SQL_FIND_ALL = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s OFFSET %(offset)s"
+    )
+
+    # Pagination keyset : la page suivante repart de la dernière clé vue
+    SQL_FIND_PAGE = (
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE id_utilisateur > %(apres)s "
+        "ORDER BY id_utilisateur "
+        "LIMIT %(limit)s"
+    )
+
+    SQL_FIND_BY_ID = RequetePreparee(
+        "utilisateur_find_by_id",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE id_utilisateur = %(id)s"
+    )
+
+    SQL_FIND_BY_EMAIL = RequetePreparee(
+        "utilisateur_find_by_email",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE email = %(email)s"
+    )
+
+    SQL_CREATE = (
+        "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
+        "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, %(administrateur)s) "
+        "RETURNING id_utilisateur, date_creation"
+    )
+
+    SQL_UPDATE = (
+        "WITH updated AS ("
+        "  UPDATE utilisateur SET "
+        "    email = %(email)s, "
+        "    prenom = %(prenom)s, "
+        "    nom = %(nom)s, "
+        "    telephone = %(telephone)s, "
+        "    administrateur = %(administrateur)s "
+        "  WHERE id_utilisateur = %(id)s "
+        "  RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation"
+        ") "
+        "SELECT * FROM updated"
+    )
+
+    SQL_DELETE = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s"
+
+    SQL_AUTHENTICATE = RequetePreparee(
+        "utilisateur_authenticate",
+        "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
+        "FROM utilisateur "
+        "WHERE email = %(email)s"
+    )
+
+    SQL_CHANGE_PASSWORD = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s"
+    )
+
+    # Coût bcrypt changé depuis l'enregistrement du mot de passe : nouveau hash posé
+    # à la connexion, sauf si le mot de passe a été modifié entre-temps
+    SQL_REHASH = (
+        "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
+        "WHERE id_utilisateur = %(id)s AND mot_de_passe = %(ancien)s"
+    )
+
     # ---------- Helpers ----------
-    @staticmethod
-    def _hash_password(plain: str) -> str:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        return bcrypt.hashpw(plain, bcrypt.gensalt()).decode("utf-8")
 
     @staticmethod
-    def _check_password(plain: str, hashed: str) -> bool:
-        if isinstance(plain, str):
-            plain = plain.encode("utf-8")
-        if isinstance(hashed, str):
-            hashed = hashed.encode("utf-8")
-        return bcrypt.checkpw(plain, hashed)
+    def _row_to_model(r: dict) -> UtilisateurModelOut:
+        """Convertit une ligne SQL (dict) en UtilisateurModelOut (sans le hash du mot de passe)."""
+        return vers_modele(UtilisateurModelOut, r)
+
+    LISTE_PAGE = "utilisateurs"
 
     # ---------- READ ----------
     def find_all(self, limit: int = 100, offset: int = 0) -> List[UtilisateurModelOut]:
         """
         Récupère une liste paginée d'utilisateurs.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "ORDER BY id_utilisateur "
-            "LIMIT %(limit)s OFFSET %(offset)s"
-        )
         params = {"limit": max(limit, 0), "offset": max(offset, 0)}
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_FIND_ALL, params)
                 results = curs.fetchall()
 
-        users: List[UtilisateurModelOut] = []
-        for r in results:
-            users.append(
-                UtilisateurModelOut(
-                    id_utilisateur=r["id_utilisateur"],
-                    email=r["email"],
-                    prenom=r["prenom"],
-                    nom=r["nom"],
-                    telephone=r["telephone"],
-                    administrateur=r["administrateur"],
-                    date_creation=r["date_creation"],
-                )
-            )
-        return users
+        return vers_modeles(UtilisateurModelOut, results)
+
+    def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[UtilisateurModelOut]:
+        """
+        Page d'utilisateurs située après `curseur` (None pour la première page).
+        Le curseur_suivant de la page rendue donne accès à la suivante.
+        """
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_FIND_PAGE, params_par_id(curseur, limit, self.LISTE_PAGE))
+                rows = curs.fetchall()
+
+        return paginer_par_id(vers_modeles(UtilisateurModelOut, rows), limit, self.LISTE_PAGE, "id_utilisateur")
 
     def find_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
         """
         Récupère un utilisateur par son ID.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE id_utilisateur = %(id)s"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_FIND_BY_ID, {"id": id_utilisateur})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return UtilisateurModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     def find_by_email(self, email: str) -> Optional[UtilisateurModelOut]:
         """
         Récupère un utilisateur par son email.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_FIND_BY_EMAIL, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return UtilisateurModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- CREATE ----------
     def create(self, user_in: UtilisateurModelIn) -> UtilisateurModelOut:
@@ -123,23 +160,18 @@ class UtilisateurDao:
         Crée un nouvel utilisateur (hash le mot de passe).
         Laisse la BDD remplir date_creation (DEFAULT CURRENT_TIMESTAMP).
         """
-        query = (
-            "INSERT INTO utilisateur (email, prenom, nom, telephone, mot_de_passe, administrateur) "
-            "VALUES (%(email)s, %(prenom)s, %(nom)s, %(telephone)s, %(mot_de_passe)s, %(administrateur)s) "
-            "RETURNING id_utilisateur, date_creation"
-        )
         params = {
             "email": user_in.email,
             "prenom": user_in.prenom,
             "nom": user_in.nom,
             "telephone": user_in.telephone,
-            "mot_de_passe": self._hash_password(user_in.mot_de_passe),
+            "mot_de_passe": hacheur().hacher(user_in.mot_de_passe),
             "administrateur": getattr(user_in, "administrateur", False),
         }
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CREATE, params)
                 row = curs.fetchone()
 
         return UtilisateurModelOut(
@@ -157,19 +189,6 @@ class UtilisateurDao:
         """
         Met à jour un utilisateur (hors mot de passe).
         """
-        query = (
-            "WITH updated AS ("
-            "  UPDATE utilisateur SET "
-            "    email = %(email)s, "
-            "    prenom = %(prenom)s, "
-            "    nom = %(nom)s, "
-            "    telephone = %(telephone)s, "
-            "    administrateur = %(administrateur)s "
-            "  WHERE id_utilisateur = %(id)s "
-            "  RETURNING id_utilisateur, email, prenom, nom, telephone, administrateur, date_creation"
-            ") "
-            "SELECT * FROM updated"
-        )
         params = {
             "id": user_out.id_utilisateur,
             "email": user_out.email,
@@ -181,31 +200,22 @@ class UtilisateurDao:
 
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_UPDATE, params)
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        return UtilisateurModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
 
     # ---------- DELETE ----------
     def delete(self, id_utilisateur: int) -> bool:
         """
         Supprime un utilisateur par ID.
         """
-        query = "DELETE FROM utilisateur WHERE id_utilisateur = %(id)s"
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"id": id_utilisateur})
+                curs.execute(self.SQL_DELETE, {"id": id_utilisateur})
                 return curs.rowcount > 0
 
     # ---------- AUTH ----------
@@ -213,42 +223,38 @@ class UtilisateurDao:
         """
         Vérifie email/mot de passe et retourne l'utilisateur si OK.
         """
-        query = (
-            "SELECT id_utilisateur, email, prenom, nom, telephone, mot_de_passe, administrateur, date_creation "
-            "FROM utilisateur "
-            "WHERE email = %(email)s"
-        )
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, {"email": email})
+                curs.execute(self.SQL_AUTHENTICATE, {"email": email})
                 r = curs.fetchone()
 
         if r is None:
             return None
 
-        if not self._check_password(mot_de_passe, r["mot_de_passe"]):
+        ok, nouveau_hash = hacheur().verifier_et_rehacher(mot_de_passe, r["mot_de_passe"])
+        if not ok:
             return None
+        if nouveau_hash:
+            self._rehacher(r, nouveau_hash)
 
-        return UtilisateurModelOut(
-            id_utilisateur=r["id_utilisateur"],
-            email=r["email"],
-            prenom=r["prenom"],
-            nom=r["nom"],
-            telephone=r["telephone"],
-            administrateur=r["administrateur"],
-            date_creation=r["date_creation"],
-        )
+        return self._row_to_model(r)
+
+    @staticmethod
+    def _params_rehash(r: dict, nouveau_hash: str) -> Dict[str, Any]:
+        return {"pwd": nouveau_hash, "id": r["id_utilisateur"], "ancien": r["mot_de_passe"]}
+
+    def _rehacher(self, r: dict, nouveau_hash: str) -> None:
+        """Remplace le hash lu à la connexion par `nouveau_hash` (coût bcrypt à jour)."""
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute(self.SQL_REHASH, self._params_rehash(r, nouveau_hash))
 
     def change_password(self, id_utilisateur: int, new_password: str) -> bool:
         """
         Met à jour le mot de passe (hash bcrypt).
         """
-        query = (
-            "UPDATE utilisateur SET mot_de_passe = %(pwd)s "
-            "WHERE id_utilisateur = %(id)s"
-        )
-        params = {"pwd": self._hash_password(new_password), "id": id_utilisateur}
+        params = {"pwd": hacheur().hacher(new_password), "id": id_utilisateur}
         with DBConnection().getConnexion() as con:
             with con.cursor() as curs:
-                curs.execute(query, params)
+                curs.execute(self.SQL_CHANGE_PASSWORD, params)
                 return curs.rowcount > 0
@@ -0,0 +1,142 @@
+# src/dao_async/administrateur_dao.py
+from typing import List, Optional
+
+from dao.administrateur_dao import AdministrateurDao
+from dao.lignes import vers_modeles
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.utilisateur_models import AdministrateurModelIn, AdministrateurModelOut
+from utils.pagination import paginer_par_id, params_par_id
+from utils.securite import hacheur
+
+
+class AdministrateurDaoAsync:
+    """
+    Jumeau asynchrone de AdministrateurDao : mêmes méthodes, mêmes requêtes SQL.
+    Le hachage / la vérification bcrypt (coûteux en CPU) s'exécutent dans le
+    pool de processus de utils.securite, sans bloquer la boucle d'événements.
+    """
+
+    # ---------- READ ----------
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[AdministrateurModelOut]:
+        """Récupère une liste paginée d'administrateurs."""
+        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_FIND_ALL, params)
+                rows = await curs.fetchall()
+
+        return vers_modeles(AdministrateurModelOut, rows)
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[AdministrateurModelOut]:
+        """Page d'administrateurs située après `curseur` (None pour la première page)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_FIND_PAGE, params_par_id(curseur, limit, AdministrateurDao.LISTE_PAGE))
+                rows = await curs.fetchall()
+
+        return paginer_par_id(vers_modeles(AdministrateurModelOut, rows), limit, AdministrateurDao.LISTE_PAGE, "id_utilisateur")
+
+    async def find_by_id(self, id_utilisateur: int) -> Optional[AdministrateurModelOut]:
+        """Récupère un administrateur par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_FIND_BY_ID, {"id": id_utilisateur})
+                r = await curs.fetchone()
+
+        return AdministrateurDao._row_to_model(r) if r else None
+
+    async def find_by_email(self, email: str) -> Optional[AdministrateurModelOut]:
+        """Récupère un administrateur par son email."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_FIND_BY_EMAIL, {"email": email})
+                r = await curs.fetchone()
+
+        return AdministrateurDao._row_to_model(r) if r else None
+
+    # ---------- CREATE ----------
+    async def create(self, admin_in: AdministrateurModelIn) -> AdministrateurModelOut:
+        """Crée un administrateur (mot de passe hashé avant insertion)."""
+        params = {
+            "email": admin_in.email,
+            "prenom": admin_in.prenom,
+            "nom": admin_in.nom,
+            "telephone": admin_in.telephone,
+            "mot_de_passe": await hacheur().hacher_async(admin_in.mot_de_passe),
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_CREATE, params)
+                row = await curs.fetchone()
+
+        return AdministrateurModelOut(
+            id_utilisateur=row["id_utilisateur"],
+            email=admin_in.email,
+            prenom=admin_in.prenom,
+            nom=admin_in.nom,
+            telephone=admin_in.telephone,
+            administrateur=True,
+            date_creation=row["date_creation"],
+        )
+
+    # ---------- UPDATE ----------
+    async def update(self, admin_out: AdministrateurModelOut) -> Optional[AdministrateurModelOut]:
+        """Met à jour un administrateur (hors mot de passe)."""
+        params = {
+            "id": admin_out.id_utilisateur,
+            "email": admin_out.email,
+            "prenom": admin_out.prenom,
+            "nom": admin_out.nom,
+            "telephone": admin_out.telephone,
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_UPDATE, params)
+                r = await curs.fetchone()
+
+        return AdministrateurDao._row_to_model(r) if r else None
+
+    # ---------- DELETE ----------
+    async def delete(self, id_utilisateur: int) -> bool:
+        """Supprime un administrateur par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_DELETE, {"id": id_utilisateur})
+                return curs.rowcount > 0
+
+    # ---------- AUTH ----------
+    async def authenticate(self, email: str, mot_de_passe: str) -> Optional[AdministrateurModelOut]:
+        """Vérifie email/mot de passe et retourne l'administrateur si OK, sinon None."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_AUTHENTICATE, {"email": email})
+                r = await curs.fetchone()
+
+        if r is None:
+            return None
+
+        ok, nouveau_hash = await hacheur().verifier_et_rehacher_async(mot_de_passe, r["mot_de_passe"])
+        if not ok:
+            return None
+        if nouveau_hash:
+            async with AsyncDBConnection().getConnexion() as con:
+                async with con.cursor() as curs:
+                    await curs.execute(AdministrateurDao.SQL_REHASH, AdministrateurDao._params_rehash(r, nouveau_hash))
+
+        return AdministrateurDao._row_to_model(r)
+
+    async def change_password(self, id_utilisateur: int, new_password: str) -> bool:
+        """Met à jour le mot de passe (hash bcrypt)."""
+        params = {
+            "pwd": await hacheur().hacher_async(new_password),
+            "id": id_utilisateur,
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(AdministrateurDao.SQL_CHANGE_PASSWORD, params)
+                return curs.rowcount > 0
@@ -0,0 +1,54 @@
+# src/dao_async/commentaire_dao.py
+from typing import Optional
+import logging
+
+from dao.commentaire_dao import CommentaireDao
+from dao.lignes import vers_modele
+from dao_async.db_connection import AsyncDBConnection
+from model.commentaire_models import CommentaireModelIn, CommentaireModelOut
+
+logger = logging.getLogger(__name__)
+
+
+class CommentaireDaoAsync:
+    """
+    Jumeau asynchrone de CommentaireDao : mêmes méthodes, mêmes requêtes SQL.
+    """
+
+    async def find_by_reservation_id(self, id_reservation: int) -> Optional[CommentaireModelOut]:
+        """Trouve le commentaire associé à une réservation."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(CommentaireDao.SQL_FIND_BY_RESERVATION_ID, {"id_resa": id_reservation})
+                row = await curs.fetchone()
+
+        return vers_modele(CommentaireModelOut, row) if row else None
+
+    async def find_all_by_event_id(self, id_evenement: int) -> list:
+        """Tous les commentaires d'un événement, avec nom/prénom de l'auteur."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(CommentaireDao.SQL_FIND_ALL_BY_EVENT_ID, {"id_evt": id_evenement})
+                return await curs.fetchall()
+
+    async def _ecrire(self, query: str, params: dict, contexte: str) -> Optional[CommentaireModelOut]:
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                try:
+                    await curs.execute(query, params)
+                    row = await curs.fetchone()
+                    await con.commit()
+                    return vers_modele(CommentaireModelOut, row) if row else None
+                except Exception as e:
+                    await con.rollback()
+                    logger.exception(f"Erreur DAO ({contexte}): {e}")
+                    return None
+
+    async def create(self, comm_in: CommentaireModelIn) -> Optional[CommentaireModelOut]:
+        """Crée un nouveau commentaire."""
+        return await self._ecrire(CommentaireDao.SQL_CREATE, comm_in.model_dump(), "create commentaire")
+
+    async def update(self, id_commentaire: int, comm_in: CommentaireModelIn) -> Optional[CommentaireModelOut]:
+        """Met à jour un commentaire existant (note et avis)."""
+        params = {"note": comm_in.note, "avis": comm_in.avis, "id_comm": id_commentaire}
+        return await self._ecrire(CommentaireDao.SQL_UPDATE, params, "update commentaire")
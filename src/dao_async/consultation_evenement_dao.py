@@ -0,0 +1,156 @@
+# src/dao_async/consultation_evenement_dao.py
+from typing import List, Optional, Dict, Any
+from datetime import date
+
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.lignes import vers_modeles
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.evenement_models import DisponibiliteModelOut, EvenementModelOut, ResultatRechercheModelOut
+
+
+class ConsultationEvenementDaoAsync:
+    """
+    Jumeau asynchrone de ConsultationEvenementDao (lecture seule).
+    Les requêtes sont construites par les mêmes méthodes `_requete_*`.
+    """
+
+    async def _fetchall(self, query: str, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(query, params)
+                return await curs.fetchall()
+
+    async def lister_tous(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        order_by: str = "date_evenement ASC, id_evenement ASC",
+    ) -> List[Dict[str, Any]]:
+        """Liste paginée de tous les événements avec toutes les stats (dictionnaires)."""
+        query, params = ConsultationEvenementDao._requete_lister_tous(limit, offset, order_by)
+        return await self._fetchall(query, params)
+
+    async def lister_disponibles(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        a_partir_du: Optional[date] = None,
+    ) -> List[EvenementModelOut]:
+        """Liste simple des événements 'disponible en ligne' (EvenementModelOut)."""
+        query, params = ConsultationEvenementDao._requete_lister_disponibles(limit, offset, a_partir_du)
+        return vers_modeles(EvenementModelOut, await self._fetchall(query, params))
+
+    async def lister_avec_places_restantes(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Liste des événements avec places restantes et avis (dictionnaires)."""
+        query, params = ConsultationEvenementDao._requete_lister_avec_places_restantes(
+            limit, offset, seulement_disponibles, a_partir_du
+        )
+        return await self._fetchall(query, params)
+
+    async def rechercher(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[EvenementModelOut]:
+        """Recherche d'événements avec filtres (EvenementModelOut)."""
+        query, params = ConsultationEvenementDao._requete_rechercher(
+            ville, categorie, statut, date_min, date_max, limit, offset
+        )
+        return vers_modeles(EvenementModelOut, await self._fetchall(query, params))
+
+    async def rechercher_texte(
+        self,
+        texte: str,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[ResultatRechercheModelOut]:
+        """Recherche libre triée par pertinence, avec extraits (ResultatRechercheModelOut)."""
+        dao = ConsultationEvenementDao
+        if dao._trigramme is None:
+            rows = await self._fetchall(dao.SQL_TRIGRAMME_DISPONIBLE, {})
+            dao._trigramme = rows[0]["disponible"]
+        query, params = dao._requete_rechercher_texte(
+            texte, categorie, statut, date_min, date_max, limit, offset, dao._trigramme
+        )
+        return vers_modeles(ResultatRechercheModelOut, await self._fetchall(query, params))
+
+    # ---------- Lecture paginée par curseur ----------
+    async def lister_tous_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur:
+        """lister_tous, par pages triées par (date_evenement, id_evenement)."""
+        dao = ConsultationEvenementDao
+        query, params = dao._requete_lister_tous(
+            max(limit, 1) + 1, 0, dao.ORDRE_PAGE, dao._decoder(curseur, "consultation.tous")
+        )
+        return dao._page(await self._fetchall(query, params), limit, "consultation.tous")
+
+    async def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """lister_disponibles, par pages (mêmes filtres à chaque page)."""
+        dao = ConsultationEvenementDao
+        query, params = dao._requete_lister_disponibles(
+            max(limit, 1) + 1, 0, a_partir_du, dao._decoder(curseur, "consultation.disponibles")
+        )
+        rows = await self._fetchall(query, params)
+        return dao._page(vers_modeles(EvenementModelOut, rows), limit, "consultation.disponibles")
+
+    async def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """lister_avec_places_restantes, par pages (mêmes filtres à chaque page)."""
+        dao = ConsultationEvenementDao
+        query, params = dao._requete_lister_avec_places_restantes(
+            max(limit, 1) + 1, 0, seulement_disponibles, a_partir_du,
+            dao._decoder(curseur, "consultation.places_restantes"),
+        )
+        return dao._page(await self._fetchall(query, params), limit, "consultation.places_restantes")
+
+    async def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageCurseur:
+        """rechercher, par pages (mêmes filtres à chaque page)."""
+        dao = ConsultationEvenementDao
+        query, params = dao._requete_rechercher(
+            ville, categorie, statut, date_min, date_max, max(limit, 1) + 1, 0,
+            dao._decoder(curseur, "consultation.recherche"),
+        )
+        rows = await self._fetchall(query, params)
+        return dao._page(vers_modeles(EvenementModelOut, rows), limit, "consultation.recherche")
+
+    # ---------- Disponibilités ----------
+    async def disponibilites(self, ids_evenements: List[int]) -> Dict[int, DisponibiliteModelOut]:
+        """Disponibilités (lieu, bus) d'un ensemble d'événements, en une requête."""
+        if not ids_evenements:
+            return {}
+        rows = await self._fetchall(ConsultationEvenementDao.SQL_DISPONIBILITES, {"ids": list(ids_evenements)})
+        return {r["id_evenement"]: ConsultationEvenementDao._disponibilite(r) for r in rows}
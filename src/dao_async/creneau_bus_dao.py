@@ -0,0 +1,110 @@
+# src/dao_async/creneau_bus_dao.py
+from typing import Any, Dict, List, Optional
+
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.lignes import vers_modeles
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.creneauBus_models import CreneauBusModelIn, CreneauBusModelOut
+from utils.pagination import paginer_par_id, params_par_id
+
+
+class CreneauBusDaoAsync:
+    """
+    Jumeau asynchrone de CreneauBusDao : mêmes méthodes, mêmes requêtes SQL.
+    """
+
+    # ------------- HELPERS -------------
+    async def _fetchone(self, query: str, params: Dict[str, Any]) -> Optional[dict]:
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(query, params)
+                return await curs.fetchone()
+
+    async def _fetchall(self, query: str, params: Dict[str, Any]) -> List[dict]:
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(query, params)
+                return await curs.fetchall()
+
+    async def _ecrire(self, query: str, params: Dict[str, Any], contexte: str) -> Optional[CreneauBusModelOut]:
+        """INSERT / UPDATE ... RETURNING : None (et rollback) en cas d'erreur SQL."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                try:
+                    await curs.execute(query, params)
+                    row = await curs.fetchone()
+                    await con.commit()
+                except Exception as e:
+                    await con.rollback()
+                    print(f"Erreur DAO ({contexte}): {e}")
+                    return None
+        return CreneauBusDao._row_to_model(row) if row else None
+
+    # ------------- CREATE -------------
+    async def create(self, bus_in: CreneauBusModelIn) -> Optional[CreneauBusModelOut]:
+        """Insère un bus à partir d'un CreneauBusModelIn."""
+        return await self._ecrire(CreneauBusDao.SQL_CREATE, bus_in.model_dump(), "create bus")
+
+    # ------------- READ -------------
+    async def find_by_id(self, id_bus: int) -> Optional[CreneauBusModelOut]:
+        row = await self._fetchone(CreneauBusDao.SQL_FIND_BY_ID, {"id": id_bus})
+        return CreneauBusDao._row_to_model(row) if row else None
+
+    async def find_by_event(self, id_evenement: int) -> List[CreneauBusModelOut]:
+        """Récupère tous les bus d'un événement."""
+        rows = await self._fetchall(CreneauBusDao.SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
+        return vers_modeles(CreneauBusModelOut, rows)
+
+    async def find_by_description(self, description: str) -> Optional[CreneauBusModelOut]:
+        row = await self._fetchone(CreneauBusDao.SQL_FIND_BY_DESCRIPTION, {"description": description})
+        return CreneauBusDao._row_to_model(row) if row else None
+
+    async def exists_description(self, description: str) -> bool:
+        """Vérifie l'unicité de la description."""
+        return await self.find_by_description(description) is not None
+
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[CreneauBusModelOut]:
+        rows = await self._fetchall(CreneauBusDao.SQL_FIND_ALL, {"limit": limit, "offset": offset})
+        return vers_modeles(CreneauBusModelOut, rows)
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[CreneauBusModelOut]:
+        """Page de bus située après `curseur` (None pour la première page), triée par id_bus."""
+        rows = await self._fetchall(CreneauBusDao.SQL_FIND_PAGE, params_par_id(curseur, limit, CreneauBusDao.LISTE_PAGE))
+        return paginer_par_id(vers_modeles(CreneauBusModelOut, rows), limit, CreneauBusDao.LISTE_PAGE, "id_bus")
+
+    async def find_by_event_id(self, id_evenement: int) -> List[CreneauBusModelOut]:
+        """Récupère tous les bus (aller et retour) pour un événement donné."""
+        rows = await self._fetchall(CreneauBusDao.SQL_FIND_BY_EVENT_ID, {"id": id_evenement})
+        return vers_modeles(CreneauBusModelOut, rows)
+
+    # ------------- CALCULS (Capacité) -------------
+    async def get_capacite_totale(self, id_evenement: int, direction: str) -> int:
+        """Somme des places pour un événement et une direction (compteur trigger)."""
+        query = CreneauBusDao.SQL_CAPACITE_TOTALE["aller" if direction == "aller" else "retour"]
+        row = await self._fetchone(query, {"id": id_evenement})
+        val = row.get("total") if row else 0
+        return int(val) if val else 0
+
+    # ------------- UPDATE / DELETE -------------
+    async def update(self, bus_in: CreneauBusModelIn, id_bus: int) -> Optional[CreneauBusModelOut]:
+        """Met à jour un bus."""
+        params = bus_in.model_dump()
+        params["id_bus"] = id_bus
+        return await self._ecrire(CreneauBusDao.SQL_UPDATE, params, "update bus")
+
+    async def update_places(self, id_bus: int, nombre_places: int) -> Optional[CreneauBusModelOut]:
+        """Met à jour uniquement le nombre de places."""
+        params = {"id_bus": id_bus, "nombre_places": nombre_places}
+        return await self._ecrire(CreneauBusDao.SQL_UPDATE_PLACES, params, "update_places")
+
+    async def delete(self, id_bus: int) -> bool:
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(CreneauBusDao.SQL_DELETE, {"id": id_bus})
+                return curs.rowcount > 0
+
+    async def count_for_event(self, id_evenement: int) -> int:
+        """Nombre de bus rattachés à un événement."""
+        row = await self._fetchone(CreneauBusDao.SQL_COUNT_FOR_EVENT, {"id": id_evenement})
+        return int(row["c"]) if row else 0
@@ -0,0 +1,135 @@
+import asyncio
+import functools
+import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Optional
+
+import dotenv
+import psycopg
+from psycopg.conninfo import make_conninfo
+from psycopg.rows import dict_row
+from psycopg_pool import AsyncConnectionPool
+
+from dao.db_connection import ConnexionChronometree, RequetePreparee
+from utils.singleton import Singleton
+from utils.stats_requetes import chronometrer_async
+
+
+class CurseurChronometre(psycopg.AsyncCursor):
+    """
+    Curseur asynchrone qui enregistre chaque requête (utils.stats_requetes), comme en synchrone.
+    Les RequetePreparee sont préparées dès leur première exécution (psycopg 3
+    tient lui-même le registre des instructions préparées de chaque connexion).
+    """
+
+    async def execute(self, query, params=None, **kwargs):
+        if isinstance(query, RequetePreparee) and query.preparable and ConnexionChronometree.preparer:
+            kwargs.setdefault("prepare", True)
+        return await chronometrer_async(
+            functools.partial(super().execute, **kwargs), query, params, self, _texte(query, self)
+        )
+
+    async def executemany(self, query, params_seq, **kwargs):
+        return await chronometrer_async(
+            functools.partial(super().executemany, **kwargs), query, params_seq, self, _texte(query, self)
+        )
+
+
+def _texte(query, curseur) -> Optional[str]:
+    """Texte d'une requête composée (psycopg.sql), None pour une chaîne."""
+    return None if isinstance(query, (str, bytes)) else query.as_string(curseur)
+
+
+class AsyncDBConnection(metaclass=Singleton):
+    """
+    Pendant asynchrone de dao.db_connection.DBConnection (psycopg 3).
+    Partage un unique pool borné de connexions entre toutes les coroutines
+    d'un processus : pas de thread par requête, une connexion n'est occupée
+    que le temps d'une transaction.
+
+    Mêmes réglages que la version synchrone (variables d'environnement) :
+      POSTGRES_POOL_MIN, POSTGRES_POOL_MAX, POSTGRES_POOL_TIMEOUT, POSTGRES_POOL_MAX_IDLE
+
+    Les lignes sont renvoyées sous forme de dict (dict_row), comme avec le
+    RealDictCursor des DAO synchrones : le code de conversion est partagé.
+
+    Un pool asyncio est lié à la boucle d'événements qui l'a ouvert : il est
+    ouvert à la première utilisation (ou via `ouvrir()`), et recréé si on
+    l'utilise depuis une autre boucle.
+    """
+
+    def __init__(self):
+        dotenv.load_dotenv()
+        ConnexionChronometree.lire_reglages()
+        self.schema: Optional[str] = os.getenv("POSTGRES_SCHEMA")
+        self.__pool: Optional[AsyncConnectionPool] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _creer_pool(self) -> AsyncConnectionPool:
+        """Construit (sans l'ouvrir) le pool à partir des variables d'environnement."""
+        conninfo = make_conninfo(
+            host=os.getenv("POSTGRES_HOST"),
+            port=os.getenv("POSTGRES_PORT"),
+            dbname=os.getenv("POSTGRES_DATABASE"),
+            user=os.getenv("POSTGRES_USER"),
+            password=os.getenv("POSTGRES_PASSWORD"),
+        )
+        kwargs = {"row_factory": dict_row, "cursor_factory": CurseurChronometre}
+        if self.schema:
+            kwargs["options"] = f"-c search_path={self.schema}"
+
+        return AsyncConnectionPool(
+            conninfo,
+            kwargs=kwargs,
+            min_size=int(os.getenv("POSTGRES_POOL_MIN", "1")),
+            max_size=int(os.getenv("POSTGRES_POOL_MAX", "10")),
+            timeout=float(os.getenv("POSTGRES_POOL_TIMEOUT", "30")),
+            max_idle=float(os.getenv("POSTGRES_POOL_MAX_IDLE", "600")),
+            open=False,
+        )
+
+    async def ouvrir(self) -> AsyncConnectionPool:
+        """Ouvre le pool s'il ne l'est pas déjà (idempotent) et le retourne."""
+        loop = asyncio.get_running_loop()
+        if self.__pool is None or self.__loop is not loop:
+            # Pas d'await entre le test et l'affectation : pas de course entre coroutines
+            self.__pool = self._creer_pool()
+            self.__loop = loop
+        await self.__pool.open()
+        return self.__pool
+
+    async def fermer(self) -> None:
+        """Ferme le pool ; il sera recréé à la prochaine utilisation."""
+        pool, self.__pool, self.__loop = self.__pool, None, None
+        if pool is not None:
+            await pool.close()
+
+    @property
+    def pool(self) -> Optional[AsyncConnectionPool]:
+        """Pool courant (None tant qu'il n'a pas été ouvert)."""
+        return self.__pool
+
+    @asynccontextmanager
+    async def getConnexion(self) -> AsyncIterator[psycopg.AsyncConnection]:
+        """
+        Emprunte une connexion pour un bloc `async with` :
+        commit si le bloc se termine normalement, rollback en cas d'exception,
+        puis restitution au pool.
+        """
+        pool = await self.ouvrir()
+        async with pool.connection() as con:
+            yield con
+
+    @property
+    def connection(self):
+        """Alias de getConnexion(), comme DBConnection().connection."""
+        return self.getConnexion()
+
+    def definir_schema(self, schema: str) -> None:
+        """
+        Change le search_path des connexions.
+        Prend effet à la prochaine ouverture du pool : à appeler avant `ouvrir()`.
+        """
+        if self.__pool is not None and schema != self.schema:
+            raise RuntimeError("Le pool asynchrone est déjà ouvert : fermez-le avant de changer de schéma.")
+        self.schema = schema
@@ -0,0 +1,96 @@
+# src/dao_async/evenement_dao.py
+from typing import List, Optional
+
+from dao.evenement_dao import EvenementDao
+from dao.lignes import vers_modeles
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.evenement_models import EvenementModelOut, EvenementModelIn
+from utils.pagination import paginer_par_id, params_par_id
+
+
+class EvenementDaoAsync:
+    """
+    Jumeau asynchrone d'EvenementDao : mêmes méthodes, mêmes requêtes SQL.
+    """
+
+    # ---------- READ ----------
+
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
+        """Récupère une liste paginée d'événements."""
+        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_FIND_ALL, params)
+                rows = await curs.fetchall()
+
+        return vers_modeles(EvenementModelOut, rows)
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[EvenementModelOut]:
+        """Page d'événements située après `curseur` (None pour la première page)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_FIND_PAGE, params_par_id(curseur, limit, EvenementDao.LISTE_PAGE))
+                rows = await curs.fetchall()
+
+        return paginer_par_id(vers_modeles(EvenementModelOut, rows), limit, EvenementDao.LISTE_PAGE, "id_evenement")
+
+    async def find_by_id(self, id_evenement: int) -> Optional[EvenementModelOut]:
+        """Récupère un événement par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_FIND_BY_ID, {"id": id_evenement})
+                r = await curs.fetchone()
+
+        return EvenementDao._row_to_model(r) if r else None
+
+    # ---------- CREATE ----------
+
+    async def create(self, evenement_in: EvenementModelIn) -> Optional[EvenementModelOut]:
+        """Crée un nouvel événement."""
+        params = EvenementDao._params_create(evenement_in)
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_CREATE, params)
+                row = await curs.fetchone()
+
+        if not row:
+            return None
+
+        return EvenementModelOut(
+            id_evenement=row["id_evenement"],
+            date_creation=row["date_creation"],
+            **params,
+        )
+
+    # ---------- UPDATE ----------
+
+    async def update(self, evenement: EvenementModelOut) -> Optional[EvenementModelOut]:
+        """Met à jour un événement existant."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_UPDATE, EvenementDao._params_update(evenement))
+                r = await curs.fetchone()
+
+        return EvenementDao._row_to_model(r) if r else None
+
+    # ---------- DELETE ----------
+
+    async def delete(self, id_evenement: int) -> bool:
+        """Supprime un événement par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_DELETE, {"id": id_evenement})
+                return curs.rowcount > 0
+
+    # ---------- MAINTENANCE ----------
+
+    async def recalculer_compteurs(self) -> int:
+        """Recalcule les compteurs dénormalisés ; retourne le nombre d'événements corrigés."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(EvenementDao.SQL_RECALCULER_COMPTEURS)
+                row = await curs.fetchone()
+        return int(row["corriges"]) if row else 0
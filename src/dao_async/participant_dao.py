@@ -0,0 +1,172 @@
+# src/dao_async/participant_dao.py
+from typing import Iterable, List, Optional, Set, Tuple
+
+from dao.lignes import vers_modeles
+from dao.participant_dao import ParticipantDao
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.participant_models import ParticipantModelIn, ParticipantModelOut
+from utils.pagination import paginer_par_id, params_par_id
+from utils.securite import hacheur
+
+
+class ParticipantDaoAsync:
+    """
+    Jumeau asynchrone de ParticipantDao : mêmes méthodes, mêmes requêtes SQL.
+    Le hachage / la vérification bcrypt (coûteux en CPU) s'exécutent dans le
+    pool de processus de utils.securite, sans bloquer la boucle d'événements.
+    """
+
+    # ---------- READ ----------
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[ParticipantModelOut]:
+        """Récupère une liste paginée de participants."""
+        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_ALL, params)
+                rows = await curs.fetchall()
+
+        return vers_modeles(ParticipantModelOut, rows)
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[ParticipantModelOut]:
+        """Page de participants située après `curseur` (None pour la première page)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_PAGE, params_par_id(curseur, limit, ParticipantDao.LISTE_PAGE))
+                rows = await curs.fetchall()
+
+        return paginer_par_id(vers_modeles(ParticipantModelOut, rows), limit, ParticipantDao.LISTE_PAGE, "id_utilisateur")
+
+    async def find_by_id(self, id_utilisateur: int) -> Optional[ParticipantModelOut]:
+        """Récupère un participant par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_BY_ID, {"id": id_utilisateur})
+                r = await curs.fetchone()
+
+        return ParticipantDao._row_to_model(r) if r else None
+
+    async def find_by_email(self, email: str) -> Optional[ParticipantModelOut]:
+        """Récupère un participant par son email."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_BY_EMAIL, {"email": email})
+                r = await curs.fetchone()
+
+        return ParticipantDao._row_to_model(r) if r else None
+
+    # ---------- CREATE ----------
+    async def create(self, participant_in: ParticipantModelIn) -> ParticipantModelOut:
+        """Crée un participant (mot de passe hashé avant insertion)."""
+        params = {
+            "email": participant_in.email,
+            "prenom": participant_in.prenom,
+            "nom": participant_in.nom,
+            "telephone": participant_in.telephone,
+            "mot_de_passe": await hacheur().hacher_async(participant_in.mot_de_passe),
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_CREATE, params)
+                row = await curs.fetchone()
+
+        return ParticipantModelOut(
+            id_utilisateur=row["id_utilisateur"],
+            email=participant_in.email,
+            prenom=participant_in.prenom,
+            nom=participant_in.nom,
+            telephone=participant_in.telephone,
+            administrateur=False,
+            date_creation=row["date_creation"],
+        )
+
+    async def create_many(self, participants: Iterable[Tuple[ParticipantModelIn, str]]) -> Set[str]:
+        """Insère des participants (couples participant, hash) par COPY ; retourne les emails insérés."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_CREATE_STAGING)
+                async with curs.copy(ParticipantDao.SQL_COPY_STAGING) as copie:
+                    await copie.write(ParticipantDao._csv_staging(participants))
+                await curs.execute(ParticipantDao.SQL_INSERT_STAGING)
+                rows = await curs.fetchall()
+
+        return {r["email"] for r in rows}
+
+    # ---------- UPDATE ----------
+    async def update(self, participant_out: ParticipantModelOut) -> Optional[ParticipantModelOut]:
+        """Met à jour un participant (hors mot de passe)."""
+        params = {
+            "id": participant_out.id_utilisateur,
+            "email": participant_out.email,
+            "prenom": participant_out.prenom,
+            "nom": participant_out.nom,
+            "telephone": participant_out.telephone,
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_UPDATE, params)
+                r = await curs.fetchone()
+
+        return ParticipantDao._row_to_model(r) if r else None
+
+    # ---------- DELETE ----------
+    async def delete(self, id_utilisateur: int) -> bool:
+        """Supprime un participant par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_DELETE, {"id": id_utilisateur})
+                return curs.rowcount > 0
+
+    # ---------- AUTH ----------
+    async def authenticate(self, email: str, mot_de_passe: str) -> Optional[ParticipantModelOut]:
+        """Vérifie email/mot de passe et retourne le participant si OK, sinon None."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_AUTHENTICATE, {"email": email})
+                r = await curs.fetchone()
+
+        if r is None:
+            return None
+
+        ok, nouveau_hash = await hacheur().verifier_et_rehacher_async(mot_de_passe, r["mot_de_passe"])
+        if not ok:
+            return None
+        if nouveau_hash:
+            async with AsyncDBConnection().getConnexion() as con:
+                async with con.cursor() as curs:
+                    await curs.execute(ParticipantDao.SQL_REHASH, ParticipantDao._params_rehash(r, nouveau_hash))
+
+        return ParticipantDao._row_to_model(r)
+
+    async def change_password(self, id_utilisateur: int, new_password: str) -> bool:
+        """Met à jour le mot de passe (hash bcrypt)."""
+        params = {
+            "pwd": await hacheur().hacher_async(new_password),
+            "id": id_utilisateur,
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_CHANGE_PASSWORD, params)
+                return curs.rowcount > 0
+
+    async def find_emails_existants(self, emails: List[str]) -> Set[str]:
+        """Parmi `emails`, ceux déjà utilisés par un compte (comparaison en minuscules)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_EMAILS_EXISTANTS, {"emails": [e.lower() for e in emails]})
+                rows = await curs.fetchall()
+
+        return {r["email"] for r in rows}
+
+    async def find_all_emails(self) -> List[str]:
+        """Retourne tous les emails des participants (administrateur = FALSE)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ParticipantDao.SQL_FIND_ALL_EMAILS)
+                rows = await curs.fetchall()
+
+        return [r["email"] for r in rows]
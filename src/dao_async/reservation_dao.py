@@ -0,0 +1,180 @@
+# src/dao_async/reservation_dao.py
+from typing import AsyncIterator, List, Optional
+
+from psycopg.rows import tuple_row
+
+from dao.lignes import vers_modele, vers_modeles
+from dao.reservation_dao import ReservationDao
+from dao_async.db_connection import AsyncDBConnection
+from model.reservation_models import (
+    InscritModelOut,
+    ReservationModelOut,
+    ReservationModelIn,
+    ResultatReservation,
+)
+
+
+class ReservationDaoAsync:
+    """
+    Jumeau asynchrone de ReservationDao : mêmes méthodes, mêmes requêtes SQL
+    (attributs de ReservationDao), exécutées via psycopg 3 sans bloquer la boucle.
+    """
+
+    # ---------- READ ----------
+    async def find_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
+        """Récupère toutes les réservations d'un utilisateur donné."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_FIND_BY_USER, {"id_utilisateur": id_utilisateur})
+                rows = await curs.fetchall()
+
+        return vers_modeles(ReservationModelOut, rows)
+
+    async def find_by_event(self, id_evenement: int) -> List[ReservationModelOut]:
+        """Récupère toutes les réservations d'un événement donné."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_FIND_BY_EVENT, {"id_evenement": id_evenement})
+                rows = await curs.fetchall()
+
+        return vers_modeles(ReservationModelOut, rows)
+
+    async def find_by_id(self, id_reservation: int) -> Optional[ReservationModelOut]:
+        """Récupère une réservation par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_FIND_BY_ID, {"id": id_reservation})
+                r = await curs.fetchone()
+
+        return vers_modele(ReservationModelOut, r) if r else None
+
+    async def lister_inscrits(self, id_evenement: int) -> List[InscritModelOut]:
+        """Liste des inscrits d'un événement (réservation, auteur, commentaire) en une requête."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_LISTE_INSCRITS, {"id_evenement": id_evenement})
+                rows = await curs.fetchall()
+
+        return vers_modeles(InscritModelOut, rows)
+
+    async def iter_inscrits(self, id_evenement: int, taille_lot: int = 1000) -> AsyncIterator[InscritModelOut]:
+        """Liste des inscrits lue par un curseur côté serveur, `taille_lot` lignes à la fois."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor(name="liste_inscrits") as curs:
+                curs.itersize = taille_lot
+                await curs.execute(ReservationDao.SQL_LISTE_INSCRITS, {"id_evenement": id_evenement})
+                async for r in curs:
+                    yield vers_modele(InscritModelOut, r)
+
+    async def iter_lignes_export(self, id_evenement: int, taille_lot: int = 5000) -> AsyncIterator[List[tuple]]:
+        """Inscrits à exporter, par lots de tuples (colonnes de ReservationDao.COLONNES_EXPORT)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor(name="export_inscrits", row_factory=tuple_row) as curs:
+                await curs.execute(ReservationDao.SQL_EXPORT_INSCRITS, {"id_evenement": id_evenement})
+                while True:
+                    lot = await curs.fetchmany(taille_lot)
+                    if not lot:
+                        break
+                    yield lot
+
+    async def count_bus_taken(self, id_evenement: int, direction: str) -> int:
+        """Nombre de places prises dans le bus 'aller' ou 'retour' (compteur trigger)."""
+        query = ReservationDao.SQL_COUNT_BUS_TAKEN["aller" if direction == "aller" else "retour"]
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(query, {"id": id_evenement})
+                row = await curs.fetchone()
+
+        return int(row["total"]) if row else 0
+
+    # ---------- CREATE ----------
+    async def create(self, reservation_in: ReservationModelIn) -> Optional[ReservationModelOut]:
+        """Crée une nouvelle réservation (1 par utilisateur + événement)."""
+        params = ReservationDao._params_create(reservation_in)
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                try:
+                    await curs.execute(ReservationDao.SQL_CREATE, params)
+                    row = await curs.fetchone()
+                    await con.commit()
+                except Exception as e:
+                    await con.rollback()
+                    print(f"Erreur DAO lors de la création de la réservation : {e}")
+                    return None
+
+        return ReservationModelOut(
+            id_reservation=row["id_reservation"],
+            date_reservation=row["date_reservation"],
+            **params,
+        )
+
+    async def reserver(self, reservation_in: ReservationModelIn) -> ResultatReservation:
+        """Réservation atomique (shotgun) via la fonction SQL reserver_place."""
+        params = ReservationDao._params_create(reservation_in)
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_RESERVER, params)
+                row = await curs.fetchone()
+
+        return ReservationDao._resultat_reserver(row, params)
+
+    # ---------- UPDATE ----------
+    async def update_flags(
+        self,
+        id_reservation: int,
+        *,
+        bus_aller: Optional[bool] = None,
+        bus_retour: Optional[bool] = None,
+        adherent: Optional[bool] = None,
+        sam: Optional[bool] = None,
+        boisson: Optional[bool] = None,
+    ) -> Optional[ReservationModelOut]:
+        """Met à jour sélectivement les options de la réservation."""
+        query, params = ReservationDao._requete_update_flags(
+            id_reservation,
+            bus_aller=bus_aller,
+            bus_retour=bus_retour,
+            adherent=adherent,
+            sam=sam,
+            boisson=boisson,
+        )
+
+        if query is None:
+            return await self.find_by_id(id_reservation)
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(query, params)
+                r = await curs.fetchone()
+
+        return vers_modele(ReservationModelOut, r) if r else None
+
+    # ---------- DELETE ----------
+    async def delete(self, id_reservation: int) -> bool:
+        """Supprime une réservation par ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_DELETE, {"id": id_reservation})
+                return curs.rowcount > 0
+
+    # ---------- HELPERS / STATS ----------
+    async def count_by_event(self, id_evenement: int) -> int:
+        """Nombre de réservations d'un événement (compteur evenement.inscrits)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(ReservationDao.SQL_COUNT_BY_EVENT, {"id": id_evenement})
+                r = await curs.fetchone()
+                return int(r["c"]) if r else 0
+
+    async def exists_for_user_and_event(self, id_utilisateur: int, id_evenement: int) -> bool:
+        """Vérifie si un utilisateur a déjà réservé un événement précis."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(
+                    ReservationDao.SQL_EXISTS_FOR_USER_AND_EVENT,
+                    {"id_user": id_utilisateur, "id_event": id_evenement},
+                )
+                return await curs.fetchone() is not None
@@ -0,0 +1,144 @@
+# src/dao_async/utilisateur_dao.py
+from typing import List, Optional
+
+from dao.lignes import vers_modeles
+from dao.utilisateur_dao import UtilisateurDao
+from dao_async.db_connection import AsyncDBConnection
+from model.pagination_models import PageCurseur
+from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from utils.pagination import paginer_par_id, params_par_id
+from utils.securite import hacheur
+
+
+class UtilisateurDaoAsync:
+    """
+    Jumeau asynchrone de UtilisateurDao : mêmes méthodes, mêmes requêtes SQL.
+    Le hachage / la vérification bcrypt (coûteux en CPU) s'exécutent dans le
+    pool de processus de utils.securite, sans bloquer la boucle d'événements.
+    """
+
+    # ---------- READ ----------
+    async def find_all(self, limit: int = 100, offset: int = 0) -> List[UtilisateurModelOut]:
+        """Récupère une liste paginée d'utilisateurs."""
+        params = {"limit": max(limit, 0), "offset": max(offset, 0)}
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_FIND_ALL, params)
+                rows = await curs.fetchall()
+
+        return vers_modeles(UtilisateurModelOut, rows)
+
+    async def find_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[UtilisateurModelOut]:
+        """Page d'utilisateurs située après `curseur` (None pour la première page)."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_FIND_PAGE, params_par_id(curseur, limit, UtilisateurDao.LISTE_PAGE))
+                rows = await curs.fetchall()
+
+        return paginer_par_id(vers_modeles(UtilisateurModelOut, rows), limit, UtilisateurDao.LISTE_PAGE, "id_utilisateur")
+
+    async def find_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
+        """Récupère un utilisateur par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_FIND_BY_ID, {"id": id_utilisateur})
+                r = await curs.fetchone()
+
+        return UtilisateurDao._row_to_model(r) if r else None
+
+    async def find_by_email(self, email: str) -> Optional[UtilisateurModelOut]:
+        """Récupère un utilisateur par son email."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_FIND_BY_EMAIL, {"email": email})
+                r = await curs.fetchone()
+
+        return UtilisateurDao._row_to_model(r) if r else None
+
+    # ---------- CREATE ----------
+    async def create(self, user_in: UtilisateurModelIn) -> UtilisateurModelOut:
+        """Crée un utilisateur (mot de passe hashé avant insertion)."""
+        params = {
+            "email": user_in.email,
+            "prenom": user_in.prenom,
+            "nom": user_in.nom,
+            "telephone": user_in.telephone,
+            "mot_de_passe": await hacheur().hacher_async(user_in.mot_de_passe),
+            "administrateur": getattr(user_in, "administrateur", False),
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_CREATE, params)
+                row = await curs.fetchone()
+
+        return UtilisateurModelOut(
+            id_utilisateur=row["id_utilisateur"],
+            email=user_in.email,
+            prenom=user_in.prenom,
+            nom=user_in.nom,
+            telephone=user_in.telephone,
+            administrateur=params["administrateur"],
+            date_creation=row["date_creation"],
+        )
+
+    # ---------- UPDATE ----------
+    async def update(self, user_out: UtilisateurModelOut) -> Optional[UtilisateurModelOut]:
+        """Met à jour un utilisateur (hors mot de passe)."""
+        params = {
+            "id": user_out.id_utilisateur,
+            "email": user_out.email,
+            "prenom": user_out.prenom,
+            "nom": user_out.nom,
+            "telephone": user_out.telephone,
+            "administrateur": getattr(user_out, "administrateur", False),
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_UPDATE, params)
+                r = await curs.fetchone()
+
+        return UtilisateurDao._row_to_model(r) if r else None
+
+    # ---------- DELETE ----------
+    async def delete(self, id_utilisateur: int) -> bool:
+        """Supprime un utilisateur par son ID."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_DELETE, {"id": id_utilisateur})
+                return curs.rowcount > 0
+
+    # ---------- AUTH ----------
+    async def authenticate(self, email: str, mot_de_passe: str) -> Optional[UtilisateurModelOut]:
+        """Vérifie email/mot de passe et retourne l'utilisateur si OK, sinon None."""
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_AUTHENTICATE, {"email": email})
+                r = await curs.fetchone()
+
+        if r is None:
+            return None
+
+        ok, nouveau_hash = await hacheur().verifier_et_rehacher_async(mot_de_passe, r["mot_de_passe"])
+        if not ok:
+            return None
+        if nouveau_hash:
+            async with AsyncDBConnection().getConnexion() as con:
+                async with con.cursor() as curs:
+                    await curs.execute(UtilisateurDao.SQL_REHASH, UtilisateurDao._params_rehash(r, nouveau_hash))
+
+        return UtilisateurDao._row_to_model(r)
+
+    async def change_password(self, id_utilisateur: int, new_password: str) -> bool:
+        """Met à jour le mot de passe (hash bcrypt)."""
+        params = {
+            "pwd": await hacheur().hacher_async(new_password),
+            "id": id_utilisateur,
+        }
+
+        async with AsyncDBConnection().getConnexion() as con:
+            async with con.cursor() as curs:
+                await curs.execute(UtilisateurDao.SQL_CHANGE_PASSWORD, params)
+                return curs.rowcount > 0
@@ -3,12 +3,17 @@ import dotenv
 
 
 from utils.log_init import initialiser_logs
+from utils.demarrage import Demarrage
 from view.accueil.accueil_vue import AccueilVue
 
 """
 Point d'entrée de l'application : charge la configuration, initialise les logs,
 puis exécute la boucle principale d'affichage et de navigation entre les vues.
 Gère les erreurs et assure un arrêt propre du programme.
+
+Démarrage rapide : seul le menu d'accueil est chargé ici. Les autres vues, les
+services et leurs dépendances sont importés à la première navigation ; la
+connexion à la base s'ouvre en tâche de fond pendant l'affichage du menu.
 """
 
 
@@ -16,6 +21,10 @@ if __name__ == "__main__":
     dotenv.load_dotenv(override=True)
     initialiser_logs("Application")
 
+    # Connexion à la base et envoi des e-mails en file (confirmations,
+    # notifications) en tâche de fond
+    demarrage = Demarrage().lancer()
+
     vue_courante = AccueilVue("Bienvenue")
     nb_erreurs = 0
 
@@ -31,6 +40,8 @@ if __name__ == "__main__":
             nb_erreurs += 1
             vue_courante = AccueilVue("Une erreur est survenue, retour au menu principal")
 
+    demarrage.arreter(timeout=10)
+
     print("----------------------------------")
     print("Au revoir")
     logging.info("Fin de l'application")
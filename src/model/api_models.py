@@ -0,0 +1,156 @@
+# src/model/api_models.py
+from datetime import datetime
+from typing import Dict, Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel, EmailStr, Field
+
+from model.creneauBus_models import CreneauBusModelOut
+from model.evenement_models import EvenementModelOut, PlacesBusModelOut
+from model.reservation_models import StatutReservation
+from model.utilisateur_models import UtilisateurModelOut
+
+T = TypeVar("T")
+
+
+# ---------- Pagination ----------
+
+class Page(BaseModel, Generic[T]):
+    """
+    Page de résultats renvoyée par l'API.
+    offset_suivant / curseur_suivant valent None quand il n'y a plus rien après
+    cette page. Les listes paginées par curseur renvoient curseur_suivant, à
+    repasser tel quel (?curseur=) : plus rapide qu'offset sur les pages lointaines.
+    """
+    items: List[T]
+    limit: int
+    offset: int
+    offset_suivant: Optional[int] = None
+    curseur_suivant: Optional[str] = None
+
+
+# ---------- Authentification ----------
+
+class ConnexionIn(BaseModel):
+    email: EmailStr
+    mot_de_passe: str
+
+
+class JetonOut(BaseModel):
+    access_token: str
+    token_type: str = "bearer"
+    expire_dans: int  # secondes
+    utilisateur: UtilisateurModelOut
+
+
+# ---------- Événements ----------
+
+class EvenementListeOut(EvenementModelOut):
+    """Ligne de la liste des événements : l'événement et ses compteurs."""
+    places_restantes: int
+    avg_note: Optional[float] = None
+    comment_count: int = 0
+
+
+# Places d'une direction de bus (modèle partagé avec ConsultationEvenementService.disponibilites)
+PlacesBusOut = PlacesBusModelOut
+
+
+class EvenementDetailOut(BaseModel):
+    """Fiche d'un événement : places du lieu et des bus, liste des bus."""
+    evenement: EvenementModelOut
+    inscrits: int
+    places_restantes: int
+    bus_aller: PlacesBusOut
+    bus_retour: PlacesBusOut
+    bus: List[CreneauBusModelOut]
+
+
+# ---------- Réservations ----------
+
+class ReservationDemandeIn(BaseModel):
+    """Demande de réservation : l'utilisateur est celui du jeton."""
+    fk_evenement: int
+    bus_aller: bool = False
+    bus_retour: bool = False
+    adherent: bool = False
+    sam: bool = False
+    boisson: bool = False
+    # Délivré par POST /evenements/{id}/admission, exigé si l'ouverture est programmée
+    jeton_admission: Optional[str] = None
+
+
+class ReservationOptionsIn(BaseModel):
+    """Mise à jour partielle des options : seuls les champs fournis sont modifiés."""
+    bus_aller: Optional[bool] = None
+    bus_retour: Optional[bool] = None
+    adherent: Optional[bool] = None
+    sam: Optional[bool] = None
+    boisson: Optional[bool] = None
+
+
+class RefusReservationOut(BaseModel):
+    statut: StatutReservation
+    message: str
+
+
+class AttenteOut(BaseModel):
+    """Inscription en liste d'attente : rang dans la file, ou None si la place a été attribuée aussitôt."""
+    position: Optional[int] = None
+
+
+# ---------- Commentaires ----------
+
+class AvisIn(BaseModel):
+    """Note et/ou avis laissés sur une réservation (l'auteur est celui du jeton)."""
+    note: Optional[int] = Field(None, ge=1, le=5)
+    avis: Optional[str] = None
+
+
+class AvisEvenementOut(BaseModel):
+    """Avis affiché sur la fiche d'un événement."""
+    note: Optional[int] = None
+    avis: Optional[str] = None
+    prenom: str
+    nom: str
+    date_commentaire: datetime
+
+
+# ---------- Statistiques des requêtes ----------
+
+class StatsRequeteOut(BaseModel):
+    """Latence agrégée d'une requête SQL depuis un site d'appel (centiles : bornes de l'histogramme)."""
+    site: str
+    sql: str
+    appels: int
+    erreurs: int
+    lignes: int
+    total_ms: float
+    moyenne_ms: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    max_ms: float
+    histogramme: Dict[str, int]
+
+
+class RapportRequetesOut(BaseModel):
+    """Statistiques des requêtes du worker qui répond (chaque worker a les siennes)."""
+    pid: int
+    depuis: datetime
+    seuil_lente_ms: float
+    requetes: List[StatsRequeteOut]
+
+
+class RequeteLenteOut(BaseModel):
+    """Requête plus lente que le seuil ; `index` sert à en demander le plan."""
+    index: int
+    date: datetime
+    site: str
+    sql: str
+    duree_ms: float
+    lignes: int
+
+
+class PlanOut(BaseModel):
+    """Plan d'exécution (EXPLAIN) d'une requête lente."""
+    plan: str
@@ -0,0 +1,33 @@
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from pydantic import BaseModel
+
+
+class StatutEmail(str, Enum):
+    """
+    Cycle de vie d'un message de la table email_outbox.
+    en_attente -> en_cours -> envoye | en_attente (nouvel essai) | echec
+    """
+    EN_ATTENTE = "en_attente"
+    EN_COURS = "en_cours"
+    ENVOYE = "envoye"
+    ECHEC = "echec"
+
+
+class EmailModelOut(BaseModel):
+    """
+    Modèle de sortie pour la lecture d'un message de la file d'envoi.
+    """
+    id_email: int
+    destinataire: str
+    sujet: str
+    contenu: str
+    statut: StatutEmail
+    tentatives: int
+    prochain_essai: datetime
+    verrouille_le: Optional[datetime] = None
+    derniere_erreur: Optional[str] = None
+    message_id: Optional[str] = None
+    date_creation: datetime
+    date_envoi: Optional[datetime] = None
@@ -1,5 +1,5 @@
 from datetime import date, datetime
-from pydantic import BaseModel, constr, Field
+from pydantic import BaseModel, constr, Field, field_validator
 from typing import Optional, Literal
 
 
@@ -24,6 +24,16 @@ class EvenementModelIn(BaseModel):
             "pas encore finalisé"
         ]
     ] = "pas encore finalisé"
+    # Ouverture programmée des réservations (None : dès la mise en ligne)
+    ouverture: Optional[datetime] = None
+
+    @field_validator("ouverture")
+    @classmethod
+    def _ouverture_avec_fuseau(cls, ouverture: Optional[datetime]) -> Optional[datetime]:
+        """Une heure sans fuseau est l'heure locale : la colonne est un TIMESTAMPTZ."""
+        if ouverture is not None and ouverture.tzinfo is None:
+            return ouverture.astimezone()
+        return ouverture
 
 
 class EvenementModelOut(BaseModel):
@@ -46,3 +56,33 @@ class EvenementModelOut(BaseModel):
         "pas encore finalisé"
     ]
     date_creation: datetime
+    ouverture: Optional[datetime] = None
+
+
+class ResultatRechercheModelOut(EvenementModelOut):
+    """
+    Événement trouvé par la recherche libre : pertinence (entre 0 et 1) et
+    extrait de la description, mots trouvés entre « ».
+    """
+    score: float
+    extrait: Optional[str] = None
+
+
+class PlacesBusModelOut(BaseModel):
+    """Places de bus d'une direction : capacité totale, places prises et restantes."""
+    capacite: int
+    prises: int
+    restantes: int
+
+
+class DisponibiliteModelOut(BaseModel):
+    """
+    Disponibilités d'un événement, lues en direct : lieu (capacité, inscrits,
+    places restantes) et bus dans chaque direction.
+    """
+    id_evenement: int
+    capacite: int
+    inscrits: int
+    places_restantes: int
+    bus_aller: PlacesBusModelOut
+    bus_retour: PlacesBusModelOut
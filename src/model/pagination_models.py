@@ -0,0 +1,14 @@
+from typing import Generic, List, Optional, TypeVar
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class PageCurseur(BaseModel, Generic[T]):
+    """
+    Page d'une liste parcourue par curseur (pagination « keyset »).
+    curseur_suivant est un jeton opaque à repasser pour obtenir la page
+    suivante ; il vaut None sur la dernière page.
+    """
+    items: List[T]
+    curseur_suivant: Optional[str] = None
@@ -1,6 +1,6 @@
 from datetime import datetime
 from pydantic import BaseModel, EmailStr, constr
-from typing import Optional
+from typing import List, Optional
 
 
 class ParticipantModelIn(BaseModel):
@@ -19,3 +19,17 @@ class ParticipantModelOut(BaseModel):
     email: EmailStr
     administrateur: bool = False
     date_creation: datetime
+
+
+class LigneRejetee(BaseModel):
+    """Ligne d'un fichier d'import écartée, avec la raison du rejet."""
+    ligne: int
+    email: Optional[str] = None
+    motif: str
+
+
+class RapportImport(BaseModel):
+    """Bilan d'un import de participants en masse."""
+    lues: int = 0
+    importees: int = 0
+    rejetees: List[LigneRejetee] = []
@@ -1,4 +1,6 @@
 from datetime import datetime
+from enum import Enum
+from typing import Literal, Optional
 from pydantic import BaseModel, Field
 
 
@@ -29,3 +31,115 @@ class ReservationModelOut(BaseModel):
     sam: bool
     boisson: bool
     date_reservation: datetime = Field(..., description="Horodatage automatique de la réservation")
+
+
+class StatutReservation(str, Enum):
+    """
+    Issue d'une tentative de réservation atomique (cf. fonction SQL reserver_place).
+    """
+    OK = "ok"
+    INTROUVABLE = "introuvable"
+    PAS_OUVERT = "pas_ouvert"
+    DEJA_RESERVE = "deja_reserve"
+    COMPLET = "complet"
+    BUS_ALLER_COMPLET = "bus_aller_complet"
+    BUS_RETOUR_COMPLET = "bus_retour_complet"
+    # Refus avant la base (service d'admission, ouverture programmée)
+    ADMISSION_REQUISE = "admission_requise"
+    TROP_DE_TENTATIVES = "trop_de_tentatives"
+    # Inscription en liste d'attente (cf. fonction SQL inscrire_liste_attente)
+    EN_ATTENTE = "en_attente"
+    PLACES_LIBRES = "places_libres"
+
+
+class ResultatReservation(BaseModel):
+    """
+    Résultat typé d'une réservation : le statut, et la réservation créée si statut == OK.
+    """
+    statut: StatutReservation
+    reservation: Optional[ReservationModelOut] = None
+    # TROP_DE_TENTATIVES : délai avant une nouvelle tentative, en secondes
+    reessayer_dans: Optional[float] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.statut == StatutReservation.OK
+
+
+class InscritModelOut(BaseModel):
+    """
+    Ligne de la liste des inscrits à un événement : la réservation, son auteur
+    et l'éventuel commentaire laissé (lus en une seule requête).
+    """
+    id_reservation: int
+    fk_utilisateur: int
+    nom: str
+    prenom: str
+    email: str
+    bus_aller: bool
+    bus_retour: bool
+    adherent: bool
+    sam: bool
+    boisson: bool
+    date_reservation: datetime
+    commentaire_note: Optional[int] = None
+    commentaire_avis: Optional[str] = None
+
+
+class StatsExport(BaseModel):
+    """Totaux d'un export des inscrits, calculés pendant l'écriture du fichier."""
+    lignes: int = 0
+    bus_aller: int = 0
+    bus_retour: int = 0
+    adherent: int = 0
+    sam: int = 0
+    boisson: int = 0
+
+
+class DemandeAttenteModelOut(BaseModel):
+    """
+    Demande en liste d'attente (cf. migration 004) : une place à l'événement
+    (direction None, avec les options voulues) ou une place dans le bus d'un sens
+    pour un inscrit. `position` : rang dans sa file, 1 = prochain servi.
+    """
+    id_attente: int
+    fk_utilisateur: int
+    fk_evenement: int
+    direction: Optional[Literal["aller", "retour"]] = None
+    bus_aller: bool = False
+    bus_retour: bool = False
+    adherent: bool = False
+    sam: bool = False
+    boisson: bool = False
+    date_demande: datetime
+    position: int
+
+
+class PromotionAttente(BaseModel):
+    """Demande servie lors d'une libération de place : réservation créée (ou bus ajouté)."""
+    id_utilisateur: int
+    id_reservation: int
+    direction: Optional[Literal["aller", "retour"]] = None
+
+
+class StatutAdmission(str, Enum):
+    """Situation d'un utilisateur dans la file d'admission d'un événement (ouverture programmée)."""
+    PAS_OUVERT = "pas_ouvert"
+    EN_ATTENTE = "en_attente"
+    ADMIS = "admis"
+    COMPLET = "complet"
+
+
+class AdmissionModelOut(BaseModel):
+    """
+    Réponse de la file d'admission. `position` : rang dans la file (les arrivées
+    avant l'ouverture sont classées par tirage au sort) ; `attente` : délai estimé
+    avant l'ouverture ou l'admission, en secondes ; `jeton` : jeton de réservation
+    signé, délivré à l'admission et à présenter avec la réservation.
+    """
+    id_evenement: int
+    statut: StatutAdmission
+    ouverture: Optional[datetime] = None
+    position: Optional[int] = None
+    attente: float = 0.0
+    jeton: Optional[str] = None
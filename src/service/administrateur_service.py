@@ -2,6 +2,7 @@
 from typing import List, Optional
 
 from dao.administrateur_dao import AdministrateurDao
+from model.pagination_models import PageCurseur
 from model.utilisateur_models import AdministrateurModelOut, AdministrateurModelIn
 
 
@@ -18,6 +19,10 @@ class AdministrateurService:
     def get_all_admins(self, limit: int = 100, offset: int = 0) -> List[AdministrateurModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_admins_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[AdministrateurModelOut]:
+        """Page d'administrateurs suivant `curseur` (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_admin_by_id(self, id_utilisateur: int) -> Optional[AdministrateurModelOut]:
         admin = self.dao.find_by_id(id_utilisateur)
         if not admin:
@@ -0,0 +1,242 @@
+# service/admission_service.py
+import base64
+import hashlib
+import hmac
+import json
+import os
+import random
+import secrets
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Set
+
+from model.reservation_models import (
+    AdmissionModelOut,
+    ReservationModelIn,
+    ResultatReservation,
+    StatutAdmission,
+    StatutReservation,
+)
+from service.evenement_service import EvenementService
+from service.reservation_service import ReservationService
+from utils.limiteur import LimiteurParCle
+
+
+@dataclass
+class FileAdmission:
+    """File d'admission d'un événement (horloge murale, secondes depuis l'epoch)."""
+    ouverture: float
+    # Arrivées avant l'ouverture, classées par tirage au sort à l'ouverture
+    salle_attente: Set[int] = field(default_factory=set)
+    rangs: Dict[int, int] = field(default_factory=dict)
+    tiree: bool = False
+
+
+class AdmissionService:
+    """
+    File d'admission des événements à ouverture programmée (champ `ouverture`).
+
+    Au lieu de laisser des milliers de clients marteler la réservation à l'heure
+    d'ouverture, chacun demande d'abord son admission (`demander`) :
+    - avant l'ouverture, il entre en salle d'attente ; à l'ouverture, la salle
+      est classée par tirage au sort (arriver 50 ms plus tôt ne donne rien) ;
+    - ensuite, les arrivées prennent rang à la suite ;
+    - les rangs sont admis au rythme d'un seau à jetons : `rafale` d'emblée,
+      puis `debit` par seconde ; l'admis reçoit un jeton de réservation signé
+      (HMAC), valable `validite` secondes ;
+    - dès que l'événement est complet, la file répond COMPLET (liste d'attente).
+
+    `reserver` exige ce jeton pour un événement à ouverture programmée, et
+    limite les tentatives de chaque utilisateur (seau à jetons par utilisateur)
+    avant tout accès à la base.
+
+    La file (rangs, tirage, débit) vit dans le processus : une seule file par
+    événement suppose un seul processus qui réponde aux demandes d'admission.
+    Avec plusieurs workers uvicorn, chacun tiendrait sa propre file (débit
+    multiplié, rang différent d'un worker à l'autre) : la route d'admission
+    doit alors être servie par une instance à un seul worker. Le jeton étant
+    signé, tout worker qui partage ADMISSION_SECRET_KEY l'accepte ; l'API
+    refuse de démarrer sans cette clé (`verifier_configuration`).
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      ADMISSION_DEBIT             admissions par seconde après la rafale (défaut 20)
+      ADMISSION_RAFALE            admissions immédiates à l'ouverture (défaut 50)
+      ADMISSION_VALIDITE          validité du jeton de réservation, en secondes (défaut 120)
+      ADMISSION_SECRET_KEY        clé de signature des jetons, obligatoire pour l'API
+                                  (défaut hors API : tirée au hasard pour le processus)
+      LIMITE_TENTATIVES_DEBIT     tentatives de réservation par seconde et par utilisateur (défaut 0.5)
+      LIMITE_TENTATIVES_RAFALE    tentatives consécutives permises (défaut 3)
+    """
+
+    # Files gardées après l'ouverture (au-delà, l'ouverture est passée depuis longtemps)
+    DUREE_FILE = 24 * 3600
+    # Délai maximal conseillé entre deux rappels de `demander`, même loin dans la
+    # file : un client apprend vite que l'événement est complet
+    RAPPEL_MAX = 5.0
+
+    def __init__(
+        self,
+        debit: Optional[float] = None,
+        rafale: Optional[int] = None,
+        validite: Optional[float] = None,
+        horloge: Callable[[], float] = time.time,
+    ):
+        self.debit = debit or float(os.getenv("ADMISSION_DEBIT", "20"))
+        self.rafale = rafale if rafale is not None else int(os.getenv("ADMISSION_RAFALE", "50"))
+        self.validite = validite or float(os.getenv("ADMISSION_VALIDITE", "120"))
+        self.limiteur = LimiteurParCle(
+            debit=float(os.getenv("LIMITE_TENTATIVES_DEBIT", "0.5")),
+            capacite=float(os.getenv("LIMITE_TENTATIVES_RAFALE", "3")),
+        )
+        self._horloge = horloge
+        self._files: Dict[int, FileAdmission] = {}
+        self._lock = threading.Lock()
+        self._tirage = random.SystemRandom()
+        self.evenement_service = EvenementService()
+        self.reservation_service = ReservationService()
+
+    # ---------- File ----------
+    def demander(self, id_utilisateur: int, id_evenement: int) -> AdmissionModelOut:
+        """
+        Place l'utilisateur dans la file de l'événement (ou l'y retrouve) et
+        retourne sa situation. Sans effet de bord en base : un client peut
+        rappeler `demander` après `attente` secondes jusqu'à son admission.
+        """
+        evenement = self.evenement_service.get_event_by_id(id_evenement)
+        reponse = AdmissionModelOut(id_evenement=id_evenement, statut=StatutAdmission.ADMIS,
+                                    ouverture=evenement.ouverture)
+        maintenant = self._horloge()
+
+        if evenement.ouverture is None:
+            # Pas d'ouverture programmée : pas de file
+            reponse.jeton = self.creer_jeton(id_utilisateur, id_evenement)
+            return reponse
+
+        ouverture = evenement.ouverture.timestamp()
+        with self._lock:
+            file = self._file(id_evenement, ouverture, maintenant)
+            if maintenant < ouverture:
+                file.salle_attente.add(id_utilisateur)
+                reponse.statut = StatutAdmission.PAS_OUVERT
+                reponse.attente = ouverture - maintenant
+                return reponse
+            rang = self._rang(file, id_utilisateur)
+
+        reponse.position = rang
+        if self.reservation_service.get_nb_inscrits_evenement(id_evenement) >= evenement.capacite:
+            reponse.statut = StatutAdmission.COMPLET
+            return reponse
+
+        # Seau à jetons de la file : `rafale` admis à l'ouverture, puis `debit` par seconde
+        admis = self.rafale + (maintenant - ouverture) * self.debit
+        if rang <= admis:
+            reponse.jeton = self.creer_jeton(id_utilisateur, id_evenement)
+        else:
+            reponse.statut = StatutAdmission.EN_ATTENTE
+            reponse.attente = (rang - admis) / self.debit
+        return reponse
+
+    def _file(self, id_evenement: int, ouverture: float, maintenant: float) -> FileAdmission:
+        """File de l'événement, recréée si l'ouverture a été déplacée (sous verrou)."""
+        file = self._files.get(id_evenement)
+        if file is None or file.ouverture != ouverture:
+            for id_evt in [i for i, f in self._files.items() if f.ouverture < maintenant - self.DUREE_FILE]:
+                del self._files[id_evt]
+            file = self._files[id_evenement] = FileAdmission(ouverture=ouverture)
+        return file
+
+    def _rang(self, file: FileAdmission, id_utilisateur: int) -> int:
+        """Rang de l'utilisateur, attribué à sa première demande après l'ouverture (sous verrou)."""
+        if not file.tiree:
+            tirage = sorted(file.salle_attente)
+            self._tirage.shuffle(tirage)
+            for id_attente in tirage:
+                file.rangs[id_attente] = len(file.rangs) + 1
+            file.salle_attente = set()
+            file.tiree = True
+        return file.rangs.setdefault(id_utilisateur, len(file.rangs) + 1)
+
+    # ---------- Jetons de réservation ----------
+    @staticmethod
+    def verifier_configuration() -> None:
+        """
+        Lève RuntimeError si ADMISSION_SECRET_KEY n'est pas définie : chaque
+        worker tirerait sa propre clé et refuserait les jetons des autres.
+        """
+        if not os.getenv("ADMISSION_SECRET_KEY"):
+            raise RuntimeError(
+                "ADMISSION_SECRET_KEY n'est pas définie : tous les workers de l'API "
+                "doivent partager la clé de signature des jetons d'admission."
+            )
+
+    @staticmethod
+    def _cle() -> bytes:
+        """Clé de signature (ADMISSION_SECRET_KEY), tirée au hasard et placée dans l'environnement à défaut."""
+        cle = os.getenv("ADMISSION_SECRET_KEY")
+        if not cle:
+            cle = secrets.token_urlsafe(32)
+            os.environ["ADMISSION_SECRET_KEY"] = cle
+        return cle.encode("utf-8")
+
+    def creer_jeton(self, id_utilisateur: int, id_evenement: int) -> str:
+        """Jeton de réservation signé : utilisateur, événement, expiration."""
+        corps = base64.urlsafe_b64encode(json.dumps(
+            {"sub": id_utilisateur, "evt": id_evenement, "exp": int(self._horloge() + self.validite)},
+            separators=(",", ":"),
+        ).encode("utf-8")).rstrip(b"=").decode("ascii")
+        signature = hmac.new(self._cle(), corps.encode("ascii"), hashlib.sha256).hexdigest()
+        return f"{corps}.{signature}"
+
+    def verifier_jeton(self, jeton: Optional[str], id_utilisateur: int, id_evenement: int) -> bool:
+        """Vrai si le jeton est intègre, non expiré, et délivré à cet utilisateur pour cet événement."""
+        if not jeton or "." not in jeton:
+            return False
+        corps, signature = jeton.rsplit(".", 1)
+        attendu = hmac.new(self._cle(), corps.encode("ascii", "replace"), hashlib.sha256).hexdigest()
+        if not hmac.compare_digest(signature, attendu):
+            return False
+        try:
+            contenu = json.loads(base64.urlsafe_b64decode(corps + "=" * (-len(corps) % 4)))
+        except ValueError:
+            return False
+        return (
+            contenu.get("sub") == id_utilisateur
+            and contenu.get("evt") == id_evenement
+            and contenu.get("exp", 0) >= self._horloge()
+        )
+
+    # ---------- Réservation ----------
+    def reserver(self, reservation_in: ReservationModelIn, jeton: Optional[str] = None) -> ResultatReservation:
+        """
+        Réservation derrière la file : limite de tentatives par utilisateur,
+        puis jeton d'admission exigé si l'événement a une ouverture programmée.
+        Même contrat que ReservationService.reserver.
+        """
+        attente = self.limiteur.autoriser(reservation_in.fk_utilisateur)
+        if attente:
+            return ResultatReservation(statut=StatutReservation.TROP_DE_TENTATIVES, reessayer_dans=attente)
+
+        try:
+            evenement = self.evenement_service.get_event_by_id(reservation_in.fk_evenement)
+        except ValueError:
+            return ResultatReservation(statut=StatutReservation.INTROUVABLE)
+        if evenement.ouverture is not None and not self.verifier_jeton(
+            jeton, reservation_in.fk_utilisateur, reservation_in.fk_evenement
+        ):
+            return ResultatReservation(statut=StatutReservation.ADMISSION_REQUISE)
+
+        return self.reservation_service.reserver(reservation_in)
+
+
+_admission: Optional[AdmissionService] = None
+_admission_lock = threading.Lock()
+
+
+def admission_service() -> AdmissionService:
+    """File d'admission partagée par le processus (créée à la première utilisation)."""
+    global _admission
+    with _admission_lock:
+        if _admission is None:
+            _admission = AdmissionService()
+        return _admission
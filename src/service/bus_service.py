@@ -3,6 +3,8 @@ from typing import List, Optional
 
 from dao.creneau_bus_dao import CreneauBusDao
 from model.creneauBus_models import CreneauBusModelIn, CreneauBusModelOut
+from model.pagination_models import PageCurseur
+from service.cache_evenements import CacheEvenements
 
 
 class BusService:
@@ -13,6 +15,7 @@ class BusService:
 
     def __init__(self):
         self.dao = CreneauBusDao()
+        self.cache = CacheEvenements()
 
     def ajouter_bus_evenement(
         self, 
@@ -57,13 +60,15 @@ class BusService:
         """
         Récupère la capacité totale pour une direction donnée via le DAO.
         """
-        return self.dao.get_capacite_totale(id_evenement, direction)
+        return self.cache.capacite(
+            id_evenement, direction, lambda: self.dao.get_capacite_totale(id_evenement, direction)
+        )
     
     def get_buses_for_event(self, id_evenement: int) -> list[CreneauBusModelOut]:
         """
         Récupère la liste des objets Bus pour un événement.
         """
-        return self.dao.find_by_event_id(id_evenement)
+        return self.cache.bus(id_evenement, lambda: self.dao.find_by_event_id(id_evenement))
 
     # ---------- CRUD ----------
 
@@ -81,6 +86,7 @@ class BusService:
             raise ValueError(f"Un bus avec la description '{bus_in.description}' existe déjà.")
 
         created = self.dao.create(bus_in)
+        self.cache.invalider_bus(bus_in.fk_evenement)
         if not created:
             raise ValueError("Erreur lors de la création du bus.")
         return created
@@ -90,6 +96,10 @@ class BusService:
         """Retourne la liste paginée de tous les bus."""
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_buses_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[CreneauBusModelOut]:
+        """Page de bus suivant `curseur` (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_bus_by_id(self, id_bus: int) -> CreneauBusModelOut:
         """Retourne un bus par son ID, ou lève une erreur si non trouvé."""
         bus = self.dao.find_by_id(id_bus)
@@ -122,6 +132,9 @@ class BusService:
             raise ValueError(f"Un autre bus utilise déjà la description '{bus.description}'.")
 
         updated = self.dao.update(bus, id_bus)
+        self.cache.invalider_bus(existing.fk_evenement)
+        if bus.fk_evenement != existing.fk_evenement:
+            self.cache.invalider_bus(bus.fk_evenement)
         if not updated:
             raise ValueError("Erreur lors de la mise à jour du bus.")
         return updated
@@ -136,6 +149,7 @@ class BusService:
             raise ValueError("Bus introuvable pour mise à jour du nombre de places.")
         
         updated = self.dao.update_places(id_bus, nombre_places)
+        self.cache.invalider_bus(existing.fk_evenement)
         if not updated:
             raise ValueError("Erreur lors de la mise à jour du nombre de places.")
         return updated
@@ -146,7 +160,9 @@ class BusService:
         existing = self.dao.find_by_id(id_bus)
         if not existing:
             raise ValueError("Impossible de supprimer : bus introuvable.")
-        return self.dao.delete(id_bus)
+        ok = self.dao.delete(id_bus)
+        self.cache.invalider_bus(existing.fk_evenement)
+        return ok
 
     # ---------- HELPERS ----------
     def count_buses_for_event(self, id_evenement: int) -> int:
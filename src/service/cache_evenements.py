@@ -0,0 +1,113 @@
+# service/cache_evenements.py
+import os
+from typing import Any, Callable, List, Optional
+
+from business_object.compacts import CreneauBusCompact, EvenementCompact
+from model.creneauBus_models import CreneauBusModelOut
+from model.evenement_models import EvenementModelOut
+from utils.cache import cache, lire_ou_charger
+
+DIRECTIONS = ("aller", "retour")
+
+
+class CacheEvenements:
+    """
+    Lectures mises en cache par événement (utils.cache) et leurs invalidations.
+
+    Clés (une par donnée et par événement) :
+      evt:<id>                  fiche de l'événement
+      evt:<id>:bus              créneaux de bus
+      evt:<id>:capacite:<dir>   capacité totale des bus 'aller' / 'retour'
+      evt:<id>:inscrits         nombre d'inscrits
+      evt:<id>:prises:<dir>     places de bus prises
+
+    La fiche et les bus sont gardés sous forme compacte (business_object.compacts :
+    sans état pydantic, plus petits une fois sérialisés pour Redis) et redonnés en
+    modèles de sortie à chaque lecture : l'appelant reçoit sa propre copie.
+    Ils changent rarement : ils gardent la durée de vie du cache (CACHE_TTL).
+
+    Les compteurs de réservations changent à chaque inscription, y compris
+    depuis d'autres processus : ils ne sont gardés que CACHE_TTL_COMPTEURS
+    secondes (défaut 5). Les écritures passant par les services invalident
+    immédiatement les clés de l'événement concerné, et seulement celles-là.
+    """
+
+    def __init__(self):
+        self.ttl_compteurs = float(os.getenv("CACHE_TTL_COMPTEURS", "5"))
+
+    # ---------- Clés ----------
+    @staticmethod
+    def cle_evenement(id_evenement: int) -> str:
+        return f"evt:{id_evenement}"
+
+    @staticmethod
+    def cle_bus(id_evenement: int) -> str:
+        return f"evt:{id_evenement}:bus"
+
+    @staticmethod
+    def cle_capacite(id_evenement: int, direction: str) -> str:
+        return f"evt:{id_evenement}:capacite:{direction}"
+
+    @staticmethod
+    def cle_inscrits(id_evenement: int) -> str:
+        return f"evt:{id_evenement}:inscrits"
+
+    @staticmethod
+    def cle_places_prises(id_evenement: int, direction: str) -> str:
+        return f"evt:{id_evenement}:prises:{direction}"
+
+    # ---------- Lectures ----------
+    def evenement(
+        self, id_evenement: int, charger: Callable[[], Optional[EvenementModelOut]]
+    ) -> Optional[EvenementModelOut]:
+        def compacter():
+            evt = charger()
+            return None if evt is None else EvenementCompact.depuis(evt)
+
+        compact = lire_ou_charger(self.cle_evenement(id_evenement), compacter)
+        return None if compact is None else compact.vers_modele()
+
+    def bus(
+        self, id_evenement: int, charger: Callable[[], List[CreneauBusModelOut]]
+    ) -> List[CreneauBusModelOut]:
+        compacts = lire_ou_charger(
+            self.cle_bus(id_evenement), lambda: [CreneauBusCompact.depuis(b) for b in charger()]
+        )
+        return [b.vers_modele() for b in compacts]
+
+    def capacite(self, id_evenement: int, direction: str, charger: Callable[[], Any]) -> Any:
+        return lire_ou_charger(self.cle_capacite(id_evenement, direction), charger)
+
+    def inscrits(self, id_evenement: int, charger: Callable[[], Any]) -> Any:
+        return lire_ou_charger(self.cle_inscrits(id_evenement), charger, self.ttl_compteurs)
+
+    def places_prises(self, id_evenement: int, direction: str, charger: Callable[[], Any]) -> Any:
+        return lire_ou_charger(self.cle_places_prises(id_evenement, direction), charger, self.ttl_compteurs)
+
+    # ---------- Invalidations ----------
+    def invalider_reservations(self, id_evenement: Optional[int]) -> None:
+        """Une réservation de l'événement a été créée, modifiée ou supprimée."""
+        if id_evenement is None:
+            return
+        cache().supprimer(
+            self.cle_inscrits(id_evenement),
+            *(self.cle_places_prises(id_evenement, d) for d in DIRECTIONS),
+        )
+
+    def invalider_bus(self, id_evenement: Optional[int]) -> None:
+        """
+        Un bus de l'événement a été créé, modifié ou supprimé. Les compteurs de
+        réservations aussi : des places ajoutées servent la liste d'attente.
+        """
+        if id_evenement is None:
+            return
+        cache().supprimer(
+            self.cle_bus(id_evenement),
+            *(self.cle_capacite(id_evenement, d) for d in DIRECTIONS),
+        )
+        self.invalider_reservations(id_evenement)
+
+    def invalider_evenement(self, id_evenement: int) -> None:
+        """L'événement a été modifié ou supprimé : toutes ses entrées."""
+        cache().supprimer(self.cle_evenement(id_evenement))
+        self.invalider_bus(id_evenement)
@@ -1,9 +1,11 @@
 # service/consultation_evenement_service.py
-from typing import List, Optional, Dict, Any
+from typing import Iterable, List, Optional, Dict, Any
 from datetime import date
 
 from dao.consultation_evenement_dao import ConsultationEvenementDao
-from model.evenement_models import EvenementModelOut
+from dao_async.consultation_evenement_dao import ConsultationEvenementDaoAsync
+from model.evenement_models import DisponibiliteModelOut, EvenementModelOut, ResultatRechercheModelOut
+from model.pagination_models import PageCurseur
 
 
 class ConsultationEvenementService:
@@ -61,6 +63,33 @@ class ConsultationEvenementService:
             offset=offset,
         )
 
+    # ---------- RECHERCHE LIBRE ----------
+    def rechercher_texte(
+        self,
+        texte: str,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[ResultatRechercheModelOut]:
+        """
+        Recherche libre dans le titre, la ville, la catégorie et la description,
+        triée par pertinence. Tolère les fautes de frappe sur le titre et la
+        ville si l'extension pg_trgm est installée.
+        """
+        texte = self._valider_texte(texte, date_min, date_max)
+        return self.dao.rechercher_texte(
+            texte,
+            categorie=categorie,
+            statut=statut,
+            date_min=date_min,
+            date_max=date_max,
+            limit=limit,
+            offset=offset,
+        )
+
     # ---------- LISTE AVEC PLACES RESTANTES ----------
     def lister_avec_places_restantes(
         self,
@@ -80,7 +109,83 @@ class ConsultationEvenementService:
             a_partir_du=a_partir_du,
         )
 
+    # ---------- LISTES PAGINÉES PAR CURSEUR ----------
+    # Passer `curseur=None` pour la première page, puis le curseur_suivant de la
+    # page précédente (avec les mêmes filtres). Jeton invalide : ValueError.
+    def lister_tous_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur:
+        """Tous les événements avec leurs stats, par date puis id."""
+        return self.dao.lister_tous_page(limit=limit, curseur=curseur)
+
+    def lister_disponibles_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """Événements disponibles, par date puis id."""
+        return self.dao.lister_disponibles_page(limit=limit, curseur=curseur, a_partir_du=a_partir_du)
+
+    def rechercher_page(
+        self,
+        ville: Optional[str] = None,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+    ) -> PageCurseur:
+        """Recherche multi-filtres, par date puis id."""
+        if date_min and date_max and date_min > date_max:
+            raise ValueError("La date minimale ne peut pas être postérieure à la date maximale.")
+        return self.dao.rechercher_page(
+            ville=ville,
+            categorie=categorie,
+            statut=statut,
+            date_min=date_min,
+            date_max=date_max,
+            limit=limit,
+            curseur=curseur,
+        )
+
+    def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """Événements avec places restantes et avis, par date puis id."""
+        return self.dao.lister_avec_places_restantes_page(
+            limit=limit,
+            curseur=curseur,
+            seulement_disponibles=seulement_disponibles,
+            a_partir_du=a_partir_du,
+        )
+
+    # ---------- DISPONIBILITÉS ----------
+    def disponibilites(self, ids_evenements: Iterable[int]) -> Dict[int, DisponibiliteModelOut]:
+        """
+        Places restantes du lieu et des bus (aller, retour) pour plusieurs
+        événements en un seul aller-retour, indexées par id d'événement.
+        Lecture directe (sans cache) : de quoi afficher une page entière de
+        disponibilités à jour. Les ids inconnus sont absents du résultat.
+        """
+        return self.dao.disponibilites(sorted(set(ids_evenements)))
+
     # ---------- VALIDATION INTERNE ----------
+    @staticmethod
+    def _valider_texte(texte: str, date_min: Optional[date], date_max: Optional[date]) -> str:
+        """Texte de la recherche libre, nettoyé ; ValueError s'il est vide ou trop long."""
+        texte = (texte or "").strip()
+        if not texte:
+            raise ValueError("Le texte recherché ne peut pas être vide.")
+        if len(texte) > 200:
+            raise ValueError("Le texte recherché est trop long (200 caractères maximum).")
+        if date_min and date_max and date_min > date_max:
+            raise ValueError("La date minimale ne peut pas être postérieure à la date maximale.")
+        return texte
+
     def _validate_order_by(self, order_by: str) -> None:
         """Valide le champ de tri pour éviter les injections SQL."""
         champs_valides = {
@@ -97,3 +202,71 @@ class ConsultationEvenementService:
             # Vérifie que les noms de colonnes appartiennent à la liste blanche
             if token.lower() not in {"asc", "desc"} and token not in champs_valides:
                 raise ValueError(f"Champ de tri invalide : {token}")
+
+
+class ConsultationEvenementServiceAsync:
+    """
+    Pendant asynchrone des lectures les plus sollicitées à l'ouverture d'un
+    shotgun (liste avec places restantes, recherche libre, disponibilités),
+    au-dessus des DAO asynchrones (dao_async) : l'API les sert sans occuper
+    un thread par requête. Mêmes validations que ConsultationEvenementService.
+    """
+
+    def __init__(self):
+        self.dao = ConsultationEvenementDaoAsync()
+
+    async def lister_avec_places_restantes(
+        self,
+        limit: int = 100,
+        offset: int = 0,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> List[Dict[str, Any]]:
+        """Voir ConsultationEvenementService.lister_avec_places_restantes."""
+        return await self.dao.lister_avec_places_restantes(
+            limit=limit,
+            offset=offset,
+            seulement_disponibles=seulement_disponibles,
+            a_partir_du=a_partir_du,
+        )
+
+    async def lister_avec_places_restantes_page(
+        self,
+        limit: int = 100,
+        curseur: Optional[str] = None,
+        seulement_disponibles: bool = True,
+        a_partir_du: Optional[date] = None,
+    ) -> PageCurseur:
+        """Voir ConsultationEvenementService.lister_avec_places_restantes_page."""
+        return await self.dao.lister_avec_places_restantes_page(
+            limit=limit,
+            curseur=curseur,
+            seulement_disponibles=seulement_disponibles,
+            a_partir_du=a_partir_du,
+        )
+
+    async def rechercher_texte(
+        self,
+        texte: str,
+        categorie: Optional[str] = None,
+        statut: Optional[str] = None,
+        date_min: Optional[date] = None,
+        date_max: Optional[date] = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> List[ResultatRechercheModelOut]:
+        """Voir ConsultationEvenementService.rechercher_texte."""
+        texte = ConsultationEvenementService._valider_texte(texte, date_min, date_max)
+        return await self.dao.rechercher_texte(
+            texte,
+            categorie=categorie,
+            statut=statut,
+            date_min=date_min,
+            date_max=date_max,
+            limit=limit,
+            offset=offset,
+        )
+
+    async def disponibilites(self, ids_evenements: Iterable[int]) -> Dict[int, DisponibiliteModelOut]:
+        """Voir ConsultationEvenementService.disponibilites."""
+        return await self.dao.disponibilites(sorted(set(ids_evenements)))
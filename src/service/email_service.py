@@ -0,0 +1,174 @@
+# src/service/email_service.py
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import requests
+
+from dao.email_outbox_dao import EmailOutboxDao
+from model.email_models import EmailModelOut, StatutEmail
+from utils.api_brevo import BrevoClient
+
+logger = logging.getLogger(__name__)
+
+
+class EmailService:
+    """
+    Service d'envoi des e-mails.
+    Les messages sont déposés dans la file d'envoi (table email_outbox) :
+    l'appelant ne dépend ni de la latence ni de la disponibilité de Brevo.
+    L'envoi effectif est fait par DispatcheurEmails.
+    """
+
+    def __init__(self):
+        self.dao = EmailOutboxDao()
+
+    def programmer(self, destinataires: Iterable[str], sujet: str, contenu: str) -> int:
+        """
+        Dépose le message pour chaque destinataire (doublons et adresses vides ignorés).
+        Retourne le nombre de messages mis en file.
+        """
+        if not sujet or not sujet.strip():
+            raise ValueError("Le sujet de l'e-mail est obligatoire.")
+
+        uniques = list(dict.fromkeys(d.strip() for d in destinataires if d and d.strip()))
+        return len(self.dao.ajouter(uniques, sujet, contenu))
+
+    def statistiques(self) -> Dict[StatutEmail, int]:
+        """Nombre de messages de la file par statut."""
+        return self.dao.compter_par_statut()
+
+
+class DispatcheurEmails:
+    """
+    Vide la file d'envoi vers Brevo.
+
+    À chaque cycle : réserve un lot de messages dus, regroupe ceux qui partagent
+    sujet et contenu (une requête Brevo pour tout le groupe), envoie les groupes
+    en parallèle (au plus `envois_paralleles` requêtes simultanées), puis
+    enregistre le statut de chaque message :
+      - 2xx : 'envoye' ;
+      - 429, 5xx ou erreur réseau : nouvel essai après un délai exponentiel,
+        'echec' après `max_tentatives` ;
+      - autre 4xx : 'echec' immédiat (requête refusée, inutile de réessayer).
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      EMAIL_TAILLE_LOT        messages réservés par cycle (défaut 500)
+      EMAIL_ENVOIS_PARALLELES requêtes Brevo simultanées (défaut 4)
+      EMAIL_MAX_TENTATIVES    tentatives avant abandon (défaut 5)
+      EMAIL_DELAI_BASE        délai avant le 1er nouvel essai, en secondes (défaut 30)
+      EMAIL_DELAI_MAX         plafond du délai entre deux essais, en secondes (défaut 3600)
+      EMAIL_INTERVALLE        attente entre deux cycles quand la file est vide (défaut 5)
+      EMAIL_VERROU_EXPIRE     délai après lequel un lot réservé non traité est libéré,
+                              ou abandonné après max_tentatives (défaut 300)
+    """
+
+    def __init__(
+        self,
+        client: Optional[BrevoClient] = None,
+        taille_lot: Optional[int] = None,
+        envois_paralleles: Optional[int] = None,
+        max_tentatives: Optional[int] = None,
+        delai_base: Optional[float] = None,
+        delai_max: Optional[float] = None,
+        intervalle: Optional[float] = None,
+        verrou_expire: Optional[float] = None,
+    ):
+        self.dao = EmailOutboxDao()
+        self.envois_paralleles = envois_paralleles or int(os.getenv("EMAIL_ENVOIS_PARALLELES", "4"))
+        self.client = client or BrevoClient(max_connexions=self.envois_paralleles)
+        self.taille_lot = taille_lot or int(os.getenv("EMAIL_TAILLE_LOT", "500"))
+        self.max_tentatives = max_tentatives or int(os.getenv("EMAIL_MAX_TENTATIVES", "5"))
+        self.delai_base = delai_base if delai_base is not None else float(os.getenv("EMAIL_DELAI_BASE", "30"))
+        self.delai_max = delai_max if delai_max is not None else float(os.getenv("EMAIL_DELAI_MAX", "3600"))
+        self.intervalle = intervalle if intervalle is not None else float(os.getenv("EMAIL_INTERVALLE", "5"))
+        self.verrou_expire = verrou_expire or float(os.getenv("EMAIL_VERROU_EXPIRE", "300"))
+
+        self._arret = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ---------- Un cycle ----------
+    def _grouper(self, messages: List[EmailModelOut]) -> List[Tuple[List[int], List[str], str, str]]:
+        """Regroupe les messages identiques en envois d'au plus MAX_DESTINATAIRES destinataires."""
+        groupes: Dict[Tuple[str, str], List[EmailModelOut]] = {}
+        for m in messages:
+            groupes.setdefault((m.sujet, m.contenu), []).append(m)
+
+        envois = []
+        taille = self.client.MAX_DESTINATAIRES
+        for (sujet, contenu), membres in groupes.items():
+            for i in range(0, len(membres), taille):
+                tranche = membres[i:i + taille]
+                envois.append(([m.id_email for m in tranche], [m.destinataire for m in tranche], sujet, contenu))
+        return envois
+
+    def _envoyer(self, ids: List[int], destinataires: List[str], sujet: str, contenu: str) -> None:
+        """Envoie un groupe et enregistre le résultat pour chacun de ses messages."""
+        try:
+            reponse = self.client.envoyer_lot(destinataires, sujet, contenu)
+        except requests.RequestException as exc:
+            self.dao.replanifier(ids, f"Erreur réseau : {exc}", self.max_tentatives, self.delai_base, self.delai_max)
+            return
+
+        if reponse.ok:
+            message_ids = reponse.message_ids if len(reponse.message_ids) == len(ids) else [None] * len(ids)
+            self.dao.marquer_envoyes(zip(ids, message_ids))
+        elif reponse.status == 429 or reponse.status >= 500:
+            erreur = f"HTTP {reponse.status} : {reponse.texte[:500]}"
+            self.dao.replanifier(ids, erreur, self.max_tentatives, self.delai_base, self.delai_max)
+        else:
+            self.dao.marquer_echec(ids, f"HTTP {reponse.status} : {reponse.texte[:500]}")
+
+    def traiter_une_fois(self) -> int:
+        """Traite un lot de la file. Retourne le nombre de messages réservés (0 si rien à faire)."""
+        self.dao.liberer_verrous_expires(self.verrou_expire, self.max_tentatives)
+        messages = self.dao.reserver_lot(self.taille_lot)
+        if not messages:
+            return 0
+
+        envois = self._grouper(messages)
+        with ThreadPoolExecutor(max_workers=min(self.envois_paralleles, len(envois))) as executor:
+            futures = [executor.submit(self._envoyer, *envoi) for envoi in envois]
+        for future, (ids, *_reste) in zip(futures, envois):
+            if future.exception() is not None:
+                # Erreur inattendue (base, bug) : le verrou expirera et le lot sera repris
+                logger.error("Envoi des e-mails %s interrompu : %s", ids, future.exception())
+        return len(messages)
+
+    # ---------- Tâche de fond ----------
+    def _boucle(self) -> None:
+        while not self._arret.is_set():
+            try:
+                traites = self.traiter_une_fois()
+            except Exception:
+                logger.exception("Dispatcher d'e-mails : cycle en erreur")
+                traites = 0
+            # Lot plein : il en reste probablement, on enchaîne sans attendre
+            if traites < self.taille_lot:
+                self._arret.wait(self.intervalle)
+
+    def demarrer(self) -> None:
+        """Lance le dispatcher dans un thread de fond (sans effet s'il tourne déjà)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._arret.clear()
+        self._thread = threading.Thread(target=self._boucle, name="dispatcheur-emails", daemon=True)
+        self._thread.start()
+
+    def arreter(self, timeout: Optional[float] = None) -> None:
+        """Demande l'arrêt du thread et attend la fin du cycle en cours."""
+        self._arret.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    @staticmethod
+    def active() -> bool:
+        """
+        Le dispatcher n'est lancé que si Brevo est configuré (TOKEN_BREVO)
+        et qu'il n'a pas été désactivé (EMAIL_DISPATCHER=0) ; sinon les
+        messages restent en file pour un autre processus.
+        """
+        return bool(os.getenv("TOKEN_BREVO")) and os.getenv("EMAIL_DISPATCHER", "1") != "0"
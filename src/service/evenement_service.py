@@ -2,9 +2,12 @@
 from typing import List, Optional
 from dao.evenement_dao import EvenementDao
 from model.evenement_models import EvenementModelIn, EvenementModelOut
+from model.pagination_models import PageCurseur
+
+from service.cache_evenements import CacheEvenements
 
 from service.participant_service import ParticipantService
-from utils.api_brevo import send_email_brevo
+from service.email_service import EmailService
 
 
 class EvenementService:
@@ -17,15 +20,21 @@ class EvenementService:
         self.dao = EvenementDao()
         #from service.participant_service import ParticipantService
         self.participant_service = ParticipantService()
+        self.email_service = EmailService()
+        self.cache = CacheEvenements()
 
     # ---------- READ ----------
     def get_all_events(self, limit: int = 100, offset: int = 0) -> List[EvenementModelOut]:
         """Récupère tous les événements (paginés)."""
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_events_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[EvenementModelOut]:
+        """Page d'événements suivant `curseur` (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_event_by_id(self, id_evenement: int) -> EvenementModelOut:
         """Récupère un événement par son ID, ou lève une erreur s’il n’existe pas."""
-        event = self.dao.find_by_id(id_evenement)
+        event = self.cache.evenement(id_evenement, lambda: self.dao.find_by_id(id_evenement))
         if not event:
             raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
         return event
@@ -79,17 +88,9 @@ class EvenementService:
                 f"L’événement est actuellement **{evt_out.statut}**.\n\n"
                 "— L’équipe du BDE Ensai"
             )
-            envoyes = 0
-            for email in emails:
-                status, _ = send_email_brevo(
-                    to_email=email,
-                    subject=subject,
-                    message_text=message
-                )
-                if 200 <= status < 300:
-                    envoyes += 1
-
-            print(f"[F08] Notification envoyée à {envoyes}/{len(emails)} participant(s).")
+            # Envoi par lots en tâche de fond (cf. DispatcheurEmails)
+            programmes = self.email_service.programmer(emails, subject, message)
+            print(f"[F08] Notification programmée pour {programmes} participant(s).")
 
         except Exception as e:
             print(f"[F08] Erreur lors de l’envoi des mails : {e}")
@@ -104,6 +105,7 @@ class EvenementService:
             raise ValueError("Impossible de mettre à jour : événement introuvable.")
 
         updated = self.dao.update(evenement_out)
+        self.cache.invalider_evenement(evenement_out.id_evenement)
         if not updated:
             raise ValueError("Erreur lors de la mise à jour de l'événement.")
         return updated
@@ -114,5 +116,7 @@ class EvenementService:
         existing = self.dao.find_by_id(id_evenement)
         if not existing:
             raise ValueError("Impossible de supprimer : événement introuvable.")
-        return self.dao.delete(id_evenement)
+        ok = self.dao.delete(id_evenement)
+        self.cache.invalider_evenement(id_evenement)
+        return ok
 
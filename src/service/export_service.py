@@ -0,0 +1,154 @@
+# service/export_service.py
+import csv
+import importlib.util
+import io
+from typing import BinaryIO, Iterable, Iterator, List, Optional
+
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from model.reservation_models import StatsExport
+
+
+class _Tampon:
+    """Fichier en écriture dont on récupère le contenu au fur et à mesure (flux HTTP)."""
+
+    def __init__(self):
+        self._morceaux: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._morceaux.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def vider(self) -> bytes:
+        contenu, self._morceaux = b"".join(self._morceaux), []
+        return contenu
+
+
+class ExportService:
+    """
+    Export des inscrits d'un événement (réservations avec options bus / SAM / boisson)
+    en CSV ou en Parquet, pour les transporteurs et le bar.
+
+    Les lignes sont lues par lots sur un curseur côté serveur et écrites au fil de
+    l'eau : la mémoire utilisée ne dépend pas du nombre d'inscrits.
+    Le Parquet nécessite le paquet optionnel `pyarrow`.
+    """
+
+    FORMATS = ("csv", "parquet")
+    TYPES_CONTENU = {"csv": "text/csv; charset=utf-8", "parquet": "application/vnd.apache.parquet"}
+
+    # Index des colonnes booléennes comptées dans StatsExport
+    _COLONNES_STATS = [
+        (nom, ReservationDao.COLONNES_EXPORT.index(nom))
+        for nom in ("bus_aller", "bus_retour", "adherent", "sam", "boisson")
+    ]
+
+    def __init__(self):
+        self.dao = ReservationDao()
+        self.evenement_dao = EvenementDao()
+
+    # ---------- API ----------
+    @staticmethod
+    def parquet_disponible() -> bool:
+        """True si le paquet optionnel pyarrow est installé."""
+        return importlib.util.find_spec("pyarrow") is not None
+
+    def flux(
+        self, id_evenement: int, format: str = "csv", taille_lot: int = 5000,
+        stats: Optional[StatsExport] = None, separateur: str = ",",
+    ) -> Iterator[bytes]:
+        """
+        Contenu du fichier d'export, morceau par morceau (un par lot de lignes).
+        L'événement et le format sont vérifiés immédiatement (ValueError), avant
+        toute lecture. `stats`, si fourni, est complété pendant le parcours.
+        """
+        if format not in self.FORMATS:
+            raise ValueError(f"Format d'export inconnu : {format} (attendu : {', '.join(self.FORMATS)}).")
+        if self.evenement_dao.find_by_id(id_evenement) is None:
+            raise ValueError(f"Aucun événement trouvé avec l'id {id_evenement}.")
+
+        lots = self._compter(self.dao.iter_lignes_export(id_evenement, taille_lot), stats or StatsExport())
+        if format == "parquet":
+            return self._flux_parquet(lots)
+        return self._flux_csv(lots, separateur)
+
+    def exporter(
+        self, id_evenement: int, sortie: BinaryIO, format: str = "csv",
+        taille_lot: int = 5000, separateur: str = ",",
+    ) -> StatsExport:
+        """Écrit l'export dans `sortie` (fichier ouvert en binaire) et retourne ses totaux."""
+        stats = StatsExport()
+        for morceau in self.flux(id_evenement, format, taille_lot, stats, separateur):
+            sortie.write(morceau)
+        return stats
+
+    # ---------- Helpers ----------
+    def _compter(self, lots: Iterable[List[tuple]], stats: StatsExport) -> Iterator[List[tuple]]:
+        for lot in lots:
+            stats.lignes += len(lot)
+            for nom, i in self._COLONNES_STATS:
+                setattr(stats, nom, getattr(stats, nom) + sum(1 for ligne in lot if ligne[i]))
+            yield lot
+
+    @staticmethod
+    def _flux_csv(lots: Iterable[List[tuple]], separateur: str) -> Iterator[bytes]:
+        tampon = io.StringIO()
+        ecrivain = csv.writer(tampon, delimiter=separateur)
+        ecrivain.writerow(ReservationDao.COLONNES_EXPORT)
+        for lot in lots:
+            ecrivain.writerows(lot)
+            yield tampon.getvalue().encode("utf-8")
+            tampon.seek(0)
+            tampon.truncate()
+        reste = tampon.getvalue()
+        if reste:
+            yield reste.encode("utf-8")
+
+    @staticmethod
+    def _flux_parquet(lots: Iterable[List[tuple]]) -> Iterator[bytes]:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("L'export Parquet nécessite le paquet pyarrow (pip install pyarrow).")
+
+        schema = pa.schema([
+            ("id_reservation", pa.int64()),
+            ("nom", pa.string()),
+            ("prenom", pa.string()),
+            ("email", pa.string()),
+            ("telephone", pa.string()),
+            ("bus_aller", pa.bool_()),
+            ("bus_retour", pa.bool_()),
+            ("adherent", pa.bool_()),
+            ("sam", pa.bool_()),
+            ("boisson", pa.bool_()),
+            ("date_reservation", pa.timestamp("us")),
+        ])
+        return ExportService._ecrire_parquet(lots, schema, pa, pq)
+
+    @staticmethod
+    def _ecrire_parquet(lots, schema, pa, pq) -> Iterator[bytes]:
+        """Un groupe de lignes Parquet par lot, rendu dès qu'il est écrit."""
+        tampon = _Tampon()
+        with pq.ParquetWriter(tampon, schema) as ecrivain:
+            for lot in lots:
+                colonnes = list(zip(*lot))
+                ecrivain.write_batch(pa.RecordBatch.from_arrays(
+                    [pa.array(c, type=champ.type) for c, champ in zip(colonnes, schema)], schema=schema
+                ))
+                yield tampon.vider()
+        yield tampon.vider()
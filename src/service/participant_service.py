@@ -1,8 +1,13 @@
 # service/participant_service.py
-from typing import List, Optional
+import csv
+from typing import IO, List, Optional
+
+from pydantic import ValidationError
 
 from dao.participant_dao import ParticipantDao
-from model.participant_models import ParticipantModelIn, ParticipantModelOut
+from model.pagination_models import PageCurseur
+from model.participant_models import LigneRejetee, ParticipantModelIn, ParticipantModelOut, RapportImport
+from utils.securite import hacheur
 
 
 class ParticipantService:
@@ -18,6 +23,10 @@ class ParticipantService:
     def get_all_participants(self, limit: int = 100, offset: int = 0) -> List[ParticipantModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_participants_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[ParticipantModelOut]:
+        """Page de participants suivant `curseur` (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_participant_by_id(self, id_utilisateur: int) -> ParticipantModelOut:
         participant = self.dao.find_by_id(id_utilisateur)
         if not participant:
@@ -38,6 +47,82 @@ class ParticipantService:
             raise ValueError(f"L'email '{participant_in.email}' est déjà utilisé.")
         return self.dao.create(participant_in)
 
+    def importer_csv(self, fichier: IO[str], separateur: str = ",", taille_lot: int = 1000) -> RapportImport:
+        """
+        Importe en masse les participants d'un fichier CSV (export d'une promotion).
+
+        En-tête attendu : nom, prenom, email, mot_de_passe et, optionnellement, telephone.
+        Le fichier est lu au fil de l'eau, par lots de `taille_lot` lignes valides :
+        chaque lot est dédoublonné (emails du fichier et de la base), ses mots de passe
+        sont hashés en parallèle par le pool bcrypt, puis il est chargé par COPY.
+        Les lignes invalides ou en double sont listées dans le rapport, pas importées.
+        """
+        lecteur = csv.DictReader(fichier, delimiter=separateur)
+        manquantes = {"nom", "prenom", "email", "mot_de_passe"} - set(lecteur.fieldnames or [])
+        if manquantes:
+            raise ValueError(f"Colonnes manquantes dans le fichier : {', '.join(sorted(manquantes))}.")
+
+        rapport = RapportImport()
+        vus = set()
+        lot = []
+
+        for ligne in lecteur:
+            rapport.lues += 1
+            numero = lecteur.line_num
+            email = (ligne.get("email") or "").strip() or None
+            try:
+                participant = ParticipantModelIn(
+                    nom=(ligne.get("nom") or "").strip(),
+                    prenom=(ligne.get("prenom") or "").strip(),
+                    telephone=(ligne.get("telephone") or "").strip() or None,
+                    email=email,
+                    mot_de_passe=ligne.get("mot_de_passe") or "",
+                )
+            except ValidationError as e:
+                motif = "; ".join(f"{'.'.join(str(x) for x in err['loc'])}: {err['msg']}" for err in e.errors())
+                rapport.rejetees.append(LigneRejetee(ligne=numero, email=email, motif=motif))
+                continue
+            if not (participant.nom and participant.prenom and participant.mot_de_passe):
+                rapport.rejetees.append(LigneRejetee(ligne=numero, email=email, motif="nom, prénom et mot de passe sont obligatoires"))
+                continue
+
+            cle = participant.email.lower()
+            if cle in vus:
+                rapport.rejetees.append(LigneRejetee(ligne=numero, email=participant.email, motif="email en double dans le fichier"))
+                continue
+            vus.add(cle)
+            lot.append((numero, participant))
+
+            if len(lot) >= taille_lot:
+                self._importer_lot(lot, rapport)
+                lot = []
+
+        if lot:
+            self._importer_lot(lot, rapport)
+        rapport.rejetees.sort(key=lambda r: r.ligne)
+        return rapport
+
+    def _importer_lot(self, lot, rapport: RapportImport) -> None:
+        """Écarte les emails déjà en base, hashe les mots de passe restants et charge le lot."""
+        existants = self.dao.find_emails_existants([p.email for _, p in lot])
+        nouveaux = []
+        for numero, p in lot:
+            if p.email.lower() in existants:
+                rapport.rejetees.append(LigneRejetee(ligne=numero, email=p.email, motif="email déjà utilisé"))
+            else:
+                nouveaux.append((numero, p))
+        if not nouveaux:
+            return
+
+        hashes = hacheur().hacher_lot([p.mot_de_passe for _, p in nouveaux])
+        inseres = self.dao.create_many((p, h) for (_, p), h in zip(nouveaux, hashes))
+
+        rapport.importees += len(inseres)
+        for numero, p in nouveaux:
+            if p.email not in inseres:
+                # Compte créé par ailleurs entre la vérification et l'insertion
+                rapport.rejetees.append(LigneRejetee(ligne=numero, email=p.email, motif="email déjà utilisé"))
+
     # ---------- UPDATE ----------
     def update_participant(self, participant_out: ParticipantModelOut) -> ParticipantModelOut:
         existing = self.dao.find_by_id(participant_out.id_utilisateur)
@@ -1,17 +1,38 @@
 # src/service/reservation_service.py
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+from dao.liste_attente_dao import ListeAttenteDao
 from dao.reservation_dao import ReservationDao
-from model.reservation_models import ReservationModelIn, ReservationModelOut
+from service.cache_evenements import CacheEvenements
+from service.evenement_service import EvenementService
+from model.reservation_models import (
+    DemandeAttenteModelOut,
+    InscritModelOut,
+    PromotionAttente,
+    ReservationModelIn,
+    ReservationModelOut,
+    ResultatReservation,
+    StatutReservation,
+)
 
 
 class ReservationService:
     """
     Service pour la gestion des réservations.
     Contient la logique métier et la coordination avec le DAO.
+
+    Liste d'attente : quand une place se libère (réservation supprimée, bus
+    abandonné...), les premiers de la file sont servis et prévenus par e-mail
+    dans la même transaction (triggers de la migration 004) : rien à faire ici
+    pour la promotion, seulement invalider les compteurs en cache.
     """
 
+    DIRECTIONS = ("aller", "retour")
+
     def __init__(self):
         self.dao = ReservationDao()
+        self.attente_dao = ListeAttenteDao()
+        self.cache = CacheEvenements()
 
     # ---------- READ ----------
     def get_reservations_by_user(self, id_utilisateur: int) -> List[ReservationModelOut]:
@@ -22,6 +43,14 @@ class ReservationService:
         """Récupère toutes les réservations d'un événement."""
         return self.dao.find_by_event(id_evenement)
 
+    def get_inscrits_evenement(self, id_evenement: int) -> List[InscritModelOut]:
+        """Liste des inscrits d'un événement, avec leur identité et leur commentaire."""
+        return self.dao.lister_inscrits(id_evenement)
+
+    def iter_inscrits_evenement(self, id_evenement: int, taille_lot: int = 1000) -> Iterator[InscritModelOut]:
+        """Liste des inscrits en flux, pour les très gros événements (mémoire bornée)."""
+        return self.dao.iter_inscrits(id_evenement, taille_lot=taille_lot)
+
     def get_reservation_by_id(self, id_reservation: int) -> ReservationModelOut:
         """Récupère une réservation par son ID."""
         reservation = self.dao.find_by_id(id_reservation)
@@ -34,13 +63,39 @@ class ReservationService:
         Récupère le nombre total d'inscrits pour un événement.
         (Utilisé pour vérifier la capacité du *lieu*).
         """
-        return self.dao.count_by_event(id_evenement)
+        return self.cache.inscrits(id_evenement, lambda: self.dao.count_by_event(id_evenement))
     
     def get_nb_places_bus_prises(self, id_evenement: int, direction: str) -> int:
         """Renvoie le nombre de places de bus déjà réservées."""
-        return self.dao.count_bus_taken(id_evenement, direction)
+        return self.cache.places_prises(
+            id_evenement, direction, lambda: self.dao.count_bus_taken(id_evenement, direction)
+        )
 
     # ---------- CREATE ----------
+    # Message d'erreur associé à chaque issue d'une réservation refusée
+    MESSAGES_REFUS = {
+        StatutReservation.INTROUVABLE: "Événement introuvable.",
+        StatutReservation.PAS_OUVERT: "Les réservations ne sont pas encore ouvertes.",
+        StatutReservation.DEJA_RESERVE: "Vous avez déjà réservé une place pour cet événement.",
+        StatutReservation.COMPLET: "L'événement est complet.",
+        StatutReservation.BUS_ALLER_COMPLET: "Le bus aller est complet.",
+        StatutReservation.BUS_RETOUR_COMPLET: "Le bus retour est complet.",
+        StatutReservation.ADMISSION_REQUISE: "Passez par la file d'admission : jeton de réservation absent ou expiré.",
+        StatutReservation.TROP_DE_TENTATIVES: "Trop de tentatives, réessayez dans quelques secondes.",
+        StatutReservation.PLACES_LIBRES: "Des places sont encore libres : réservez directement.",
+    }
+
+    def reserver(self, reservation_in: ReservationModelIn) -> ResultatReservation:
+        """
+        Tente une réservation atomique (capacités lieu + bus vérifiées et insertion
+        dans la même transaction). Ne lève pas d'erreur métier : l'issue est décrite
+        par ResultatReservation.statut (OK, COMPLET, BUS_*_COMPLET, DEJA_RESERVE...).
+        """
+        resultat = self.dao.reserver(reservation_in)
+        if resultat.ok:
+            self.cache.invalider_reservations(reservation_in.fk_evenement)
+        return resultat
+
     def create_reservation(self, reservation_in: ReservationModelIn) -> ReservationModelOut:
         """
         Crée une nouvelle réservation.
@@ -48,18 +103,13 @@ class ReservationService:
         Règle métier :
         Un utilisateur ne peut pas réserver deux fois le même événement,
         mais peut réserver plusieurs événements différents.
+        Les capacités (lieu et bus) sont vérifiées au moment de l'insertion,
+        ce qui empêche toute survente lors d'un shotgun.
         """
-        # Vérifie s’il existe déjà une réservation pour cet utilisateur + cet événement
-        existing_reservations = self.dao.find_by_user(reservation_in.fk_utilisateur)
-        for r in existing_reservations:
-            if r.fk_evenement == reservation_in.fk_evenement:
-                raise ValueError("Vous avez déjà réservé une place pour cet événement.")
-
-        # Si OK → création
-        reservation = self.dao.create(reservation_in)
-        if not reservation:
-            raise ValueError("Échec de la création de la réservation (erreur base de données).")
-        return reservation
+        resultat = self.reserver(reservation_in)
+        if not resultat.ok:
+            raise ValueError(self.MESSAGES_REFUS[resultat.statut])
+        return resultat.reservation
 
     # ---------- UPDATE ----------
     def update_reservation_flags(
@@ -72,10 +122,21 @@ class ReservationService:
         sam: Optional[bool] = None,
         boisson: Optional[bool] = None,
     ) -> ReservationModelOut:
-        """Met à jour les options (flags) d'une réservation existante."""
+        """
+        Met à jour les options (flags) d'une réservation existante.
+        Une place de bus abandonnée va au premier de la file d'attente de ce bus.
+        Une place de bus ne s'ajoute pas ici (ValueError) mais par attendre_bus,
+        qui vérifie la capacité et la file du bus sous le verrou de l'événement.
+        """
         existing = self.dao.find_by_id(id_reservation)
         if not existing:
             raise ValueError("Impossible de mettre à jour : réservation introuvable.")
+        for direction, demande in (("aller", bus_aller), ("retour", bus_retour)):
+            if demande and not getattr(existing, f"bus_{direction}"):
+                raise ValueError(
+                    f"Une place dans le bus {direction} se demande par sa liste d'attente "
+                    "(attribuée aussitôt si une place est libre)."
+                )
 
         updated = self.dao.update_flags(
             id_reservation,
@@ -85,24 +146,82 @@ class ReservationService:
             sam=sam,
             boisson=boisson,
         )
+        self.cache.invalider_reservations(existing.fk_evenement)
         if not updated:
             raise ValueError("Erreur lors de la mise à jour de la réservation.")
         return updated
 
     # ---------- DELETE ----------
     def delete_reservation(self, id_reservation: int) -> bool:
-        """Supprime une réservation existante."""
+        """Supprime une réservation existante (la place libérée va au premier de la liste d'attente)."""
         existing = self.dao.find_by_id(id_reservation)
         if not existing:
             raise ValueError("Impossible de supprimer : réservation introuvable.")
-        return self.dao.delete(id_reservation)
+        ok = self.dao.delete(id_reservation)
+        self.cache.invalider_reservations(existing.fk_evenement)
+        return ok
+
+    # ---------- LISTE D'ATTENTE ----------
+    def rejoindre_liste_attente(self, demande: ReservationModelIn) -> int:
+        """
+        Inscrit l'utilisateur en liste d'attente d'un événement complet, avec ses
+        options (bus compris), et retourne son rang dans la file.
+        Refusée si une place est libre pour lui (elle se réserve par
+        create_reservation, derrière la file d'admission et la limite de
+        tentatives) et avant l'ouverture programmée.
+        """
+        ouverture = EvenementService().get_event_by_id(demande.fk_evenement).ouverture
+        if ouverture is not None and ouverture > datetime.now(timezone.utc):
+            raise ValueError(self.MESSAGES_REFUS[StatutReservation.PAS_OUVERT])
+        if self.dao.exists_for_user_and_event(demande.fk_utilisateur, demande.fk_evenement):
+            raise ValueError(self.MESSAGES_REFUS[StatutReservation.DEJA_RESERVE])
+        statut = self.attente_dao.inscrire(demande)
+        if statut != StatutReservation.EN_ATTENTE:
+            raise ValueError(self.MESSAGES_REFUS[statut])
+        return self.attente_dao.position(demande.fk_utilisateur, demande.fk_evenement)
+
+    def attendre_bus(self, id_reservation: int, direction: str) -> Optional[int]:
+        """
+        Inscrit une réservation en liste d'attente du bus `direction` ('aller' / 'retour').
+        Retourne le rang dans la file, ou None si la place a été attribuée aussitôt.
+        """
+        if direction not in self.DIRECTIONS:
+            raise ValueError("Direction invalide (attendu : 'aller' ou 'retour').")
+        reservation = self.get_reservation_by_id(id_reservation)
+        if getattr(reservation, f"bus_{direction}"):
+            raise ValueError(f"Cette réservation a déjà une place dans le bus {direction}.")
+        demande = ReservationModelIn(
+            fk_utilisateur=reservation.fk_utilisateur, fk_evenement=reservation.fk_evenement
+        )
+        promotions = self.attente_dao.inscrire_bus(demande, direction)
+        if promotions:
+            self.cache.invalider_reservations(demande.fk_evenement)
+        servie = any(p.id_utilisateur == demande.fk_utilisateur and p.direction == direction for p in promotions)
+        if servie:
+            return None
+        return self.attente_dao.position(demande.fk_utilisateur, demande.fk_evenement, direction)
+
+    def quitter_liste_attente(self, id_utilisateur: int, id_evenement: int, direction: Optional[str] = None) -> bool:
+        """Retire la demande (place si direction None, sinon bus de ce sens)."""
+        return self.attente_dao.retirer(id_utilisateur, id_evenement, direction)
+
+    def position_liste_attente(
+        self, id_utilisateur: int, id_evenement: int, direction: Optional[str] = None
+    ) -> Optional[int]:
+        """Rang dans la file (1 = prochain servi), None si pas en attente."""
+        return self.attente_dao.position(id_utilisateur, id_evenement, direction)
+
+    def get_liste_attente(self, id_evenement: int) -> List[DemandeAttenteModelOut]:
+        """Files d'attente d'un événement (places, puis bus aller et retour)."""
+        return self.attente_dao.lister(id_evenement)
 
-    # ---------- HELPERS / STATS ----------
-    def count_reservations_for_event(self, id_evenement: int) -> int:
-        """Compte le nombre de réservations pour un événement."""
-        return self.dao.count_by_event(id_evenement)
+    def get_attentes_utilisateur(self, id_utilisateur: int) -> List[DemandeAttenteModelOut]:
+        """Demandes en attente d'un utilisateur, avec leur rang."""
+        return self.attente_dao.find_by_user(id_utilisateur)
 
-    def user_has_reservation_for_event(self, id_utilisateur: int, id_evenement: int) -> bool:
-        """Retourne True si l'utilisateur a déjà réservé ce même événement."""
-        reservations = self.dao.find_by_user(id_utilisateur)
-        return any(r.fk_evenement == id_evenement for r in reservations)
+    def promouvoir_liste_attente(self, id_evenement: int) -> List[PromotionAttente]:
+        """Sert la liste d'attente tant que des places sont libres (rattrapage manuel)."""
+        promotions = self.attente_dao.promouvoir(id_evenement)
+        if promotions:
+            self.cache.invalider_reservations(id_evenement)
+        return promotions
@@ -0,0 +1,247 @@
+# service/session_service.py
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Optional
+
+from dao.session_dao import SessionDao
+from dao.utilisateur_dao import UtilisateurDao
+
+
+@dataclass
+class SessionOuverte:
+    """Session en mémoire : utilisateur connecté et échéances (horloge monotone)."""
+    utilisateur: Any
+    debut: datetime
+    expire: float
+    # Échéance enregistrée en base (persistance) : la prolongation n'y est écrite
+    # que lorsqu'elle a pris assez d'avance, pas à chaque lecture
+    expire_en_base: float = 0.0
+    # HMAC du mot de passe vérifié à la connexion (jamais persisté)
+    empreinte_mdp: Optional[bytes] = field(default=None, repr=False)
+
+
+class SessionService:
+    """
+    Magasin de sessions multi-utilisateurs.
+
+    - `ouvrir` délivre un jeton aléatoire (256 bits) pour un utilisateur authentifié ;
+    - chaque lecture (`utilisateur`) prolonge la session de `ttl` secondes
+      (expiration glissante) ; une session inactive plus longtemps expire ;
+    - les sessions vivent dans un cache LRU borné à `capacite` entrées ;
+    - avec `persistance`, elles sont aussi écrites dans la table
+      session_utilisateur : une session sortie du cache (ou ouverte par un
+      autre processus) y est relue, et survit au redémarrage.
+
+    Le mot de passe saisi à la connexion est gardé sous forme d'empreinte HMAC
+    (clé aléatoire propre au processus) : les re-vérifications demandées avant
+    une action sensible (`verifier_mot_de_passe`) ne refont pas de bcrypt.
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      SESSION_TTL          durée d'inactivité avant expiration, en secondes (défaut 3600)
+      SESSION_CAPACITE     nombre de sessions gardées en mémoire (défaut 10000)
+      SESSION_PERSISTANCE  1 pour stocker aussi les sessions en base (défaut 0)
+    """
+
+    def __init__(
+        self,
+        ttl: Optional[float] = None,
+        capacite: Optional[int] = None,
+        persistance: Optional[bool] = None,
+    ):
+        self.ttl = ttl or float(os.getenv("SESSION_TTL", "3600"))
+        self.capacite = capacite or int(os.getenv("SESSION_CAPACITE", "10000"))
+        self.persistance = (
+            persistance if persistance is not None else os.getenv("SESSION_PERSISTANCE", "0") == "1"
+        )
+        self.dao = SessionDao()
+        self.utilisateur_dao = UtilisateurDao()
+
+        self._sessions: "OrderedDict[str, SessionOuverte]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._cle_empreinte = secrets.token_bytes(32)
+
+    # ---------- Helpers ----------
+    @staticmethod
+    def _cle(jeton: str) -> str:
+        """Empreinte du jeton : clé du cache et de la table (le jeton n'est jamais stocké)."""
+        return hashlib.sha256(jeton.encode("utf-8")).hexdigest()
+
+    def _empreinte(self, mot_de_passe: str) -> bytes:
+        return hmac.new(self._cle_empreinte, mot_de_passe.encode("utf-8"), hashlib.sha256).digest()
+
+    def _garder(self, cle: str, session: SessionOuverte) -> None:
+        """Ajoute au cache en évinçant la session la moins récemment utilisée si besoin."""
+        with self._lock:
+            self._sessions[cle] = session
+            self._sessions.move_to_end(cle)
+            while len(self._sessions) > self.capacite:
+                self._sessions.popitem(last=False)
+
+    def _session(self, jeton: Optional[str]) -> Optional[SessionOuverte]:
+        """Session valide du jeton (prolongée), relue en base si elle n'est plus en cache."""
+        if not jeton:
+            return None
+        cle = self._cle(jeton)
+        maintenant = time.monotonic()
+
+        with self._lock:
+            session = self._sessions.get(cle)
+            if session is not None:
+                if session.expire <= maintenant:
+                    del self._sessions[cle]
+                    session = None
+                else:
+                    self._sessions.move_to_end(cle)
+                    session.expire = maintenant + self.ttl
+
+        if session is None:
+            if not self.persistance:
+                return None
+            row = self.dao.find_valide(cle)
+            if row is None:
+                return None
+            session = SessionOuverte(
+                utilisateur=UtilisateurDao._row_to_model(row),
+                debut=row["debut_session"],
+                expire=maintenant + self.ttl,
+                expire_en_base=maintenant + row["reste"],
+            )
+            self._garder(cle, session)
+
+        # Prolongation écrite en base au plus une fois par dixième de TTL
+        if self.persistance and session.expire - session.expire_en_base > self.ttl / 10:
+            if not self.dao.prolonger(cle, self.ttl):
+                # Fermée (ou expirée) par un autre processus
+                self._retirer(cle)
+                return None
+            session.expire_en_base = session.expire
+        return session
+
+    def _retirer(self, cle: str) -> None:
+        with self._lock:
+            self._sessions.pop(cle, None)
+
+    # ---------- Ouverture / fermeture ----------
+    def ouvrir(self, utilisateur: Any, mot_de_passe: Optional[str] = None) -> str:
+        """
+        Ouvre une session pour un utilisateur déjà authentifié et retourne son jeton.
+        `mot_de_passe` (celui qui vient d'être vérifié) permet les re-vérifications sans bcrypt.
+        """
+        jeton = secrets.token_urlsafe(32)
+        cle = self._cle(jeton)
+        expire = time.monotonic() + self.ttl
+        if self.persistance:
+            self.dao.create(cle, utilisateur.id_utilisateur, self.ttl)
+
+        self._garder(cle, SessionOuverte(
+            utilisateur=utilisateur,
+            debut=datetime.now(),
+            expire=expire,
+            expire_en_base=expire,
+            empreinte_mdp=self._empreinte(mot_de_passe) if mot_de_passe else None,
+        ))
+        return jeton
+
+    def connecter(self, email: str, mot_de_passe: str) -> str:
+        """Vérifie les identifiants (seul passage par bcrypt) et ouvre une session."""
+        utilisateur = self.utilisateur_dao.authenticate(email, mot_de_passe)
+        if utilisateur is None:
+            raise ValueError("Email ou mot de passe incorrect.")
+        return self.ouvrir(utilisateur, mot_de_passe)
+
+    def fermer(self, jeton: Optional[str]) -> None:
+        """Ferme la session (sans effet si elle n'existe pas)."""
+        if not jeton:
+            return
+        cle = self._cle(jeton)
+        self._retirer(cle)
+        if self.persistance:
+            self.dao.delete(cle)
+
+    def fermer_sessions_utilisateur(self, id_utilisateur: int) -> None:
+        """Ferme toutes les sessions d'un utilisateur (compte supprimé...)."""
+        with self._lock:
+            for cle in [c for c, s in self._sessions.items() if s.utilisateur.id_utilisateur == id_utilisateur]:
+                del self._sessions[cle]
+        if self.persistance:
+            self.dao.delete_for_user(id_utilisateur)
+
+    def purger(self) -> int:
+        """Retire les sessions expirées du cache (et de la base) ; retourne le nombre retiré du cache."""
+        maintenant = time.monotonic()
+        with self._lock:
+            expirees = [c for c, s in self._sessions.items() if s.expire <= maintenant]
+            for cle in expirees:
+                del self._sessions[cle]
+        if self.persistance:
+            self.dao.purger()
+        return len(expirees)
+
+    # ---------- Lecture ----------
+    def utilisateur(self, jeton: Optional[str]) -> Optional[Any]:
+        """Utilisateur de la session (None si le jeton est inconnu ou expiré)."""
+        session = self._session(jeton)
+        return session.utilisateur if session else None
+
+    def debut(self, jeton: Optional[str]) -> Optional[datetime]:
+        session = self._session(jeton)
+        return session.debut if session else None
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    # ---------- Mise à jour ----------
+    def rafraichir_utilisateur(self, jeton: str, utilisateur: Any) -> bool:
+        """Remplace le profil gardé en session (après modification du compte)."""
+        session = self._session(jeton)
+        if session is None:
+            return False
+        session.utilisateur = utilisateur
+        return True
+
+    def verifier_mot_de_passe(self, jeton: str, mot_de_passe: str) -> bool:
+        """
+        Re-vérifie le mot de passe de l'utilisateur connecté : comparaison avec
+        l'empreinte gardée en session, bcrypt seulement si elle est absente
+        (session relue en base, mot de passe changé depuis la connexion).
+        """
+        session = self._session(jeton)
+        if session is None or not mot_de_passe:
+            return False
+
+        empreinte = self._empreinte(mot_de_passe)
+        if session.empreinte_mdp is not None:
+            return hmac.compare_digest(session.empreinte_mdp, empreinte)
+
+        verifie = self.utilisateur_dao.authenticate(session.utilisateur.email, mot_de_passe)
+        if verifie is None or verifie.id_utilisateur != session.utilisateur.id_utilisateur:
+            return False
+        session.empreinte_mdp = empreinte
+        return True
+
+    def oublier_mots_de_passe(self, id_utilisateur: int) -> None:
+        """Efface les empreintes gardées pour un utilisateur (mot de passe changé)."""
+        with self._lock:
+            for session in self._sessions.values():
+                if session.utilisateur.id_utilisateur == id_utilisateur:
+                    session.empreinte_mdp = None
+
+
+_sessions: Optional[SessionService] = None
+_sessions_lock = threading.Lock()
+
+
+def session_service() -> SessionService:
+    """Magasin de sessions partagé par le processus (créé à la première utilisation)."""
+    global _sessions
+    with _sessions_lock:
+        if _sessions is None:
+            _sessions = SessionService()
+        return _sessions
@@ -2,7 +2,9 @@
 from typing import List, Optional
 
 from dao.utilisateur_dao import UtilisateurDao
+from model.pagination_models import PageCurseur
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
+from service.session_service import session_service
 from view.session import Session
 
 
@@ -19,6 +21,10 @@ class UtilisateurService:
     def get_all_users(self, limit: int = 100, offset: int = 0) -> List[UtilisateurModelOut]:
         return self.dao.find_all(limit=limit, offset=offset)
 
+    def get_users_page(self, limit: int = 100, curseur: Optional[str] = None) -> PageCurseur[UtilisateurModelOut]:
+        """Page d'utilisateurs suivant `curseur` (pagination par curseur)."""
+        return self.dao.find_page(limit=limit, curseur=curseur)
+
     def get_user_by_id(self, id_utilisateur: int) -> Optional[UtilisateurModelOut]:
         user = self.dao.find_by_id(id_utilisateur)
         if not user:
@@ -47,7 +53,11 @@ class UtilisateurService:
     def delete_user(self, id_utilisateur: int) -> bool:
         if not self.dao.find_by_id(id_utilisateur):
             raise ValueError("Impossible de supprimer : utilisateur introuvable.")
-        return self.dao.delete(id_utilisateur)
+        ok = self.dao.delete(id_utilisateur)
+        if ok:
+            # Les sessions en base partent avec l'utilisateur (ON DELETE CASCADE), pas celles en mémoire
+            session_service().fermer_sessions_utilisateur(id_utilisateur)
+        return ok
 
     # ---------- AUTH ----------
     def authenticate_user(self, email: str, password: str) -> Optional[UtilisateurModelOut]:
@@ -59,7 +69,11 @@ class UtilisateurService:
     def change_user_password(self, id_utilisateur: int, new_password: str) -> bool:
         if not self.dao.find_by_id(id_utilisateur):
             raise ValueError("Utilisateur introuvable pour mise à jour du mot de passe.")
-        return self.dao.change_password(id_utilisateur, new_password)
+        ok = self.dao.change_password(id_utilisateur, new_password)
+        if ok:
+            # L'ancien mot de passe ne doit plus être accepté par les re-vérifications
+            session_service().oublier_mots_de_passe(id_utilisateur)
+        return ok
 
     # ---------- SESSION ----------
     def deconnexion(self) -> bool:
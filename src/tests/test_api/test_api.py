@@ -0,0 +1,367 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from utils.reset_database import ResetDatabase
+
+from api.app import app
+from api.dependances import creer_jeton, lire_jeton
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from model.creneauBus_models import CreneauBusModelIn
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn
+from service.admission_service import admission_service
+from utils.limiteur import LimiteurParCle
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+@pytest.fixture(scope="module")
+def client():
+    with patch.dict(os.environ, {"ADMISSION_SECRET_KEY": "cle-admission-test"}):
+        with TestClient(app) as c:
+            yield c
+
+
+def entete(client, email, mot_de_passe):
+    """Se connecte et retourne l'en-tête Authorization correspondant."""
+    reponse = client.post("/auth/connexion", json={"email": email, "mot_de_passe": mot_de_passe})
+    assert reponse.status_code == 200
+    return {"Authorization": f"Bearer {reponse.json()['access_token']}"}
+
+
+def test_demarrage_sans_cle_admission():
+    """Sans ADMISSION_SECRET_KEY, l'API refuse de démarrer (chaque worker aurait sa clé)"""
+
+    # GIVEN
+    with patch.dict(os.environ):
+        os.environ.pop("ADMISSION_SECRET_KEY", None)
+
+        # WHEN / THEN
+        with pytest.raises(RuntimeError, match="ADMISSION_SECRET_KEY"):
+            with TestClient(app):
+                pass
+
+
+def test_jeton_signe():
+    """Un jeton valide est relu, un jeton modifié est rejeté"""
+
+    # GIVEN
+    jeton = creer_jeton(1, False)
+
+    # WHEN
+    corps, signature = jeton.split(".")
+    falsifie = creer_jeton(2, True).split(".")[0] + "." + signature
+
+    # THEN
+    assert lire_jeton(jeton).id_utilisateur == 1
+    assert lire_jeton(falsifie) is None
+    assert lire_jeton("n'importe quoi") is None
+
+
+def test_lister_evenements_pagine(client):
+    """La liste des événements est paginée (limit / offset / offset_suivant)"""
+
+    # WHEN
+    page1 = client.get("/evenements", params={"limit": 3}).json()
+    page2 = client.get("/evenements", params={"limit": 3, "offset": page1["offset_suivant"]}).json()
+
+    # THEN
+    assert len(page1["items"]) == 3
+    assert page1["offset_suivant"] == 3
+    assert page2["offset_suivant"] is None
+    ids = [e["id_evenement"] for e in page1["items"] + page2["items"]]
+    assert len(ids) == len(set(ids))
+    assert "places_restantes" in page1["items"][0]
+
+
+def test_lister_evenements_curseur(client):
+    """La liste des événements se parcourt aussi par curseur (curseur_suivant)"""
+
+    # WHEN
+    page1 = client.get("/evenements", params={"limit": 3}).json()
+    page2 = client.get("/evenements", params={"limit": 3, "curseur": page1["curseur_suivant"]}).json()
+    par_offset = client.get("/evenements", params={"limit": 3, "offset": 3}).json()
+    invalide = client.get("/evenements", params={"curseur": "abc"})
+
+    # THEN
+    assert page1["curseur_suivant"] is not None
+    assert page2["curseur_suivant"] is None
+    assert page2["items"] == par_offset["items"]
+    assert invalide.status_code == 400
+
+
+def test_consultation_par_les_dao_asynchrones(client):
+    """Liste, recherche et disponibilités sont lues par les DAO asynchrones, sans le pool synchrone"""
+
+    # GIVEN : les lectures synchrones correspondantes échoueraient
+    synchrone = AssertionError("DAO synchrone")
+    with patch.multiple(
+        ConsultationEvenementDao,
+        lister_avec_places_restantes_page=MagicMock(side_effect=synchrone),
+        rechercher_texte=MagicMock(side_effect=synchrone),
+        disponibilites=MagicMock(side_effect=synchrone),
+    ):
+
+        # WHEN
+        liste = client.get("/evenements", params={"limit": 3})
+        recherche = client.get("/evenements/recherche", params={"q": "soirée"})
+        dispos = client.get("/evenements/disponibilites", params={"ids": [1]})
+
+    # THEN
+    assert liste.status_code == 200 and len(liste.json()["items"]) == 3
+    assert recherche.status_code == 200
+    assert dispos.status_code == 200 and dispos.json()[0]["id_evenement"] == 1
+
+def test_detail_evenement(client):
+    """La fiche d'un événement contient ses bus et les places restantes"""
+
+    # WHEN
+    reponse = client.get("/evenements/1")
+
+    # THEN
+    assert reponse.status_code == 200
+    detail = reponse.json()
+    assert detail["evenement"]["id_evenement"] == 1
+    assert detail["places_restantes"] == detail["evenement"]["capacite"] - detail["inscrits"]
+    assert len(detail["bus"]) >= 1
+
+
+def test_detail_evenement_introuvable(client):
+    """Un événement inexistant renvoie 404"""
+
+    # WHEN / THEN
+    assert client.get("/evenements/9999").status_code == 404
+
+
+def test_disponibilites_evenements(client):
+    """Disponibilités de plusieurs événements en un appel, cohérentes avec les fiches"""
+
+    # WHEN
+    reponse = client.get("/evenements/disponibilites", params={"ids": [1, 2, 9999]})
+    trop = client.get("/evenements/disponibilites", params={"ids": list(range(1, 102))})
+
+    # THEN
+    assert reponse.status_code == 200
+    dispos = {d["id_evenement"]: d for d in reponse.json()}
+    assert sorted(dispos) == [1, 2]
+    detail = client.get("/evenements/1").json()
+    assert dispos[1]["places_restantes"] == detail["places_restantes"]
+    assert dispos[1]["bus_aller"] == detail["bus_aller"]
+    assert trop.status_code == 400
+
+
+def test_connexion_echec(client):
+    """Un mauvais mot de passe renvoie 401"""
+
+    # WHEN
+    reponse = client.post("/auth/connexion", json={"email": "alice.dupont@email.com", "mot_de_passe": "faux"})
+
+    # THEN
+    assert reponse.status_code == 401
+
+
+def test_reserver_sans_jeton(client):
+    """Réserver sans être connecté renvoie 401"""
+
+    # WHEN / THEN
+    assert client.post("/reservations", json={"fk_evenement": 2}).status_code == 401
+
+
+def test_parcours_reservation(client):
+    """Réservation, refus du doublon, modification, avis, puis annulation"""
+
+    # GIVEN
+    auth = entete(client, "alice.dupont@email.com", "mdpAlice123")
+
+    # WHEN
+    creation = client.post("/reservations", json={"fk_evenement": 2, "bus_aller": True}, headers=auth)
+    doublon = client.post("/reservations", json={"fk_evenement": 2}, headers=auth)
+    id_resa = creation.json()["id_reservation"]
+    modification = client.patch(f"/reservations/{id_resa}", json={"boisson": True}, headers=auth)
+    mes_resas = client.get("/reservations", headers=auth).json()
+    avis = client.post(f"/reservations/{id_resa}/commentaire", json={"note": 4, "avis": "Top"}, headers=auth)
+    annulation = client.delete(f"/reservations/{id_resa}", headers=auth)
+
+    # THEN
+    assert creation.status_code == 201
+    assert creation.json()["fk_utilisateur"] == 1
+    assert doublon.status_code == 409
+    assert doublon.json()["statut"] == "deja_reserve"
+    assert modification.json()["boisson"] is True
+    assert modification.json()["bus_aller"] is True
+    assert id_resa in [r["id_reservation"] for r in mes_resas["items"]]
+    assert avis.status_code == 201
+    assert annulation.status_code == 204
+    assert client.get(f"/reservations/{id_resa}", headers=auth).status_code == 404
+
+
+def test_reservation_d_un_autre_utilisateur(client):
+    """Un participant ne voit pas la réservation d'un autre ; un administrateur si"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    bob_admin = entete(client, "bob.martin@email.com", "mdpBob123")
+
+    # WHEN / THEN (réservation 2 = Caroline)
+    assert client.get("/reservations/2", headers=alice).status_code == 403
+    assert client.get("/reservations/2", headers=bob_admin).status_code == 200
+
+
+def test_export_inscrits(client):
+    """L'export des inscrits est réservé aux administrateurs et envoyé en CSV"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    bob_admin = entete(client, "bob.martin@email.com", "mdpBob123")
+
+    # WHEN
+    refuse = client.get("/evenements/1/inscrits/export", headers=alice)
+    export = client.get("/evenements/1/inscrits/export", headers=bob_admin)
+    introuvable = client.get("/evenements/9999/inscrits/export", headers=bob_admin)
+
+    # THEN
+    assert refuse.status_code == 403
+    assert export.status_code == 200
+    assert export.headers["content-type"].startswith("text/csv")
+    assert export.text.splitlines()[0].startswith("id_reservation,nom,prenom")
+    assert introuvable.status_code == 404
+
+
+def test_recherche_evenements(client):
+    """Recherche libre : résultats paginés avec extrait, texte vide refusé"""
+
+    # WHEN
+    reponse = client.get("/evenements/recherche", params={"q": "art contemporain", "limit": 5})
+    vide = client.get("/evenements/recherche", params={"q": "   "})
+
+    # THEN
+    assert reponse.status_code == 200
+    items = reponse.json()["items"]
+    assert items[0]["id_evenement"] == 2
+    assert "«art»" in items[0]["extrait"]
+    assert vide.status_code == 400
+
+
+def test_liste_attente(client):
+    """Un utilisateur déjà inscrit ne peut pas rejoindre la file ; il peut consulter ses demandes"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+
+    # WHEN
+    refus = client.post("/reservations/liste-attente", json={"fk_evenement": 1}, headers=alice)
+    demandes = client.get("/reservations/liste-attente", headers=alice)
+    absente = client.delete("/reservations/liste-attente/1", headers=alice)
+
+    # THEN
+    assert refus.status_code == 409
+    assert demandes.status_code == 200 and demandes.json() == []
+    assert absente.status_code == 404
+
+
+def test_admission_ouverture_programmee(client):
+    """Ouverture programmée : sans jeton 403 ; la file délivre le jeton qui permet de réserver"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    id_evt = EvenementDao().create(EvenementModelIn(
+        titre="Gala d'hiver", ville="Rennes", date_evenement="2026-12-12", capacite=10,
+        statut="disponible en ligne", ouverture=datetime.now() - timedelta(seconds=1),
+    )).id_evenement
+
+    # WHEN
+    with patch.object(admission_service(), "limiteur", LimiteurParCle(debit=1, capacite=10)):
+        sans_jeton = client.post("/reservations", json={"fk_evenement": id_evt}, headers=alice)
+        admission = client.post(f"/evenements/{id_evt}/admission", headers=alice)
+        reservation = client.post(
+            "/reservations", json={"fk_evenement": id_evt, "jeton_admission": admission.json()["jeton"]}, headers=alice
+        )
+
+    # THEN
+    assert sans_jeton.status_code == 403
+    assert sans_jeton.json()["statut"] == "admission_requise"
+    assert admission.json()["statut"] == "admis"
+    assert admission.json()["position"] == 1
+    assert reservation.status_code == 201
+
+
+def test_liste_attente_ne_contourne_pas_l_admission(client):
+    """Place libre après l'ouverture : la liste d'attente refuse, sans jeton pas de réservation"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    id_evt = EvenementDao().create(EvenementModelIn(
+        titre="Gala de printemps", ville="Rennes", date_evenement="2026-12-19", capacite=10,
+        statut="disponible en ligne", ouverture=datetime.now() - timedelta(seconds=1),
+    )).id_evenement
+
+    # WHEN
+    attente = client.post("/reservations/liste-attente", json={"fk_evenement": id_evt}, headers=alice)
+    reservations = client.get("/reservations", headers=alice).json()["items"]
+
+    # THEN
+    assert attente.status_code == 409
+    assert "réservez directement" in attente.json()["detail"]
+    assert all(r["fk_evenement"] != id_evt for r in reservations)
+    assert client.get("/reservations/liste-attente", headers=alice).json() == []
+
+
+def test_modification_n_ajoute_pas_de_bus(client):
+    """Bus complet : le PATCH qui ajoute le bus est refusé, sans dépasser la capacité du bus"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    id_evt = EvenementDao().create(EvenementModelIn(
+        titre="Soirée en car", ville="Rennes", date_evenement="2026-12-05", capacite=10,
+        statut="disponible en ligne",
+    )).id_evenement
+    CreneauBusDao().create(CreneauBusModelIn(
+        fk_evenement=id_evt, matricule=f"BA-{id_evt}", nombre_places=1,
+        direction="aller", description=f"Bus aller {id_evt}",
+    ))
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt, bus_aller=True))
+    resa = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt)).reservation
+
+    # WHEN
+    reponse = client.patch(f"/reservations/{resa.id_reservation}", json={"bus_aller": True}, headers=alice)
+
+    # THEN
+    assert reponse.status_code == 400
+    assert "liste d'attente" in reponse.json()["detail"]
+    assert not ReservationDao().find_by_id(resa.id_reservation).bus_aller
+    assert ReservationDao().count_bus_taken(id_evt, "aller") == 1
+
+
+def test_statistiques_requetes(client):
+    """Les statistiques de requêtes sont réservées aux administrateurs"""
+
+    # GIVEN
+    alice = entete(client, "alice.dupont@email.com", "mdpAlice123")
+    bob_admin = entete(client, "bob.martin@email.com", "mdpBob123")
+    client.get("/evenements/1")
+
+    # WHEN
+    refuse = client.get("/stats/requetes", headers=alice)
+    rapport = client.get("/stats/requetes", params={"tri": "appels"}, headers=bob_admin)
+
+    # THEN
+    assert refuse.status_code == 403
+    assert rapport.status_code == 200
+    requetes = rapport.json()["requetes"]
+    assert requetes and requetes[0]["appels"] >= requetes[-1]["appels"]
+    assert any(r["site"].startswith("UtilisateurDao.") for r in requetes)
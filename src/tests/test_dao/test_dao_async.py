@@ -0,0 +1,188 @@
+import asyncio
+import inspect
+import os
+from datetime import date
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.reservation_dao import ReservationDao
+from dao.evenement_dao import EvenementDao
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.commentaire_dao import CommentaireDao
+from dao.participant_dao import ParticipantDao
+from dao.utilisateur_dao import UtilisateurDao
+from dao.administrateur_dao import AdministrateurDao
+
+from dao_async.db_connection import AsyncDBConnection
+from dao_async.reservation_dao import ReservationDaoAsync
+from dao_async.evenement_dao import EvenementDaoAsync
+from dao_async.consultation_evenement_dao import ConsultationEvenementDaoAsync
+from dao_async.creneau_bus_dao import CreneauBusDaoAsync
+from dao_async.commentaire_dao import CommentaireDaoAsync
+from dao_async.participant_dao import ParticipantDaoAsync
+from dao_async.utilisateur_dao import UtilisateurDaoAsync
+from dao_async.administrateur_dao import AdministrateurDaoAsync
+
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn, StatutReservation
+from utils.stats_requetes import stats_requetes
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        AsyncDBConnection().definir_schema("projet_test_dao")
+        yield
+
+
+def run(coro):
+    """Exécute une coroutine dans une boucle neuve, puis ferme le pool asynchrone."""
+    async def main():
+        try:
+            return await coro
+        finally:
+            await AsyncDBConnection().fermer()
+
+    return asyncio.run(main())
+
+
+def test_memes_methodes_que_les_dao_synchrones():
+    """Chaque jumeau asynchrone expose les méthodes publiques de son DAO synchrone"""
+
+    # GIVEN
+    paires = [
+        (ReservationDao, ReservationDaoAsync),
+        (EvenementDao, EvenementDaoAsync),
+        (ConsultationEvenementDao, ConsultationEvenementDaoAsync),
+        (CreneauBusDao, CreneauBusDaoAsync),
+        (CommentaireDao, CommentaireDaoAsync),
+        (ParticipantDao, ParticipantDaoAsync),
+        (UtilisateurDao, UtilisateurDaoAsync),
+        (AdministrateurDao, AdministrateurDaoAsync),
+    ]
+
+    for sync_cls, async_cls in paires:
+        # WHEN
+        publiques = {n for n in dir(sync_cls) if not n.startswith("_") and callable(getattr(sync_cls, n))}
+        publiques -= {n for n in publiques if n.startswith("SQL_")}
+
+        # THEN
+        for nom in publiques:
+            methode = getattr(async_cls, nom, None)
+            if inspect.isgeneratorfunction(getattr(sync_cls, nom)):
+                assert inspect.isasyncgenfunction(methode), f"{async_cls.__name__}.{nom}"
+            else:
+                assert asyncio.iscoroutinefunction(methode), f"{async_cls.__name__}.{nom}"
+
+
+def test_lectures_identiques_aux_dao_synchrones():
+    """Les lectures asynchrones renvoient les mêmes objets que les lectures synchrones"""
+
+    # GIVEN
+    async def inscrits_en_flux():
+        return [i async for i in ReservationDaoAsync().iter_inscrits(1, taille_lot=1)]
+
+    async def lire():
+        return await asyncio.gather(
+            ReservationDaoAsync().find_by_user(1),
+            ReservationDaoAsync().lister_inscrits(1),
+            inscrits_en_flux(),
+            EvenementDaoAsync().find_by_id(1),
+            ConsultationEvenementDaoAsync().lister_avec_places_restantes(),
+            ConsultationEvenementDaoAsync().disponibilites([1, 2, 3, 4]),
+            CreneauBusDaoAsync().find_by_event(1),
+            CommentaireDaoAsync().find_all_by_event_id(1),
+            UtilisateurDaoAsync().find_by_email("alice.dupont@email.com"),
+        )
+
+    # WHEN
+    resas, inscrits, flux, evt, listing, dispos, bus, comms, user = run(lire())
+
+    # THEN
+    assert resas == ReservationDao().find_by_user(1)
+    assert inscrits == flux == ReservationDao().lister_inscrits(1)
+    assert evt == EvenementDao().find_by_id(1)
+    assert listing == ConsultationEvenementDao().lister_avec_places_restantes()
+    assert dispos == ConsultationEvenementDao().disponibilites([1, 2, 3, 4])
+    assert bus == CreneauBusDao().find_by_event(1)
+    assert [dict(c) for c in comms] == [dict(c) for c in CommentaireDao().find_all_by_event_id(1)]
+    assert user == UtilisateurDao().find_by_email("alice.dupont@email.com")
+
+
+def test_authenticate_async():
+    """Authentification asynchrone : bon et mauvais mot de passe"""
+
+    # GIVEN
+    email = "bob.martin@email.com"
+
+    # WHEN
+    async def authentifier():
+        return await asyncio.gather(
+            AdministrateurDaoAsync().authenticate(email, "mdpBob123"),
+            AdministrateurDaoAsync().authenticate(email, "mauvais"),
+        )
+
+    ok, ko = run(authentifier())
+
+    # THEN
+    assert ok is not None and ok.email == email
+    assert ko is None
+
+
+def test_reserver_concurrent_sans_survente():
+    """Des réservations simultanées ne dépassent jamais la capacité de l'événement"""
+
+    # GIVEN
+    async def scenario():
+        evt = await EvenementDaoAsync().create(
+            EvenementModelIn(
+                fk_utilisateur=2,
+                titre="Shotgun async",
+                adresse="1 rue du Test",
+                ville="Rennes",
+                date_evenement=date(2030, 1, 1),
+                description="Test de concurrence",
+                capacite=2,
+                categorie="Test",
+                statut="disponible en ligne",
+            )
+        )
+        # WHEN
+        resultats = await asyncio.gather(*(
+            ReservationDaoAsync().reserver(
+                ReservationModelIn(fk_utilisateur=u, fk_evenement=evt.id_evenement)
+            )
+            for u in (1, 3, 4, 5)
+        ))
+        inscrits = await ReservationDaoAsync().count_by_event(evt.id_evenement)
+        await EvenementDaoAsync().delete(evt.id_evenement)
+        return resultats, inscrits
+
+    resultats, inscrits = run(scenario())
+
+    # THEN
+    statuts = [r.statut for r in resultats]
+    assert statuts.count(StatutReservation.OK) == 2
+    assert statuts.count(StatutReservation.COMPLET) == 2
+    assert inscrits == 2
+
+
+def test_requetes_async_chronometrees():
+    """Les requêtes des DAO asynchrones sont comptées sous leur propre site d'appel"""
+
+    # GIVEN
+    stats_requetes().reinitialiser()
+
+    # WHEN
+    run(EvenementDaoAsync().find_by_id(1))
+
+    # THEN
+    sites = [r["site"] for r in stats_requetes().rapport()["requetes"]]
+    assert "EvenementDaoAsync.find_by_id" in sites
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from psycopg2 import extensions
+
+from dao.db_connection import ConnectionPool, PoolTimeoutError
+
+
+class FakeConnection:
+    """Connexion factice : suffisante pour exercer le pool sans base de données."""
+
+    def __init__(self):
+        self.closed = 0
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+        self.commits = 0
+        self.rollbacks = 0
+
+    def get_transaction_status(self):
+        return self.status
+
+    def commit(self):
+        self.commits += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.status = extensions.TRANSACTION_STATUS_IDLE
+
+    def close(self):
+        self.closed = 1
+
+    def cursor(self):
+        raise AssertionError("Aucune requête attendue dans ces tests")
+
+
+def test_pool_ouvre_min_size_connexions():
+    """Le pool ouvre min_size connexions dès sa création"""
+
+    # GIVEN / WHEN
+    pool = ConnectionPool(FakeConnection, min_size=2, max_size=4)
+
+    # THEN
+    assert pool.size == 2
+    assert pool.idle == 2
+
+
+def test_pool_reutilise_les_connexions():
+    """Une connexion rendue est réutilisée au prochain emprunt"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=2)
+
+    # WHEN
+    with pool.connection() as con1:
+        pass
+    with pool.connection() as con2:
+        pass
+
+    # THEN
+    assert con1 is con2
+    assert con1.commits == 2
+    assert pool.size == 1
+
+
+def test_pool_rollback_sur_exception():
+    """Une exception dans le bloc entraîne un rollback et la restitution de la connexion"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+
+    # WHEN
+    with pytest.raises(ValueError):
+        with pool.connection() as con:
+            raise ValueError("boom")
+
+    # THEN
+    assert con.rollbacks == 1
+    assert pool.idle == 1
+
+
+def test_pool_timeout_quand_plein():
+    """Au-delà de max_size, l'emprunt échoue après le délai d'attente"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=1, timeout=0.05)
+    con = pool.getconn()
+
+    # WHEN / THEN
+    with pytest.raises(PoolTimeoutError):
+        pool.getconn()
+
+    pool.putconn(con)
+
+
+def test_pool_attend_une_connexion_liberee():
+    """Un thread en attente récupère la connexion rendue par un autre"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=1, timeout=2)
+    con = pool.getconn()
+    recu = []
+
+    def emprunter():
+        recu.append(pool.getconn())
+
+    t = threading.Thread(target=emprunter)
+
+    # WHEN
+    t.start()
+    time.sleep(0.05)
+    pool.putconn(con)
+    t.join(timeout=2)
+
+    # THEN
+    assert recu == [con]
+
+
+def test_pool_remplace_connexion_cassee():
+    """Une connexion fermée n'est jamais rendue à l'appelant"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=1, max_size=1)
+    con = pool.getconn()
+    con.closed = 1
+    pool.putconn(con)
+
+    # WHEN
+    nouvelle = pool.getconn()
+
+    # THEN
+    assert nouvelle is not con
+    assert pool.size == 1
+
+
+def test_pool_recycle_connexions_inactives():
+    """Les connexions inactives au-delà de max_idle sont fermées (au-dessus de min_size)"""
+
+    # GIVEN
+    pool = ConnectionPool(FakeConnection, min_size=0, max_size=2, max_idle=0.01)
+    con = pool.getconn()
+    pool.putconn(con)
+    time.sleep(0.02)
+
+    # WHEN
+    nouvelle = pool.getconn()
+
+    # THEN
+    assert con.closed
+    assert nouvelle is not con
@@ -1,5 +1,5 @@
 import os
-from datetime import datetime
+from datetime import datetime, timedelta, timezone
 
 import pytest
 
@@ -7,8 +7,14 @@ from unittest.mock import patch
 
 from utils.reset_database import ResetDatabase
 
+from dao.db_connection import DBConnection
 from dao.evenement_dao import EvenementDao
+from dao.consultation_evenement_dao import ConsultationEvenementDao
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.reservation_dao import ReservationDao
 from model.evenement_models import EvenementModelIn, EvenementModelOut
+from model.reservation_models import ReservationModelIn
+from utils.pagination import CurseurInvalide
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -62,6 +68,33 @@ def test_create():
     assert creation_ok
 
 
+def test_ouverture_instant_independant_du_fuseau():
+    """L'ouverture est relue comme le même instant, quel que soit le fuseau de la session"""
+
+    # GIVEN : 20h à Paris en hiver, soit 19h UTC
+    ouverture = datetime(2026, 1, 26, 20, 0, tzinfo=timezone(timedelta(hours=1)))
+    evenement = EvenementDao().create(EvenementModelIn(
+        titre="Gala", ville="Rennes", date_evenement="2026-02-01", capacite=20,
+        statut="disponible en ligne", ouverture=ouverture,
+    ))
+
+    # WHEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SET TIME ZONE 'America/New_York'")
+            curs.execute(
+                "SELECT ouverture, ouverture > %(avant)s AS apres FROM evenement WHERE id_evenement = %(id)s",
+                {"id": evenement.id_evenement, "avant": datetime(2026, 1, 26, 18, 59, tzinfo=timezone.utc)},
+            )
+            row = curs.fetchone()
+            curs.execute("RESET TIME ZONE")
+
+    # THEN
+    assert row["ouverture"] == ouverture
+    assert row["apres"]
+    assert EvenementDao().find_by_id(evenement.id_evenement).ouverture == ouverture
+
+
 def test_update():
     """Met à jour un événement"""
 
@@ -91,3 +124,220 @@ def test_delete():
 
     # THEN
     assert suppression_ok
+
+
+def test_compteurs_suivent_les_reservations():
+    """Les compteurs de l'événement sont mis à jour par trigger à chaque réservation"""
+
+    # GIVEN
+    dao = EvenementDao()
+    avant = ReservationDao().count_by_event(2)
+
+    # WHEN
+    ReservationDao().create(ReservationModelIn(fk_utilisateur=4, fk_evenement=2, bus_aller=True))
+
+    # THEN
+    assert ReservationDao().count_by_event(2) == avant + 1
+    assert dao.recalculer_compteurs() == 0
+
+
+def test_recalculer_compteurs():
+    """La réconciliation corrige un compteur qui a dérivé"""
+
+    # GIVEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("UPDATE evenement SET inscrits = inscrits + 42 WHERE id_evenement = 1")
+
+    # WHEN
+    corriges = EvenementDao().recalculer_compteurs()
+
+    # THEN
+    assert corriges == 1
+    assert EvenementDao().recalculer_compteurs() == 0
+
+
+def test_disponibilites_en_une_requete():
+    """Les disponibilités groupées sont celles que donnent les compteurs pris un à un"""
+
+    # GIVEN
+    resa_dao = ReservationDao()
+    bus_dao = CreneauBusDao()
+
+    # WHEN
+    dispos = ConsultationEvenementDao().disponibilites([1, 4, 9999])
+
+    # THEN
+    assert sorted(dispos) == [1, 4]
+    for id_evt, dispo in dispos.items():
+        evenement = EvenementDao().find_by_id(id_evt)
+        assert dispo.inscrits == resa_dao.count_by_event(id_evt)
+        assert dispo.places_restantes == max(evenement.capacite - dispo.inscrits, 0)
+        for direction, bus in (("aller", dispo.bus_aller), ("retour", dispo.bus_retour)):
+            assert bus.capacite == bus_dao.get_capacite_totale(id_evt, direction)
+            assert bus.prises == resa_dao.count_bus_taken(id_evt, direction)
+            assert bus.restantes == max(bus.capacite - bus.prises, 0)
+    assert dispos[4].bus_retour.capacite == 0
+    assert ConsultationEvenementDao().disponibilites([]) == {}
+
+
+def test_find_page_parcours_complet():
+    """Le parcours par curseur renvoie les mêmes événements que find_all, sans doublon"""
+
+    # GIVEN
+    attendus = [e.id_evenement for e in EvenementDao().find_all()]
+
+    # WHEN
+    vus, curseur = [], None
+    while True:
+        page = EvenementDao().find_page(limit=2, curseur=curseur)
+        vus += [e.id_evenement for e in page.items]
+        curseur = page.curseur_suivant
+        if curseur is None:
+            break
+
+    # THEN
+    assert vus == attendus
+
+
+def test_find_page_curseur_invalide():
+    """Un curseur altéré ou émis pour une autre liste est refusé"""
+
+    # GIVEN
+    page_bus = ConsultationEvenementDao().lister_tous_page(limit=1)
+
+    # WHEN / THEN
+    with pytest.raises(CurseurInvalide):
+        EvenementDao().find_page(curseur="pas-un-curseur")
+    with pytest.raises(CurseurInvalide):
+        EvenementDao().find_page(curseur=page_bus.curseur_suivant)
+
+
+def test_page_stable_malgre_insertion():
+    """Un événement inséré avant la position courante ne décale pas la page suivante"""
+
+    # GIVEN
+    dao = ConsultationEvenementDao()
+    page1 = dao.lister_avec_places_restantes_page(limit=2, seulement_disponibles=False)
+    avant = dao.lister_avec_places_restantes_page(limit=2, curseur=page1.curseur_suivant, seulement_disponibles=False)
+    nouveau = EvenementDao().create(
+        EvenementModelIn(
+            fk_utilisateur=2,
+            titre="Inséré en tête",
+            date_evenement=datetime(2000, 1, 1).date(),
+            capacite=10,
+        )
+    )
+
+    # WHEN
+    apres = dao.lister_avec_places_restantes_page(limit=2, curseur=page1.curseur_suivant, seulement_disponibles=False)
+    EvenementDao().delete(nouveau.id_evenement)
+
+    # THEN
+    assert [e["id_evenement"] for e in apres.items] == [e["id_evenement"] for e in avant.items]
+    assert nouveau.id_evenement not in [e["id_evenement"] for e in page1.items + apres.items]
+
+
+def _avis(id_evenement):
+    lignes = ConsultationEvenementDao().lister_tous(limit=1000)
+    ligne = next(e for e in lignes if e["id_evenement"] == id_evenement)
+    return ligne["avg_note"], ligne["comment_count"]
+
+
+def test_stats_avis_suivent_les_ecritures():
+    """Les avis de l'événement suivent l'ajout d'un commentaire et la suppression de la réservation"""
+
+    # GIVEN : l'événement 2 a un seul avis (note 4)
+    assert _avis(2) == (4, 1)
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "INSERT INTO reservation (fk_utilisateur, fk_evenement) VALUES (1, 2) RETURNING id_reservation"
+            )
+            id_resa = curs.fetchone()["id_reservation"]
+
+    # WHEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "INSERT INTO commentaire (fk_reservation, fk_utilisateur, note, avis) VALUES (%s, 1, 2, 'Bof')",
+                (id_resa,),
+            )
+    apres_commentaire = _avis(2)
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("DELETE FROM reservation WHERE id_reservation = %s", (id_resa,))
+    apres_suppression = _avis(2)
+
+    # THEN
+    assert apres_commentaire == (3, 2)
+    assert apres_suppression == (4, 1)
+    assert EvenementDao().recalculer_compteurs() == 0
+
+
+def test_recalculer_compteurs_stats_avis():
+    """La réconciliation corrige aussi les statistiques d'avis"""
+
+    # GIVEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("UPDATE evenement_stats SET somme_notes = 99 WHERE fk_evenement = 1")
+
+    # WHEN
+    corriges = EvenementDao().recalculer_compteurs()
+
+    # THEN
+    assert corriges == 1
+    assert _avis(1) == (5, 1)
+
+
+def test_rechercher_texte():
+    """La recherche libre trouve les mots racinisés de la description et les surligne"""
+
+    # GIVEN
+    dao = ConsultationEvenementDao()
+
+    # WHEN
+    resultats = dao.rechercher_texte("technologie")
+    aucun = dao.rechercher_texte("astrophysique quantique")
+
+    # THEN
+    assert [r.id_evenement for r in resultats] == [1]
+    assert "«technologies»" in resultats[0].extrait
+    assert 0 < resultats[0].score <= 1
+    assert aucun == []
+
+
+def test_rechercher_texte_pertinence():
+    """Un mot du titre pèse plus qu'un mot de la description"""
+
+    # GIVEN
+    EvenementDao().create(EvenementModelIn(
+        titre="Soirée jeux", ville="Rennes", date_evenement="2026-02-01",
+        description="Jeux de société en musique.", capacite=20, statut="disponible en ligne",
+    ))
+
+    # WHEN
+    resultats = ConsultationEvenementDao().rechercher_texte("musique")
+    filtres = ConsultationEvenementDao().rechercher_texte("musique", categorie="Musique")
+
+    # THEN
+    assert [r.titre for r in resultats] == ["Festival de Musique", "Soirée jeux"]
+    assert resultats[0].score > resultats[1].score
+    assert [r.titre for r in filtres] == ["Festival de Musique"]
+
+
+def test_rechercher_texte_fautes_de_frappe():
+    """Avec pg_trgm, une faute de frappe dans le titre ou la ville est tolérée"""
+
+    # GIVEN
+    dao = ConsultationEvenementDao()
+    dao.rechercher_texte("musique")
+    if not ConsultationEvenementDao._trigramme:
+        pytest.skip("extension pg_trgm absente du serveur")
+
+    # WHEN
+    resultats = dao.rechercher_texte("festval toulouze")
+
+    # THEN
+    assert resultats[0].titre == "Festival de Musique"
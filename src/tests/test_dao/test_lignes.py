@@ -0,0 +1,123 @@
+import os
+from datetime import date, datetime
+
+import pytest
+
+from unittest.mock import patch
+
+from pydantic import ValidationError
+
+from dao.lignes import vers_modele, vers_modeles
+from model.email_models import EmailModelOut, StatutEmail
+from model.evenement_models import EvenementModelOut
+from model.utilisateur_models import UtilisateurModelOut
+
+LIGNE_EVENEMENT = {
+    "id_evenement": 1,
+    "fk_utilisateur": 2,
+    "titre": "Soirée d'intégration",
+    "adresse": "51 rue Blaise Pascal",
+    "ville": "Bruz",
+    "date_evenement": date(2026, 9, 12),
+    "description": None,
+    "capacite": 30,
+    "categorie": "Soirée",
+    "statut": "disponible en ligne",
+    "date_creation": datetime(2026, 1, 1, 12, 0),
+    "ouverture": None,
+}
+
+LIGNE_UTILISATEUR = {
+    "id_utilisateur": 1, "nom": "Dupont", "prenom": "Alice", "telephone": None,
+    "email": "alice.dupont@email.com", "administrateur": False, "date_creation": datetime(2026, 1, 1),
+}
+
+
+def test_ligne_identique_au_modele_valide():
+    """Le modèle obtenu est celui que construisait Modele(**ligne)"""
+
+    # WHEN
+    evenement = vers_modele(EvenementModelOut, LIGNE_EVENEMENT)
+
+    # THEN
+    attendu = EvenementModelOut(**LIGNE_EVENEMENT)
+    assert evenement == attendu
+    assert evenement.model_dump_json() == attendu.model_dump_json()
+    assert evenement.model_fields_set == attendu.model_fields_set
+
+
+def test_colonnes_absentes_et_en_trop():
+    """Colonne en trop ignorée, champ absent à sa valeur par défaut, dans l'ordre des champs"""
+
+    # GIVEN
+    ligne = {k: v for k, v in LIGNE_EVENEMENT.items() if k not in ("ouverture", "adresse")}
+    ligne["mot_de_passe"] = "hash"
+
+    # WHEN
+    evenement = vers_modele(EvenementModelOut, ligne)
+
+    # THEN
+    assert evenement.ouverture is None
+    assert evenement.adresse is None
+    assert not hasattr(evenement, "mot_de_passe")
+    assert list(evenement.model_dump()) == list(EvenementModelOut.model_fields)
+    assert "ouverture" not in evenement.model_fields_set
+
+
+def test_enum_converti():
+    """Le texte d'une colonne est converti en membre de l'Enum du champ"""
+
+    # GIVEN
+    ligne = {
+        "id_email": 1, "destinataire": "alice.dupont@email.com", "sujet": "s", "contenu": "c",
+        "statut": "envoye", "tentatives": 1, "prochain_essai": datetime(2026, 1, 1),
+        "date_creation": datetime(2026, 1, 1),
+    }
+
+    # WHEN
+    email = vers_modele(EmailModelOut, ligne)
+
+    # THEN
+    assert email.statut is StatutEmail.ENVOYE
+
+
+def test_colonne_requise_absente():
+    """Une requête qui ne lit pas un champ obligatoire est refusée"""
+
+    # GIVEN
+    ligne = {k: v for k, v in LIGNE_EVENEMENT.items() if k != "titre"}
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        vers_modele(EvenementModelOut, ligne)
+
+
+def test_champ_couteux_non_revalide():
+    """EmailStr : le modèle lu est identique au modèle validé, sans repasser par le validateur"""
+
+    # GIVEN
+    ligne = dict(LIGNE_UTILISATEUR, mot_de_passe="hash")
+
+    # WHEN
+    utilisateurs = vers_modeles(UtilisateurModelOut, [ligne, dict(ligne, email="pas-un-email")])
+
+    # THEN
+    attendu = UtilisateurModelOut.model_validate(LIGNE_UTILISATEUR)
+    assert utilisateurs[0] == attendu
+    assert utilisateurs[0].model_fields_set == attendu.model_fields_set
+    assert utilisateurs[1].email == "pas-un-email"
+
+
+def test_type_inattendu_signale():
+    """Avec DB_VALIDER_LIGNES=1, une valeur qui ne correspond plus au modèle est signalée"""
+
+    # GIVEN
+    ligne = dict(LIGNE_UTILISATEUR, email="pas-un-email")
+
+    # WHEN / THEN
+    with patch.dict(os.environ, {"DB_VALIDER_LIGNES": "1"}):
+        with pytest.raises(ValidationError):
+            vers_modeles(UtilisateurModelOut, [ligne])
+        assert vers_modeles(UtilisateurModelOut, []) == []
+    with pytest.raises(ValidationError):
+        vers_modele(EvenementModelOut, dict(LIGNE_EVENEMENT, capacite="trente"))
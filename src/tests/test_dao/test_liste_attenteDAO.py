@@ -0,0 +1,172 @@
+import os
+from datetime import datetime, timedelta
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.db_connection import DBConnection
+from dao.evenement_dao import EvenementDao
+from dao.liste_attente_dao import ListeAttenteDao
+from dao.reservation_dao import ReservationDao
+from model.creneauBus_models import CreneauBusModelIn
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn, StatutReservation
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def _evenement(capacite: int, places_bus_aller: int = 0, ouverture: datetime = None) -> int:
+    """Crée un événement (et son bus aller) et retourne son id."""
+    evenement = EvenementDao().create(EvenementModelIn(
+        titre="Soirée complète", ville="Rennes", date_evenement="2026-03-01",
+        capacite=capacite, statut="disponible en ligne", ouverture=ouverture,
+    ))
+    if places_bus_aller:
+        CreneauBusDao().create(CreneauBusModelIn(
+            fk_evenement=evenement.id_evenement, matricule=f"BA-{evenement.id_evenement}", nombre_places=places_bus_aller,
+            direction="aller", description=f"Bus aller {evenement.id_evenement}",
+        ))
+    return evenement.id_evenement
+
+
+def _emails(destinataire: str) -> list:
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SELECT sujet, contenu FROM email_outbox WHERE destinataire = %s", (destinataire,))
+            return curs.fetchall()
+
+
+def test_suppression_promeut_le_premier_de_la_file():
+    """Une place libérée va au premier arrivé, avec ses options, et il est prévenu par e-mail"""
+
+    # GIVEN
+    id_evt = _evenement(capacite=1)
+    reservation = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt)).reservation
+    dao = ListeAttenteDao()
+    dao.inscrire(ReservationModelIn(fk_utilisateur=3, fk_evenement=id_evt, sam=True))
+    dao.inscrire(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt))
+    emails_avant = len(_emails("caroline.durand@email.com"))
+
+    # WHEN
+    ReservationDao().delete(reservation.id_reservation)
+
+    # THEN
+    inscrits = ReservationDao().find_by_event(id_evt)
+    assert [(r.fk_utilisateur, r.sam) for r in inscrits] == [(3, True)]
+    assert dao.position(3, id_evt) is None
+    assert dao.position(4, id_evt) == 1
+    emails = _emails("caroline.durand@email.com")
+    assert len(emails) == emails_avant + 1
+    assert "Soirée complète" in emails[-1]["contenu"]
+
+
+def test_inscription_refusee_si_place_libre():
+    """Une place libre (lieu et bus demandé) ne s'obtient pas par la liste d'attente"""
+
+    # GIVEN
+    id_evt = _evenement(capacite=2, places_bus_aller=1)
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt, bus_aller=True))
+    dao = ListeAttenteDao()
+
+    # WHEN
+    sans_bus = dao.inscrire(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt))
+    bus_complet = dao.inscrire(ReservationModelIn(fk_utilisateur=3, fk_evenement=id_evt, bus_aller=True))
+
+    # THEN
+    assert sans_bus == StatutReservation.PLACES_LIBRES
+    assert bus_complet == StatutReservation.EN_ATTENTE
+    assert not ReservationDao().exists_for_user_and_event(4, id_evt)
+    assert [d.fk_utilisateur for d in dao.lister(id_evt)] == [3]
+
+
+def test_bus_abandonne_promeut_la_file_du_bus():
+    """Abandonner le bus aller donne la place au premier de la file de ce bus"""
+
+    # GIVEN
+    id_evt = _evenement(capacite=10, places_bus_aller=1)
+    alice = ReservationDao().reserver(
+        ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt, bus_aller=True)
+    ).reservation
+    david = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt)).reservation
+    ListeAttenteDao().inscrire_bus(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt), "aller")
+    assert ListeAttenteDao().position(4, id_evt, "aller") == 1
+
+    # WHEN
+    ReservationDao().update_flags(alice.id_reservation, bus_aller=False)
+
+    # THEN
+    assert ReservationDao().find_by_id(david.id_reservation).bus_aller
+    assert ReservationDao().count_bus_taken(id_evt, "aller") == 1
+    assert ListeAttenteDao().lister(id_evt) == []
+
+
+def test_update_flags_n_ajoute_pas_de_bus():
+    """update_flags ne fait que retirer un bus : True laisse le bus complet intact"""
+
+    # GIVEN
+    id_evt = _evenement(capacite=10, places_bus_aller=1)
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt, bus_aller=True))
+    david = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt)).reservation
+
+    # WHEN
+    modifiee = ReservationDao().update_flags(david.id_reservation, bus_aller=True, sam=True)
+
+    # THEN
+    assert not modifiee.bus_aller and modifiee.sam
+    assert ReservationDao().count_bus_taken(id_evt, "aller") == 1
+
+
+def test_demande_dont_le_bus_est_complet_ne_bloque_pas_la_file():
+    """Le premier attend aussi le bus, complet : la place va au suivant, il garde son rang"""
+
+    # GIVEN
+    id_evt = _evenement(capacite=2, places_bus_aller=1)
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=3, fk_evenement=id_evt, bus_aller=True))
+    bob = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=2, fk_evenement=id_evt)).reservation
+    dao = ListeAttenteDao()
+    dao.inscrire(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt, bus_aller=True))
+    dao.inscrire(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt))
+
+    # WHEN : une place se libère, mais pas dans le bus
+    ReservationDao().delete(bob.id_reservation)
+
+    # THEN
+    assert sorted(r.fk_utilisateur for r in ReservationDao().find_by_event(id_evt)) == [3, 4]
+    assert [(d.fk_utilisateur, d.position) for d in dao.lister(id_evt)] == [(1, 1)]
+
+
+def test_liste_attente_non_servie_avant_ouverture():
+    """Avant l'ouverture programmée, on ne s'inscrit pas et agrandir l'événement ne sert pas la file"""
+
+    # GIVEN : une demande en file, puis l'ouverture reportée à plus tard
+    id_evt = _evenement(capacite=1)
+    ReservationDao().reserver(ReservationModelIn(fk_utilisateur=1, fk_evenement=id_evt))
+    dao = ListeAttenteDao()
+    dao.inscrire(ReservationModelIn(fk_utilisateur=4, fk_evenement=id_evt))
+    evenement = EvenementDao().find_by_id(id_evt)
+    evenement.ouverture = datetime.now() + timedelta(hours=1)
+    EvenementDao().update(evenement)
+
+    # WHEN
+    statut = dao.inscrire(ReservationModelIn(fk_utilisateur=3, fk_evenement=id_evt))
+    CreneauBusDao().create(CreneauBusModelIn(
+        fk_evenement=id_evt, matricule=f"BA-{id_evt}", nombre_places=10,
+        direction="aller", description=f"Bus aller {id_evt}",
+    ))
+    evenement.capacite = 5
+    EvenementDao().update(evenement)
+
+    # THEN
+    assert statut == StatutReservation.PAS_OUVERT
+    assert [r.fk_utilisateur for r in ReservationDao().find_by_event(id_evt)] == [1]
+    assert dao.position(4, id_evt) == 1
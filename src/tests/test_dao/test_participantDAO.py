@@ -156,3 +156,26 @@ def test_change_password():
     participant_apres = dao.authenticate(email, nouveau_mdp)
     assert participant_apres is not None, "Le nouveau mot de passe devrait fonctionner"
     assert participant_apres.id_utilisateur == participant.id_utilisateur
+
+
+def test_create_many():
+    """Insertion en masse par COPY : les emails déjà pris sont ignorés"""
+
+    # GIVEN
+    existant = ParticipantDao().find_all()[0]
+    nouveaux = [
+        ParticipantModelIn(nom=f"Lot{i}", prenom="Import", telephone=None,
+                           email=f"lot{i}.{uuid.uuid4().hex[:6]}@example.com", mot_de_passe="x")
+        for i in range(3)
+    ]
+    doublon = ParticipantModelIn(nom="Dup", prenom="Import", email=existant.email, mot_de_passe="x")
+    hashed = hash_password("mdpLot1", rounds=4)
+
+    # WHEN
+    inseres = ParticipantDao().create_many([(p, hashed) for p in nouveaux + [doublon]])
+
+    # THEN
+    assert inseres == {p.email for p in nouveaux}
+    relu = ParticipantDao().find_by_email(nouveaux[0].email)
+    assert relu is not None and relu.telephone is None
+    assert ParticipantDao().authenticate(nouveaux[0].email, "mdpLot1") is not None
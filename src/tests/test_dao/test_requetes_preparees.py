@@ -0,0 +1,155 @@
+import os
+
+import pytest
+
+from psycopg2 import errors
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.db_connection import ConnexionChronometree, DBConnection, RequetePreparee
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def _preparees(curs) -> set:
+    curs.execute("SELECT name FROM pg_prepared_statements")
+    return {r["name"] for r in curs.fetchall()}
+
+
+def test_positionnelle():
+    """Les %(nom)s deviennent $n (un même nom, un même numéro), %% un % littéral"""
+
+    # GIVEN
+    requete = RequetePreparee(
+        "test_positionnelle",
+        "SELECT %(a)s, %(b)s, %(a)s WHERE titre LIKE 'x%%'",
+    )
+
+    # WHEN
+    texte, noms, nb = requete.positionnelle()
+
+    # THEN
+    assert texte == "SELECT $1, $2, $1 WHERE titre LIKE 'x%'"
+    assert noms == ["a", "b"]
+    assert nb == 2
+    assert requete == "SELECT %(a)s, %(b)s, %(a)s WHERE titre LIKE 'x%%'"
+    assert RequetePreparee("anonymes", "SELECT %s, %s").positionnelle() == ("SELECT $1, $2", None, 2)
+    with pytest.raises(ValueError):
+        RequetePreparee("melange", "SELECT %s, %(a)s").positionnelle()
+
+
+def test_requete_preparee_sur_la_connexion():
+    """Une RequetePreparee est préparée à sa première exécution, puis exécutée par son nom"""
+
+    # GIVEN
+    requete = EvenementDao.SQL_FIND_BY_ID
+
+    # WHEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(requete, {"id": 1})
+            premiere = curs.fetchone()
+            curs.execute(requete, {"id": 2})
+            seconde = curs.fetchone()
+            preparees = _preparees(curs)
+
+    # THEN
+    assert premiere["id_evenement"] == 1
+    assert seconde["id_evenement"] == 2
+    assert requete.nom in preparees
+    assert requete.nom in con.preparees
+
+
+def test_resultats_identiques_sans_preparation():
+    """DB_PREPARE=0 : mêmes résultats, sans instruction préparée"""
+
+    # GIVEN
+    prepare = ReservationDao().find_by_user(1)
+
+    # WHEN
+    with patch.object(ConnexionChronometree, "preparer", False):
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                curs.execute("DEALLOCATE ALL")
+            con.preparees.clear()
+        direct = ReservationDao().find_by_user(1)
+        with DBConnection().getConnexion() as con:
+            with con.cursor() as curs:
+                preparees = _preparees(curs)
+
+    # THEN
+    assert direct == prepare
+    assert ReservationDao.SQL_FIND_BY_USER.nom not in preparees
+
+
+def test_db_prepare_lu_apres_le_fichier_env():
+    """DB_PREPARE=0 venu du .env est pris en compte à la création du pool"""
+
+    # GIVEN : le .env (chargé par DBConnection) désactive la préparation
+    def charger_env(*args, **kwargs):
+        os.environ["DB_PREPARE"] = "0"
+
+    with patch.dict(os.environ), patch.object(ConnexionChronometree, "preparer", True), \
+         patch("dao.db_connection.dotenv.load_dotenv", side_effect=charger_env), \
+         patch("dao.db_connection.ConnectionPool"):
+        os.environ.pop("DB_PREPARE", None)
+
+        # WHEN : création d'un pool (hors singleton)
+        DBConnection.__init__(object.__new__(DBConnection))
+
+        # THEN
+        assert ConnexionChronometree.preparer is False
+
+def test_repli_si_la_preparation_echoue():
+    """Une requête impréparable est exécutée normalement, sans interrompre la transaction"""
+
+    # GIVEN : le type de $1 ne peut pas être déduit
+    requete = RequetePreparee("test_impreparable", "SELECT %(x)s IS NULL AS vide")
+
+    # WHEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(requete, {"x": 42})
+            resultat = curs.fetchone()
+            curs.execute(EvenementDao.SQL_FIND_BY_ID, {"id": 1})
+            suite = curs.fetchone()
+
+    # THEN
+    assert resultat["vide"] is False
+    assert suite["id_evenement"] == 1
+    assert requete.preparable is False
+
+
+def test_instruction_disparue_preparee_a_nouveau():
+    """Après un DEALLOCATE, la requête échoue une fois puis est préparée à nouveau"""
+
+    # GIVEN
+    requete = ReservationDao.SQL_COUNT_BY_EVENT
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(requete, {"id": 1})
+            curs.execute(f"DEALLOCATE {requete.nom}")
+        con.commit()
+
+        # WHEN
+        with con.cursor() as curs:
+            with pytest.raises(errors.InvalidSqlStatementName):
+                curs.execute(requete, {"id": 1})
+        con.rollback()
+        with con.cursor() as curs:
+            curs.execute(requete, {"id": 1})
+            resultat = curs.fetchone()
+
+    # THEN
+    assert resultat["c"] >= 0
+    assert requete.nom in con.preparees
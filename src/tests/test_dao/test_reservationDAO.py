@@ -1,5 +1,5 @@
 import os
-from datetime import datetime
+from datetime import datetime, timedelta
 
 
 import pytest
@@ -10,7 +10,10 @@ from utils.reset_database import ResetDatabase
 
 from dao.reservation_dao import ReservationDao
 from dao.evenement_dao import EvenementDao
-from model.reservation_models import ReservationModelIn, ReservationModelOut
+from dao.utilisateur_dao import UtilisateurDao
+from dao.commentaire_dao import CommentaireDao
+from model.evenement_models import EvenementModelIn
+from model.reservation_models import ReservationModelIn, ReservationModelOut, StatutReservation
 
 
 @pytest.fixture(scope="session", autouse=True)
@@ -49,6 +52,42 @@ def test_find_by_event():
     assert reservations is not None
 
 
+def test_lister_inscrits():
+    """La liste des inscrits en une requête correspond aux lectures réservation par réservation"""
+
+    # GIVEN
+    id_evenement = 1
+    reservations = ReservationDao().find_by_event(id_evenement)
+
+    # WHEN
+    inscrits = ReservationDao().lister_inscrits(id_evenement)
+
+    # THEN
+    assert len(inscrits) == len(reservations) > 0
+    par_id = {i.id_reservation: i for i in inscrits}
+    for r in reservations:
+        inscrit = par_id[r.id_reservation]
+        user = UtilisateurDao().find_by_id(r.fk_utilisateur)
+        comm = CommentaireDao().find_by_reservation_id(r.id_reservation)
+        assert (inscrit.nom, inscrit.prenom, inscrit.email) == (user.nom, user.prenom, user.email)
+        assert inscrit.bus_aller == r.bus_aller and inscrit.sam == r.sam
+        assert inscrit.commentaire_note == (comm.note if comm else None)
+        assert inscrit.commentaire_avis == (comm.avis if comm else None)
+
+
+def test_iter_inscrits():
+    """La lecture en flux renvoie la même liste, lot après lot"""
+
+    # GIVEN
+    id_evenement = 1
+
+    # WHEN
+    flux = list(ReservationDao().iter_inscrits(id_evenement, taille_lot=1))
+
+    # THEN
+    assert flux == ReservationDao().lister_inscrits(id_evenement)
+
+
 def test_find_by_id():
     """Récupère la réservation par son identifiant"""
 
@@ -78,6 +117,79 @@ def test_create():
     assert creation_ok.fk_evenement == 4
 
 
+def test_reserver_ok():
+    """Réservation atomique acceptée"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=4, fk_evenement=1, bus_aller=True)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == StatutReservation.OK
+    assert resultat.reservation is not None
+    assert resultat.reservation.fk_evenement == 1
+
+
+def test_reserver_deja_reserve():
+    """Une deuxième réservation du même utilisateur pour le même événement est refusée"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=1, fk_evenement=1)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == StatutReservation.DEJA_RESERVE
+    assert resultat.reservation is None
+
+
+def test_reserver_bus_complet():
+    """Pas de bus retour prévu pour l'événement 4 : la réservation avec bus retour est refusée"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=3, fk_evenement=4, bus_retour=True)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == StatutReservation.BUS_RETOUR_COMPLET
+    assert not ReservationDao().exists_for_user_and_event(3, 4)
+
+
+def test_reserver_evenement_introuvable():
+    """Réservation d'un événement inexistant"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=3, fk_evenement=9999)
+
+    # WHEN
+    resultat = ReservationDao().reserver(reservation)
+
+    # THEN
+    assert resultat.statut == StatutReservation.INTROUVABLE
+
+
+def test_reserver_avant_ouverture():
+    """Avant l'ouverture programmée, la réservation est refusée sans rien écrire"""
+
+    # GIVEN
+    evenement = EvenementDao().create(EvenementModelIn(
+        titre="Gala d'hiver", ville="Rennes", date_evenement="2026-12-12", capacite=50,
+        statut="disponible en ligne", ouverture=datetime.now() + timedelta(hours=1),
+    ))
+
+    # WHEN
+    resultat = ReservationDao().reserver(ReservationModelIn(fk_utilisateur=3, fk_evenement=evenement.id_evenement))
+
+    # THEN
+    assert resultat.statut == StatutReservation.PAS_OUVERT
+    assert not ReservationDao().exists_for_user_and_event(3, evenement.id_evenement)
+
+
 def test_update_flags():
     """Met à jour les flags d'une réservation"""
 
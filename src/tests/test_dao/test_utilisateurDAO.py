@@ -5,10 +5,11 @@ from datetime import datetime
 import pytest
 
 from unittest.mock import patch
-from utils.securite import hash_password
+from utils.securite import cout_du_hash, hacheur, hash_password
 
 from utils.reset_database import ResetDatabase
 
+from dao.db_connection import DBConnection
 from dao.utilisateur_dao import UtilisateurDao
 from model.utilisateur_models import UtilisateurModelOut, UtilisateurModelIn
 
@@ -159,3 +160,31 @@ def test_change_password():
     utilisateur_apres = dao.authenticate(email, nouveau_mdp)
     assert utilisateur_apres is not None, "Le nouveau mot de passe devrait fonctionner"
     assert utilisateur_apres.id_utilisateur == utilisateur.id_utilisateur
+
+
+def test_authenticate_rehache_au_cout_configure():
+    """Un mot de passe hashé à un ancien coût est re-hashé au coût configuré à la connexion"""
+
+    # GIVEN
+    email = f"ancien.cout.{uuid.uuid4().hex[:8]}@example.com"
+    cree = UtilisateurDao().create(
+        UtilisateurModelIn(email=email, prenom="Ancien", nom="Cout", telephone="0600000000", mot_de_passe="mdpAncien1")
+    )
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "UPDATE utilisateur SET mot_de_passe = %s WHERE id_utilisateur = %s",
+                (hash_password("mdpAncien1", rounds=4), cree.id_utilisateur),
+            )
+
+    # WHEN
+    utilisateur = UtilisateurDao().authenticate(email, "mdpAncien1")
+
+    # THEN
+    assert utilisateur is not None
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SELECT mot_de_passe FROM utilisateur WHERE id_utilisateur = %s", (cree.id_utilisateur,))
+            nouveau_hash = curs.fetchone()["mot_de_passe"]
+    assert cout_du_hash(nouveau_hash) == hacheur().cout
+    assert UtilisateurDao().authenticate(email, "mdpAncien1") is not None
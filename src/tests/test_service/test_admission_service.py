@@ -0,0 +1,141 @@
+from datetime import datetime
+
+from unittest.mock import Mock
+
+from model.reservation_models import ReservationModelIn, StatutAdmission, StatutReservation
+from service.admission_service import AdmissionService
+from utils.limiteur import SeauAJetons
+
+OUVERTURE = datetime(2026, 3, 1, 12, 0, 0)
+
+
+class Horloge:
+    """Horloge murale réglable à la main."""
+
+    def __init__(self, t: float):
+        self.t = t
+
+    def __call__(self) -> float:
+        return self.t
+
+
+def _service(horloge, capacite=100, inscrits=0, **reglages) -> AdmissionService:
+    service = AdmissionService(horloge=horloge, **reglages)
+    service.evenement_service = Mock()
+    service.evenement_service.get_event_by_id.return_value = Mock(ouverture=OUVERTURE, capacite=capacite)
+    service.reservation_service = Mock()
+    service.reservation_service.get_nb_inscrits_evenement.return_value = inscrits
+    return service
+
+
+def test_salle_attente_tiree_au_sort_a_l_ouverture():
+    """Avant l'ouverture on attend sans rang ; à l'ouverture la salle est classée, les suivants prennent la suite"""
+
+    # GIVEN
+    horloge = Horloge(OUVERTURE.timestamp() - 30)
+    service = _service(horloge, rafale=100)
+    avant = [service.demander(id_utilisateur, 1) for id_utilisateur in range(1, 6)]
+
+    # WHEN
+    horloge.t += 31
+    rangs = {id_utilisateur: service.demander(id_utilisateur, 1).position for id_utilisateur in range(1, 7)}
+
+    # THEN
+    assert all(a.statut == StatutAdmission.PAS_OUVERT and a.attente == 30 for a in avant)
+    assert sorted(rangs[i] for i in range(1, 6)) == [1, 2, 3, 4, 5]
+    assert rangs[6] == 6
+
+
+def test_admission_au_rythme_du_debit():
+    """Après la rafale, un rang de plus est admis toutes les 1/debit secondes, avec un jeton valide"""
+
+    # GIVEN
+    horloge = Horloge(OUVERTURE.timestamp())
+    service = _service(horloge, rafale=2, debit=1)
+    for id_utilisateur in (1, 2):
+        service.demander(id_utilisateur, 1)
+
+    # WHEN
+    attente = service.demander(3, 1)
+    horloge.t += 1
+    admis = service.demander(3, 1)
+
+    # THEN
+    assert attente.statut == StatutAdmission.EN_ATTENTE and attente.position == 3
+    assert attente.attente == 1 and attente.jeton is None
+    assert admis.statut == StatutAdmission.ADMIS
+    assert service.verifier_jeton(admis.jeton, 3, 1)
+    assert not service.verifier_jeton(admis.jeton, 2, 1)
+    assert not service.verifier_jeton(admis.jeton, 3, 2)
+
+
+def test_file_fermee_quand_complet():
+    """Une fois l'événement complet, la file ne délivre plus de jeton"""
+
+    # GIVEN
+    horloge = Horloge(OUVERTURE.timestamp() + 5)
+    service = _service(horloge, capacite=10, inscrits=10)
+
+    # WHEN
+    admission = service.demander(1, 1)
+
+    # THEN
+    assert admission.statut == StatutAdmission.COMPLET
+    assert admission.jeton is None
+
+
+def test_jeton_expire():
+    """Un jeton de réservation n'est plus accepté après sa durée de validité"""
+
+    # GIVEN
+    horloge = Horloge(OUVERTURE.timestamp())
+    service = _service(horloge, validite=60)
+    jeton = service.demander(1, 1).jeton
+
+    # WHEN
+    horloge.t += 61
+
+    # THEN
+    assert not service.verifier_jeton(jeton, 1, 1)
+    assert not service.verifier_jeton(jeton[:-1] + "0", 1, 1)
+
+
+def test_reserver_jeton_requis_et_tentatives_limitees():
+    """Sans jeton la réservation est refusée avant la base ; au-delà de la rafale, trop de tentatives"""
+
+    # GIVEN
+    horloge = Horloge(OUVERTURE.timestamp())
+    service = _service(horloge)
+    service.limiteur.capacite = 2
+    reservation = ReservationModelIn(fk_utilisateur=1, fk_evenement=1)
+    jeton = service.demander(1, 1).jeton
+
+    # WHEN
+    sans_jeton = service.reserver(reservation)
+    avec_jeton = service.reserver(reservation, jeton)
+    de_trop = service.reserver(reservation, jeton)
+
+    # THEN
+    assert sans_jeton.statut == StatutReservation.ADMISSION_REQUISE
+    assert avec_jeton is service.reservation_service.reserver.return_value
+    assert de_trop.statut == StatutReservation.TROP_DE_TENTATIVES
+    assert de_trop.reessayer_dans > 0
+    service.reservation_service.reserver.assert_called_once_with(reservation)
+
+
+def test_seau_a_jetons():
+    """Le seau autorise une rafale de `capacite` puis `debit` actions par seconde"""
+
+    # GIVEN
+    horloge = Horloge(0.0)
+    seau = SeauAJetons(debit=2, capacite=3, horloge=horloge)
+
+    # WHEN
+    rafale = [seau.prendre() for _ in range(4)]
+    horloge.t += 0.5
+    apres = seau.prendre()
+
+    # THEN
+    assert rafale[:3] == [0, 0, 0]
+    assert rafale[3] == 0.5
+    assert apres == 0
@@ -0,0 +1,116 @@
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.cache import CacheMemoire, cache, definir_cache
+from utils.reset_database import ResetDatabase
+
+from business_object.compacts import CreneauBusCompact, EvenementCompact
+from dao.creneau_bus_dao import CreneauBusDao
+from dao.evenement_dao import EvenementDao
+from model.reservation_models import ReservationModelIn
+from service.bus_service import BusService
+from service.evenement_service import EvenementService
+from service.reservation_service import ReservationService
+
+
+@pytest.fixture(scope="function", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test, cache vide"""
+    definir_cache(CacheMemoire())
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def test_lectures_mises_en_cache():
+    """Fiche, bus et capacités ne sont lus qu'une fois en base"""
+
+    # GIVEN
+    EvenementService().get_event_by_id(1)
+    BusService().get_buses_for_event(1)
+    BusService().get_capacite(1, "aller")
+
+    # WHEN
+    with patch.object(EvenementDao, "find_by_id") as find_evt, \
+         patch.object(CreneauBusDao, "find_by_event_id") as find_bus, \
+         patch.object(CreneauBusDao, "get_capacite_totale") as capacite:
+        evt = EvenementService().get_event_by_id(1)
+        BusService().get_buses_for_event(1)
+        BusService().get_capacite(1, "aller")
+
+    # THEN
+    assert evt.id_evenement == 1
+    find_evt.assert_not_called()
+    find_bus.assert_not_called()
+    capacite.assert_not_called()
+
+
+def test_fiche_et_bus_gardes_compacts():
+    """Le cache garde la fiche et les bus compacts, chaque lecture rend sa propre copie"""
+
+    # GIVEN
+    service = EvenementService()
+    cles = service.cache
+
+    # WHEN
+    evt = service.get_event_by_id(1)
+    bus = BusService().get_buses_for_event(1)
+
+    # THEN
+    assert isinstance(cache().lire(cles.cle_evenement(1)), EvenementCompact)
+    assert all(isinstance(b, CreneauBusCompact) for b in cache().lire(cles.cle_bus(1)))
+    assert evt == EvenementDao().find_by_id(1)
+    assert bus == CreneauBusDao().find_by_event_id(1)
+    assert service.get_event_by_id(1) is not evt
+
+
+def test_modification_evenement_invalide():
+    """Modifier un événement rend sa nouvelle fiche dès la lecture suivante"""
+
+    # GIVEN
+    service = EvenementService()
+    evt = service.get_event_by_id(1)
+
+    # WHEN
+    service.update_event(evt.model_copy(update={"titre": "Titre modifié"}))
+
+    # THEN
+    assert service.get_event_by_id(1).titre == "Titre modifié"
+
+
+def test_modification_bus_invalide_seulement_son_evenement():
+    """Changer les places d'un bus invalide la capacité de son événement, pas celle des autres"""
+
+    # GIVEN
+    bus_service = BusService()
+    bus = bus_service.get_buses_for_event(1)[0]
+    avant = bus_service.get_capacite(1, bus.direction)
+    bus_service.get_capacite(2, "aller")
+
+    # WHEN
+    bus_service.update_places(bus.id_bus, bus.nombre_places + 10)
+
+    # THEN
+    assert bus_service.get_capacite(1, bus.direction) == avant + 10
+    with patch.object(CreneauBusDao, "get_capacite_totale") as capacite:
+        bus_service.get_capacite(2, "aller")
+    capacite.assert_not_called()
+
+
+def test_reservation_invalide_les_compteurs():
+    """Une réservation met à jour les places prises et les inscrits lus ensuite"""
+
+    # GIVEN
+    service = ReservationService()
+    inscrits = service.get_nb_inscrits_evenement(2)
+    prises = service.get_nb_places_bus_prises(2, "aller")
+
+    # WHEN
+    service.create_reservation(ReservationModelIn(fk_utilisateur=4, fk_evenement=2, bus_aller=True))
+
+    # THEN
+    assert service.get_nb_inscrits_evenement(2) == inscrits + 1
+    assert service.get_nb_places_bus_prises(2, "aller") == prises + 1
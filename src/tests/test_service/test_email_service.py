@@ -0,0 +1,228 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+from utils.api_brevo import BrevoClient
+
+from dao.db_connection import DBConnection
+from dao.email_outbox_dao import EmailOutboxDao
+from model.email_models import StatutEmail
+from service.email_service import DispatcheurEmails, EmailService
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+class FauxBrevo:
+    """
+    Serveur HTTP local qui imite l'endpoint /v3/smtp/email de Brevo.
+    Enregistre les requêtes reçues ; les réponses peuvent être imposées une à une
+    (sinon 201 avec un messageId par destinataire).
+    """
+
+    def __init__(self):
+        self.requetes = []
+        self.reponses = []
+        faux = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                corps = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                faux.requetes.append({"api-key": self.headers["api-key"], "corps": corps})
+
+                if faux.reponses:
+                    status, reponse = faux.reponses.pop(0)
+                else:
+                    versions = corps.get("messageVersions") or [{"to": corps["to"]}]
+                    status = 201
+                    reponse = {"messageIds": [f"<{v['to'][0]['email']}>" for v in versions]}
+
+                data = json.dumps(reponse).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.serveur = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.serveur.server_address[1]}/v3/smtp/email"
+        threading.Thread(target=self.serveur.serve_forever, daemon=True).start()
+
+    def arreter(self):
+        self.serveur.shutdown()
+        self.serveur.server_close()
+
+
+@pytest.fixture
+def brevo():
+    faux = FauxBrevo()
+    yield faux
+    faux.arreter()
+
+
+@pytest.fixture
+def dispatcheur(brevo):
+    # Vide la file des messages laissés par les autres tests
+    DispatcheurEmails(client=BrevoClient(url=brevo.url, api_key="k", expediteur="bde@ensai.fr")).traiter_une_fois()
+    brevo.requetes.clear()
+
+    client = BrevoClient(url=brevo.url, api_key="cle-test", expediteur="bde@ensai.fr")
+    yield DispatcheurEmails(client=client, max_tentatives=3, delai_base=0, intervalle=0.05)
+    client.fermer()
+
+
+def test_programmer_ignore_doublons():
+    """Les doublons et adresses vides ne sont mis en file qu'une fois"""
+
+    # GIVEN
+    destinataires = ["a@ensai.fr", "b@ensai.fr", "a@ensai.fr", " ", ""]
+
+    # WHEN
+    nb = EmailService().programmer(destinataires, "Sujet", "Contenu")
+
+    # THEN
+    assert nb == 2
+
+
+def test_envoi_groupe_en_une_requete(brevo, dispatcheur):
+    """Un même message pour plusieurs destinataires part en une seule requête Brevo"""
+
+    # GIVEN
+    dao = EmailOutboxDao()
+    destinataires = [f"participant{i}@ensai.fr" for i in range(25)]
+    ids = dao.ajouter(destinataires, "Nouvel événement", "Venez nombreux")
+
+    # WHEN
+    traites = dispatcheur.traiter_une_fois()
+
+    # THEN
+    assert traites == 25
+    assert len(brevo.requetes) == 1
+    requete = brevo.requetes[0]
+    assert requete["api-key"] == "cle-test"
+    assert [v["to"][0]["email"] for v in requete["corps"]["messageVersions"]] == destinataires
+    for id_email, email in zip(ids, destinataires):
+        message = dao.find_by_id(id_email)
+        assert message.statut == StatutEmail.ENVOYE
+        assert message.message_id == f"<{email}>"
+        assert message.date_envoi is not None
+
+
+def test_erreur_serveur_nouvel_essai(brevo, dispatcheur):
+    """Une erreur 503 replanifie le message, qui part au cycle suivant"""
+
+    # GIVEN
+    dao = EmailOutboxDao()
+    [id_email] = dao.ajouter(["c@ensai.fr"], "Confirmation", "Réservation confirmée")
+    brevo.reponses.append((503, {"message": "indisponible"}))
+
+    # WHEN
+    dispatcheur.traiter_une_fois()
+    apres_erreur = dao.find_by_id(id_email)
+    dispatcheur.traiter_une_fois()
+    final = dao.find_by_id(id_email)
+
+    # THEN
+    assert apres_erreur.statut == StatutEmail.EN_ATTENTE
+    assert "503" in apres_erreur.derniere_erreur
+    assert final.statut == StatutEmail.ENVOYE
+    assert final.tentatives == 2
+
+
+def test_requete_refusee_echec_definitif(brevo, dispatcheur):
+    """Une erreur 400 n'est pas réessayée"""
+
+    # GIVEN
+    dao = EmailOutboxDao()
+    [id_email] = dao.ajouter(["pas-une-adresse"], "Confirmation", "Texte")
+    brevo.reponses.append((400, {"code": "invalid_parameter"}))
+
+    # WHEN
+    dispatcheur.traiter_une_fois()
+    dispatcheur.traiter_une_fois()
+
+    # THEN
+    message = dao.find_by_id(id_email)
+    assert message.statut == StatutEmail.ECHEC
+    assert message.tentatives == 1
+    assert len(brevo.requetes) == 1
+
+
+def test_abandon_apres_max_tentatives(brevo, dispatcheur):
+    """Après max_tentatives erreurs temporaires, le message passe en échec"""
+
+    # GIVEN
+    dao = EmailOutboxDao()
+    [id_email] = dao.ajouter(["d@ensai.fr"], "Rappel", "Texte")
+    brevo.reponses.extend([(429, {"message": "trop de requêtes"})] * 5)
+
+    # WHEN
+    for _ in range(5):
+        dispatcheur.traiter_une_fois()
+
+    # THEN
+    message = dao.find_by_id(id_email)
+    assert message.statut == StatutEmail.ECHEC
+    assert message.tentatives == 3
+    assert len(brevo.requetes) == 3
+
+
+def test_verrou_expire_apres_max_tentatives(brevo, dispatcheur):
+    """Un lot réservé jamais traité est repris, sauf s'il a épuisé ses tentatives"""
+
+    # GIVEN : deux messages réservés il y a une heure par un dispatcher disparu
+    dao = EmailOutboxDao()
+    id_repris, id_abandonne = dao.ajouter(["g@ensai.fr", "h@ensai.fr"], "Relance", "Texte")
+    with DBConnection().connection as con:
+        with con.cursor() as curs:
+            curs.execute(
+                "UPDATE email_outbox SET statut = 'en_cours', verrouille_le = NOW() - INTERVAL '1 hour', "
+                "tentatives = CASE WHEN id_email = %(repris)s THEN 1 ELSE 3 END "
+                "WHERE id_email IN (%(repris)s, %(abandonne)s)",
+                {"repris": id_repris, "abandonne": id_abandonne},
+            )
+
+    # WHEN
+    dispatcheur.traiter_une_fois()
+
+    # THEN
+    assert dao.find_by_id(id_repris).statut == StatutEmail.ENVOYE
+    abandonne = dao.find_by_id(id_abandonne)
+    assert abandonne.statut == StatutEmail.ECHEC
+    assert "Verrou expiré" in abandonne.derniere_erreur
+    assert [r["corps"]["to"][0]["email"] for r in brevo.requetes] == ["g@ensai.fr"]
+
+
+def test_dispatcheur_en_tache_de_fond(brevo, dispatcheur):
+    """Le thread de fond envoie les messages déposés après son démarrage"""
+
+    # GIVEN
+    dao = EmailOutboxDao()
+    dispatcheur.demarrer()
+
+    # WHEN
+    ids = dao.ajouter(["e@ensai.fr", "f@ensai.fr"], "Annulation", "Texte")
+    try:
+        for _ in range(100):
+            if all(dao.find_by_id(i).statut == StatutEmail.ENVOYE for i in ids):
+                break
+            threading.Event().wait(0.05)
+    finally:
+        dispatcheur.arreter(timeout=5)
+
+    # THEN
+    assert all(dao.find_by_id(i).statut == StatutEmail.ENVOYE for i in ids)
@@ -0,0 +1,77 @@
+import csv
+import io
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from service.export_service import ExportService
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def test_exporter_csv():
+    """L'export CSV contient l'en-tête, une ligne par inscrit et les totaux d'options"""
+
+    # GIVEN
+    sortie = io.BytesIO()
+
+    # WHEN
+    stats = ExportService().exporter(1, sortie, format="csv", separateur=";")
+
+    # THEN
+    lignes = list(csv.reader(io.StringIO(sortie.getvalue().decode("utf-8")), delimiter=";"))
+    assert lignes[0][:4] == ["id_reservation", "nom", "prenom", "email"]
+    assert len(lignes) == 1 + stats.lignes
+    assert lignes[1][1:3] == ["Dupont", "Alice"]
+    assert stats.lignes == 1 and stats.bus_aller == 1 and stats.sam == 0 and stats.boisson == 1
+
+
+def test_flux_par_lots():
+    """Le flux rend un morceau par lot de lignes lu sur le curseur serveur"""
+
+    # GIVEN
+    lots = [[(i, "Nom", "Prenom", "e@x.fr", None, True, False, False, False, True, None)] for i in range(3)]
+
+    # WHEN
+    with patch("dao.reservation_dao.ReservationDao.iter_lignes_export", return_value=iter(lots)):
+        morceaux = list(ExportService().flux(1, "csv", taille_lot=1))
+
+    # THEN
+    assert len(morceaux) == 3
+    assert morceaux[0].startswith(b"id_reservation,")
+
+
+def test_flux_evenement_ou_format_invalide():
+    """Événement inconnu ou format inconnu : ValueError avant toute lecture"""
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        ExportService().flux(9999)
+    with pytest.raises(ValueError):
+        ExportService().flux(1, format="xlsx")
+
+
+def test_exporter_parquet():
+    """L'export Parquet se relit avec les mêmes lignes"""
+
+    # GIVEN
+    pq = pytest.importorskip("pyarrow.parquet")
+    sortie = io.BytesIO()
+
+    # WHEN
+    stats = ExportService().exporter(1, sortie, format="parquet")
+
+    # THEN
+    table = pq.read_table(io.BytesIO(sortie.getvalue()))
+    assert table.num_rows == stats.lignes
+    assert table.column("nom").to_pylist() == ["Dupont"]
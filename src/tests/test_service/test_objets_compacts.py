@@ -0,0 +1,76 @@
+import sys
+from datetime import date, datetime
+
+import pytest
+
+from business_object.compacts import (
+    CreneauBusCompact,
+    Direction,
+    EvenementCompact,
+    ReservationCompacte,
+    StatutEvenement,
+    UtilisateurCompact,
+)
+from model.creneauBus_models import CreneauBusModelOut
+from model.evenement_models import EvenementModelOut
+from model.reservation_models import ReservationModelOut
+from model.utilisateur_models import UtilisateurModelOut
+
+
+def _ligne_evenement(ville: str) -> dict:
+    return {
+        "id_evenement": 1, "fk_utilisateur": 2, "titre": "Gala", "adresse": None, "ville": ville,
+        "date_evenement": date(2026, 12, 5), "description": None, "capacite": 200,
+        "categorie": "Soirée", "statut": "disponible en ligne", "date_creation": datetime(2026, 1, 1),
+    }
+
+
+def test_aller_retour_modeles():
+    """Compact -> modèle de sortie redonne le modèle d'origine"""
+
+    # GIVEN
+    reservation = ReservationModelOut(
+        id_reservation=7, fk_utilisateur=1, fk_evenement=2, bus_aller=True, bus_retour=False,
+        adherent=True, sam=False, boisson=True, date_reservation=datetime(2026, 3, 1, 20, 0),
+    )
+    bus = CreneauBusModelOut(
+        id_bus=1, fk_evenement=2, matricule=None, nombre_places=50, direction="retour", description="Retour 2h",
+    )
+    utilisateur = UtilisateurModelOut(
+        id_utilisateur=1, nom="Dupont", prenom="Alice", telephone=None, email="alice.dupont@email.com",
+        administrateur=False, date_creation=datetime(2026, 1, 1),
+    )
+    evenement = EvenementModelOut(**_ligne_evenement("Rennes"))
+
+    # WHEN / THEN
+    assert ReservationCompacte.depuis(reservation).vers_modele() == reservation
+    assert CreneauBusCompact.depuis(bus).vers_modele() == bus
+    assert UtilisateurCompact.depuis(utilisateur).vers_modele() == utilisateur
+    assert EvenementCompact.depuis(evenement).vers_modele() == evenement
+
+
+def test_options_et_valeurs_partagees():
+    """Options rangées dans un entier, statut/direction en Enum, ville et catégorie internées"""
+
+    # GIVEN : deux lignes dont les chaînes sont des objets distincts (comme lues en base)
+    ville = "".join(["Ren", "nes"])
+    e1 = EvenementCompact.depuis(_ligne_evenement(ville))
+    e2 = EvenementCompact.depuis(_ligne_evenement("".join(["Ren", "nes"])))
+    reservation = ReservationCompacte.depuis({
+        "id_reservation": 1, "fk_utilisateur": 1, "fk_evenement": 1, "bus_aller": False, "bus_retour": True,
+        "adherent": False, "sam": True, "boisson": False, "date_reservation": datetime(2026, 3, 1),
+    })
+
+    # THEN
+    assert e1.ville is e2.ville is sys.intern("Rennes")
+    assert e1.statut is StatutEvenement.DISPONIBLE
+    assert CreneauBusCompact.depuis({
+        "id_bus": 1, "fk_evenement": 1, "matricule": None, "nombre_places": 10,
+        "direction": "aller", "description": "Aller",
+    }).direction is Direction.ALLER
+    assert reservation.options == 0b01010
+    assert (reservation.bus_aller, reservation.bus_retour, reservation.sam) == (False, True, True)
+    assert not hasattr(reservation, "__dict__")
+    with pytest.raises(AttributeError):
+        reservation.options = 0
+
@@ -0,0 +1,61 @@
+import io
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.participant_dao import ParticipantDao
+from service.participant_service import ParticipantService
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def test_importer_csv():
+    """Import d'un CSV : lignes valides chargées, doublons et lignes invalides rapportés"""
+
+    # GIVEN
+    existant = ParticipantDao().find_all()[0]
+    fichier = io.StringIO(
+        "nom;prenom;telephone;email;mot_de_passe\n"
+        "Martin;Léa;0601020304;lea.martin@import.fr;mdpLea123\n"
+        "Durand;Hugo;;hugo.durand@import.fr;mdpHugo123\n"
+        "Petit;Zoé;;pas-un-email;mdpZoe123\n"
+        "Martin;Léa bis;;LEA.MARTIN@import.fr;mdpLea456\n"
+        f"Deja;Inscrit;;{existant.email};mdpDeja123\n"
+        ";SansNom;;sans.nom@import.fr;mdpSans123\n"
+    )
+
+    # WHEN
+    rapport = ParticipantService().importer_csv(fichier, separateur=";", taille_lot=2)
+
+    # THEN
+    assert rapport.lues == 6
+    assert rapport.importees == 2
+    assert [(r.ligne, r.motif.split(":")[0]) for r in rapport.rejetees] == [
+        (4, "email"),
+        (5, "email en double dans le fichier"),
+        (6, "email déjà utilisé"),
+        (7, "nom, prénom et mot de passe sont obligatoires"),
+    ]
+    hugo = ParticipantService().authenticate_participant("hugo.durand@import.fr", "mdpHugo123")
+    assert hugo.telephone is None
+
+
+def test_importer_csv_colonnes_manquantes():
+    """Un fichier sans les colonnes obligatoires est refusé"""
+
+    # GIVEN
+    fichier = io.StringIO("nom,prenom\nMartin,Léa\n")
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        ParticipantService().importer_csv(fichier)
@@ -1,20 +1,110 @@
-from unittest.mock import MagicMock, Mock
+import pytest
 
+from datetime import datetime, timedelta, timezone
+
+from unittest.mock import MagicMock, Mock, patch
+
+from service.evenement_service import EvenementService
 from service.reservation_service import ReservationService
+from dao.liste_attente_dao import ListeAttenteDao
 from dao.reservation_dao import ReservationDao
 from business_object.Reservation import Reservation
-from model.reservation_models import ReservationModelIn, ReservationModelOut
+from model.reservation_models import ReservationModelIn, ReservationModelOut, StatutReservation
 
 
 def test_create_reservation():
     """ "Création d'une réservation réussie"""
 
     # GIVEN
+    # L'événement 4 n'a pas de bus retour : on ne réserve que l'aller
     reservation = ReservationModelIn(fk_utilisateur=1, fk_evenement=4, bus_aller=True,
-                                     bus_retour=True, adherent=False, sam=False, boisson=True)
+                                     bus_retour=False, adherent=False, sam=False, boisson=True)
 
     # WHEN
     nvelle_reservation = ReservationService().create_reservation(reservation)
 
     # THEN
     assert nvelle_reservation is not None
+
+
+def test_create_reservation_bus_inexistant():
+    """Réserver un bus retour qui n'existe pas est refusé"""
+
+    # GIVEN
+    reservation = ReservationModelIn(fk_utilisateur=3, fk_evenement=4, bus_retour=True)
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        ReservationService().create_reservation(reservation)
+
+
+def _service_attente(ouverture=None, deja_reserve=False):
+    """ReservationService aux DAO simulés ; l'événement 1 ouvre à `ouverture`."""
+    service = ReservationService()
+    service.dao = Mock(spec=ReservationDao)
+    service.dao.exists_for_user_and_event.return_value = deja_reserve
+    service.attente_dao = Mock(spec=ListeAttenteDao)
+    evenement = Mock(ouverture=ouverture)
+    return service, patch.object(EvenementService, "get_event_by_id", return_value=evenement)
+
+
+def test_rejoindre_liste_attente_deja_inscrit():
+    """On ne peut pas attendre une place pour un événement déjà réservé"""
+
+    # GIVEN
+    service, evenement = _service_attente(deja_reserve=True)
+
+    # WHEN / THEN
+    with evenement, pytest.raises(ValueError):
+        service.rejoindre_liste_attente(ReservationModelIn(fk_utilisateur=1, fk_evenement=1))
+    service.attente_dao.inscrire.assert_not_called()
+
+
+def test_rejoindre_liste_attente_avant_ouverture():
+    """Avant l'ouverture programmée, la liste d'attente est refusée : on passe par la file d'admission"""
+
+    # GIVEN
+    service, evenement = _service_attente(ouverture=datetime.now(timezone.utc) + timedelta(hours=1))
+
+    # WHEN / THEN
+    with evenement, pytest.raises(ValueError, match="pas encore ouvertes"):
+        service.rejoindre_liste_attente(ReservationModelIn(fk_utilisateur=1, fk_evenement=1))
+    service.attente_dao.inscrire.assert_not_called()
+
+
+def test_rejoindre_liste_attente_apres_ouverture():
+    """Après l'ouverture, un événement complet accepte la demande et donne son rang"""
+
+    # GIVEN
+    service, evenement = _service_attente(ouverture=datetime.now(timezone.utc) - timedelta(hours=1))
+    service.attente_dao.inscrire.return_value = StatutReservation.EN_ATTENTE
+    service.attente_dao.position.return_value = 3
+
+    # WHEN
+    with evenement:
+        rang = service.rejoindre_liste_attente(ReservationModelIn(fk_utilisateur=1, fk_evenement=1))
+
+    # THEN
+    assert rang == 3
+    service.attente_dao.position.assert_called_once_with(1, 1)
+
+
+def test_rejoindre_liste_attente_places_libres():
+    """Une place libre se réserve (file d'admission), elle ne s'obtient pas par la liste d'attente"""
+
+    # GIVEN
+    service, evenement = _service_attente(ouverture=datetime.now(timezone.utc) - timedelta(hours=1))
+    service.attente_dao.inscrire.return_value = StatutReservation.PLACES_LIBRES
+
+    # WHEN / THEN
+    with evenement, pytest.raises(ValueError, match="réservez directement"):
+        service.rejoindre_liste_attente(ReservationModelIn(fk_utilisateur=1, fk_evenement=1))
+    service.attente_dao.position.assert_not_called()
+
+
+def test_attendre_bus_direction_invalide():
+    """La file d'attente d'un bus est 'aller' ou 'retour'"""
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        ReservationService().attendre_bus(1, "aller-retour")
@@ -0,0 +1,142 @@
+import os
+import time
+import uuid
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.utilisateur_dao import UtilisateurDao
+from model.utilisateur_models import UtilisateurModelIn
+from service.session_service import SessionService
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def _nouvel_utilisateur(mot_de_passe="mdpSession1"):
+    email = f"session.{uuid.uuid4().hex[:8]}@example.com"
+    return UtilisateurDao().create(
+        UtilisateurModelIn(email=email, prenom="Sess", nom="Ion", telephone="0600000000", mot_de_passe=mot_de_passe)
+    )
+
+
+def test_connecter_et_lire_utilisateur():
+    """Un jeton délivré à la connexion donne l'utilisateur ; un jeton inconnu ne donne rien"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    sessions = SessionService(persistance=False)
+
+    # WHEN
+    jeton = sessions.connecter(user.email, "mdpSession1")
+
+    # THEN
+    assert sessions.utilisateur(jeton).id_utilisateur == user.id_utilisateur
+    assert sessions.utilisateur("inconnu") is None
+    with pytest.raises(ValueError):
+        sessions.connecter(user.email, "mauvais1")
+
+
+def test_expiration_glissante():
+    """Chaque lecture repousse l'expiration ; une session inactive plus que le TTL expire"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    sessions = SessionService(ttl=0.3, persistance=False)
+    jeton = sessions.ouvrir(user)
+
+    # WHEN / THEN : lectures rapprochées, au-delà du TTL au total
+    for _ in range(3):
+        time.sleep(0.15)
+        assert sessions.utilisateur(jeton) is not None
+
+    # WHEN / THEN : inactivité
+    time.sleep(0.4)
+    assert sessions.utilisateur(jeton) is None
+    assert len(sessions) == 0
+
+
+def test_eviction_lru():
+    """Au-delà de la capacité, la session la moins récemment utilisée est évincée"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    sessions = SessionService(capacite=2, persistance=False)
+    j1, j2 = sessions.ouvrir(user), sessions.ouvrir(user)
+    sessions.utilisateur(j1)  # j1 redevient la plus récente
+
+    # WHEN
+    j3 = sessions.ouvrir(user)
+
+    # THEN
+    assert len(sessions) == 2
+    assert sessions.utilisateur(j2) is None
+    assert sessions.utilisateur(j1) is not None
+    assert sessions.utilisateur(j3) is not None
+
+
+def test_persistance_relue_par_un_autre_processus():
+    """Une session persistée est relue en base par un autre magasin, et fermée partout"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    jeton = SessionService(persistance=True).ouvrir(user)
+    autre = SessionService(persistance=True)
+
+    # WHEN
+    relu = autre.utilisateur(jeton)
+
+    # THEN
+    assert relu.id_utilisateur == user.id_utilisateur
+    assert relu.email == user.email
+
+    # WHEN / THEN : fermeture de toutes les sessions de l'utilisateur
+    autre.fermer_sessions_utilisateur(user.id_utilisateur)
+    assert SessionService(persistance=True).utilisateur(jeton) is None
+
+
+def test_verifier_mot_de_passe_sans_bcrypt():
+    """Le mot de passe saisi à la connexion est re-vérifié sans repasser par bcrypt"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    sessions = SessionService(persistance=False)
+    jeton = sessions.connecter(user.email, "mdpSession1")
+
+    # WHEN
+    with patch.object(UtilisateurDao, "authenticate") as authenticate:
+        bon = sessions.verifier_mot_de_passe(jeton, "mdpSession1")
+        mauvais = sessions.verifier_mot_de_passe(jeton, "mauvais1")
+
+    # THEN
+    assert bon is True
+    assert mauvais is False
+    authenticate.assert_not_called()
+
+
+def test_oublier_mots_de_passe():
+    """Après un changement de mot de passe, l'ancien n'est plus accepté"""
+
+    # GIVEN
+    user = _nouvel_utilisateur()
+    sessions = SessionService(persistance=False)
+    jeton = sessions.connecter(user.email, "mdpSession1")
+    UtilisateurDao().change_password(user.id_utilisateur, "mdpSession2")
+
+    # WHEN
+    sessions.oublier_mots_de_passe(user.id_utilisateur)
+
+    # THEN : vérification par bcrypt, puis par empreinte
+    assert sessions.verifier_mot_de_passe(jeton, "mdpSession1") is False
+    assert sessions.verifier_mot_de_passe(jeton, "mdpSession2") is True
+    with patch.object(UtilisateurDao, "authenticate") as authenticate:
+        assert sessions.verifier_mot_de_passe(jeton, "mdpSession2") is True
+    authenticate.assert_not_called()
@@ -0,0 +1,61 @@
+import time
+
+from utils.cache import CacheMemoire, _ABSENT, definir_cache, lire_ou_charger
+
+
+def test_cache_memoire_lru():
+    """Au-delà de la capacité, l'entrée la moins récemment lue est évincée"""
+
+    # GIVEN
+    cache = CacheMemoire(capacite=2, ttl=60)
+    cache.ecrire("a", 1)
+    cache.ecrire("b", 2)
+    cache.lire("a")
+
+    # WHEN
+    cache.ecrire("c", 3)
+
+    # THEN
+    assert cache.lire("b") is _ABSENT
+    assert cache.lire("a") == 1 and cache.lire("c") == 3
+
+
+def test_cache_memoire_ttl_et_suppression():
+    """Une entrée expire après son TTL ; supprimer retire les clés données"""
+
+    # GIVEN
+    cache = CacheMemoire(ttl=60)
+    cache.ecrire("court", "x", ttl=0.05)
+    cache.ecrire("long", "y")
+    cache.ecrire("autre", "z")
+
+    # WHEN
+    time.sleep(0.1)
+    cache.supprimer("autre", "inconnue")
+
+    # THEN
+    assert cache.lire("court") is _ABSENT
+    assert cache.lire("long") == "y"
+    assert cache.lire("autre") is _ABSENT
+
+
+def test_lire_ou_charger():
+    """La valeur n'est chargée qu'une fois ; None n'est pas gardé"""
+
+    # GIVEN
+    definir_cache(CacheMemoire())
+    appels = []
+
+    def charger():
+        appels.append(1)
+        return "valeur"
+
+    # WHEN
+    premiere = lire_ou_charger("cle", charger)
+    seconde = lire_ou_charger("cle", charger)
+    lire_ou_charger("vide", lambda: None)
+
+    # THEN
+    assert premiere == seconde == "valeur"
+    assert len(appels) == 1
+    assert lire_ou_charger("vide", lambda: "cree") == "cree"
@@ -0,0 +1,107 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.demarrage import Demarrage
+from utils.singleton import Singleton
+
+SRC = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+
+# Le menu d'accueil ne doit charger aucun de ces paquets : ils le sont à la
+# première navigation (vues, services) ou en tâche de fond (base, e-mails)
+IMPORTS_DIFFERES = ("service", "dao", "model", "pydantic", "psycopg2", "requests", "bcrypt", "email_validator")
+
+# Budget d'import de main.py (meilleur de 3 essais, en ms) ; surchargeable pour une machine lente
+BUDGET_IMPORT_MS = float(os.getenv("BUDGET_IMPORT_MS", "250"))
+
+
+@pytest.fixture(scope="session")
+def base_de_test():
+    """Initialisation des données de test (seul le démarrage en tâche de fond utilise la base)"""
+    from utils.reset_database import ResetDatabase
+
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def _importer_main():
+    """Importe main.py dans un interpréteur neuf : (modules chargés, durée cumulée en ms)."""
+    resultat = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import sys, main; print(' '.join(sys.modules))"],
+        cwd=SRC,
+        env={**os.environ, "PYTHONPATH": SRC},
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    ligne_main = next(l for l in resultat.stderr.splitlines() if l.split("|")[-1].strip() == "main")
+    return set(resultat.stdout.split()), int(ligne_main.split("|")[1]) / 1000
+
+
+def test_import_main_differe_les_dependances_lourdes():
+    """Le menu d'accueil s'affiche sans services, DAO, modèles ni pilote PostgreSQL"""
+
+    # WHEN
+    modules, _ = _importer_main()
+
+    # THEN
+    charges = sorted(m for m in modules if m.split(".")[0] in IMPORTS_DIFFERES)
+    assert charges == []
+    assert "view.accueil.accueil_vue" in modules
+    assert "view.consulter.consulter_evenement_vue" not in modules
+
+
+def test_budget_import_main():
+    """L'import de main.py (-X importtime) reste dans son budget"""
+
+    # WHEN
+    duree_ms = min(_importer_main()[1] for _ in range(3))
+
+    # THEN
+    assert duree_ms <= BUDGET_IMPORT_MS, f"import de main : {duree_ms:.0f} ms > {BUDGET_IMPORT_MS:.0f} ms"
+
+
+def test_demarrage_en_tache_de_fond(base_de_test):
+    """La base s'ouvre en tâche de fond ; le dispatcheur ne démarre que s'il est activé"""
+
+    # GIVEN
+    with patch.dict(os.environ, {"EMAIL_DISPATCHER": "0"}):
+
+        # WHEN
+        demarrage = Demarrage().lancer()
+        termine = demarrage.attendre(timeout=30)
+
+    # THEN
+    assert termine
+    assert demarrage.erreur is None
+    assert demarrage.dispatcheur is None
+    demarrage.arreter()
+
+
+def test_singleton_partage_entre_threads():
+    """Deux threads qui créent le même singleton en même temps obtiennent la même instance"""
+
+    # GIVEN
+    class Lent(metaclass=Singleton):
+        def __init__(self):
+            time.sleep(0.05)
+
+    instances = []
+
+    # WHEN
+    threads = [threading.Thread(target=lambda: instances.append(Lent())) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    # THEN
+    assert len(instances) == 8
+    assert all(i is instances[0] for i in instances)
@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+from utils.migrations import Migrations
+
+from dao.db_connection import DBConnection
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def test_migrations_appliquees_au_reset():
+    """La réinitialisation applique toutes les migrations et les enregistre"""
+
+    # GIVEN
+    attendues = [version for version, _, _ in Migrations().lister()]
+
+    # WHEN
+    with DBConnection().getConnexion() as con:
+        with con.cursor() as curs:
+            curs.execute("SELECT version FROM schema_version ORDER BY version")
+            versions = [row["version"] for row in curs.fetchall()]
+            curs.execute(
+                "SELECT indexname FROM pg_indexes WHERE schemaname = current_schema() AND tablename = 'reservation'"
+            )
+            index = {row["indexname"] for row in curs.fetchall()}
+
+    # THEN
+    assert versions == attendues
+    assert "reservation_evenement_date_idx" in index
+
+
+def test_appliquer_sans_migration_manquante():
+    """Relancer les migrations sur un schéma à jour ne fait rien"""
+
+    # WHEN
+    appliquees = Migrations().appliquer()
+
+    # THEN
+    assert appliquees == []
+
+
+def test_numero_de_migration_en_double(tmp_path):
+    """Deux fichiers de même version sont refusés"""
+
+    # GIVEN
+    (tmp_path / "001_a.sql").write_text("SELECT 1;")
+    (tmp_path / "001_b.sql").write_text("SELECT 1;")
+
+    # WHEN / THEN
+    with pytest.raises(ValueError):
+        Migrations(str(tmp_path)).lister()
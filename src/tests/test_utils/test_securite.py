@@ -0,0 +1,77 @@
+import asyncio
+
+from utils.securite import (
+    HacheurMotsDePasse,
+    check_password,
+    cout_du_hash,
+    hash_password,
+    verifier_et_rehacher,
+)
+
+
+def test_cout_du_hash():
+    """Le coût est lu dans l'en-tête du hash bcrypt"""
+
+    # GIVEN
+    hashed = hash_password("mdp", rounds=5)
+
+    # WHEN / THEN
+    assert cout_du_hash(hashed) == 5
+    assert cout_du_hash("pas un hash") is None
+
+
+def test_verifier_et_rehacher():
+    """Un nouveau hash n'est produit que si le mot de passe est bon et le coût différent"""
+
+    # GIVEN
+    hashed = hash_password("mdp", rounds=4)
+
+    # WHEN
+    ok_meme_cout, rien = verifier_et_rehacher("mdp", hashed, 4)
+    ok_autre_cout, nouveau = verifier_et_rehacher("mdp", hashed, 5)
+    faux, rien_non_plus = verifier_et_rehacher("autre", hashed, 5)
+
+    # THEN
+    assert ok_meme_cout and rien is None
+    assert ok_autre_cout and cout_du_hash(nouveau) == 5 and check_password("mdp", nouveau)
+    assert not faux and rien_non_plus is None
+
+
+def test_hacheur_pool_de_processus():
+    """Les API synchrone et asynchrone du hacheur passent par le pool de processus"""
+
+    # GIVEN
+    hacheur = HacheurMotsDePasse(workers=2, cout=4)
+
+    async def en_parallele():
+        hashes = await asyncio.gather(*(hacheur.hacher_async(f"mdp{i}") for i in range(4)))
+        return await asyncio.gather(*(hacheur.verifier_async(f"mdp{i}", h) for i, h in enumerate(hashes)))
+
+    try:
+        # WHEN
+        hashed = hacheur.hacher("mdp")
+        verifications = asyncio.run(en_parallele())
+
+        # THEN
+        assert cout_du_hash(hashed) == 4
+        assert hacheur.verifier("mdp", hashed)
+        assert not hacheur.verifier("autre", hashed)
+        assert verifications == [True] * 4
+        lot = hacheur.hacher_lot([f"mdp{i}" for i in range(5)])
+        assert [check_password(f"mdp{i}", h) for i, h in enumerate(lot)] == [True] * 5
+    finally:
+        hacheur.fermer()
+
+
+def test_hacheur_sans_pool():
+    """Avec 0 processus, le calcul se fait dans l'appelant"""
+
+    # GIVEN
+    hacheur = HacheurMotsDePasse(workers=0, cout=4)
+
+    # WHEN
+    ok, nouveau = hacheur.verifier_et_rehacher("mdp", hash_password("mdp", rounds=5))
+
+    # THEN
+    assert ok and cout_du_hash(nouveau) == 4
+    assert hacheur._pool is None
@@ -0,0 +1,80 @@
+import os
+
+import pytest
+
+from unittest.mock import patch
+
+from utils.reset_database import ResetDatabase
+
+from dao.evenement_dao import EvenementDao
+from dao.reservation_dao import ReservationDao
+from utils.stats_requetes import HistogrammeLatence, stats_requetes
+
+
+@pytest.fixture(scope="session", autouse=True)
+def setup_test_environment():
+    """Initialisation des données de test"""
+    with patch.dict(os.environ, {"SCHEMA": "projet_test_dao"}):
+        ResetDatabase().lancer(test_dao=True)
+        yield
+
+
+def _requetes(site: str) -> list:
+    return [r for r in stats_requetes().rapport()["requetes"] if r["site"] == site]
+
+
+def test_histogramme_centiles():
+    """Les centiles sont les bornes des classes qui les contiennent"""
+
+    # GIVEN
+    histogramme = HistogrammeLatence()
+
+    # WHEN
+    for duree_ms in [0.8] * 90 + [15] * 9 + [700]:
+        histogramme.ajouter(duree_ms, lignes=1, erreur=False)
+
+    # THEN
+    assert histogramme.centile(0.50) == 1
+    assert histogramme.centile(0.95) == 20
+    assert histogramme.centile(1.0) == 1000
+    assert histogramme.resume()["lignes"] == 100
+
+
+def test_requetes_chronometrees_par_site():
+    """Chaque requête d'un DAO est comptée sous « Classe.méthode », avec ses lignes"""
+
+    # GIVEN
+    stats_requetes().reinitialiser()
+
+    # WHEN
+    EvenementDao().find_by_id(1)
+    EvenementDao().find_by_id(2)
+    ReservationDao().find_by_event(1)
+
+    # THEN
+    [find_by_id] = _requetes("EvenementDao.find_by_id")
+    assert find_by_id["appels"] == 2
+    assert find_by_id["lignes"] == 2
+    assert "FROM evenement" in find_by_id["sql"]
+    assert _requetes("ReservationDao.find_by_event")[0]["appels"] == 1
+
+
+def test_requete_lente_et_plan():
+    """Au-delà du seuil, la requête est gardée et son plan disponible à la demande"""
+
+    # GIVEN
+    stats = stats_requetes()
+    stats.reinitialiser()
+
+    # WHEN
+    with patch.object(stats, "seuil_ms", 0):
+        EvenementDao().find_by_id(3)
+    lentes = [r for r in stats.requetes_lentes() if r["site"] == "EvenementDao.find_by_id"]
+    plan = stats.expliquer(stats.requetes_lentes().index(lentes[0]))
+
+    # THEN
+    assert "params" not in lentes[0]
+    assert "Scan" in plan
+    assert _requetes("EvenementDao.find_by_id")[0]["appels"] == 1
+    with pytest.raises(ValueError):
+        stats.expliquer(10_000)
@@ -1,24 +1,130 @@
-import requests
 import os
+import threading
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 
+URL_BREVO = "https://api.brevo.com/v3/smtp/email"
+
+
+@dataclass
+class ReponseBrevo:
+    """Réponse de l'API d'envoi : code HTTP, corps brut et identifiants des messages acceptés."""
+    status: int
+    texte: str
+    message_ids: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+
+class BrevoClient:
+    """
+    Client de l'API transactionnelle de Brevo.
+
+    - une seule session HTTP (connexions keep-alive réutilisées d'un envoi à l'autre),
+      dimensionnée pour `max_connexions` envois simultanés ;
+    - `envoyer_lot` envoie le même message à plusieurs destinataires en une requête
+      (paramètre `messageVersions` : chaque destinataire reçoit son propre e-mail
+      et ne voit pas les autres).
+
+    Configuration : TOKEN_BREVO, EMAIL_BREVO, BREVO_API_URL (par défaut l'API publique).
+    """
+
+    # Nombre de destinataires par requête
+    MAX_DESTINATAIRES = 1000
+
+    def __init__(
+        self,
+        url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        expediteur: Optional[str] = None,
+        timeout: float = 10.0,
+        max_connexions: int = 10,
+    ):
+        self.url = url or os.getenv("BREVO_API_URL", URL_BREVO)
+        self.api_key = api_key or os.getenv("TOKEN_BREVO", "")
+        self.expediteur = expediteur or os.getenv("EMAIL_BREVO", "")
+        self.timeout = timeout
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_connexions)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers.update({
+            "accept": "application/json",
+            "api-key": self.api_key,
+            "content-type": "application/json",
+        })
+
+    def _corps(self, destinataires: Sequence[str], subject: str, message_text: str) -> dict:
+        data = {
+            "sender": {"name": "no_reply BDE Ensai", "email": self.expediteur},
+            "subject": subject,
+            "textContent": message_text,
+        }
+        if len(destinataires) == 1:
+            data["to"] = [{"email": destinataires[0], "name": "Destinataire"}]
+        else:
+            data["messageVersions"] = [
+                {"to": [{"email": email, "name": "Destinataire"}]} for email in destinataires
+            ]
+        return data
+
+    def envoyer_lot(self, destinataires: Sequence[str], subject: str, message_text: str) -> ReponseBrevo:
+        """
+        Envoie le message à tous les destinataires (au plus MAX_DESTINATAIRES) en une requête.
+        Les erreurs réseau sont propagées (requests.RequestException).
+        """
+        if not destinataires:
+            raise ValueError("Aucun destinataire.")
+        if len(destinataires) > self.MAX_DESTINATAIRES:
+            raise ValueError(f"Au plus {self.MAX_DESTINATAIRES} destinataires par envoi.")
+
+        response = self.session.post(
+            self.url, json=self._corps(destinataires, subject, message_text), timeout=self.timeout
+        )
+        message_ids: List[str] = []
+        if 200 <= response.status_code < 300:
+            try:
+                payload = response.json()
+            except ValueError:
+                payload = {}
+            if "messageIds" in payload:
+                message_ids = list(payload["messageIds"])
+            elif "messageId" in payload:
+                message_ids = [payload["messageId"]]
+        return ReponseBrevo(response.status_code, response.text, message_ids)
+
+    def fermer(self) -> None:
+        self.session.close()
+
+
+_client: Optional[BrevoClient] = None
+_client_lock = threading.Lock()
+
+
+def client_brevo() -> BrevoClient:
+    """Client partagé par le processus (créé à la première utilisation)."""
+    global _client
+    with _client_lock:
+        if _client is None:
+            _client = BrevoClient()
+        return _client
+
+
 def send_email_brevo(to_email, subject, message_text):
-    url = "https://api.brevo.com/v3/smtp/email"
-    headers = {
-        "accept": "application/json",
-        "api-key": os.environ["TOKEN_BREVO"],
-        "content-type": "application/json"
-    }
-    data = {
-        "sender": {"name": "no_reply BDE Ensai", "email": os.environ["EMAIL_BREVO"]},
-        "to": [{"email": to_email, "name": "Destinataire"}],
-        "subject": subject,
-        "textContent": message_text
-    }
-
-    response = requests.post(url, headers=headers, json=data)
-    return response.status_code, response.text
+    """
+    Envoi immédiat d'un e-mail à un destinataire.
+    Les services passent plutôt par la file d'envoi (service.email_service.EmailService).
+    """
+    reponse = client_brevo().envoyer_lot([to_email], subject, message_text)
+    return reponse.status, reponse.texte
 
 
 if __name__ == "__main__":
@@ -0,0 +1,159 @@
+# utils/cache.py
+import os
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+_ABSENT = object()
+
+
+class CacheMemoire:
+    """
+    Cache LRU en mémoire du processus, avec durée de vie par entrée.
+
+    - au-delà de `capacite` entrées, la moins récemment lue est évincée ;
+    - une entrée plus vieille que son `ttl` (secondes) est ignorée puis retirée ;
+    - les valeurs sont rendues telles quelles (pas de copie) : ne pas les modifier.
+    """
+
+    def __init__(self, capacite: int = 10000, ttl: float = 300.0):
+        self.capacite = capacite
+        self.ttl = ttl
+        self._entrees: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lire(self, cle: str) -> Any:
+        """Valeur de `cle`, ou `_ABSENT` si elle n'est pas en cache (ou expirée)."""
+        with self._lock:
+            entree = self._entrees.get(cle)
+            if entree is None:
+                return _ABSENT
+            expire, valeur = entree
+            if expire <= time.monotonic():
+                del self._entrees[cle]
+                return _ABSENT
+            self._entrees.move_to_end(cle)
+            return valeur
+
+    def ecrire(self, cle: str, valeur: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._entrees[cle] = (time.monotonic() + (ttl or self.ttl), valeur)
+            self._entrees.move_to_end(cle)
+            while len(self._entrees) > self.capacite:
+                self._entrees.popitem(last=False)
+
+    def supprimer(self, *cles: str) -> None:
+        with self._lock:
+            for cle in cles:
+                self._entrees.pop(cle, None)
+
+    def vider(self) -> None:
+        with self._lock:
+            self._entrees.clear()
+
+    def __len__(self) -> int:
+        return len(self._entrees)
+
+
+class CacheRedis:
+    """
+    Cache partagé entre processus (workers de l'API, console) sur un serveur Redis :
+    une invalidation faite par un processus vaut pour tous.
+    Même interface que CacheMemoire ; nécessite le paquet optionnel `redis`.
+    Les valeurs sont sérialisées avec pickle : le serveur doit être privé.
+    """
+
+    def __init__(self, url: str, ttl: float = 300.0, prefixe: str = "shotgun:"):
+        try:
+            import redis
+        except ImportError:
+            raise ValueError("CACHE_REDIS_URL nécessite le paquet redis (pip install redis).")
+        self.ttl = ttl
+        self.prefixe = prefixe
+        self._client = redis.Redis.from_url(url)
+
+    def lire(self, cle: str) -> Any:
+        data = self._client.get(self.prefixe + cle)
+        return _ABSENT if data is None else pickle.loads(data)
+
+    def ecrire(self, cle: str, valeur: Any, ttl: Optional[float] = None) -> None:
+        self._client.set(self.prefixe + cle, pickle.dumps(valeur), px=int((ttl or self.ttl) * 1000))
+
+    def supprimer(self, *cles: str) -> None:
+        if cles:
+            self._client.delete(*(self.prefixe + c for c in cles))
+
+    def vider(self) -> None:
+        curseur = 0
+        while True:
+            curseur, cles = self._client.scan(curseur, match=self.prefixe + "*", count=1000)
+            if cles:
+                self._client.delete(*cles)
+            if curseur == 0:
+                break
+
+
+class CacheDesactive:
+    """Cache vide (CACHE_ACTIF=0) : chaque lecture passe par la base."""
+
+    def lire(self, cle: str) -> Any:
+        return _ABSENT
+
+    def ecrire(self, cle: str, valeur: Any, ttl: Optional[float] = None) -> None:
+        pass
+
+    def supprimer(self, *cles: str) -> None:
+        pass
+
+    def vider(self) -> None:
+        pass
+
+
+def lire_ou_charger(cle: str, charger: Callable[[], Any], ttl: Optional[float] = None) -> Any:
+    """
+    Valeur en cache de `cle`, sinon calculée par `charger()` puis mise en cache.
+    None (objet introuvable) n'est pas gardé : il peut être créé juste après.
+    """
+    c = cache()
+    valeur = c.lire(cle)
+    if valeur is _ABSENT:
+        valeur = charger()
+        if valeur is not None:
+            c.ecrire(cle, valeur, ttl)
+    return valeur
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def cache():
+    """
+    Cache partagé par le processus (créé à la première utilisation).
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      CACHE_ACTIF       0 pour désactiver le cache (défaut 1)
+      CACHE_TTL         durée de vie des entrées, en secondes (défaut 300)
+      CACHE_CAPACITE    entrées gardées en mémoire (défaut 10000)
+      CACHE_REDIS_URL   cache partagé sur un serveur Redis (défaut : mémoire du processus)
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            ttl = float(os.getenv("CACHE_TTL", "300"))
+            if os.getenv("CACHE_ACTIF", "1") == "0":
+                _cache = CacheDesactive()
+            elif os.getenv("CACHE_REDIS_URL"):
+                _cache = CacheRedis(os.getenv("CACHE_REDIS_URL"), ttl=ttl)
+            else:
+                _cache = CacheMemoire(capacite=int(os.getenv("CACHE_CAPACITE", "10000")), ttl=ttl)
+        return _cache
+
+
+def definir_cache(backend) -> None:
+    """Remplace le cache du processus (autre backend partagé, tests...)."""
+    global _cache
+    with _cache_lock:
+        _cache = backend
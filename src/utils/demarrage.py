@@ -0,0 +1,59 @@
+# utils/demarrage.py
+import logging
+import threading
+from typing import Any, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Demarrage:
+    """
+    Travaux de démarrage de la console, faits dans un thread de fond pendant
+    que le menu d'accueil s'affiche (le menu n'attend pas la base) :
+    - ouverture du pool de connexions (DBConnection) ;
+    - démarrage du dispatcheur d'e-mails, s'il est activé (DispatcheurEmails.active).
+
+    Les modules lourds (psycopg2, services, modèles pydantic, requests...) sont
+    importés ici, pas par main.py : le menu d'accueil ne charge qu'InquirerPy.
+    Un échec est journalisé sans interrompre l'application : la connexion
+    sera retentée, et l'erreur affichée, à la première requête.
+    """
+
+    def __init__(self):
+        self.dispatcheur: Optional[Any] = None
+        self.erreur: Optional[Exception] = None
+        self._thread: Optional[threading.Thread] = None
+
+    def lancer(self) -> "Demarrage":
+        """Démarre les travaux en tâche de fond et rend la main immédiatement."""
+        self._thread = threading.Thread(target=self._executer, name="demarrage", daemon=True)
+        self._thread.start()
+        return self
+
+    def _executer(self) -> None:
+        try:
+            from dao.db_connection import DBConnection
+
+            DBConnection()
+
+            from service.email_service import DispatcheurEmails
+
+            if DispatcheurEmails.active():
+                self.dispatcheur = DispatcheurEmails()
+                self.dispatcheur.demarrer()
+        except Exception as e:
+            self.erreur = e
+            logger.exception("Échec du démarrage en tâche de fond : %s", e)
+
+    def attendre(self, timeout: Optional[float] = None) -> bool:
+        """Attend la fin des travaux de démarrage ; True s'ils sont terminés."""
+        if self._thread is None:
+            return True
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def arreter(self, timeout: float = 10) -> None:
+        """Fin de l'application : arrête le dispatcheur d'e-mails s'il a été démarré."""
+        self.attendre(timeout)
+        if self.dispatcheur:
+            self.dispatcheur.arreter(timeout=timeout)
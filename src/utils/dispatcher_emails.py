@@ -0,0 +1,48 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+
+import dotenv
+
+from service.email_service import DispatcheurEmails, EmailService
+
+
+def vider_file() -> int:
+    """
+    Envoie tous les e-mails dus de la file, puis affiche l'état de la file.
+    Retourne le nombre de messages traités.
+    """
+    dispatcheur = DispatcheurEmails()
+    total = 0
+    while True:
+        traites = dispatcheur.traiter_une_fois()
+        total += traites
+        if traites < dispatcheur.taille_lot:
+            break
+
+    stats = EmailService().statistiques()
+    print(f"{total} message(s) traité(s). File : "
+          + ", ".join(f"{statut.value}={n}" for statut, n in stats.items()))
+    return total
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    if "--continu" in sys.argv:
+        # Tourne jusqu'à Ctrl+C (à la place du dispatcher intégré : EMAIL_DISPATCHER=0)
+        dispatcheur = DispatcheurEmails()
+        dispatcheur.demarrer()
+        try:
+            while True:
+                time.sleep(3600)
+        except KeyboardInterrupt:
+            dispatcheur.arreter()
+    else:
+        vider_file()
+
+# Exemple :
+# PYTHONPATH="src"; python src/utils/dispatcher_emails.py [--continu]
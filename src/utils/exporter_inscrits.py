@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import time
+
+import dotenv
+
+from model.reservation_models import StatsExport
+from service.export_service import ExportService
+
+
+def exporter_inscrits(id_evenement: int, chemin: str, format: str = None, separateur: str = ",") -> StatsExport:
+    """
+    Exporte les inscrits d'un événement dans `chemin` (CSV ou Parquet, d'après
+    l'extension si `format` n'est pas donné) et affiche les totaux.
+    """
+    format = format or ("parquet" if chemin.endswith(".parquet") else "csv")
+    debut = time.perf_counter()
+    with open(chemin, "wb") as f:
+        stats = ExportService().exporter(id_evenement, f, format=format, separateur=separateur)
+    duree = time.perf_counter() - debut
+
+    print(f"{stats.lignes} inscrit(s) exporté(s) dans {chemin} en {duree:.1f} s.")
+    print(f"  bus aller : {stats.bus_aller} | bus retour : {stats.bus_retour} | "
+          f"adhérents : {stats.adherent} | SAM : {stats.sam} | boisson : {stats.boisson}")
+    return stats
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Export des inscrits d'un événement (CSV / Parquet)")
+    parser.add_argument("id_evenement", type=int)
+    parser.add_argument("fichier", help="fichier de sortie (.csv ou .parquet)")
+    parser.add_argument("--format", choices=ExportService.FORMATS, help="défaut : d'après l'extension")
+    parser.add_argument("--separateur", default=",", help="séparateur CSV (défaut : ',')")
+    args = parser.parse_args()
+
+    try:
+        exporter_inscrits(args.id_evenement, args.fichier, args.format, args.separateur)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+
+# Exemple :
+# PYTHONPATH="src"; python src/utils/exporter_inscrits.py 12 inscrits_gala.csv [--separateur ";"]
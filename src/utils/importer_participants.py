@@ -0,0 +1,49 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import argparse
+import time
+
+import dotenv
+
+from model.participant_models import RapportImport
+from service.participant_service import ParticipantService
+from utils.securite import hacheur
+
+
+def importer_participants(chemin: str, separateur: str = ",", taille_lot: int = 1000) -> RapportImport:
+    """
+    Importe les participants d'un fichier CSV (en-tête : nom, prenom, telephone,
+    email, mot_de_passe) et affiche le bilan, avec les lignes rejetées.
+    """
+    debut = time.perf_counter()
+    with open(chemin, encoding="utf-8-sig", newline="") as f:
+        rapport = ParticipantService().importer_csv(f, separateur=separateur, taille_lot=taille_lot)
+    duree = time.perf_counter() - debut
+
+    print(f"{rapport.importees} participant(s) importé(s) sur {rapport.lues} ligne(s) en {duree:.1f} s.")
+    if rapport.rejetees:
+        print(f"{len(rapport.rejetees)} ligne(s) rejetée(s) :")
+        for r in rapport.rejetees:
+            print(f"  ligne {r.ligne} ({r.email or '?'}) : {r.motif}")
+    return rapport
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    parser = argparse.ArgumentParser(description="Import en masse de participants depuis un CSV")
+    parser.add_argument("fichier", help="fichier CSV (UTF-8) avec ligne d'en-tête")
+    parser.add_argument("--separateur", default=",", help="séparateur de colonnes (défaut : ',')")
+    parser.add_argument("--taille-lot", type=int, default=1000, help="lignes chargées par transaction")
+    args = parser.parse_args()
+
+    try:
+        importer_participants(args.fichier, args.separateur, args.taille_lot)
+    finally:
+        hacheur().fermer()
+
+# Exemple :
+# PYTHONPATH="src"; python src/utils/importer_participants.py promo_2025.csv [--separateur ";"]
@@ -0,0 +1,67 @@
+# utils/limiteur.py
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable
+
+
+class SeauAJetons:
+    """
+    Seau à jetons : `debit` jetons par seconde, au plus `capacite` en réserve.
+    Une action coûte un jeton ; un seau plein autorise une rafale de `capacite`
+    actions, puis le rythme est limité à `debit` par seconde.
+    """
+
+    def __init__(self, debit: float, capacite: float, horloge: Callable[[], float] = time.monotonic):
+        if debit <= 0 or capacite < 1:
+            raise ValueError("Seau à jetons invalide (debit > 0, capacite >= 1).")
+        self.debit = debit
+        self.capacite = capacite
+        self._horloge = horloge
+        self._jetons = float(capacite)
+        self._maj = horloge()
+        self._lock = threading.Lock()
+
+    def _remplir(self) -> None:
+        maintenant = self._horloge()
+        self._jetons = min(self.capacite, self._jetons + (maintenant - self._maj) * self.debit)
+        self._maj = maintenant
+
+    def prendre(self, n: float = 1) -> float:
+        """
+        Prend `n` jetons s'ils sont disponibles et retourne 0.
+        Sinon ne prend rien et retourne le délai (secondes) avant qu'ils le soient.
+        """
+        with self._lock:
+            self._remplir()
+            if self._jetons >= n:
+                self._jetons -= n
+                return 0.0
+            return (n - self._jetons) / self.debit
+
+
+class LimiteurParCle:
+    """
+    Un seau à jetons par clé (identifiant d'utilisateur...), créé à la première
+    demande. Les `max_cles` clés les moins récemment vues sont oubliées :
+    un seau oublié repart plein, ce qui ne fait qu'assouplir la limite.
+    """
+
+    def __init__(self, debit: float, capacite: float, max_cles: int = 100_000):
+        self.debit = debit
+        self.capacite = capacite
+        self.max_cles = max_cles
+        self._seaux: "OrderedDict[Hashable, SeauAJetons]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def autoriser(self, cle: Hashable) -> float:
+        """0 si l'action est autorisée (un jeton consommé), sinon le délai d'attente en secondes."""
+        with self._lock:
+            seau = self._seaux.get(cle)
+            if seau is None:
+                seau = self._seaux[cle] = SeauAJetons(self.debit, self.capacite)
+                while len(self._seaux) > self.max_cles:
+                    self._seaux.popitem(last=False)
+            else:
+                self._seaux.move_to_end(cle)
+        return seau.prendre()
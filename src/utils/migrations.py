@@ -0,0 +1,93 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import re
+from typing import List, Optional, Tuple
+
+import dotenv
+
+from dao.db_connection import DBConnection
+
+
+class Migrations:
+    """
+    Migrations versionnées du schéma.
+
+    data/init_db.sql crée le schéma de base (version 0) ; chaque fichier
+    data/migrations/NNN_nom.sql le fait passer à la version NNN. Les versions
+    appliquées sont enregistrées dans la table schema_version : relancer
+    `appliquer` n'exécute que les migrations manquantes, dans l'ordre.
+    Un verrou consultatif empêche deux processus de migrer en même temps.
+    """
+
+    DOSSIER = "data/migrations"
+    MOTIF_FICHIER = re.compile(r"^(\d{3})_(\w+)\.sql$")
+
+    SQL_TABLE_VERSION = """
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INT PRIMARY KEY,
+            nom VARCHAR(200) NOT NULL,
+            date_application TIMESTAMP NOT NULL DEFAULT NOW()
+        )
+    """
+    SQL_VERROU = "SELECT pg_advisory_xact_lock(hashtext('schema_version'))"
+    SQL_VERSIONS = "SELECT version FROM schema_version"
+    SQL_ENREGISTRER = "INSERT INTO schema_version (version, nom) VALUES (%(version)s, %(nom)s)"
+
+    def __init__(self, dossier: Optional[str] = None):
+        self.dossier = dossier or self.DOSSIER
+
+    def lister(self) -> List[Tuple[int, str, str]]:
+        """Migrations disponibles (version, nom, chemin), par version croissante."""
+        migrations = []
+        for fichier in os.listdir(self.dossier):
+            m = self.MOTIF_FICHIER.match(fichier)
+            if m:
+                migrations.append((int(m.group(1)), m.group(2), os.path.join(self.dossier, fichier)))
+        migrations.sort()
+
+        versions = [v for v, _, _ in migrations]
+        if len(versions) != len(set(versions)):
+            raise ValueError(f"Numéro de migration en double dans {self.dossier}.")
+        return migrations
+
+    def appliquer(self, connection=None, jusqu_a: Optional[int] = None) -> List[int]:
+        """
+        Applique les migrations manquantes (jusqu'à la version `jusqu_a` incluse
+        si elle est donnée), en une transaction. Retourne les versions appliquées.
+        Avec `connection`, la transaction de l'appelant est utilisée (pas de commit).
+        """
+        if connection is None:
+            with DBConnection().connection as con:
+                return self.appliquer(con, jusqu_a)
+
+        appliquees = []
+        with connection.cursor() as curs:
+            curs.execute(self.SQL_TABLE_VERSION)
+            curs.execute(self.SQL_VERROU)
+            curs.execute(self.SQL_VERSIONS)
+            deja = {row["version"] for row in curs.fetchall()}
+
+            for version, nom, chemin in self.lister():
+                if version in deja or (jusqu_a is not None and version > jusqu_a):
+                    continue
+                with open(chemin, encoding="utf-8") as f:
+                    curs.execute(f.read())
+                curs.execute(self.SQL_ENREGISTRER, {"version": version, "nom": nom})
+                appliquees.append(version)
+        return appliquees
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    versions = Migrations().appliquer()
+    if versions:
+        print(f"Migration(s) appliquée(s) : {', '.join(f'{v:03d}' for v in versions)}")
+    else:
+        print("Schéma à jour : aucune migration à appliquer.")
+
+# Exemple :
+# PYTHONPATH="src"; python src/utils/migrations.py
@@ -0,0 +1,103 @@
+# utils/pagination.py
+"""
+Jetons de pagination par curseur (keyset).
+
+Une page est lue par `WHERE (clé de tri) > (clé de la dernière ligne vue)
+ORDER BY clé de tri LIMIT n` : PostgreSQL descend directement dans l'index
+au lieu de lire puis jeter les lignes sautées (OFFSET), et une ligne insérée
+entre deux pages ne décale pas la suite (ni doublon, ni ligne manquée).
+
+Le jeton transmis aux appelants encode la clé de la dernière ligne et la liste
+concernée ; il n'a pas à être interprété côté client.
+"""
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from model.pagination_models import PageCurseur
+
+
+class CurseurInvalide(ValueError):
+    """Jeton de pagination illisible, ou émis pour une autre liste."""
+
+
+def _vers_json(valeur: Any) -> Any:
+    # datetime avant date : datetime est une sous-classe de date
+    if isinstance(valeur, datetime):
+        return {"t": valeur.isoformat()}
+    if isinstance(valeur, date):
+        return {"d": valeur.isoformat()}
+    return valeur
+
+
+def _depuis_json(valeur: Any) -> Any:
+    if isinstance(valeur, dict):
+        if "t" in valeur:
+            return datetime.fromisoformat(valeur["t"])
+        if "d" in valeur:
+            return date.fromisoformat(valeur["d"])
+        raise ValueError(valeur)
+    return valeur
+
+
+def encoder_curseur(liste: str, cle: Sequence[Any]) -> str:
+    """Jeton opaque désignant la position juste après la ligne de clé `cle` dans `liste`."""
+    corps = json.dumps({"l": liste, "k": [_vers_json(v) for v in cle]}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(corps.encode("utf-8")).rstrip(b"=").decode("ascii")
+
+
+def decoder_curseur(jeton: str, liste: str, types: Sequence[type]) -> Tuple[Any, ...]:
+    """
+    Retourne la clé portée par le jeton, dont les composantes doivent être des `types`.
+    CurseurInvalide s'il est illisible, altéré ou émis pour une autre liste.
+    """
+    try:
+        corps = json.loads(base64.urlsafe_b64decode(jeton + "=" * (-len(jeton) % 4)))
+        if corps["l"] != liste:
+            raise CurseurInvalide("Ce curseur de pagination appartient à une autre liste.")
+        cle = tuple(_depuis_json(v) for v in corps["k"])
+    except CurseurInvalide:
+        raise
+    except (ValueError, TypeError, KeyError) as exc:
+        raise CurseurInvalide("Curseur de pagination invalide.") from exc
+
+    if len(cle) != len(types) or not all(type(v) is t for v, t in zip(cle, types)):
+        raise CurseurInvalide("Curseur de pagination invalide.")
+    return cle
+
+
+def decoder_si_present(
+    jeton: Optional[str], liste: str, types: Sequence[type]
+) -> Optional[Tuple[Any, ...]]:
+    """decoder_curseur, ou None pour la première page (pas de jeton)."""
+    return decoder_curseur(jeton, liste, types) if jeton else None
+
+
+def paginer(lignes: List[Any], limit: int, liste: str, cle: Callable[[Any], Sequence[Any]]) -> PageCurseur:
+    """
+    Construit la page à partir de `limit + 1` lignes lues après le curseur :
+    la ligne en trop indique seulement qu'il existe une page suivante.
+    """
+    if len(lignes) <= limit:
+        return PageCurseur(items=lignes)
+    items = lignes[:limit]
+    return PageCurseur(items=items, curseur_suivant=encoder_curseur(liste, cle(items[-1])))
+
+
+# ---------- Listes triées par identifiant ----------
+# Requêtes de la forme `WHERE id > %(apres)s ORDER BY id LIMIT %(limit)s`
+# (find_page des DAO) : la clé du curseur est le seul identifiant.
+
+def params_par_id(curseur: Optional[str], limit: int, liste: str) -> Dict[str, Any]:
+    """
+    Paramètres `apres` et `limit` de la page suivant `curseur` (None : première page).
+    Une ligne de plus que demandé est lue pour savoir s'il y a une suite.
+    """
+    cle = decoder_si_present(curseur, liste, (int,))
+    return {"apres": cle[0] if cle else 0, "limit": max(limit, 1) + 1}
+
+
+def paginer_par_id(items: List[Any], limit: int, liste: str, champ: str) -> PageCurseur:
+    """Page lue avec params_par_id ; `champ` est l'attribut identifiant des éléments."""
+    return paginer(items, max(limit, 1), liste, lambda item: (getattr(item, champ),))
@@ -0,0 +1,44 @@
+import os
+import sys
+
+# Ajoute automatiquement le dossier parent (src/) au PYTHONPATH
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+import time
+
+import dotenv
+
+from dao.evenement_dao import EvenementDao
+
+
+def recalculer_compteurs() -> int:
+    """
+    Reconstruit les compteurs dénormalisés de la table evenement
+    (inscrits, bus_aller_pris, bus_retour_pris, nb_sam, nb_adh, capacités bus)
+    et la table evenement_stats (avis), à partir des tables reservation, bus et commentaire.
+    Retourne le nombre d'événements corrigés (0 si tout était cohérent).
+    """
+    corriges = EvenementDao().recalculer_compteurs()
+    if corriges:
+        print(f"Compteurs corrigés pour {corriges} événement(s).")
+    else:
+        print("Compteurs cohérents : aucune correction nécessaire.")
+    return corriges
+
+
+if __name__ == "__main__":
+    dotenv.load_dotenv()
+    if "--continu" in sys.argv:
+        # Réconciliation périodique (défaut : toutes les heures) jusqu'à Ctrl+C
+        intervalle = float(os.getenv("RECALCUL_INTERVALLE", "3600"))
+        try:
+            while True:
+                recalculer_compteurs()
+                time.sleep(intervalle)
+        except KeyboardInterrupt:
+            pass
+    else:
+        recalculer_compteurs()
+
+# Exemple :
+# PYTHONPATH="src"; python src/utils/recalculer_compteurs.py [--continu]
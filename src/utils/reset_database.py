@@ -11,6 +11,8 @@ from unittest import mock
 from utils.log_decorator import log
 from utils.singleton import Singleton
 from dao.db_connection import DBConnection
+from utils.cache import cache
+from utils.migrations import Migrations
 
 
 class ResetDatabase(metaclass=Singleton):
@@ -37,7 +39,7 @@ class ResetDatabase(metaclass=Singleton):
             self._reset_schema(schema, pop_data_path)
 
     def _reset_schema(self, schema, pop_data_path):
-        """Exécute le drop / create du schéma et les scripts SQL"""
+        """Exécute le drop / create du schéma, les scripts SQL et les migrations"""
         print(f" Initialisation du schéma : {schema}")
 
         create_schema = f"DROP SCHEMA IF EXISTS {schema} CASCADE; CREATE SCHEMA {schema};"
@@ -48,6 +50,8 @@ class ResetDatabase(metaclass=Singleton):
             pop_db_as_string = f.read()
 
         try:
+            # Toutes les connexions du pool suivront désormais ce schéma
+            DBConnection().definir_schema(schema)
             with DBConnection().connection as connection:
                 with connection.cursor() as cursor:
                     # Forcer le search_path vers le bon schéma
@@ -55,8 +59,11 @@ class ResetDatabase(metaclass=Singleton):
                     cursor.execute(f"SET search_path TO {schema};")
 
                     cursor.execute(init_db_as_string)
+                    Migrations().appliquer(connection)
                     cursor.execute(pop_db_as_string)
                 connection.commit()
+            # Les données en cache décrivent l'ancienne base
+            cache().vider()
 
             print(f"Schéma {schema} réinitialisé avec succès !\n")
         except Exception as e:
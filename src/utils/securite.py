@@ -1,13 +1,40 @@
-# utils/password_utils.py
-import bcrypt
-from typing import Optional
+# utils/securite.py
+import asyncio
+import multiprocessing
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from getpass import getpass
+from itertools import repeat
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+import bcrypt
+
+T = TypeVar("T")
+
+# Facteur de coût bcrypt par défaut (BCRYPT_COUT pour le changer)
+COUT_PAR_DEFAUT = 12
+
+_MOTIF_COUT = re.compile(r"^\$2[abxy]?\$(\d{2})\$")
+
+
+def cout_configure() -> int:
+    """Facteur de coût des nouveaux hash (variable BCRYPT_COUT, défaut 12)."""
+    return int(os.getenv("BCRYPT_COUT", str(COUT_PAR_DEFAUT)))
+
+
+def cout_du_hash(hashed_password: str) -> Optional[int]:
+    """Facteur de coût d'un hash bcrypt ($2b$12$... -> 12), None si le format est inconnu."""
+    m = _MOTIF_COUT.match(hashed_password or "")
+    return int(m.group(1)) if m else None
 
 
-def hash_password(password: str, rounds: int = 12, salt: Optional[bytes] = None) -> str:
+def hash_password(password: str, rounds: Optional[int] = None, salt: Optional[bytes] = None) -> str:
     """
     Hash un mot de passe avec bcrypt.
-    - rounds : facteur de coût (par défaut 12).
+    - rounds : facteur de coût (par défaut celui de la configuration, cf. cout_configure).
     - salt : sel bcrypt optionnel (généralement on laisse None pour bcrypt.gensalt()).
 
     Retourne une chaîne UTF-8 au format bcrypt, ex: $2b$12$...
@@ -16,7 +43,7 @@ def hash_password(password: str, rounds: int = 12, salt: Optional[bytes] = None)
         password = password.encode("utf-8")
 
     if salt is None:
-        salt = bcrypt.gensalt(rounds=rounds)
+        salt = bcrypt.gensalt(rounds=rounds or cout_configure())
 
     hashed = bcrypt.hashpw(password, salt)
     return hashed.decode("utf-8")
@@ -40,6 +67,144 @@ def check_password(plain_password: str, hashed_password: str) -> bool:
         return False
 
 
+def verifier_et_rehacher(plain_password: str, hashed_password: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    """
+    Vérifie le mot de passe ; s'il est correct mais que son hash n'a pas le coût
+    `rounds`, retourne aussi un nouveau hash à ce coût (sinon None).
+    """
+    if not check_password(plain_password, hashed_password):
+        return False, None
+    if cout_du_hash(hashed_password) != rounds:
+        return True, hash_password(plain_password, rounds)
+    return True, None
+
+
+class HacheurMotsDePasse:
+    """
+    Hachage / vérification des mots de passe hors du processus appelant.
+
+    bcrypt coûte ~250 ms de CPU par opération au coût 12 : à l'ouverture d'un
+    shotgun, des centaines de connexions simultanées satureraient le processus.
+    Les calculs partent dans un pool de processus (un par cœur par défaut),
+    avec une API synchrone (`hacher`, `verifier`, `verifier_et_rehacher`) et
+    son équivalent asynchrone (`*_async`), qui ne bloque pas la boucle d'événements.
+
+    `verifier_et_rehacher` renvoie un nouveau hash quand le coût configuré a
+    changé depuis l'enregistrement du mot de passe : les DAO le stockent à la
+    connexion, et les comptes migrent au nouveau coût sans intervention.
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      BCRYPT_COUT     facteur de coût des nouveaux hash (défaut 12)
+      BCRYPT_WORKERS  processus de calcul (défaut : nombre de cœurs ;
+                      0 = calcul dans le thread appelant)
+    """
+
+    def __init__(self, workers: Optional[int] = None, cout: Optional[int] = None):
+        self.workers = workers if workers is not None else int(os.getenv("BCRYPT_WORKERS", str(os.cpu_count() or 1)))
+        self.cout = cout or cout_configure()
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+
+    # ---------- Pool de processus ----------
+    def _executeur(self) -> Optional[ProcessPoolExecutor]:
+        """Pool créé à la première utilisation ; None si le calcul se fait sur place."""
+        if self.workers <= 0:
+            return None
+        with self._lock:
+            if self._pool is None:
+                # spawn : les processus ne copient ni le pool de connexions ni les threads du parent
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._pool
+
+    def _oublier_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Abandonne un pool cassé (processus tué...) : le suivant sera recréé à la demande."""
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+        pool.shutdown(wait=False)
+
+    def _executer(self, fn: Callable[..., T], *args) -> T:
+        pool = self._executeur()
+        if pool is None:
+            return fn(*args)
+        try:
+            return pool.submit(fn, *args).result()
+        except BrokenProcessPool:
+            self._oublier_pool(pool)
+            return fn(*args)
+
+    async def _executer_async(self, fn: Callable[..., T], *args) -> T:
+        pool = self._executeur()
+        if pool is None:
+            return await asyncio.to_thread(fn, *args)
+        try:
+            return await asyncio.wrap_future(pool.submit(fn, *args))
+        except BrokenProcessPool:
+            self._oublier_pool(pool)
+            return await asyncio.to_thread(fn, *args)
+
+    def fermer(self) -> None:
+        """Arrête les processus de calcul (ils seront relancés si besoin)."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    # ---------- API synchrone ----------
+    def hacher(self, mot_de_passe: str) -> str:
+        return self._executer(hash_password, mot_de_passe, self.cout)
+
+    def verifier(self, mot_de_passe: str, hash_enregistre: str) -> bool:
+        return self._executer(check_password, mot_de_passe, hash_enregistre)
+
+    def hacher_lot(self, mots_de_passe: Sequence[str]) -> List[str]:
+        """
+        Hash une série de mots de passe en les répartissant sur tous les processus
+        (import en masse) ; résultats dans l'ordre des mots de passe.
+        """
+        pool = self._executeur()
+        if pool is None:
+            return [hash_password(m, self.cout) for m in mots_de_passe]
+        # Paquets de taille moyenne : peu d'allers-retours, charge bien répartie
+        paquet = max(1, len(mots_de_passe) // (self.workers * 4))
+        try:
+            return list(pool.map(hash_password, mots_de_passe, repeat(self.cout), chunksize=paquet))
+        except BrokenProcessPool:
+            self._oublier_pool(pool)
+            return [hash_password(m, self.cout) for m in mots_de_passe]
+
+    def verifier_et_rehacher(self, mot_de_passe: str, hash_enregistre: str) -> Tuple[bool, Optional[str]]:
+        """(mot de passe correct ?, nouveau hash si le coût a changé sinon None)."""
+        return self._executer(verifier_et_rehacher, mot_de_passe, hash_enregistre, self.cout)
+
+    # ---------- API asynchrone ----------
+    async def hacher_async(self, mot_de_passe: str) -> str:
+        return await self._executer_async(hash_password, mot_de_passe, self.cout)
+
+    async def verifier_async(self, mot_de_passe: str, hash_enregistre: str) -> bool:
+        return await self._executer_async(check_password, mot_de_passe, hash_enregistre)
+
+    async def verifier_et_rehacher_async(
+        self, mot_de_passe: str, hash_enregistre: str
+    ) -> Tuple[bool, Optional[str]]:
+        return await self._executer_async(verifier_et_rehacher, mot_de_passe, hash_enregistre, self.cout)
+
+
+_hacheur: Optional[HacheurMotsDePasse] = None
+_hacheur_lock = threading.Lock()
+
+
+def hacheur() -> HacheurMotsDePasse:
+    """Hacheur partagé par le processus (créé à la première utilisation)."""
+    global _hacheur
+    with _hacheur_lock:
+        if _hacheur is None:
+            _hacheur = HacheurMotsDePasse()
+        return _hacheur
+
+
 # --- Utilitaire CLI simple ---
 def _cli_hash_interactive():
     """Saisie interactive (masquée) pour hasher un mot de passe et l'afficher."""
@@ -80,8 +245,8 @@ if __name__ == "__main__":
     parser.add_argument(
         "-c", "--cost",
         type=int,
-        default=12,
-        help="Facteur de coût bcrypt (rounds), défaut 12."
+        default=None,
+        help="Facteur de coût bcrypt (rounds), défaut BCRYPT_COUT ou 12."
     )
     args = parser.parse_args()
 
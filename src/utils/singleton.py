@@ -1,13 +1,24 @@
+import threading
+
+
 class Singleton(type):
     """
     Toutes les classes qui hériteront de Singleton n'auront qu'une seule et unique instance
     -> https://refactoring.guru/fr/design-patterns/singleton
+
+    La création est protégée par un verrou : deux threads qui demandent l'instance
+    en même temps (ex. DBConnection ouverte en tâche de fond au démarrage et
+    première requête de la console) obtiennent la même.
     """
 
     _instances = {}
+    _lock = threading.RLock()
 
     def __call__(cls, *args, **kwargs):
-        if cls not in cls._instances:
-            instance = super().__call__(*args, **kwargs)
-            cls._instances[cls] = instance
-        return cls._instances[cls]
+        instance = cls._instances.get(cls)
+        if instance is None:
+            with Singleton._lock:
+                if cls not in cls._instances:
+                    cls._instances[cls] = super().__call__(*args, **kwargs)
+                instance = cls._instances[cls]
+        return instance
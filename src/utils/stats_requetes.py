@@ -0,0 +1,260 @@
+# utils/stats_requetes.py
+import bisect
+import logging
+import os
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bornes supérieures des classes de l'histogramme, en millisecondes (au-delà : dernière classe)
+BORNES_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000)
+
+# Mécanique du chronométrage (curseurs, connexions) : jamais un site d'appel.
+# Les autres fonctions de ces modules (requêtes propres au pool) en sont un.
+_MODULES_INTERNES = ("utils.stats_requetes", "dao.db_connection", "dao_async.db_connection")
+_FONCTIONS_INTERNES = ("execute", "executemany", "chronometrer", "chronometrer_async", "site_appel")
+
+
+class HistogrammeLatence:
+    """Appels, lignes, erreurs et répartition des durées d'une requête (classes fixes, mémoire constante)."""
+
+    __slots__ = ("appels", "erreurs", "lignes", "total_ms", "max_ms", "classes")
+
+    def __init__(self):
+        self.appels = 0
+        self.erreurs = 0
+        self.lignes = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.classes = [0] * (len(BORNES_MS) + 1)
+
+    def ajouter(self, duree_ms: float, lignes: int, erreur: bool) -> None:
+        self.appels += 1
+        self.erreurs += erreur
+        self.lignes += max(lignes, 0)
+        self.total_ms += duree_ms
+        self.max_ms = max(self.max_ms, duree_ms)
+        self.classes[bisect.bisect_left(BORNES_MS, duree_ms)] += 1
+
+    def centile(self, q: float) -> float:
+        """Borne supérieure de la classe contenant le centile `q` (majorant, en ms)."""
+        rang = q * self.appels
+        cumul = 0
+        for i, n in enumerate(self.classes):
+            cumul += n
+            if n and cumul >= rang:
+                return BORNES_MS[i] if i < len(BORNES_MS) else self.max_ms
+        return 0.0
+
+    def resume(self) -> Dict[str, Any]:
+        return {
+            "appels": self.appels,
+            "erreurs": self.erreurs,
+            "lignes": self.lignes,
+            "total_ms": round(self.total_ms, 3),
+            "moyenne_ms": round(self.total_ms / self.appels, 3) if self.appels else 0.0,
+            "p50_ms": self.centile(0.50),
+            "p95_ms": self.centile(0.95),
+            "p99_ms": self.centile(0.99),
+            "max_ms": round(self.max_ms, 3),
+            "histogramme": dict(zip([f"<={b}" for b in BORNES_MS] + [f">{BORNES_MS[-1]}"], self.classes)),
+        }
+
+
+class StatsRequetes:
+    """
+    Chronométrage des requêtes SQL, agrégé en mémoire par site d'appel
+    (classe DAO + méthode) et par requête.
+
+    - chaque exécution alimente un histogramme de latence (appels, lignes, erreurs) ;
+    - une requête plus lente que `seuil_ms` est journalisée (logger de ce module,
+      sans ses paramètres) et gardée, avec ses paramètres, parmi les `max_lentes`
+      dernières : `expliquer` en donne le plan (EXPLAIN) à la demande ;
+    - au-delà de `max_requetes` requêtes distinctes, les suivantes sont comptées
+      ensemble sous « (autres) ».
+
+    Réglages (variables d'environnement, toutes optionnelles) :
+      DB_STATS               0 pour ne rien mesurer (défaut 1)
+      DB_REQUETE_LENTE_MS    seuil d'une requête lente, en millisecondes (défaut 200)
+      DB_LENTES_MAX          requêtes lentes gardées (défaut 100)
+    """
+
+    def __init__(
+        self,
+        actif: Optional[bool] = None,
+        seuil_ms: Optional[float] = None,
+        max_lentes: Optional[int] = None,
+        max_requetes: int = 1000,
+    ):
+        self.actif = os.getenv("DB_STATS", "1") != "0" if actif is None else actif
+        self.seuil_ms = seuil_ms if seuil_ms is not None else float(os.getenv("DB_REQUETE_LENTE_MS", "200"))
+        self.max_requetes = max_requetes
+        self._histogrammes: Dict[Tuple[str, str], HistogrammeLatence] = {}
+        self._lentes: Deque[Dict[str, Any]] = deque(maxlen=max_lentes or int(os.getenv("DB_LENTES_MAX", "100")))
+        self._depuis = datetime.now()
+        self._lock = threading.Lock()
+        # Les EXPLAIN lancés par `expliquer` ne sont pas comptés
+        self._local = threading.local()
+
+    # ---------- Mesure ----------
+    @staticmethod
+    def site_appel() -> str:
+        """
+        Premier appelant hors de la mécanique de connexion : « Classe.méthode »
+        dans un DAO (les deux familles, dao et dao_async), sinon « module.fonction ».
+        """
+        frame = sys._getframe(1)
+        premier = None
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            code = frame.f_code
+            interne = module.startswith(_MODULES_INTERNES) and code.co_name in _FONCTIONS_INTERNES
+            if not interne and not module.startswith(("psycopg", "contextlib")):
+                if module.startswith(("dao.", "dao_async.")):
+                    proprietaire = frame.f_locals.get("self", frame.f_locals.get("cls"))
+                    if proprietaire is not None:
+                        nom = proprietaire.__name__ if isinstance(proprietaire, type) else type(proprietaire).__name__
+                        return f"{nom}.{code.co_name}"
+                    return f"{module}.{code.co_name}"
+                premier = premier or f"{module}.{code.co_name}"
+            frame = frame.f_back
+        return premier or "?"
+
+    def enregistrer(
+        self, site: str, sql: str, params: Any, duree_s: float, lignes: int = -1, erreur: bool = False
+    ) -> None:
+        """Ajoute une exécution aux statistiques (appelé par les curseurs chronométrés)."""
+        if getattr(self._local, "pause", False):
+            return
+        duree_ms = duree_s * 1000
+        texte = " ".join(sql.split())
+        with self._lock:
+            cle = (site, texte)
+            histogramme = self._histogrammes.get(cle)
+            if histogramme is None:
+                if len(self._histogrammes) >= self.max_requetes:
+                    cle = (site, "(autres)")
+                histogramme = self._histogrammes.setdefault(cle, HistogrammeLatence())
+            histogramme.ajouter(duree_ms, lignes, erreur)
+
+            if duree_ms >= self.seuil_ms and not erreur:
+                self._lentes.append({
+                    "date": datetime.now(),
+                    "site": site,
+                    "sql": texte,
+                    "params": params,
+                    "duree_ms": round(duree_ms, 3),
+                    "lignes": lignes,
+                })
+        if duree_ms >= self.seuil_ms and not erreur:
+            logger.warning("Requête lente (%.1f ms) dans %s : %s", duree_ms, site, texte[:500])
+
+    # ---------- Lecture ----------
+    def rapport(self, tri: str = "total_ms", limite: Optional[int] = None) -> Dict[str, Any]:
+        """Requêtes agrégées, triées par `tri` décroissant (total_ms, appels, p95_ms, max_ms...)."""
+        with self._lock:
+            requetes = [
+                {"site": site, "sql": sql, **h.resume()} for (site, sql), h in self._histogrammes.items()
+            ]
+        requetes.sort(key=lambda r: r[tri], reverse=True)
+        return {
+            "depuis": self._depuis,
+            "seuil_lente_ms": self.seuil_ms,
+            "requetes": requetes[:limite] if limite else requetes,
+        }
+
+    def requetes_lentes(self) -> List[Dict[str, Any]]:
+        """Dernières requêtes lentes, de la plus récente à la plus ancienne (sans leurs paramètres)."""
+        with self._lock:
+            lentes = list(self._lentes)
+        return [{k: v for k, v in r.items() if k != "params"} for r in reversed(lentes)]
+
+    def expliquer(self, index: int) -> str:
+        """
+        Plan d'exécution (EXPLAIN, sans exécuter la requête) de la requête lente
+        n° `index` de `requetes_lentes()`, avec ses paramètres d'origine.
+        """
+        with self._lock:
+            lentes = list(self._lentes)
+        if not 0 <= index < len(lentes):
+            raise ValueError(f"Aucune requête lente n° {index}.")
+        lente = lentes[len(lentes) - 1 - index]
+
+        from dao.db_connection import DBConnection
+
+        self._local.pause = True
+        try:
+            with DBConnection().getConnexion() as con:
+                with con.cursor() as curs:
+                    curs.execute("EXPLAIN " + lente["sql"], lente["params"])
+                    lignes = curs.fetchall()
+                con.rollback()
+        except Exception as e:
+            # DDL, plusieurs instructions, paramètres non rejouables...
+            raise ValueError(f"EXPLAIN impossible pour cette requête : {e}") from e
+        finally:
+            self._local.pause = False
+        return "\n".join(next(iter(l.values())) for l in lignes)
+
+    def reinitialiser(self) -> None:
+        with self._lock:
+            self._histogrammes.clear()
+            self._lentes.clear()
+            self._depuis = datetime.now()
+
+
+_stats: Optional[StatsRequetes] = None
+_stats_lock = threading.Lock()
+
+
+def stats_requetes() -> StatsRequetes:
+    """Statistiques de requêtes partagées par le processus (créées à la première utilisation)."""
+    global _stats
+    with _stats_lock:
+        if _stats is None:
+            _stats = StatsRequetes()
+        return _stats
+
+
+def chronometrer(execute, sql: Any, params: Any, curseur: Any, texte: Optional[str] = None) -> Any:
+    """
+    Exécute `execute(sql, params)` en l'enregistrant dans les statistiques.
+    `texte` : la requête en clair quand `sql` est un objet composé (psycopg.sql).
+    """
+    stats = stats_requetes()
+    if not stats.actif:
+        return execute(sql, params)
+    debut = time.perf_counter()
+    erreur = True
+    try:
+        resultat = execute(sql, params)
+        erreur = False
+        return resultat
+    finally:
+        stats.enregistrer(
+            stats.site_appel(), texte or str(sql), params, time.perf_counter() - debut,
+            lignes=-1 if erreur else curseur.rowcount, erreur=erreur,
+        )
+
+
+async def chronometrer_async(execute, sql: Any, params: Any, curseur: Any, texte: Optional[str] = None) -> Any:
+    """Pendant de `chronometrer` pour les curseurs asynchrones (psycopg 3)."""
+    stats = stats_requetes()
+    if not stats.actif:
+        return await execute(sql, params)
+    debut = time.perf_counter()
+    erreur = True
+    try:
+        resultat = await execute(sql, params)
+        erreur = False
+        return resultat
+    finally:
+        stats.enregistrer(
+            stats.site_appel(), texte or str(sql), params, time.perf_counter() - debut,
+            lignes=-1 if erreur else curseur.rowcount, erreur=erreur,
+        )
@@ -3,14 +3,10 @@
 from InquirerPy import inquirer
 from view.vue_abstraite import VueAbstraite
 from view.session import Session 
-from view.auth.connexion_vue import ConnexionVue
-from view.auth.creation_compte_vue import CreationCompteVue
-from view.consulter.consulter_evenement_vue import ConsulterVue
-from view.client.connexion_client_vue import ConnexionClientVue
 
-# On garde l'import admin différé pour éviter les cycles
-# importé uniquement au moment du besoin
-# from view.administrateur.connexion_admin_vue import ConnexionAdminVue
+# Les vues suivantes sont importées au moment du choix, pas ici : le menu
+# d'accueil s'affiche sans charger les autres vues ni les services
+# (et l'import différé de la vue admin évite aussi les cycles).
 
 
 class AccueilVue(VueAbstraite):
@@ -37,6 +33,7 @@ class AccueilVue(VueAbstraite):
                 return ConnexionAdminVue(f"Bienvenue {self.user.prenom} !")
             else:
                 # --- Vue client ---
+                from view.client.connexion_client_vue import ConnexionClientVue
                 return ConnexionClientVue(f"Bienvenue {self.user.prenom} !")
 
         # --- PARTIE 2 : UTILISATEUR NON CONNECTÉ ---
@@ -55,8 +52,11 @@ class AccueilVue(VueAbstraite):
             case "Quitter":
                 return None
             case "Consulter les événements":
+                from view.consulter.consulter_evenement_vue import ConsulterVue
                 return ConsulterVue()
             case "Se connecter":
+                from view.auth.connexion_vue import ConnexionVue
                 return ConnexionVue("Connexion à l'application")
             case "Créer un compte":
+                from view.auth.creation_compte_vue import CreationCompteVue
                 return CreationCompteVue("Création de compte")
@@ -50,7 +50,8 @@ class ConnexionVue:
             return AccueilVue("Retour au menu principal")
 
         # --- Si succès : mise en session + feedback ---
-        Session().connexion(user)
+        # Le mot de passe vérifié est gardé (empreinte) pour les re-vérifications sans bcrypt
+        Session().connexion(user, mot_de_passe=mot_de_passe)
         role = "Administrateur" if getattr(user, "administrateur", False) else "Participant"
         print(f"Connecté : {user.prenom} {user.nom} — {role}")
 
@@ -3,14 +3,11 @@ from typing import Optional, List
 import re
 import pwinput
 from pydantic import ValidationError
-from dotenv import load_dotenv
 
 from view.session import Session
 from service.utilisateur_service import UtilisateurService
 from model.utilisateur_models import UtilisateurModelIn, UtilisateurModelOut
-from utils.api_brevo import send_email_brevo
-
-load_dotenv()
+from service.email_service import EmailService
 
 
 class CreationCompteVue:
@@ -82,7 +79,7 @@ class CreationCompteVue:
 
         # --- Connexion automatique ---
         try:
-            Session().connexion(user_out)
+            Session().connexion(user_out, mot_de_passe=mot_de_passe)
             print(f" Compte créé et connecté : {user_out.prenom} {user_out.nom}")
         except Exception as exc:
             print(f"Compte créé mais échec de la connexion automatique : {exc}")
@@ -97,15 +94,8 @@ class CreationCompteVue:
                 "Si vous n'êtes pas à l'origine de cette action, veuillez nous contacter.\n\n"
                 "— L’équipe du BDE Ensai"
             )
-            status, _ = send_email_brevo(
-                to_email=user_out.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation vous a été envoyé 🎉")
-            else:
-                print(f" L'e-mail de confirmation n'a pas pu être envoyé (HTTP {status}).")
+            EmailService().programmer([user_out.email], subject, message_text)
+            print("Un e-mail de confirmation va vous être envoyé 🎉")
         except Exception as exc:
             print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
 
@@ -3,14 +3,11 @@ from typing import Optional, List
 import re
 import pwinput
 from pydantic import ValidationError
-from dotenv import load_dotenv
 
 from view.session import Session
 from service.utilisateur_service import UtilisateurService  # Nouveau import
 from model.utilisateur_models import UtilisateurModelOut
-from utils.api_brevo import send_email_brevo
-
-load_dotenv()
+from service.email_service import EmailService
 
 
 class ModificationCompteVue:
@@ -98,8 +95,7 @@ class ModificationCompteVue:
         if changer_mdp == "o":
             mot_de_passe_actuel = pwinput.pwinput(prompt="Mot de passe actuel: ", mask="*").strip()
             try:
-                reauth = self.service.authenticate_user(email=user_out.email, password=mot_de_passe_actuel)
-                if reauth is None or reauth.id_utilisateur != user_out.id_utilisateur:
+                if not Session().verifier_mot_de_passe(mot_de_passe_actuel):
                     print("Échec de la re-authentification (mot de passe incorrect).")
                     return AccueilVue("Profil mis à jour — mot de passe non changé.")
             except Exception as exc:
@@ -151,15 +147,8 @@ class ModificationCompteVue:
         """Envoi d'un e-mail de notification (best-effort)."""
         try:
             message_text = f"Bonjour {prenom} {nom},\n\n{message_body}\n\n— L'équipe du BDE Ensai"
-            status, response = send_email_brevo(
-                to_email=to_email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print(f"E-mail envoyé : {subject}")
-            else:
-                print(f"E-mail non envoyé (HTTP {status}).")
+            EmailService().programmer([to_email], subject, message_text)
+            print(f"E-mail programmé : {subject}")
         except Exception as e:
             print(f"Erreur envoi e-mail : {e}")
 
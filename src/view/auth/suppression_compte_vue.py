@@ -1,20 +1,17 @@
 # view/auth/suppression_compte_vue.py
 from typing import Optional
 import pwinput
-from dotenv import load_dotenv
 
 from view.session import Session
 from service.utilisateur_service import UtilisateurService  # Nouveau import
 from model.utilisateur_models import UtilisateurModelOut
-from utils.api_brevo import send_email_brevo
-
-load_dotenv()
+from service.email_service import EmailService
 
 
 class SuppressionCompteVue:
     """
     Vue console de suppression de compte.
-    Utilise UtilisateurService (authenticate_user, delete_user) et la Session.
+    Utilise UtilisateurService (delete_user) et la Session (re-vérification du mot de passe).
     - Exige une session connectée.
     - Demande 'SUPPRIMER' + mot de passe pour confirmer.
     - Supprime via le service.
@@ -53,13 +50,9 @@ class SuppressionCompteVue:
             return AccueilVue("Suppression annulée — retour au menu principal")
 
         try:
-            reauth = self.service.authenticate_user(user.email, mot_de_passe)
-            if reauth is None or reauth.id_utilisateur != user.id_utilisateur:
+            if not Session().verifier_mot_de_passe(mot_de_passe):
                 print("Mot de passe incorrect.")
                 return AccueilVue("Suppression annulée — retour au menu principal")
-        except ValueError as e:
-            print(f"{e}")
-            return AccueilVue("Suppression annulée — retour au menu principal")
         except Exception as e:
             print(f"Erreur technique pendant la vérification du mot de passe : {e}")
             return AccueilVue("Erreur technique — retour au menu principal")
@@ -93,15 +86,8 @@ class SuppressionCompteVue:
                 "Si vous n'êtes pas à l'origine de cette action, contactez-nous au plus vite.\n\n"
                 "— L’équipe du BDE Ensai"
             )
-            status, response = send_email_brevo(
-                to_email=user.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation de suppression vous a été envoyé.")
-            else:
-                print(f"L'e-mail de confirmation n'a pas pu être envoyé (HTTP {status}).")
+            EmailService().programmer([user.email], subject, message_text)
+            print("Un e-mail de confirmation de suppression va vous être envoyé.")
         except Exception as e:
             print(f"Impossible d'envoyer l'e-mail de confirmation : {e}")
 
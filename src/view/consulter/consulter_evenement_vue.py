@@ -6,6 +6,8 @@ from typing import Optional, Any, List
 
 from view.vue_abstraite import VueAbstraite
 from service.consultation_evenement_service import ConsultationEvenementService  # nouveau
+from model.evenement_models import DisponibiliteModelOut
+from model.pagination_models import PageCurseur
 from view.reservations.reservation_vue import ReservationVue
 from service.reservation_service import ReservationService
 from service.bus_service import BusService
@@ -18,6 +20,9 @@ class ConsulterVue(VueAbstraite):
     Utilise ConsultationEvenementService (et non plus le DAO direct).
     """
 
+    TAILLE_PAGE = 50
+    PAGE_SUIVANTE = "__page_suivante__"
+
     def __init__(self) -> None:
         super().__init__("CONSULTER")
         self.service = ConsultationEvenementService()
@@ -56,6 +61,7 @@ class ConsulterVue(VueAbstraite):
             "Lister les événements disponibles (avec places restantes)": "places",
             "Lister tous les événements": "tous",
             "Rechercher (ville, statut, dates)": "recherche",
+            "Recherche libre (titre, description...)": "texte",
             "Retour": "retour",
         }
 
@@ -68,18 +74,19 @@ class ConsulterVue(VueAbstraite):
         if action == "retour":
             return vue_de_retour("Retour au menu principal")
 
-        events: List[Any] = []
-
         try:
-            # ---------- 1. Récupération selon action ----------
+            # ---------- 1. Récupération selon action (page par page) ----------
             if action == "places":
-                events = self.service.lister_avec_places_restantes(
-                    limit=50,
-                    a_partir_du=date.today()
-                )
+                def charger(curseur: Optional[str]):
+                    return self.service.lister_avec_places_restantes_page(
+                        limit=self.TAILLE_PAGE,
+                        curseur=curseur,
+                        a_partir_du=date.today()
+                    )
 
             elif action == "tous":
-                events = self.service.lister_tous(limit=50)
+                def charger(curseur: Optional[str]):
+                    return self.service.lister_tous_page(limit=self.TAILLE_PAGE, curseur=curseur)
 
             elif action == "recherche":
                 ville = input("Ville (laisser vide pour ignorer) : ").strip() or None
@@ -90,59 +97,91 @@ class ConsulterVue(VueAbstraite):
                 date_min = date.fromisoformat(date_min) if date_min else None
                 date_max = date.fromisoformat(date_max) if date_max else None
 
-                events = self.service.rechercher(
-                    ville=ville,
-                    categorie=categorie,
-                    statut=statut,
-                    date_min=date_min,
-                    date_max=date_max,
-                    limit=50
-                )
+                def charger(curseur: Optional[str]):
+                    return self.service.rechercher_page(
+                        ville=ville,
+                        categorie=categorie,
+                        statut=statut,
+                        date_min=date_min,
+                        date_max=date_max,
+                        limit=self.TAILLE_PAGE,
+                        curseur=curseur
+                    )
+
+            elif action == "texte":
+                texte = input("Rechercher : ").strip()
+
+                def charger(curseur: Optional[str]):
+                    # Résultats triés par pertinence : pages par offset (curseur = offset suivant)
+                    offset = int(curseur or 0)
+                    resultats = self.service.rechercher_texte(
+                        texte, limit=self.TAILLE_PAGE + 1, offset=offset
+                    )
+                    suivant = str(offset + self.TAILLE_PAGE) if len(resultats) > self.TAILLE_PAGE else None
+                    return PageCurseur(items=resultats[: self.TAILLE_PAGE], curseur_suivant=suivant)
+
+            page = charger(None)
 
             # ---------- 2. Vérification ----------
-            if not events:
+            if not page.items:
                 print("\nAucun événement ne correspond à votre recherche.")
                 input("\n(Entrée) pour continuer...")
                 return self
 
-           # ---------- 3. Formatage ----------
-            choices_events = []
-            for ev in events:
-                places_val = self._get_attr(ev, "places_restantes")
-                places_str = f"({places_val} places)" if places_val is not None else ""
-                
-                date_evt = self._get_attr(ev, "date_evenement", "")
-                titre = self._get_attr(ev, "titre", "N/A")
-
-                # --- AJOUT DES AVIS ---
-                avg_note = self._get_attr(ev, "avg_note")
-                count_avis = self._get_attr(ev, "comment_count", 0)
-                
-                avis_str = ""
-                if avg_note is not None:
-                    avis_str = f" {avg_note:.1f}/5 ({count_avis} avis)"
-
-                titre_affiche = f"{date_evt} | {titre} {places_str}{avis_str}"
-                choices_events.append({"name": titre_affiche, "value": ev})
-
-            choices_events.append({"name": "--- Retour ---", "value": None})
-
-
-            event_selectionne = inquirer.select(
-                message="Sélectionnez un événement pour voir les détails :",
-                choices=choices_events,
-            ).execute()
+            while True:
+                # ---------- 3. Formatage ----------
+                # Places du lieu et des bus à jour pour toute la page, en une requête
+                dispos = self.service.disponibilites(
+                    self._get_attr(ev, "id_evenement") for ev in page.items
+                )
+                choices_events = []
+                for ev in page.items:
+                    dispo = dispos.get(self._get_attr(ev, "id_evenement"))
+                    places_val = dispo.places_restantes if dispo else self._get_attr(ev, "places_restantes")
+                    places_str = f"({places_val} places)" if places_val is not None else ""
+
+                    date_evt = self._get_attr(ev, "date_evenement", "")
+                    titre = self._get_attr(ev, "titre", "N/A")
+
+                    # --- AJOUT DES AVIS ---
+                    avg_note = self._get_attr(ev, "avg_note")
+                    count_avis = self._get_attr(ev, "comment_count", 0)
+
+                    avis_str = ""
+                    if avg_note is not None:
+                        avis_str = f" {avg_note:.1f}/5 ({count_avis} avis)"
+
+                    titre_affiche = f"{date_evt} | {titre} {places_str}{avis_str}"
+                    extrait = self._get_attr(ev, "extrait")
+                    if extrait:
+                        titre_affiche += f" — {extrait}"
+                    choices_events.append({"name": titre_affiche, "value": ev})
+
+                if page.curseur_suivant:
+                    choices_events.append({"name": "--- Page suivante ---", "value": self.PAGE_SUIVANTE})
+                choices_events.append({"name": "--- Retour ---", "value": None})
+
+                event_selectionne = inquirer.select(
+                    message="Sélectionnez un événement pour voir les détails :",
+                    choices=choices_events,
+                ).execute()
+
+                if event_selectionne == self.PAGE_SUIVANTE:
+                    page = charger(page.curseur_suivant)
+                    continue
+                break
 
             if event_selectionne is None:
                 return self
 
             # ---------- 4. On affiche les détails ----------
-            self._afficher_details_event(event_selectionne)
+            dispo = dispos.get(self._get_attr(event_selectionne, 'id_evenement'))
+            self._afficher_details_event(event_selectionne, dispo)
             
             statut_evenement = self._get_attr(event_selectionne, 'statut')
             is_available = (statut_evenement == 'disponible en ligne')
 
-            places_restantes = self._get_attr(event_selectionne, 'places_restantes')
+            places_restantes = dispo.places_restantes if dispo else self._get_attr(event_selectionne, 'places_restantes')
             has_places = (places_restantes is None) or (places_restantes > 0)
 
             action_choices = []
@@ -176,10 +215,11 @@ class ConsulterVue(VueAbstraite):
             return self
 
     # --- FONCTION DÉTAILS ---
-    def _afficher_details_event(self, ev: Any) -> None:
+    def _afficher_details_event(self, ev: Any, dispo: Optional[DisponibiliteModelOut] = None) -> None:
         """
         Affiche une vue détaillée d'un événement (gère dict et objet)
         ET affiche les derniers commentaires textuels.
+        `dispo` : places restantes du lieu et des bus, si déjà chargées avec la liste.
         """
         print("\n" + "=" * 50)
         print("          DÉTAIL DE L'ÉVÉNEMENT")
@@ -192,7 +232,7 @@ class ConsulterVue(VueAbstraite):
         print(f"  Lieu      : {lieu}")
         print(f"  Capacité  : {self._get_attr(ev, 'capacite', 'N/A')}")
         
-        places_restantes = self._get_attr(ev, 'places_restantes')
+        places_restantes = dispo.places_restantes if dispo else self._get_attr(ev, 'places_restantes')
         if places_restantes is not None:
              print(f"  Places    : {places_restantes}")
         else:
@@ -225,14 +265,16 @@ class ConsulterVue(VueAbstraite):
             if bus_aller:
                 desc_aller = self._get_attr(bus_aller, 'description', 'Pas de description')
                 places_aller = self._get_attr(bus_aller, 'nombre_places', '?')
-                print(f"   ALLER  : {desc_aller} ({places_aller} places)")
+                restantes_aller = f", {dispo.bus_aller.restantes} restantes" if dispo else ""
+                print(f"   ALLER  : {desc_aller} ({places_aller} places{restantes_aller})")
             else:
                 print("    ALLER  : Aucun bus prévu.")
             
             if bus_retour:
                 desc_retour = self._get_attr(bus_retour, 'description', 'Pas de description')
                 places_retour = self._get_attr(bus_retour, 'nombre_places', '?')
-                print(f"   RETOUR : {desc_retour} ({places_retour} places)")
+                restantes_retour = f", {dispo.bus_retour.restantes} restantes" if dispo else ""
+                print(f"   RETOUR : {desc_retour} ({places_retour} places{restantes_retour})")
             else:
                 print("    RETOUR : Aucun bus prévu.")
         
@@ -8,8 +8,6 @@ from view.session import Session
 
 from service.consultation_evenement_service import ConsultationEvenementService
 from service.reservation_service import ReservationService
-from service.utilisateur_service import UtilisateurService
-from service.commentaire_service import CommentaireService
 
 
 class ListeInscritsEvenementVue(VueAbstraite):
@@ -21,12 +19,13 @@ class ListeInscritsEvenementVue(VueAbstraite):
     - Rafraîchissement manuel
     """
 
+    TAILLE_PAGE = 50
+    PAGE_SUIVANTE = "__page_suivante__"
+
     def __init__(self, message: str = "", id_evenement: Optional[int] = None):
         super().__init__(message)
         self.service_evt = ConsultationEvenementService()
         self.service_resa = ReservationService()
-        self.service_user = UtilisateurService()
-        self.service_comm = CommentaireService()
         self.id_evenement = id_evenement
         self._evenement_cache: Any = None 
 
@@ -46,36 +45,45 @@ class ListeInscritsEvenementVue(VueAbstraite):
     
     def _select_evenement(self) -> Optional[int]:
         """
-        Laisse l'admin choisir un événement PARMI TOUS (passés, futurs, brouillons).
+        Laisse l'admin choisir un événement PARMI TOUS (passés, futurs, brouillons),
+        page par page.
         """
-        choices: List[Dict[str, Any]] = []
+        curseur: Optional[str] = None
 
-        try:
-            tous = self.service_evt.lister_tous(limit=500)
-            
-            if not tous:
-                print("Aucun événement trouvé en base.")
+        while True:
+            choices: List[Dict[str, Any]] = []
+            try:
+                page = self.service_evt.lister_tous_page(limit=self.TAILLE_PAGE, curseur=curseur)
+
+                if not page.items and curseur is None:
+                    print("Aucun événement trouvé en base.")
+                    return None
+
+                for e in page.items:
+                    id_evt = e.get("id_evenement")
+                    date_evt = str(e.get("date_evenement", ""))[:10]
+                    titre = e.get("titre", "—")
+                    statut = e.get("statut", "")
+
+                    label = f"[{id_evt}] {date_evt} | {titre} ({statut})"
+                    choices.append({"name": label, "value": id_evt})
+
+            except Exception as e:
+                print(f"Erreur lors du chargement des événements : {e}")
                 return None
 
-            for e in tous:
-                id_evt = e.get("id_evenement")
-                date_evt = str(e.get("date_evenement", ""))[:10]
-                titre = e.get("titre", "—")
-                statut = e.get("statut", "")
-                
-                label = f"[{id_evt}] {date_evt} | {titre} ({statut})"
-                choices.append({"name": label, "value": id_evt})
-
-        except Exception as e:
-            print(f"Erreur lors du chargement des événements : {e}")
-            return None
+            if page.curseur_suivant:
+                choices.append({"name": "--- Page suivante ---", "value": self.PAGE_SUIVANTE})
+            choices.append({"name": "--- Retour ---", "value": None})
 
-        choices.append({"name": "--- Retour ---", "value": None})
+            choix = inquirer.select(
+                message="Sélectionnez un événement pour voir les inscrits :",
+                choices=choices,
+            ).execute()
 
-        return inquirer.select(
-            message="Sélectionnez un événement pour voir les inscrits :",
-            choices=choices,
-        ).execute()
+            if choix != self.PAGE_SUIVANTE:
+                return choix
+            curseur = page.curseur_suivant
 
     def _fetch_evenement(self, id_evenement: int):
         """
@@ -95,44 +103,14 @@ class ListeInscritsEvenementVue(VueAbstraite):
             return None
 
     def _load_inscrits(self, id_evenement: int) -> List[Dict[str, Any]]:
-        """Retourne la liste des inscrits enrichie avec les infos utilisateur ET leur avis."""
-        inscrits: List[Dict[str, Any]] = []
+        """Retourne la liste des inscrits enrichie avec les infos utilisateur ET leur avis (une seule requête)."""
         try:
-            reservations = self.service_resa.get_reservations_by_event(id_evenement)
+            inscrits = self.service_resa.get_inscrits_evenement(id_evenement)
         except Exception as exc:
             print(f"Erreur lors de la récupération des réservations : {exc}")
             return []
 
-        for r in reservations:
-            user = None
-            commentaire = None 
-            try:
-                user = self.service_user.get_user_by_id(r.fk_utilisateur)
-            except Exception:
-                pass
-            
-            try:
-                commentaire = self.service_comm.get_comment_by_reservation(r.id_reservation)
-            except Exception:
-                pass 
-
-            inscrits.append(
-                {
-                    "id_reservation": getattr(r, "id_reservation"),
-                    "nom": getattr(user, "nom", "—") if user else "—",
-                    "prenom": getattr(user, "prenom", "—") if user else "—",
-                    "email": getattr(user, "email", "—") if user else "—",
-                    "bus_aller": bool(getattr(r, "bus_aller", False)),
-                    "bus_retour": bool(getattr(r, "bus_retour", False)),
-                    "adherent": bool(getattr(r, "adherent", False)),
-                    "sam": bool(getattr(r, "sam", False)),
-                    "boisson": bool(getattr(r, "boisson", False)),
-                    "date_reservation": getattr(r, "date_reservation", None),
-                    "commentaire_note": self._get_attr(commentaire, 'note'), 
-                    "commentaire_avis": self._get_attr(commentaire, 'avis') 
-                }
-            )
-        return inscrits
+        return [i.model_dump() for i in inscrits]
 
     def _print_header(self):
         titre = self._get_attr(self._evenement_cache, "titre", "—")
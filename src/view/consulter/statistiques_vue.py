@@ -66,7 +66,15 @@ class StatistiquesInscriptionsVue(VueAbstraite):
              return ConnexionAdminVue("Accès refusé.")
 
         try:
-            events = self.service.lister_tous(limit=100)
+            # Tous les événements, page par page
+            events = []
+            curseur = None
+            while True:
+                page = self.service.lister_tous_page(limit=100, curseur=curseur)
+                events.extend(page.items)
+                curseur = page.curseur_suivant
+                if not curseur:
+                    break
             self._print_stats_globale(events)
 
         except Exception as e:
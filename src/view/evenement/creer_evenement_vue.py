@@ -1,7 +1,7 @@
 # src/view/evenement/creer_evenement_vue.py
 from __future__ import annotations
 from typing import Optional
-from datetime import date
+from datetime import date, datetime
 import logging
 
 from InquirerPy import inquirer
@@ -100,6 +100,13 @@ class CreerEvenementVue(VueAbstraite):
                 default="pas encore finalisé",
             ).execute()
 
+            # Shotgun : heure d'ouverture des réservations (vide = dès la mise en ligne)
+            ouverture_str = inquirer.text(
+                message="Ouverture des réservations (YYYY-MM-DD HH:MM, optionnel) :",
+                validate=lambda t: (not t.strip() or _valid_datetime(t) or "Format attendu YYYY-MM-DD HH:MM"),
+            ).execute().strip()
+            ouverture = datetime.fromisoformat(ouverture_str) if ouverture_str else None
+
             fk_utilisateur = user.id_utilisateur
 
             # Construction du modèle d'entrée
@@ -113,6 +120,7 @@ class CreerEvenementVue(VueAbstraite):
                 capacite=capacite,
                 categorie=categorie,
                 statut=statut,
+                ouverture=ouverture,
             )
 
         except ValidationError as ve:
@@ -200,4 +208,11 @@ def _valid_date(s: str) -> bool:
         date.fromisoformat(s)
         return True
     except Exception:
-        return False
\ No newline at end of file
+        return False
+
+def _valid_datetime(s: str) -> bool:
+    try:
+        datetime.fromisoformat(s.strip())
+        return True
+    except Exception:
+        return False
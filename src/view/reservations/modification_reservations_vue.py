@@ -9,9 +9,7 @@ from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
 
 # Email (Brevo)
-from dotenv import load_dotenv
-from utils.api_brevo import send_email_brevo
-load_dotenv()
+from service.email_service import EmailService
 
 
 class ModificationReservationVue(VueAbstraite):
@@ -133,14 +131,23 @@ class ModificationReservationVue(VueAbstraite):
         if not confirme:
             return ConnexionClientVue("Modification annulée.")
 
-        # 7️ Mise à jour via le service
+        # 7️ Mise à jour via le service (un bus ajouté passe par sa liste d'attente)
+        ajouts_bus = [d for d in ("aller", "retour") if new[f"bus_{d}"] and not curr[f"bus_{d}"]]
+        flags = {k: (None if k in {f"bus_{d}" for d in ajouts_bus} else v) for k, v in new.items()}
         try:
             updated = self.reservation_service.update_reservation_flags(
                 resa.id_reservation,
-                **new
+                **flags
             )
             if not updated:
                 return ConnexionClientVue("Échec de la modification de la réservation.")
+            for direction in ajouts_bus:
+                rang = self.reservation_service.attendre_bus(resa.id_reservation, direction)
+                if rang is None:
+                    print(f"Place attribuée dans le bus {direction}.")
+                else:
+                    new[f"bus_{direction}"] = False
+                    print(f"Bus {direction} complet : vous êtes en liste d'attente (rang {rang}).")
         except Exception as exc:
             print(f"Erreur lors de la mise à jour : {exc}")
             return ConnexionClientVue("Échec de la modification de la réservation.")
@@ -160,15 +167,8 @@ class ModificationReservationVue(VueAbstraite):
                 "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
                 "— L’équipe du BDE Ensai"
             )
-            status, response = send_email_brevo(
-                to_email=user.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation de modification vous a été envoyé.")
-            else:
-                print(f"E-mail non envoyé (HTTP {status}).")
+            EmailService().programmer([user.email], subject, message_text)
+            print("Un e-mail de confirmation de modification va vous être envoyé.")
         except Exception as exc:
             print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
 
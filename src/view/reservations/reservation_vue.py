@@ -1,30 +1,25 @@
 # src/view/reservations/reservation_vue.py
+import time
 from typing import Optional, Any, Union
-from datetime import date
+from datetime import date, datetime, timezone
 from InquirerPy import inquirer
 
 from view.vue_abstraite import VueAbstraite
 from view.session import Session
 
 # Passage aux services
-from service.bus_service import BusService
+from service.admission_service import AdmissionService, admission_service
+from service.consultation_evenement_service import ConsultationEvenementService
 from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
-from model.reservation_models import ReservationModelIn
+from model.reservation_models import AdmissionModelOut, ReservationModelIn, StatutAdmission, StatutReservation
 try:
     from model.evenement_models import EvenementModelOut
 except ImportError:
     EvenementModelOut = object # Fallback si le fichier n'existe pas
 
 # Envoi d’e-mail de confirmation
-from dotenv import load_dotenv
-try:
-    from utils.api_brevo import send_email_brevo
-    LOADED_BREVO = True
-except ImportError:
-    LOADED_BREVO = False
-    print("WARNING: 'api_brevo' non trouvé. L'envoi d'email sera désactivé.")
-load_dotenv()
+from service.email_service import EmailService
 
 
 class ReservationVue(VueAbstraite):
@@ -38,8 +33,8 @@ class ReservationVue(VueAbstraite):
         self.user = self.session.utilisateur
         self.reservation_service = ReservationService()
         self.evenement_service = EvenementService()
+        self.consultation_service = ConsultationEvenementService()
         self.evenement = evenement
-        self.bus_service = BusService()
 
     # --- HELPER ---
     @staticmethod
@@ -105,31 +100,33 @@ class ReservationVue(VueAbstraite):
         date_evt = self._get_attr(evt, 'date_evenement', 'N/A')
         id_evt = self._get_attr(evt, 'id_evenement') # On récupère l'ID ici
         print(f"\nÉvénement sélectionné : {titre_evt} ({date_evt})")
+        ouverture = self.evenement_service.get_event_by_id(id_evt).ouverture if id_evt else None
+        if ouverture and ouverture > datetime.now(timezone.utc):
+            print(f"Ouverture des réservations le {ouverture.astimezone():%d/%m/%Y à %H:%M:%S} : "
+                  "préparez vos options, vous entrerez ensuite dans la file d'admission.")
 
-        # --- Étape 2 : NOUVELLE VÉRIFICATION (Capacité du LIEU) ---
+        # --- Étape 2 : disponibilités du lieu et des bus (une seule requête) ---
         try:
-            capacite_lieu = self._get_attr(evt, 'capacite', 0)
-            inscrits_lieu = self.reservation_service.get_nb_inscrits_evenement(id_evt)
-            restantes_lieu = capacite_lieu - inscrits_lieu
-            
-            if restantes_lieu <= 0:
-                print(f"L'événement est complet ({inscrits_lieu}/{capacite_lieu}).")
-                return ConsulterVue("Événement complet.")
+            dispo = self.consultation_service.disponibilites([id_evt]).get(id_evt)
+            if dispo is None:
+                return ConnexionClientVue("Événement introuvable.")
+
+            if dispo.places_restantes <= 0:
+                print(f"L'événement est complet ({dispo.inscrits}/{dispo.capacite}).")
+                return self._proposer_liste_attente(id_evt)
             else:
-                print(f"Places événement : {restantes_lieu} restantes sur {capacite_lieu}.")
+                print(f"Places événement : {dispo.places_restantes} restantes sur {dispo.capacite}.")
         except Exception as e:
              return ConnexionClientVue(f"Erreur lors de la vérification des places : {e}")
 
 
         # --- Étape 3 : saisie des options de réservation (BUS) ---
-        # Ton code ici était déjà parfait !
         print("\n--- Choix de vos options ---")
         
         # --- Logique BUS ALLER ---
         bus_aller = False
-        cap_aller = self.bus_service.get_capacite(id_evt, 'aller')
-        prises_aller = self.reservation_service.get_nb_places_bus_prises(id_evt, 'aller')
-        restantes_aller = cap_aller - prises_aller
+        cap_aller = dispo.bus_aller.capacite
+        restantes_aller = dispo.bus_aller.restantes
 
         if cap_aller == 0:
             print("Bus Aller : Pas de bus prévu.")
@@ -143,9 +140,8 @@ class ReservationVue(VueAbstraite):
 
         # --- Logique BUS RETOUR ---
         bus_retour = False
-        cap_retour = self.bus_service.get_capacite(id_evt, 'retour')
-        prises_retour = self.reservation_service.get_nb_places_bus_prises(id_evt, 'retour')
-        restantes_retour = cap_retour - prises_retour
+        cap_retour = dispo.bus_retour.capacite
+        restantes_retour = dispo.bus_retour.restantes
 
         if cap_retour == 0:
             print("Bus Retour : Pas de bus prévu.")
@@ -178,50 +174,64 @@ class ReservationVue(VueAbstraite):
             boisson=boisson,
         )
 
-        # --- Étape 5 : enregistrement via le service ---
+        # --- Étape 5 : file d'admission (ouverture programmée), puis enregistrement ---
+        # Les capacités ont pu bouger depuis l'affichage : la vérification qui fait foi
+        # est celle faite atomiquement au moment de l'insertion.
+        admission = self._attendre_admission(id_evt)
+        if admission is None:
+            return ConsulterVue("Attente abandonnée.")
+        if admission.statut == StatutAdmission.COMPLET:
+            print("L'événement est complet.")
+            return self._proposer_liste_attente(id_evt, resa_in)
+
         try:
-            resa_out = self.reservation_service.create_reservation(resa_in)
+            resultat = admission_service().reserver(resa_in, admission.jeton)
         except Exception as e:
             print(f"Erreur lors de la création de la réservation : {e}")
             # On affiche l'erreur réelle pour le débogage
             return ConnexionClientVue(f"Erreur lors de la réservation : {e}")
 
-        if not resa_out:
-            print("La réservation n'a pas pu être créée (peut-être déjà existante ?).")
-            return ConnexionClientVue("Échec de la réservation.")
+        if not resultat.ok:
+            message_refus = ReservationService.MESSAGES_REFUS[resultat.statut]
+            print(f"Réservation refusée : {message_refus}")
+            if resultat.statut == StatutReservation.COMPLET:
+                return self._proposer_liste_attente(id_evt, resa_in)
+            return ConnexionClientVue(f"Échec de la réservation : {message_refus}")
 
         print(f"Réservation confirmée pour {titre_evt} ({date_evt})")
 
-        # --- Étape 6 : e-mail de confirmation (Ton code est parfait) ---
-        if LOADED_BREVO: 
-            try:
-                subject = "Confirmation de votre réservation — BDE Ensai"
-                message_text = (
-                    f"Bonjour {self.user.prenom} {self.user.nom},\n\n"
-                    f"Votre réservation pour l’événement « {titre_evt} » du {date_evt} est confirmée.\n\n"
-                    f"Options :\n"
-                    f" - Bus aller : {'Oui' if bus_aller else 'Non'}\n"
-                    f" - Bus retour : {'Oui' if bus_retour else 'Non'}\n"
-                    f" - Adhérent : {'Oui' if adherent else 'Non'}\n"
-                    f" - SAM : {'Oui' if sam else 'Non'}\n"
-                    f" - Boisson : {'Oui' if boisson else 'Non'}\n\n"
-                    "Si vous n'êtes pas à l'origine de cette action, veuillez nous contacter.\n\n"
-                    "— L'équipe du BDE Ensai"
-                )
-
-                status, _ = send_email_brevo(
-                    to_email=self.user.email,
-                    subject=subject,
-                    message_text=message_text,
-                )
-
-                if 200 <= status < 300:
-                    print("Un e-mail de confirmation vous a été envoyé.")
-                else:
-                    print(f"E-mail non envoyé (HTTP {status}).")
+        # --- Bus complets : attente d'une place, attribuée automatiquement ---
+        for direction, restantes, cap in (("aller", restantes_aller, cap_aller), ("retour", restantes_retour, cap_retour)):
+            if cap > 0 and restantes <= 0 and inquirer.confirm(
+                message=f"Bus {direction.upper()} complet : rejoindre la liste d'attente de ce bus ?", default=True
+            ).execute():
+                try:
+                    rang = self.reservation_service.attendre_bus(resultat.reservation.id_reservation, direction)
+                    print(self._message_attente(rang))
+                except ValueError as e:
+                    print(f"Impossible de rejoindre la liste d'attente : {e}")
 
-            except Exception as exc:
-                print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
+        # --- Étape 6 : e-mail de confirmation (Ton code est parfait) ---
+        try:
+            subject = "Confirmation de votre réservation — BDE Ensai"
+            message_text = (
+                f"Bonjour {self.user.prenom} {self.user.nom},\n\n"
+                f"Votre réservation pour l’événement « {titre_evt} » du {date_evt} est confirmée.\n\n"
+                f"Options :\n"
+                f" - Bus aller : {'Oui' if bus_aller else 'Non'}\n"
+                f" - Bus retour : {'Oui' if bus_retour else 'Non'}\n"
+                f" - Adhérent : {'Oui' if adherent else 'Non'}\n"
+                f" - SAM : {'Oui' if sam else 'Non'}\n"
+                f" - Boisson : {'Oui' if boisson else 'Non'}\n\n"
+                "Si vous n'êtes pas à l'origine de cette action, veuillez nous contacter.\n\n"
+                "— L'équipe du BDE Ensai"
+            )
+
+            EmailService().programmer([self.user.email], subject, message_text)
+            print("Un e-mail de confirmation va vous être envoyé.")
+
+        except Exception as exc:
+            print(f"Impossible d'envoyer l'e-mail de confirmation : {exc}")
 
         # --- Étape 7 : retour au menu (Client ou Admin) ---
         
@@ -231,4 +241,62 @@ class ReservationVue(VueAbstraite):
         if self.user.administrateur:
             return ConnexionAdminVue(message_succes)
         else:
-            return ConnexionClientVue(message_succes)
\ No newline at end of file
+            return ConnexionClientVue(message_succes)
+
+    # ----------------- File d'admission -----------------
+    def _attendre_admission(self, id_evt: int) -> Optional[AdmissionModelOut]:
+        """
+        Attend son tour dans la file d'admission (immédiat sans ouverture programmée) :
+        la file est rappelée après le délai qu'elle indique, borné à AdmissionService.RAPPEL_MAX.
+        Retourne la réponse ADMIS (avec le jeton) ou COMPLET ; None si l'utilisateur abandonne (Ctrl+C).
+        """
+        try:
+            while True:
+                admission = admission_service().demander(self.user.id_utilisateur, id_evt)
+                if admission.statut in (StatutAdmission.ADMIS, StatutAdmission.COMPLET):
+                    return admission
+                if admission.statut == StatutAdmission.PAS_OUVERT:
+                    print(f"Ouverture dans {admission.attente:.0f} s... (Ctrl+C pour abandonner)")
+                else:
+                    print(f"File d'admission : position {admission.position}, environ {admission.attente:.0f} s...")
+                time.sleep(min(max(admission.attente, 0.2), AdmissionService.RAPPEL_MAX))
+        except KeyboardInterrupt:
+            print("\nAttente abandonnée.")
+            return None
+
+    # ----------------- Liste d'attente -----------------
+    @staticmethod
+    def _message_attente(rang: Optional[int]) -> str:
+        if rang is None:
+            return "Une place était libre : elle vous est attribuée, un e-mail de confirmation va vous être envoyé."
+        return (f"Vous êtes en position {rang} sur la liste d'attente. "
+                "La place vous sera attribuée automatiquement, avec un e-mail, dès qu'elle se libère.")
+
+    def _proposer_liste_attente(self, id_evt: int, demande: Optional[ReservationModelIn] = None) -> VueAbstraite:
+        """Événement complet : inscription en liste d'attente, avec les options voulues."""
+        from view.consulter.consulter_evenement_vue import ConsulterVue
+
+        if not inquirer.confirm(message="Rejoindre la liste d'attente ?", default=True).execute():
+            return ConsulterVue("Événement complet.")
+
+        if demande is None:
+            dispo = self.consultation_service.disponibilites([id_evt]).get(id_evt)
+            demande = ReservationModelIn(
+                fk_utilisateur=self.user.id_utilisateur,
+                fk_evenement=id_evt,
+                bus_aller=dispo is not None and dispo.bus_aller.capacite > 0
+                and inquirer.confirm(message="Bus ALLER souhaité ?", default=True).execute(),
+                bus_retour=dispo is not None and dispo.bus_retour.capacite > 0
+                and inquirer.confirm(message="Bus RETOUR souhaité ?", default=True).execute(),
+                adherent=inquirer.confirm(message="Êtes-vous adhérent ?", default=False).execute(),
+                sam=inquirer.confirm(message="Êtes-vous SAM ?", default=False).execute(),
+                boisson=inquirer.confirm(message="Souhaitez-vous une boisson ?", default=False).execute(),
+            )
+
+        try:
+            rang = self.reservation_service.rejoindre_liste_attente(demande)
+        except ValueError as e:
+            return ConsulterVue(f"Impossible de rejoindre la liste d'attente : {e}")
+
+        print(self._message_attente(rang))
+        return ConsulterVue("Liste d'attente")
@@ -10,9 +10,7 @@ from service.reservation_service import ReservationService
 from service.evenement_service import EvenementService
 
 # Envoi d'e-mail (Brevo)
-from dotenv import load_dotenv
-from utils.api_brevo import send_email_brevo
-load_dotenv()
+from service.email_service import EmailService
 
 
 class SuppressionReservationVue(VueAbstraite):
@@ -146,15 +144,8 @@ class SuppressionReservationVue(VueAbstraite):
                 "Si vous n'êtes pas à l'origine de cette action, merci de nous contacter.\n\n"
                 "— L'équipe du BDE Ensai"
             )
-            status, _ = send_email_brevo(
-                to_email=user.email,
-                subject=subject,
-                message_text=message_text,
-            )
-            if 200 <= status < 300:
-                print("Un e-mail de confirmation d'annulation vous a été envoyé.")
-            else:
-                print(f" E-mail non envoyé (HTTP {status}).")
+            EmailService().programmer([user.email], subject, message_text)
+            print("Un e-mail de confirmation d'annulation va vous être envoyé.")
         except Exception as exc:
             print(f" Impossible d'envoyer l'e-mail de confirmation : {exc}")
 
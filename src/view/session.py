@@ -1,39 +1,73 @@
-from datetime import datetime
+from typing import Optional
 
 from utils.singleton import Singleton
 
 
+def session_service():
+    """
+    Magasin de sessions partagé (service.session_service), importé au premier
+    besoin : tant que personne n'est connecté, la console n'a pas à charger
+    les services et les DAO.
+    """
+    from service.session_service import session_service as magasin
+
+    return magasin()
+
+
 class Session(metaclass=Singleton):
     """Stocke les données liées à une session.
     Cela permet par exemple de connaitre le joueur connecté à tout moment
     depuis n'importe quelle classe.
     Sans cela, il faudrait transmettre ce joueur entre les différentes vues.
+
+    La session de la console ne garde que son jeton : l'utilisateur est lu
+    dans le magasin de sessions partagé (service.session_service), qui gère
+    l'expiration et les sessions des autres utilisateurs.
     """
 
     def __init__(self):
         """Création de la session"""
-        self.utilisateur = None
+        self.jeton: Optional[str] = None
         self.debut_connexion = None
 
-    def connexion(self, utilisateur):
+    @property
+    def utilisateur(self):
+        """Utilisateur connecté (None si aucune session ou session expirée)."""
+        if self.jeton is None:
+            return None
+        return session_service().utilisateur(self.jeton)
+
+    def connexion(self, utilisateur, mot_de_passe: Optional[str] = None):
         """Enregistement des données en session"""
-        self.utilisateur = utilisateur
-        self.debut_connexion = datetime.now().strftime("%d/%m/%Y %H:%M:%S")
+        magasin = session_service()
+        actuel = self.utilisateur
+        if actuel is not None and actuel.id_utilisateur == utilisateur.id_utilisateur:
+            # Même utilisateur (profil modifié) : on garde la session ouverte
+            magasin.rafraichir_utilisateur(self.jeton, utilisateur)
+            return
+        magasin.fermer(self.jeton)
+        self.jeton = magasin.ouvrir(utilisateur, mot_de_passe)
+        self.debut_connexion = magasin.debut(self.jeton).strftime("%d/%m/%Y %H:%M:%S")
 
     def deconnexion(self):
         """Suppression des données de la session"""
-        self.utilisateur = None
+        session_service().fermer(self.jeton)
+        self.jeton = None
         self.debut_connexion = None
 
     def est_connecte(self) -> bool:
         """Retourne True si un utilisateur est actuellement connecté."""
         return self.utilisateur is not None
 
+    def verifier_mot_de_passe(self, mot_de_passe: str) -> bool:
+        """Re-vérifie le mot de passe de l'utilisateur connecté (sans bcrypt s'il a été saisi à la connexion)."""
+        return session_service().verifier_mot_de_passe(self.jeton, mot_de_passe)
+
     def afficher(self) -> str:
         """Afficher les informations de connexion"""
         res = "Actuellement en session :\n"
         res += "-------------------------\n"
-        for att in list(self.__dict__.items()):
-            res += f"{att[0]} : {att[1]}\n"
+        res += f"utilisateur : {self.utilisateur}\n"
+        res += f"debut_connexion : {self.debut_connexion}\n"
 
         return res